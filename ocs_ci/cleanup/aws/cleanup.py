@@ -2,16 +2,13 @@ import tempfile
 import argparse
 import logging
 import datetime
-import threading
 import os
 import re
-import boto3
+from functools import partial
 
-from botocore.exceptions import ClientError
 from ocs_ci.framework import config
 
 
-from ocs_ci.ocs.bucket_utils import delete_all_objects_in_batches
 from ocs_ci.ocs.constants import (
     CLEANUP_YAML,
     TEMPLATE_CLEANUP_DIR,
@@ -30,6 +27,12 @@ from ocs_ci.utility.aws import (
 )
 
 from ocs_ci.cleanup.aws import defaults
+from ocs_ci.cleanup.aws.scheduler import (
+    CleanupJournal,
+    CleanupScheduler,
+    CloudInventory,
+    purge_bucket,
+)
 
 
 FORMAT = "%(asctime)s - %(threadName)s - %(name)s - %(levelname)s - %(message)s"
@@ -37,7 +40,7 @@ logging.basicConfig(format=FORMAT, level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
 
-def cleanup(cluster_name, cluster_id, upi=False, failed_deletions=None):
+def cleanup(cluster_name, cluster_id, upi=False, failed_deletions=None, inventory=None):
     """
     Cleanup existing cluster in AWS
 
@@ -47,6 +50,8 @@ def cleanup(cluster_name, cluster_id, upi=False, failed_deletions=None):
         upi (bool): True for UPI cluster, False otherwise
         failed_deletions (list): list of clusters we failed to delete, used
             for reporting purposes
+        inventory (CloudInventory): Inventory of the region shared by the
+            cleanups, the CloudFormation stacks are looked up in it
 
     """
     data = {"cluster_name": cluster_name, "cluster_id": cluster_id}
@@ -69,31 +74,11 @@ def cleanup(cluster_name, cluster_id, upi=False, failed_deletions=None):
         destroy_volumes(cluster_name)
         aws.delete_apps_record_set(cluster_name)
 
-        stack_names = list()
-        # Get master, bootstrap and security group stacks
-        for stack_type in ["ma", "bs", "sg"]:
-            try:
-                stack_names.append(
-                    aws.get_cloudformation_stacks(
-                        pattern=f"{cluster_name}-{stack_type}"
-                    )[0]["StackName"]
-                )
-            except ClientError:
-                continue
-
-        # Get the worker stacks
-        worker_index = 0
-        worker_stack_exists = True
-        while worker_stack_exists:
-            try:
-                stack_names.append(
-                    aws.get_cloudformation_stacks(
-                        pattern=f"{cluster_name}-no{worker_index}"
-                    )[0]["StackName"]
-                )
-                worker_index += 1
-            except ClientError:
-                worker_stack_exists = False
+        inventory = inventory or CloudInventory(aws=aws)
+        # Get master, bootstrap and security group stacks and the worker stacks
+        stack_names = inventory.cluster_stack_names(
+            cluster_name, ["ma", "bs", "sg"]
+        ) + inventory.worker_stack_names(cluster_name)
 
         logger.info(f"Deleting stacks: {stack_names}")
         aws.delete_cloudformation_stacks(stack_names)
@@ -102,20 +87,12 @@ def cleanup(cluster_name, cluster_id, upi=False, failed_deletions=None):
         logger.info(f"cleaning up {cluster_id}")
         destroy_cluster(installer=oc_bin, cluster_path=cleanup_path)
 
-        for stack_type in ["inf", "vpc"]:
-            try:
-                stack_names.append(
-                    aws.get_cloudformation_stacks(
-                        pattern=f"{cluster_name}-{stack_type}"
-                    )[0]["StackName"]
-                )
-            except ClientError:
-                continue
+        stack_names += inventory.cluster_stack_names(cluster_name, ["inf", "vpc"])
         try:
             aws.delete_cloudformation_stacks(stack_names)
         except StackStatusError:
             logger.error("Failed to fully destroy cluster %s", cluster_name)
-            if failed_deletions:
+            if failed_deletions is not None:
                 failed_deletions.append(cluster_name)
             raise
     else:
@@ -124,7 +101,7 @@ def cleanup(cluster_name, cluster_id, upi=False, failed_deletions=None):
             destroy_cluster(installer=oc_bin, cluster_path=cleanup_path)
         except CommandFailed:
             logger.error("Failed to fully destroy cluster %s", cluster_name)
-            if failed_deletions:
+            if failed_deletions is not None:
                 failed_deletions.append(cluster_name)
             raise
 
@@ -132,7 +109,11 @@ def cleanup(cluster_name, cluster_id, upi=False, failed_deletions=None):
 
 
 def get_clusters(
-    time_to_delete, region_name, prefixes_hours_to_spare, cluster_pattern=None
+    time_to_delete,
+    region_name,
+    prefixes_hours_to_spare,
+    cluster_pattern=None,
+    inventory=None,
 ):
     """
     Get all cluster names that their EC2 instances running time is greater
@@ -146,6 +127,8 @@ def get_clusters(
             along with the maximum time in hours that is allowed for spared
             clusters to continue running
         cluster_pattern (str): The name of the ec2 instances
+        inventory (CloudInventory): Inventory of the region, the instances of
+            the CloudFormation based clusters are looked up in it
 
     Returns:
         tuple: List of the cluster names (e.g ebenahar-cluster-gqtd4) to be provided to the
@@ -207,6 +190,7 @@ def get_clusters(
         return True if vpc_id in vpc_ids and len(set(vpc_ids)) == 1 else False
 
     aws = AWS(region_name=region_name)
+    inventory = inventory or CloudInventory(aws=aws)
     clusters_to_delete = list()
     remaining_clusters = list()
     cloudformation_vpc_names = list()
@@ -253,13 +237,7 @@ def get_clusters(
     # Get all cloudformation based clusters to delete
     cf_clusters_to_delete = list()
     for vpc_name in cloudformation_vpc_names:
-        instance_dicts = aws.get_instances_by_name_pattern(
-            f"{vpc_name.replace('-vpc', '')}*"
-        )
-        ec2_instances = [
-            aws.get_ec2_instance(instance_dict["id"])
-            for instance_dict in instance_dicts
-        ]
+        ec2_instances = inventory.instances_by_name_prefix(vpc_name.replace("-vpc", ""))
         if not ec2_instances:
             continue
         cluster_io_tag = None
@@ -301,47 +279,59 @@ def cluster_cleanup():
     parser.add_argument(
         "--upi", action="store_true", required=False, help="For UPI cluster deletion"
     )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=defaults.CLEANUP_MAX_WORKERS,
+        help="Maximum number of clusters destroyed at once",
+    )
     logging.basicConfig(level=logging.DEBUG)
     args = parser.parse_args()
-    procs = []
+    inventory = CloudInventory() if args.upi else None
+    tasks = {}
     for id in args.cluster:
         cluster_name = id[0].rsplit("-", 1)[0]
         logger.info(f"cleaning up {id[0]}")
-        proc = threading.Thread(target=cleanup, args=(cluster_name, id[0], args.upi))
-        proc.start()
-        procs.append(proc)
-    for p in procs:
-        p.join()
+        tasks[f"cluster:{id[0]}"] = partial(
+            cleanup, cluster_name, id[0], args.upi, inventory=inventory
+        )
+    CleanupScheduler(max_workers=args.max_workers).run(tasks)
 
 
-def delete_buckets(bucket_prefix, hours):
+def delete_buckets(
+    bucket_prefix,
+    hours,
+    max_workers=defaults.BUCKET_PURGE_MAX_WORKERS,
+    journal=None,
+    inventory=None,
+):
     """
     Delete the S3 buckets with given prefix
 
     Args:
         bucket_prefix (dict): Bucket prefix as key and maximum hours to run/exist as value
         hours (int): hours older than this will be considered to delete
+        max_workers (int): Maximum number of buckets purged at once
+        journal (CleanupJournal): Journal of the sweep, the buckets deleted
+            according to the journal are skipped
+        inventory (CloudInventory): Inventory providing the listed buckets
+
+    Returns:
+        list: Names of the buckets which failed to be deleted
 
     """
-    aws = AWS()
-    buckets_to_delete = aws.get_buckets_to_delete(bucket_prefix, hours)
+    inventory = inventory or CloudInventory()
+    buckets_to_delete = inventory.aws.get_buckets_to_delete(
+        bucket_prefix, hours, buckets=inventory.buckets
+    )
     logger.info(f"buckets to delete: {buckets_to_delete}")
-    buckets_deletion_failed = []
-    for bucket_name in buckets_to_delete:
-        try:
-            bucket = boto3.resource("s3").Bucket(bucket_name)
-            try:
-                delete_all_objects_in_batches(
-                    s3_resource=boto3.resource("s3"), bucket_name=bucket_name
-                )
-                bucket.object_versions.all().delete()
-            except Exception as e:
-                logger.error(f"failed to list object in bucket {bucket_name} err:{e}")
-            bucket.delete()
-        except Exception as e:
-            logger.error(e)
-            buckets_deletion_failed.append(bucket_name)
-    return buckets_deletion_failed
+    failed = CleanupScheduler(max_workers=max_workers, journal=journal).run(
+        {
+            f"bucket:{bucket_name}": partial(purge_bucket, bucket_name)
+            for bucket_name in buckets_to_delete
+        }
+    )
+    return [key.split(":", 1)[1] for key in failed]
 
 
 def aws_cleanup():
@@ -400,11 +390,33 @@ def aws_cleanup():
         required=False,
         help="The name of the cluster to delete from AWS",
     )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        required=False,
+        help=f"""
+            Maximum number of clusters destroyed (or buckets purged) at once.
+            Defaults to {defaults.CLEANUP_MAX_WORKERS} clusters or
+            {defaults.BUCKET_PURGE_MAX_WORKERS} buckets.
+            """,
+    )
+    parser.add_argument(
+        "--journal",
+        action="store",
+        required=False,
+        help="""
+            Path of the progress journal, no journal is kept by default.
+            An interrupted sweep started again with the same journal skips
+            the clusters and buckets which were already deleted. The journal
+            is removed when the sweep finishes without failures.
+            """,
+    )
     bucket_group = parser.add_argument_group("S3 Bucket Sweeping Options")
     bucket_group.add_argument(
         "--sweep-buckets", action="store_true", help="Deleting S3 buckets."
     )
     args = parser.parse_args()
+    journal = CleanupJournal(args.journal) if args.journal else None
 
     if args.sweep_buckets:
         bucket_hours = (
@@ -413,8 +425,13 @@ def aws_cleanup():
             else defaults.DEFAULT_BUCKET_RUNNING_TIME
         )
         buckets_deletion_failed = delete_buckets(
-            defaults.BUCKET_PREFIXES_SPECIAL_RULES, bucket_hours
+            defaults.BUCKET_PREFIXES_SPECIAL_RULES,
+            bucket_hours,
+            max_workers=args.max_workers or defaults.BUCKET_PURGE_MAX_WORKERS,
+            journal=journal,
         )
+        if journal and not buckets_deletion_failed:
+            journal.clear()
         assert (
             len(buckets_deletion_failed) == 0
         ), f"No all buckets deleted\n buckets_deletion_failed={buckets_deletion_failed}"
@@ -452,28 +469,40 @@ def aws_cleanup():
     else:
         logger.info("Deleting clusters: %s", clusters_to_delete)
         get_openshift_installer()
-    procs = []
     failed_deletions = []
+    scheduler = CleanupScheduler(
+        max_workers=args.max_workers or defaults.CLEANUP_MAX_WORKERS, journal=journal
+    )
+    tasks = {}
     for cluster in clusters_to_delete:
         cluster_name = cluster.rsplit("-", 1)[0]
         logger.info(f"Deleting cluster {cluster_name}")
-        proc = threading.Thread(
-            target=cleanup, args=(cluster_name, cluster, False, failed_deletions)
+        tasks[f"cluster:{cluster}"] = partial(
+            cleanup, cluster_name, cluster, False, failed_deletions
         )
-        proc.start()
-        procs.append(proc)
-    for p in procs:
-        p.join()
+    failed = scheduler.run(tasks)
+    # the stacks of the UPI clusters are looked up in the region of the
+    # cleanup, shared by all the UPI cleanups
+    upi_inventory = CloudInventory() if cf_clusters_to_delete else None
+    tasks = {}
     for cluster in cf_clusters_to_delete:
         cluster_name = cluster.rsplit("-", 1)[0]
         logger.info(f"Deleting UPI cluster {cluster_name}")
-        proc = threading.Thread(
-            target=cleanup, args=(cluster_name, cluster, True, failed_deletions)
+        tasks[f"cluster:{cluster}"] = partial(
+            cleanup,
+            cluster_name,
+            cluster,
+            True,
+            failed_deletions,
+            inventory=upi_inventory,
         )
-        proc.start()
-        procs.append(proc)
-    for p in procs:
-        p.join()
+    failed.update(scheduler.run(tasks))
+    for key in failed:
+        cluster_name = key.split(":", 1)[1].rsplit("-", 1)[0]
+        if cluster_name not in failed_deletions:
+            failed_deletions.append(cluster_name)
+    if journal and not failed:
+        journal.clear()
     logger.info("Remaining clusters: %s", remaining_clusters)
     filename = "failed_cluster_deletions.txt"
     content = "None\n"
@@ -39,3 +39,10 @@ BUCKET_PREFIXES_SPECIAL_RULES = {
     "lr5-": 300,
 }
 DEFAULT_BUCKET_RUNNING_TIME = 100
+
+# maximum number of clusters destroyed at once
+CLEANUP_MAX_WORKERS = 5
+# maximum number of buckets purged at once
+BUCKET_PURGE_MAX_WORKERS = 10
+# journal older than this (in hours) is ignored and a new sweep is started
+CLEANUP_JOURNAL_MAX_AGE = 24
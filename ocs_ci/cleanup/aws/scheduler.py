@@ -0,0 +1,301 @@
+"""
+Bounded and resumable scheduler of the AWS cleanup.
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import boto3
+from botocore.config import Config as BotoConfig
+
+from ocs_ci.cleanup.aws import defaults
+from ocs_ci.ocs.bucket_utils import delete_all_objects_in_batches
+from ocs_ci.utility.aws import AWS
+
+logger = logging.getLogger(__name__)
+
+# back off the requests on throttling instead of failing the purge
+RETRY_CONFIG = BotoConfig(retries={"max_attempts": 10, "mode": "adaptive"})
+STACK_DELETED = "DELETE_COMPLETE"
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+
+
+class CloudInventory(object):
+    """
+    CloudFormation stacks, EC2 instances and S3 buckets of one region, each
+    kind is fetched once when it's needed first.
+    """
+
+    def __init__(self, region_name=None, aws=None):
+        """
+        Args:
+            region_name (str): Name of the AWS region, the region from the
+                config by default
+            aws (AWS): AWS object to use instead of creating a new one
+
+        """
+        self.aws = aws or AWS(region_name=region_name)
+        self._stacks = None
+        self._instances = None
+        self._buckets = None
+        self._lock = threading.Lock()
+
+    @property
+    def stacks(self):
+        """
+        dict: Stacks which are not deleted keyed by the stack name
+        """
+        with self._lock:
+            if self._stacks is None:
+                paginator = self.aws.cf_client.get_paginator("describe_stacks")
+                self._stacks = {
+                    stack["StackName"]: stack
+                    for page in paginator.paginate()
+                    for stack in page["Stacks"]
+                    if stack.get("StackStatus") != STACK_DELETED
+                }
+                logger.info(f"Found {len(self._stacks)} CloudFormation stacks")
+            return self._stacks
+
+    @property
+    def instances(self):
+        """
+        list: EC2 instance resources
+        """
+        with self._lock:
+            if self._instances is None:
+                self._instances = list(self.aws.ec2_resource.instances.all())
+                logger.info(f"Found {len(self._instances)} EC2 instances")
+            return self._instances
+
+    @property
+    def buckets(self):
+        """
+        list: Buckets with the name and creation date
+        """
+        with self._lock:
+            if self._buckets is None:
+                self._buckets = self.aws.list_buckets()
+                logger.info(f"Found {len(self._buckets)} S3 buckets")
+            return self._buckets
+
+    def cluster_stack_names(self, cluster_name, stack_types):
+        """
+        Args:
+            cluster_name (str): Name of the cluster
+            stack_types (list): Suffixes of the stacks, e.g. ["ma", "bs"]
+
+        Returns:
+            list: Names of the existing stacks "<cluster_name>-<stack_type>"
+
+        """
+        names = [f"{cluster_name}-{stack_type}" for stack_type in stack_types]
+        return [name for name in names if name in self.stacks]
+
+    def worker_stack_names(self, cluster_name):
+        """
+        Args:
+            cluster_name (str): Name of the cluster
+
+        Returns:
+            list: Names of the worker stacks "<cluster_name>-no<index>"
+                ordered by the index
+
+        """
+        pattern = re.compile(rf"^{re.escape(cluster_name)}-no(\d+)$")
+        workers = [
+            (int(match.group(1)), name)
+            for name in self.stacks
+            for match in [pattern.match(name)]
+            if match
+        ]
+        return [name for _, name in sorted(workers)]
+
+    def instances_by_name_prefix(self, prefix):
+        """
+        Args:
+            prefix (str): Prefix of the Name tag of the instances
+
+        Returns:
+            list: EC2 instance resources with the Name tag starting with the
+                prefix
+
+        """
+        return [
+            instance
+            for instance in self.instances
+            if any(
+                tag["Key"] == "Name" and tag["Value"].startswith(prefix)
+                for tag in instance.tags or []
+            )
+        ]
+
+
+class CleanupJournal(object):
+    """
+    Progress of the cleanup persisted in a JSON file.
+    """
+
+    def __init__(self, path, max_age=defaults.CLEANUP_JOURNAL_MAX_AGE):
+        """
+        Args:
+            path (str): Path of the journal file
+            max_age (int): Max age of the journal in hours, an older journal
+                is ignored
+
+        """
+        self.path = path
+        self.started = time.time()
+        self.entries = {}
+        self._lock = threading.Lock()
+        if os.path.exists(path):
+            with open(path) as f:
+                data = json.load(f)
+            if time.time() - data.get("started", 0) <= max_age * 60 * 60:
+                self.started = data["started"]
+                self.entries = data.get("entries", {})
+                logger.info(
+                    f"Resuming cleanup from journal {path}, "
+                    f"{len(self.done)} tasks already done"
+                )
+            else:
+                logger.info(f"Ignoring journal {path} older than {max_age} hours")
+
+    @property
+    def done(self):
+        """
+        list: Keys of the tasks which were done
+        """
+        return [
+            key for key, entry in self.entries.items() if entry["status"] == STATUS_DONE
+        ]
+
+    def is_done(self, key):
+        """
+        Args:
+            key (str): Key of the task
+
+        Returns:
+            bool: True if the task was done
+
+        """
+        return self.entries.get(key, {}).get("status") == STATUS_DONE
+
+    def record(self, key, status, error=None):
+        """
+        Record the result of the task and save the journal.
+
+        Args:
+            key (str): Key of the task
+            status (str): STATUS_DONE or STATUS_FAILED
+            error (str): Error of the failed task
+
+        """
+        with self._lock:
+            entry = {"status": status, "time": time.time()}
+            if error:
+                entry["error"] = error
+            self.entries[key] = entry
+            self.save()
+
+    def save(self):
+        """
+        Write the journal file atomically.
+        """
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"started": self.started, "entries": self.entries}, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def clear(self):
+        """
+        Remove the journal file after the finished sweep.
+        """
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+class CleanupScheduler(object):
+    """
+    Runs the cleanup tasks on a bounded pool of workers.
+    """
+
+    def __init__(self, max_workers=defaults.CLEANUP_MAX_WORKERS, journal=None):
+        """
+        Args:
+            max_workers (int): Maximum number of tasks running at once
+            journal (CleanupJournal): Journal of the progress, the tasks done
+                according to the journal are skipped
+
+        """
+        self.max_workers = max_workers
+        self.journal = journal
+
+    def run(self, tasks):
+        """
+        Run the tasks, failure of one task doesn't stop the others.
+
+        Args:
+            tasks (dict): Functions without arguments keyed by the unique key
+                of the task, e.g. "cluster:<cluster_id>"
+
+        Returns:
+            dict: Exceptions of the failed tasks keyed by the task key
+
+        """
+        pending = {}
+        for key, task in tasks.items():
+            if self.journal and self.journal.is_done(key):
+                logger.info(f"Skipping {key}, already done according to the journal")
+                continue
+            pending[key] = task
+        failed = {}
+        if not pending:
+            return failed
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(pending)),
+            thread_name_prefix="cleanup",
+        ) as executor:
+            futures = {executor.submit(task): key for key, task in pending.items()}
+            for future in as_completed(futures):
+                key = futures[future]
+                try:
+                    future.result()
+                except Exception as ex:
+                    logger.error(f"Cleanup of {key} failed: {ex}")
+                    failed[key] = ex
+                    if self.journal:
+                        self.journal.record(key, STATUS_FAILED, str(ex))
+                else:
+                    logger.info(f"Cleanup of {key} done")
+                    if self.journal:
+                        self.journal.record(key, STATUS_DONE)
+        return failed
+
+
+def purge_bucket(bucket_name, s3_resource=None):
+    """
+    Delete all the objects and versions of the bucket and the bucket.
+
+    Args:
+        bucket_name (str): Name of the bucket
+        s3_resource (S3.ServiceResource): S3 resource to use, a new one with
+            own session is created by default (the resources are not thread
+            safe)
+
+    """
+    if s3_resource is None:
+        s3_resource = boto3.session.Session().resource("s3", config=RETRY_CONFIG)
+    bucket = s3_resource.Bucket(bucket_name)
+    try:
+        delete_all_objects_in_batches(s3_resource=s3_resource, bucket_name=bucket_name)
+        bucket.object_versions.all().delete()
+    except Exception as e:
+        logger.error(f"failed to list object in bucket {bucket_name} err:{e}")
+    bucket.delete()
@@ -0,0 +1,142 @@
+import json
+import threading
+import time
+from types import SimpleNamespace
+
+
+from ocs_ci.cleanup.aws import cleanup as aws_cleanup
+from ocs_ci.cleanup.aws.scheduler import (
+    CleanupJournal,
+    CleanupScheduler,
+    CloudInventory,
+)
+
+
+class FakeAWS:
+    """
+    Stand-in of the AWS API serving the stacks in pages of two.
+    """
+
+    def __init__(self, stack_names, instances=(), buckets=()):
+        self.stacks = [
+            {"StackName": name, "StackStatus": "CREATE_COMPLETE"}
+            for name in stack_names
+        ]
+        self.calls = []
+        self.cf_client = SimpleNamespace(get_paginator=self.get_paginator)
+        self.ec2_resource = SimpleNamespace(
+            instances=SimpleNamespace(all=lambda: self.record("instances", instances))
+        )
+        self.buckets = list(buckets)
+
+    def record(self, call, value):
+        self.calls.append(call)
+        return list(value)
+
+    def get_paginator(self, operation):
+        assert operation == "describe_stacks"
+
+        def paginate():
+            for i in range(0, len(self.stacks), 2):
+                self.calls.append("describe_stacks")
+                yield {"Stacks": self.stacks[i : i + 2]}
+
+        return SimpleNamespace(paginate=paginate)
+
+    def list_buckets(self):
+        return self.record("list_buckets", self.buckets)
+
+    def get_buckets_to_delete(self, bucket_prefix, hours, buckets=None):
+        if buckets is None:
+            buckets = self.list_buckets()
+        return [bucket["Name"] for bucket in buckets]
+
+
+def test_inventory_lookups():
+    fake = FakeAWS(
+        ["c1-ma", "c1-bs", "c1-no0", "c1-no10", "c1-no2", "c1-inf", "c12-ma"],
+        instances=[
+            SimpleNamespace(tags=[{"Key": "Name", "Value": "c1-abc-worker-0"}]),
+            SimpleNamespace(tags=[{"Key": "Name", "Value": "c2-abc-worker-0"}]),
+            SimpleNamespace(tags=None),
+        ],
+    )
+    fake.stacks.append({"StackName": "c1-sg", "StackStatus": "DELETE_COMPLETE"})
+    inventory = CloudInventory(aws=fake)
+    assert inventory.cluster_stack_names("c1", ["ma", "bs", "sg"]) == [
+        "c1-ma",
+        "c1-bs",
+    ]
+    assert inventory.worker_stack_names("c1") == ["c1-no0", "c1-no2", "c1-no10"]
+    assert inventory.cluster_stack_names("c1", ["inf", "vpc"]) == ["c1-inf"]
+    assert len(inventory.instances_by_name_prefix("c1-abc")) == 1
+    assert len(inventory.instances_by_name_prefix("c1-abc")) == 1
+    # one paginated pass of every kind
+    assert fake.calls == ["describe_stacks"] * 4 + ["instances"]
+
+
+def test_scheduler_is_bounded_and_resumable(tmp_path):
+    journal_path = str(tmp_path / "journal.json")
+    running = []
+    max_running = []
+    lock = threading.Lock()
+
+    def task(name):
+        with lock:
+            running.append(name)
+            max_running.append(len(running))
+        time.sleep(0.05)
+        with lock:
+            running.remove(name)
+        if name == "bucket-3":
+            raise RuntimeError("AccessDenied")
+
+    tasks = {
+        f"bucket:bucket-{i}": (lambda name=f"bucket-{i}": task(name)) for i in range(10)
+    }
+    failed = CleanupScheduler(max_workers=3, journal=CleanupJournal(journal_path)).run(
+        tasks
+    )
+    assert list(failed) == ["bucket:bucket-3"]
+    assert max(max_running) == 3
+    with open(journal_path) as f:
+        entries = json.load(f)["entries"]
+    assert entries["bucket:bucket-3"]["status"] == "failed"
+    assert len(entries) == 10
+
+    # the interrupted sweep resumed with the journal retries only the failure
+    max_running.clear()
+    journal = CleanupJournal(journal_path)
+    failed = CleanupScheduler(max_workers=3, journal=journal).run(tasks)
+    assert list(failed) == ["bucket:bucket-3"]
+    assert len(max_running) == 1
+
+    # the old journal is ignored
+    assert not CleanupJournal(journal_path, max_age=0).entries
+    journal.clear()
+    assert not CleanupJournal(journal_path).entries
+
+
+def test_delete_buckets_in_parallel(monkeypatch, tmp_path):
+    fake = FakeAWS([], buckets=[{"Name": f"j-{i}"} for i in range(20)])
+    purged = []
+
+    def purge_bucket(bucket_name):
+        time.sleep(0.05)
+        if bucket_name == "j-5":
+            raise RuntimeError("BucketNotEmpty")
+        purged.append(bucket_name)
+
+    monkeypatch.setattr(aws_cleanup, "purge_bucket", purge_bucket)
+    inventory = CloudInventory(aws=fake)
+    journal = CleanupJournal(str(tmp_path / "journal.json"))
+    start = time.time()
+    failed = aws_cleanup.delete_buckets(
+        {}, 100, max_workers=10, journal=journal, inventory=inventory
+    )
+    assert time.time() - start < 0.5
+    # the buckets are filtered from the inventory, listed once
+    assert fake.calls == ["list_buckets"]
+    assert failed == ["j-5"]
+    assert len(purged) == 19
+    assert len(journal.done) == 19
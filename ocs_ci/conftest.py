@@ -0,0 +1,17 @@
+import logging
+
+import pytest
+
+from ocs_ci.framework.logger_factory import set_log_record_factory
+
+
+@pytest.fixture(autouse=True)
+def log_record_factory():
+    """
+    Log records need the cluster context attribute used in the log format of
+    the unit tests, the previous factory is restored after the test.
+    """
+    factory = logging.getLogRecordFactory()
+    set_log_record_factory()
+    yield
+    logging.setLogRecordFactory(factory)
@@ -35,6 +35,11 @@ from ocs_ci.deployment.helpers.odf_deployment_helpers import (
     is_storage_system_needed,
 )
 from ocs_ci.deployment.acm import Submariner
+from ocs_ci.deployment.phase_executor import (
+    DEFAULT_MAX_WORKERS as DEFAULT_PHASES_MAX_WORKERS,
+    DeploymentPhase,
+    PhaseExecutor,
+)
 from ocs_ci.deployment.ingress_node_firewall import restrict_ssh_access_to_nodes
 from ocs_ci.deployment.helpers.lso_helpers import (
     setup_local_storage,
@@ -280,16 +285,9 @@ class Deployment(object):
         self.wait_for_subscription(
             constants.GITOPS_OPERATOR_NAME, namespace=constants.GITOPS_NAMESPACE
         )
-        logger.info("Sleeping for 120 seconds after subscribing to GitOps Operator")
-        time.sleep(120)
-        subscriptions = ocp.OCP(
-            kind=constants.SUBSCRIPTION_WITH_ACM,
-            resource_name=constants.GITOPS_OPERATOR_NAME,
-            namespace=constants.GITOPS_NAMESPACE,
-        ).get()
-        gitops_csv_name = subscriptions["status"]["currentCSV"]
-        csv = CSV(resource_name=gitops_csv_name, namespace=constants.GITOPS_NAMESPACE)
-        csv.wait_for_phase("Succeeded", timeout=720)
+        self.wait_for_subscription_csv(
+            constants.GITOPS_OPERATOR_NAME, namespace=constants.GITOPS_NAMESPACE
+        )
         logger.info("GitOps Operator Deployment Succeeded")
 
     def do_gitops_deploy(self):
@@ -560,20 +558,9 @@ class Deployment(object):
                     self.wait_for_subscription(
                         constants.OADP_OPERATOR_NAME, namespace=constants.OADP_NAMESPACE
                     )
-                    logger.info(
-                        "Sleeping for 120 seconds after subscribing to OADP Operator"
-                    )
-                    time.sleep(120)
-                    oadp_subscriptions = ocp.OCP(
-                        kind=constants.SUBSCRIPTION_WITH_ACM,
-                        resource_name=constants.OADP_OPERATOR_NAME,
-                        namespace=constants.OADP_NAMESPACE,
-                    ).get()
-                    oadp_csv_name = oadp_subscriptions["status"]["currentCSV"]
-                    csv = CSV(
-                        resource_name=oadp_csv_name, namespace=constants.OADP_NAMESPACE
+                    self.wait_for_subscription_csv(
+                        constants.OADP_OPERATOR_NAME, namespace=constants.OADP_NAMESPACE
                     )
-                    csv.wait_for_phase("Succeeded", timeout=720)
                     logger.info("OADP Operator Deployment Succeeded")
 
     def do_deploy_rdr(self):
@@ -761,18 +748,56 @@ class Deployment(object):
         if perform_lso_standalone_deployment:
             cleanup_nodes_for_lso_install()
             setup_local_storage(storageclass=constants.DEFAULT_STORAGECLASS_LSO)
-        self.do_deploy_lvmo()
-        self.do_deploy_submariner()
-        self.do_gitops_deploy()
-        self.do_deploy_oadp()
-        self.do_deploy_ocs()
-        self.do_deploy_rdr()
-        self.do_deploy_odf_provider_mode()
-        self.do_deploy_mce()
-        self.do_deploy_cnv()
-        self.do_deploy_hyperconverged()
-        self.do_deploy_metallb()
-        self.do_deploy_hosted_clusters()
+        PhaseExecutor(
+            self.get_deployment_phases(),
+            max_workers=config.DEPLOYMENT.get(
+                "deployment_phases_max_workers", DEFAULT_PHASES_MAX_WORKERS
+            ),
+        ).run()
+
+    def get_deployment_phases(self):
+        """
+        Deployment phases run after the OCP deployment with their
+        dependencies. Independent phases run concurrently.
+
+        Returns:
+            list: DeploymentPhase objects
+
+        """
+        return [
+            DeploymentPhase("lvmo", self.do_deploy_lvmo),
+            DeploymentPhase("submariner", self.do_deploy_submariner),
+            DeploymentPhase("gitops", self.do_gitops_deploy),
+            DeploymentPhase("oadp", self.do_deploy_oadp),
+            DeploymentPhase(
+                "ocs", self.do_deploy_ocs, depends_on=("lvmo", "submariner")
+            ),
+            DeploymentPhase(
+                "rdr",
+                self.do_deploy_rdr,
+                depends_on=("submariner", "gitops", "oadp", "ocs"),
+            ),
+            DeploymentPhase(
+                "odf_provider_mode",
+                self.do_deploy_odf_provider_mode,
+                depends_on=("ocs",),
+            ),
+            DeploymentPhase("mce", self.do_deploy_mce),
+            DeploymentPhase("cnv", self.do_deploy_cnv),
+            DeploymentPhase("hyperconverged", self.do_deploy_hyperconverged),
+            DeploymentPhase("metallb", self.do_deploy_metallb),
+            DeploymentPhase(
+                "hosted_clusters",
+                self.do_deploy_hosted_clusters,
+                depends_on=(
+                    "odf_provider_mode",
+                    "mce",
+                    "cnv",
+                    "hyperconverged",
+                    "metallb",
+                ),
+            ),
+        ]
 
     def get_rdr_conf(self):
         """
@@ -1085,6 +1110,36 @@ class Deployment(object):
                     return
                 logger.debug(f"Still waiting for the subscription: {subscription_name}")
 
+    def wait_for_subscription_csv(self, subscription_name, namespace, timeout=720):
+        """
+        Wait for the subscription to resolve its current CSV and for the CSV
+        to succeed, instead of sleeping for a fixed time after subscribing.
+
+        Args:
+            subscription_name (str): Name of the subscription
+            namespace (str): Namespace of the subscription
+            timeout (int): Time in seconds to wait for the CSV to succeed
+
+        Returns:
+            str: Name of the CSV
+
+        """
+        subscription = ocp.OCP(
+            kind=constants.SUBSCRIPTION_WITH_ACM,
+            resource_name=subscription_name,
+            namespace=namespace,
+        )
+        for sample in TimeoutSampler(300, 10, subscription.get, dont_raise=True):
+            csv_name = (sample or {}).get("status", {}).get("currentCSV")
+            if csv_name:
+                break
+            logger.info(
+                f"Waiting for the current CSV of subscription {subscription_name}"
+            )
+        csv = CSV(resource_name=csv_name, namespace=namespace)
+        csv.wait_for_phase("Succeeded", timeout=timeout)
+        return csv_name
+
     def wait_for_csv(self, csv_name, namespace=None):
         """
         Wait for the CSV to appear
@@ -0,0 +1,254 @@
+"""
+Dependency graph executor of the deployment phases.
+"""
+
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, wait
+from dataclasses import dataclass, field
+from typing import Callable, Optional, Tuple
+
+from tabulate import tabulate
+
+from ocs_ci.framework import ConfigContextThreadPoolExecutor, config
+from ocs_ci.utility.utils import TimeoutSampler
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 4
+
+PHASE_PASSED = "passed"
+PHASE_FAILED = "failed"
+PHASE_SKIPPED = "skipped"
+PHASE_BLOCKED = "blocked"
+
+
+@dataclass
+class DeploymentPhase:
+    """
+    Single deployment phase.
+
+    Attributes:
+        name (str): Name of the phase
+        run (callable): Function without arguments running the phase
+        depends_on (tuple): Names of the phases which have to finish first
+        enabled (callable): Function without arguments returning False when
+            the phase should be skipped, the phase is always run if not set
+        ready (callable): Readiness predicate without arguments polled after
+            the run until it returns True
+        ready_timeout (int): Max time in seconds to wait for the readiness
+        ready_sleep (int): Time in seconds between the readiness checks
+
+    """
+
+    name: str
+    run: Callable
+    depends_on: Tuple[str, ...] = ()
+    enabled: Optional[Callable] = None
+    ready: Optional[Callable] = None
+    ready_timeout: int = 600
+    ready_sleep: int = 10
+
+
+@dataclass
+class PhaseResult:
+    """
+    Result and timing of the phase.
+    """
+
+    name: str
+    status: str = PHASE_BLOCKED
+    start: Optional[float] = None
+    end: Optional[float] = None
+    ready_time: float = 0.0
+    error: Optional[BaseException] = field(default=None, repr=False)
+
+    @property
+    def duration(self):
+        """
+        float: Duration of the phase in seconds, readiness wait included
+        """
+        if self.start is None or self.end is None:
+            return 0.0
+        return self.end - self.start
+
+
+class PhaseExecutor(object):
+    """
+    Runs the deployment phases according to their dependencies.
+    """
+
+    def __init__(self, phases, max_workers=DEFAULT_MAX_WORKERS):
+        """
+        Args:
+            phases (list): DeploymentPhase objects, the order is used for the
+                phases ready at the same time
+            max_workers (int): Max number of concurrently running phases, 1
+                runs the phases one by one in the declared order
+
+        Raises:
+            ValueError: If the dependencies are unknown or cyclic
+
+        """
+        self.phases = {phase.name: phase for phase in phases}
+        self.order = [phase.name for phase in phases]
+        self.max_workers = max(1, max_workers)
+        self.results = {name: PhaseResult(name) for name in self.order}
+        self.start = None
+        self.end = None
+        self.validate()
+
+    def validate(self):
+        """
+        Check the dependency graph.
+
+        Raises:
+            ValueError: If some dependency is unknown or there is a cycle
+
+        """
+        for phase in self.phases.values():
+            unknown = set(phase.depends_on) - set(self.phases)
+            if unknown:
+                raise ValueError(
+                    f"Phase {phase.name} depends on unknown phases: "
+                    f"{', '.join(sorted(unknown))}"
+                )
+        visited = set()
+        visiting = []
+
+        def visit(name):
+            if name in visiting:
+                cycle = visiting[visiting.index(name) :] + [name]
+                raise ValueError(f"Cyclic phase dependency: {' -> '.join(cycle)}")
+            if name in visited:
+                return
+            visiting.append(name)
+            for dependency in self.phases[name].depends_on:
+                visit(dependency)
+            visiting.pop()
+            visited.add(name)
+
+        for name in self.order:
+            visit(name)
+
+    def _run_phase(self, phase):
+        result = self.results[phase.name]
+        result.start = time.time()
+        try:
+            if phase.enabled is not None and not phase.enabled():
+                result.status = PHASE_SKIPPED
+                return result
+            logger.info(f"Starting deployment phase {phase.name}")
+            phase.run()
+            if phase.ready is not None:
+                ready_start = time.time()
+                for ready in TimeoutSampler(
+                    phase.ready_timeout, phase.ready_sleep, phase.ready
+                ):
+                    if ready:
+                        break
+                    logger.info(f"Waiting for deployment phase {phase.name} readiness")
+                result.ready_time = time.time() - ready_start
+            result.status = PHASE_PASSED
+            logger.info(f"Deployment phase {phase.name} finished")
+        except BaseException as e:
+            result.status = PHASE_FAILED
+            result.error = e
+            logger.error(f"Deployment phase {phase.name} failed: {e}")
+        finally:
+            result.end = time.time()
+        return result
+
+    def _run_in_context(self, phase, config_index):
+        with config.use(config_index):
+            return self._run_phase(phase)
+
+    def _ready_phases(self, pending, finished):
+        return [
+            name
+            for name in self.order
+            if name in pending
+            and all(
+                dependency in finished for dependency in self.phases[name].depends_on
+            )
+        ]
+
+    def run(self):
+        """
+        Run all the phases.
+
+        Returns:
+            dict: Phase name: PhaseResult
+
+        Raises:
+            Exception: The error of the first failed phase
+
+        """
+        self.start = time.time()
+        config_index = config.cur_index
+        pending = list(self.order)
+        finished = set()
+        failed = []
+        running = {}
+        with ConfigContextThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="deploy-phase"
+        ) as executor:
+            while pending or running:
+                if not failed:
+                    for name in self._ready_phases(pending, finished):
+                        if len(running) >= self.max_workers:
+                            break
+                        pending.remove(name)
+                        future = executor.submit(
+                            self._run_in_context, self.phases[name], config_index
+                        )
+                        running[future] = name
+                if not running:
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    result = future.result()
+                    del running[future]
+                    if result.status == PHASE_FAILED:
+                        failed.append(result)
+                    else:
+                        finished.add(result.name)
+        self.end = time.time()
+        logger.info(f"Deployment phases timing:\n{self.format_timing()}")
+        if failed:
+            blocked = [
+                name
+                for name, result in self.results.items()
+                if result.status == PHASE_BLOCKED
+            ]
+            if blocked:
+                logger.error(f"Deployment phases not started: {', '.join(blocked)}")
+            raise failed[0].error
+        return self.results
+
+    def format_timing(self):
+        """
+        Returns:
+            str: Table with the status, start offset, duration and readiness
+                wait of every phase and the total wall time
+
+        """
+        origin = self.start or 0
+        rows = [
+            [
+                result.name,
+                result.status,
+                f"{result.start - origin:.1f}" if result.start else "",
+                f"{result.duration:.1f}",
+                f"{result.ready_time:.1f}",
+            ]
+            for result in self.results.values()
+        ]
+        total = sum(result.duration for result in self.results.values())
+        wall_time = (self.end or time.time()) - origin
+        rows.append(["total", "", "", f"{wall_time:.1f}", ""])
+        rows.append(["sum of phases", "", "", f"{total:.1f}", ""])
+        return tabulate(
+            rows,
+            headers=["phase", "status", "start [s]", "duration [s]", "ready [s]"],
+        )
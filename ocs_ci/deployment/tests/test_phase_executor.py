@@ -0,0 +1,120 @@
+import threading
+import time
+
+import pytest
+
+from ocs_ci.deployment.phase_executor import (
+    PHASE_BLOCKED,
+    PHASE_FAILED,
+    PHASE_PASSED,
+    PHASE_SKIPPED,
+    DeploymentPhase,
+    PhaseExecutor,
+)
+
+
+class Recorder:
+    def __init__(self):
+        self.events = []
+        self.lock = threading.Lock()
+
+    def phase(self, name, duration=0.0, error=None):
+        def run():
+            with self.lock:
+                self.events.append(("start", name))
+            time.sleep(duration)
+            if error:
+                raise error
+            with self.lock:
+                self.events.append(("end", name))
+
+        return run
+
+    def position(self, event, name):
+        return self.events.index((event, name))
+
+
+def test_independent_phases_run_concurrently():
+    recorder = Recorder()
+    executor = PhaseExecutor(
+        [
+            DeploymentPhase("ocs", recorder.phase("ocs", 0.3)),
+            DeploymentPhase("cnv", recorder.phase("cnv", 0.3)),
+            DeploymentPhase("metallb", recorder.phase("metallb", 0.3)),
+            DeploymentPhase(
+                "hosted_clusters",
+                recorder.phase("hosted_clusters"),
+                depends_on=("ocs", "cnv", "metallb"),
+            ),
+            DeploymentPhase("mce", recorder.phase("mce"), enabled=lambda: False),
+        ]
+    )
+    start = time.time()
+    results = executor.run()
+    assert time.time() - start < 0.8
+    for name in ("ocs", "cnv", "metallb"):
+        assert recorder.position("end", name) < recorder.position(
+            "start", "hosted_clusters"
+        )
+        assert results[name].status == PHASE_PASSED
+    assert results["mce"].status == PHASE_SKIPPED
+    assert "sum of phases" in executor.format_timing()
+
+
+def test_single_worker_keeps_declared_order():
+    recorder = Recorder()
+    names = ["lvmo", "submariner", "ocs", "rdr"]
+    PhaseExecutor(
+        [
+            DeploymentPhase("lvmo", recorder.phase("lvmo")),
+            DeploymentPhase("submariner", recorder.phase("submariner")),
+            DeploymentPhase("ocs", recorder.phase("ocs"), depends_on=("lvmo",)),
+            DeploymentPhase("rdr", recorder.phase("rdr"), depends_on=("ocs",)),
+        ],
+        max_workers=1,
+    ).run()
+    assert [name for event, name in recorder.events if event == "start"] == names
+
+
+def test_failed_phase_stops_deployment():
+    recorder = Recorder()
+    executor = PhaseExecutor(
+        [
+            DeploymentPhase("ocs", recorder.phase("ocs", error=ValueError("boom"))),
+            DeploymentPhase("oadp", recorder.phase("oadp", 0.2)),
+            DeploymentPhase("rdr", recorder.phase("rdr"), depends_on=("ocs", "oadp")),
+        ]
+    )
+    with pytest.raises(ValueError, match="boom"):
+        executor.run()
+    assert executor.results["ocs"].status == PHASE_FAILED
+    # the running phase was allowed to finish
+    assert executor.results["oadp"].status == PHASE_PASSED
+    assert executor.results["rdr"].status == PHASE_BLOCKED
+
+
+def test_readiness_predicate():
+    checks = []
+
+    def ready():
+        checks.append(time.time())
+        return len(checks) >= 2
+
+    executor = PhaseExecutor(
+        [DeploymentPhase("cnv", lambda: None, ready=ready, ready_sleep=0.1)]
+    )
+    executor.run()
+    assert len(checks) == 2
+    assert executor.results["cnv"].ready_time > 0
+
+
+def test_invalid_graph():
+    with pytest.raises(ValueError, match="unknown"):
+        PhaseExecutor([DeploymentPhase("rdr", None, depends_on=("ocs",))])
+    with pytest.raises(ValueError, match="ocs -> rdr -> ocs"):
+        PhaseExecutor(
+            [
+                DeploymentPhase("ocs", None, depends_on=("rdr",)),
+                DeploymentPhase("rdr", None, depends_on=("ocs",)),
+            ]
+        )
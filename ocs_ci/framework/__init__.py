@@ -13,10 +13,12 @@ import os
 import yaml
 import logging
 from collections.abc import Mapping
-from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar, copy_context
 from dataclasses import dataclass, field, fields
 from ocs_ci.ocs.exceptions import ClusterNotFoundException
-from threading import Thread, RLock, local, get_ident
+from threading import Thread, RLock, get_ident
 
 THIS_DIR = os.path.dirname(os.path.abspath(__file__))
 DEFAULT_CONFIG_PATH = os.path.join(THIS_DIR, "conf/default_config.yaml")
@@ -25,6 +27,12 @@ logger = logging.getLogger(__name__)
 
 config_lock = RLock()
 
+# Cluster config index bound to the current thread or asyncio task, None when
+# the global MultiClusterConfig.cur_index is used. Context variables are
+# inherited by asyncio tasks and by the tasks submitted via
+# ConfigContextThreadPoolExecutor.
+cluster_index_ctx = ContextVar("cluster_index_ctx", default=None)
+
 
 @dataclass
 class Config:
@@ -139,7 +147,6 @@ class MultiClusterConfig:
     # multiple cluster contexts
     def __init__(self):
         # Holds all cluster's Config() object
-        self.thread_local_data = local()
         self.clusters = list()
         # This member always points to current cluster's Config() object
         self.nclusters = 1
@@ -156,16 +163,65 @@ class MultiClusterConfig:
         self._single_cluster_init_cluster_configs()
 
     def __getattr__(self, attr):
-        with config_lock:
-            config_index = getattr(
-                self.thread_local_data, "config_index", self.cur_index
-            )
-            return getattr(self.clusters[config_index], attr)
+        if attr in ("_cur_index", "clusters"):
+            # not initialized yet (e.g. during copy), avoid infinite recursion
+            raise AttributeError(attr)
+        return getattr(self.cluster_ctx, attr)
+
+    @property
+    def cur_index(self):
+        """
+        Index of the cluster in context. It is the index bound to the current
+        thread or asyncio task by :meth:`use` if any, the global index otherwise.
+        """
+        config_index = cluster_index_ctx.get()
+        return self._cur_index if config_index is None else config_index
+
+    @cur_index.setter
+    def cur_index(self, index):
+        if self.is_context_bound:
+            # thread or task with its own cluster context never changes the
+            # global context used by the others
+            cluster_index_ctx.set(index)
+        else:
+            self._cur_index = index
+
+    @property
+    def is_context_bound(self):
+        """
+        bool: True if the current thread or task has its own cluster context
+        """
+        return cluster_index_ctx.get() is not None
 
     @property
     def cluster_ctx(self):
-        config_index = getattr(self.thread_local_data, "config_index", self.cur_index)
-        return self.clusters[config_index]
+        return self.clusters[self.cur_index]
+
+    @contextmanager
+    def use(self, index):
+        """
+        Bind the cluster config index to the current thread or asyncio task for
+        the duration of the with block, without touching the global cur_index.
+        Calls of switch_ctx inside the block only change the bound index.
+
+        Usage:
+            with config.use(index):
+                pod_objs = get_all_pods(namespace)
+
+        Args:
+            index (int): The cluster config index
+
+        Yields:
+            Config: Config object of the cluster
+
+        """
+        if index < 0 or index >= len(self.clusters):
+            raise ClusterNotFoundException(f"Cluster with index {index} not found")
+        token = cluster_index_ctx.set(index)
+        try:
+            yield self.clusters[index]
+        finally:
+            cluster_index_ctx.reset(token)
 
     @property
     def default_cluster_ctx(self):
@@ -217,10 +273,9 @@ class MultiClusterConfig:
 
     def switch_ctx(self, index=0):
         self.cur_index = index
-        if hasattr(self.thread_local_data, "config_index"):
+        if self.is_context_bound:
             thread_id = get_ident()
             logger.info(f"Thread ID: {thread_id} is using config index: {index}")
-            config.thread_local_data.config_index = index
         # Log the switch after changing the current index
         logger.info(f"Switched to cluster: {self.current_cluster_name()}")
 
@@ -617,8 +672,7 @@ class ConfigSafeThread(Thread):
     This ConfigSafeThread prevents a situation where one thread changes its context of config and modifies other
     running thread (e.g. main thread of framework) config context.
     The instance of ConfigSafeThread will define config index which will be used by all the calls in
-    the thread. It uses config.thread_local_data with specific Thread ID and config ID to be used by the thread
-    for its life cycle.
+    the thread. It binds the config index to the thread via config.use() for its life cycle.
     """
 
     def __init__(self, config_index, *args, **kwargs):
@@ -633,16 +687,12 @@ class ConfigSafeThread(Thread):
             self.config_index = config_index
 
     def run(self, *args, **kwargs):
-        config.thread_local_data.config_index = self.config_index
         thread_id = get_ident()
         logger.info(
             f"Thread ID: {thread_id} is using config index: {self.config_index}"
         )
-        try:
+        with config.use(self.config_index):
             super(ConfigSafeThread, self).run()
-        finally:
-            if hasattr(self.thread_local_data, "config_index"):
-                del config.thread_local_data.config_index
 
 
 def config_safe_thread_pool_task(config_index, task, *args, **kwargs):
@@ -654,16 +704,21 @@ def config_safe_thread_pool_task(config_index, task, *args, **kwargs):
         task (function): function to be called by ThreadPoolExecutor
 
     """
-    with config_lock:
-        thread_id = get_ident()
-        logger.info(f"Thread ID: {thread_id} is using config index: {config_index}")
-        config.thread_local_data.config_index = config_index
-
-    try:
+    thread_id = get_ident()
+    logger.info(f"Thread ID: {thread_id} is using config index: {config_index}")
+    with config.use(config_index):
         return task(*args, **kwargs)
-    finally:
-        with config_lock:
-            del config.thread_local_data.config_index
+
+
+class ConfigContextThreadPoolExecutor(ThreadPoolExecutor):
+    """
+    ThreadPoolExecutor which runs every submitted task in a copy of the
+    submitter's context, so the task inherits the cluster context bound by
+    config.use() (or the global one) at the time of submit.
+    """
+
+    def submit(self, fn, /, *args, **kwargs):
+        return super().submit(copy_context().run, fn, *args, **kwargs)
 
 
 class GlobalVariables:
@@ -0,0 +1,203 @@
+"""
+Collection time evaluation of the cluster dependent skip markers.
+"""
+
+import logging
+from functools import cached_property
+
+from ocs_ci.framework import config
+from ocs_ci.ocs import constants
+from ocs_ci.utility.utils import (
+    get_running_ocp_version,
+    skipif_ocp_version,
+    skipif_ocs_version,
+    skipif_ui_not_support,
+    skipif_upgraded_from,
+)
+
+log = logging.getLogger(__name__)
+
+# value of the facts which can't be resolved before the cluster is installed
+NOT_INSTALLED = "not installed"
+
+
+class ClusterFacts(object):
+    """
+    Lazily resolved and memoized facts about the cluster under test.
+    """
+
+    @cached_property
+    def ocp_version(self):
+        """
+        str: Running OCP version, eg. '4.16'
+        """
+        return get_running_ocp_version()
+
+    @cached_property
+    def upgraded_from(self):
+        """
+        str: The 'replaces' field of the OCS CSV, empty string if the cluster
+            was not upgraded or the CSV can't be fetched
+        """
+        from ocs_ci.ocs.resources.ocs import get_ocs_csv
+
+        try:
+            return get_ocs_csv().get().get("spec").get("replaces", "") or ""
+        except Exception as err:
+            log.error(f"Failed to get the OCS CSV: {err}")
+            return ""
+
+    @cached_property
+    def kms_enabled(self):
+        """
+        bool: True if cluster wide encryption with KMS is configured, None
+            if the StorageCluster can't be fetched, NOT_INSTALLED if the
+            cluster is not installed yet
+        """
+        from ocs_ci.utility.kms import is_kms_enabled
+
+        try:
+            return is_kms_enabled(dont_raise=True)
+        except KeyError:
+            log.warning("Cluster is not yet installed. Skipping skipif_no_kms check.")
+            return NOT_INSTALLED
+
+    @cached_property
+    def lvm_installed(self):
+        """
+        bool: True if LVM is installed on the cluster
+        """
+        return config.RUN.get("lvm", False)
+
+    @cached_property
+    def ui_locators(self):
+        """
+        dict: UI locators of the current OCP version
+        """
+        from ocs_ci.ocs.ui.views import locators_for_current_ocp_version
+
+        return locators_for_current_ocp_version()
+
+    @cached_property
+    def platform(self):
+        """
+        str: Lower case name of the platform
+        """
+        return config.ENV_DATA.get("platform", "").lower()
+
+
+class SkipMarkerEvaluator(object):
+    """
+    Decides which collected tests have to be removed because of the skip
+    markers, the decision of every distinct marker expression is memoized.
+    """
+
+    def __init__(self, facts=None):
+        """
+        Args:
+            facts (ClusterFacts): Facts about the cluster, new lazily resolved
+                facts are used if not provided
+
+        """
+        self.facts = facts or ClusterFacts()
+        self.decisions = {}
+        self.checks = (
+            ("skipif_lvm_not_installed", self._lvm_not_installed),
+            ("skipif_ocp_version", self._ocp_version),
+            ("skipif_ocs_version", self._ocs_version),
+            ("skipif_upgraded_from", self._upgraded_from),
+            ("skipif_no_kms", self._no_kms),
+            ("skipif_ui_not_support", self._ui_not_support),
+        )
+
+    def _lvm_not_installed(self, args):
+        if not self.facts.lvm_installed:
+            return "lvm not installed"
+
+    def _ocp_version(self, args):
+        if skipif_ocp_version(args[0], ocp_version=self.facts.ocp_version):
+            return f"OCP {args}"
+
+    def _ocs_version(self, args):
+        if skipif_ocs_version(args[0]):
+            return f"{args}"
+
+    def _upgraded_from(self, args):
+        if self.facts.platform in constants.HCI_PROVIDER_CLIENT_PLATFORMS:
+            return None
+        if skipif_upgraded_from(args[0], prev_version=self.facts.upgraded_from):
+            return f"the OCS cluster is upgraded from one of these versions: {args[0]}"
+
+    def _no_kms(self, args):
+        kms_enabled = self.facts.kms_enabled
+        if kms_enabled != NOT_INSTALLED and not kms_enabled:
+            return "the OCS cluster has not configured cluster-wide encryption with KMS"
+
+    def _ui_not_support(self, args):
+        if skipif_ui_not_support(args[0], locators=self.facts.ui_locators):
+            return f"UI test {args} is not available"
+
+    def evaluate(self, marker_name, args, check):
+        """
+        Evaluate the marker expression, every distinct expression is evaluated
+        only once.
+
+        Args:
+            marker_name (str): Name of the marker
+            args (tuple): Arguments of the marker
+            check (callable): Function returning the skip reason for the args
+
+        Returns:
+            str: Reason of the skip, None if the test should not be skipped
+
+        """
+        key = (marker_name, repr(args))
+        if key not in self.decisions:
+            self.decisions[key] = check(args)
+        return self.decisions[key]
+
+    def skip_reason(self, item):
+        """
+        Args:
+            item (pytest.Item): Collected test
+
+        Returns:
+            str: Reason why the test should be removed, None if it should run
+
+        """
+        for marker_name, check in self.checks:
+            marker = item.get_closest_marker(marker_name)
+            if marker is None:
+                continue
+            reason = self.evaluate(marker_name, marker.args, check)
+            if reason:
+                return reason
+        return None
+
+    def filter_items(self, items):
+        """
+        Remove the tests which should be skipped from the items in one pass.
+
+        Args:
+            items (list): Collected tests, modified in place
+
+        Returns:
+            list: Removed tests
+
+        """
+        kept = []
+        removed = []
+        for item in items:
+            reason = self.skip_reason(item)
+            if reason:
+                log.debug(f"Test: {item} will be skipped due to {reason}")
+                removed.append(item)
+            else:
+                kept.append(item)
+        items[:] = kept
+        if removed:
+            log.info(
+                f"{len(removed)} tests removed by skip markers, "
+                f"{len(self.decisions)} distinct marker expressions evaluated"
+            )
+        return removed
@@ -0,0 +1,107 @@
+from functools import cached_property
+
+import pytest
+
+from ocs_ci.framework import config
+from ocs_ci.framework.pytest_customization.collection_facts import (
+    ClusterFacts,
+    SkipMarkerEvaluator,
+)
+from ocs_ci.utility import kms
+
+
+class FakeItem:
+    def __init__(self, name, **markers):
+        self.name = name
+        self.markers = {
+            marker_name: getattr(pytest.mark, marker_name)(*args).mark
+            for marker_name, args in markers.items()
+        }
+
+    def get_closest_marker(self, name):
+        return self.markers.get(name)
+
+    def __repr__(self):
+        return self.name
+
+
+class CountingFacts(ClusterFacts):
+    def __init__(self):
+        self.resolved = []
+
+    @cached_property
+    def ocp_version(self):
+        self.resolved.append("ocp_version")
+        return "4.16"
+
+    @cached_property
+    def upgraded_from(self):
+        self.resolved.append("upgraded_from")
+        return "ocs-operator.v4.15.2"
+
+    @cached_property
+    def kms_enabled(self):
+        self.resolved.append("kms_enabled")
+        return False
+
+    lvm_installed = True
+    platform = "aws"
+
+
+def test_filter_items_evaluates_every_expression_once():
+    facts = CountingFacts()
+    evaluator = SkipMarkerEvaluator(facts)
+    items = [FakeItem(f"ocp_{i}", skipif_ocp_version=("<4.16",)) for i in range(3)] + [
+        FakeItem("plain"),
+        FakeItem("lvm", skipif_lvm_not_installed=()),
+        FakeItem("new_ocp", skipif_ocp_version=(">=4.17",)),
+        FakeItem("upgraded", skipif_upgraded_from=(["4.15"],)),
+        # removed by both markers, must be removed only once
+        FakeItem("kms", skipif_upgraded_from=(["4.15"],), skipif_no_kms=()),
+        FakeItem("no_kms", skipif_no_kms=()),
+    ]
+    removed = evaluator.filter_items(items)
+    assert [item.name for item in items] == [
+        "ocp_0",
+        "ocp_1",
+        "ocp_2",
+        "plain",
+        "lvm",
+        "new_ocp",
+    ]
+    assert [item.name for item in removed] == ["upgraded", "kms", "no_kms"]
+    # the same expression is evaluated and the facts resolved only once
+    assert facts.resolved == ["ocp_version", "upgraded_from", "kms_enabled"]
+    assert len(evaluator.decisions) == 5
+
+
+def test_facts_are_resolved_lazily(monkeypatch):
+    monkeypatch.setitem(config.RUN, "lvm", False)
+    facts = ClusterFacts()
+    items = [FakeItem("lvm", skipif_lvm_not_installed=()), FakeItem("plain")]
+    SkipMarkerEvaluator(facts).filter_items(items)
+    assert [item.name for item in items] == ["plain"]
+    assert "lvm_installed" in vars(facts)
+    assert "ocp_version" not in vars(facts)
+
+
+@pytest.mark.parametrize(
+    "kms_enabled, removed",
+    [
+        (True, False),
+        (False, True),
+        # the StorageCluster can't be fetched
+        (None, True),
+        (KeyError("ENV_DATA"), False),
+    ],
+)
+def test_no_kms_marker(monkeypatch, kms_enabled, removed):
+    def is_kms_enabled(dont_raise=False):
+        if isinstance(kms_enabled, Exception):
+            raise kms_enabled
+        return kms_enabled
+
+    monkeypatch.setattr(kms, "is_kms_enabled", is_kms_enabled)
+    items = [FakeItem("kms", skipif_no_kms=())]
+    SkipMarkerEvaluator(ClusterFacts()).filter_items(items)
+    assert (not items) == removed
@@ -1,4 +1,6 @@
 # -*- coding: utf-8 -*-
+import asyncio
+
 from pytest import fixture
 
 from ocs_ci import framework
@@ -100,6 +102,57 @@ class TestConfig(object):
             )
         framework.config.reset_ctx()
 
+    def init_named_clusters(self, count=3):
+        framework.config.nclusters = count
+        framework.config.init_cluster_configs()
+        for i in range(count):
+            framework.config.clusters[i].ENV_DATA["cluster_name"] = f"cluster{i}"
+        framework.config.reset_ctx()
+
+    def test_multicluster_ctx_use(self):
+        self.init_named_clusters()
+        with framework.config.use(1) as cluster_config:
+            assert cluster_config is framework.config.clusters[1]
+            assert framework.config.cur_index == 1
+            assert framework.config.ENV_DATA["cluster_name"] == "cluster1"
+            # switch inside bound context doesn't touch the global context
+            framework.config.switch_ctx(2)
+            assert framework.config.current_cluster_name() == "cluster2"
+            assert framework.config._cur_index == 0
+        assert framework.config.cur_index == 0
+        assert framework.config.current_cluster_name() == "cluster0"
+
+    def test_multicluster_ctx_propagation(self):
+        self.init_named_clusters()
+
+        def cluster_name():
+            return framework.config.current_cluster_name()
+
+        async def cluster_name_async():
+            await asyncio.sleep(0)
+            return cluster_name()
+
+        with framework.ConfigContextThreadPoolExecutor(max_workers=2) as executor:
+            with framework.config.use(2):
+                future = executor.submit(cluster_name)
+                assert asyncio.run(cluster_name_async()) == "cluster2"
+            assert future.result() == "cluster2"
+            assert executor.submit(cluster_name).result() == "cluster0"
+
+    def test_multicluster_config_safe_thread(self):
+        self.init_named_clusters()
+        names = []
+
+        def switch_and_get_name():
+            framework.config.switch_ctx(2)
+            names.append(framework.config.current_cluster_name())
+
+        thread = framework.ConfigSafeThread(1, target=switch_and_get_name)
+        thread.start()
+        thread.join()
+        assert names == ["cluster2"]
+        assert framework.config.cur_index == 0
+
 
 class TestMergeDict:
     def test_merge_dict(self):
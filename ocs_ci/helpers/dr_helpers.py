@@ -12,6 +12,7 @@ from ocs_ci.framework import config
 from ocs_ci.ocs import constants, ocp
 from ocs_ci.ocs.cluster import is_hci_cluster
 from ocs_ci.ocs.defaults import RBD_NAME
+from ocs_ci.ocs.dr.status_watcher import DRStatusWatcher
 from ocs_ci.ocs.exceptions import (
     TimeoutExpiredError,
     UnexpectedBehaviour,
@@ -20,7 +21,11 @@ from ocs_ci.ocs.exceptions import (
 )
 from ocs_ci.ocs.ocp import OCP
 from ocs_ci.ocs.resources.drpc import DRPC
-from ocs_ci.ocs.resources.pod import get_all_pods, get_ceph_tools_pod
+from ocs_ci.ocs.resources.backend_volumes import (
+    BackendVolumeInventory,
+    get_backend_volumes,
+)
+from ocs_ci.ocs.resources.pod import get_all_pods
 from ocs_ci.ocs.resources.pv import get_all_pvs
 from ocs_ci.ocs.resources.pvc import get_all_pvc_objs
 from ocs_ci.ocs.node import gracefully_reboot_nodes, get_node_objs
@@ -34,6 +39,7 @@ from ocs_ci.ocs.utils import (
     get_all_acm_indexes,
 )
 from ocs_ci.utility import version, templating
+from ocs_ci.utility.multicluster import run_on_clusters
 from ocs_ci.utility.retry import retry
 
 from ocs_ci.utility.utils import (
@@ -432,7 +438,7 @@ def check_mirroring_status_ok(
 def wait_for_mirroring_status_ok(replaying_images=None, timeout=600):
     """
     Wait for mirroring status to reach health OK and expected number of replaying
-    images for each of the ODF cluster
+    images for each of the ODF cluster. The clusters are checked in parallel.
 
     Args:
         replaying_images (int): Expected number of images in replaying state
@@ -445,28 +451,14 @@ def wait_for_mirroring_status_ok(replaying_images=None, timeout=600):
         TimeoutExpiredError: In case of unexpected mirroring status
 
     """
-    restore_index = config.cur_index
-    for cluster in get_non_acm_cluster_config():
-        config.switch_ctx(cluster.MULTICLUSTER["multicluster_index"])
-        logger.info(
-            f"Validating mirroring status on cluster {cluster.ENV_DATA['cluster_name']}"
-        )
-        sample = TimeoutSampler(
-            timeout=timeout,
-            sleep=5,
-            func=check_mirroring_status_ok,
-            replaying_images=replaying_images,
-        )
-        if not sample.wait_for_func_status(result=True):
-            error_msg = (
-                "The mirroring status does not have expected values within the time"
-                f" limit on cluster {cluster.ENV_DATA['cluster_name']}"
-            )
-            logger.error(error_msg)
-            raise TimeoutExpiredError(error_msg)
-
-    config.switch_ctx(restore_index)
-    return True
+    logger.info("Validating mirroring status on all the managed clusters")
+    watcher = DRStatusWatcher(sleep=5)
+    watcher.watch_managed_clusters(
+        "mirroring status",
+        check_mirroring_status_ok,
+        replaying_images=replaying_images,
+    )
+    return watcher.wait(timeout)
 
 
 @retry(ValueError, tries=10)
@@ -1018,6 +1010,71 @@ def wait_for_all_resources_deletion(
             sample.wait_for_func_value(0)
 
 
+def wait_for_all_resources_on_clusters(
+    workloads,
+    primary_cluster_name,
+    secondary_cluster_name,
+    creation_timeout=None,
+    deletion_timeout=None,
+):
+    """
+    Wait after failover or relocate for the workload and replication resources
+    of all the workloads to be created on the new primary cluster and deleted
+    on the old primary cluster. Both clusters are checked at once, the wait
+    is finished when the slower cluster converged.
+
+    Args:
+        workloads (list): Workload objects with workload_namespace,
+            workload_pvc_count and workload_pod_count
+        primary_cluster_name (str): Name of the cluster where the workloads run
+            after the action (failoverCluster or preferredCluster)
+        secondary_cluster_name (str): Name of the cluster where the workloads
+            ran before the action
+        creation_timeout (int): time in seconds to wait for the resources of
+            one workload to be created, the default of
+            wait_for_all_resources_creation if not provided
+        deletion_timeout (int): time in seconds to wait for the resources of
+            one workload to be deleted, the default of
+            wait_for_all_resources_deletion if not provided
+
+    Raises:
+        Exception: The first error of the wait on any of the clusters, after
+            both clusters finished
+
+    """
+    primary_index = config.get_cluster_index_by_name(primary_cluster_name)
+    secondary_index = config.get_cluster_index_by_name(secondary_cluster_name)
+    creation_kwargs = {"timeout": creation_timeout} if creation_timeout else {}
+    deletion_kwargs = {"timeout": deletion_timeout} if deletion_timeout else {}
+
+    def wait_for_resources(cluster_ctx):
+        for wl in workloads:
+            if cluster_ctx.index == primary_index:
+                wait_for_all_resources_creation(
+                    wl.workload_pvc_count,
+                    wl.workload_pod_count,
+                    wl.workload_namespace,
+                    **creation_kwargs,
+                )
+            else:
+                wait_for_all_resources_deletion(
+                    wl.workload_namespace, **deletion_kwargs
+                )
+
+    results = run_on_clusters(
+        wait_for_resources, indexes=[secondary_index, primary_index]
+    )
+    for result in results.values():
+        if not result.ok:
+            logger.error(
+                f"Resources didn't converge on cluster {result.cluster_name}: "
+                f"{result.error}"
+            )
+    for result in results.values():
+        if not result.ok:
+            raise result.error
+
+
 def wait_for_cnv_workload(
     vm_name, namespace, phase=constants.STATUS_RUNNING, timeout=600
 ):
@@ -1094,6 +1151,9 @@ def get_backend_volumes_for_pvcs(namespace):
     """
     Gets list of RBD images or CephFS subvolumes associated with the PVCs in the given namespace
 
+    The backend volumes are read from one PV listing per managed cluster, the
+    clusters are listed in parallel.
+
     Args:
         namespace (str): The namespace of the PVC resources
 
@@ -1101,60 +1161,50 @@ def get_backend_volumes_for_pvcs(namespace):
         list: List of RBD images or CephFS subvolumes
 
     """
-    backend_volumes = []
-    for cluster in get_non_acm_cluster_config():
-        config.switch_ctx(cluster.MULTICLUSTER["multicluster_index"])
-        logger.info(f"Fetching backend volume names for PVCs in namespace: {namespace}")
-        all_pvcs = get_all_pvc_objs(namespace=namespace)
-        for pvc_obj in all_pvcs:
-            if pvc_obj.name.startswith("volsync"):
-                continue
+    logger.info(f"Fetching backend volume names for PVCs in namespace: {namespace}")
+    results = run_on_clusters(
+        lambda cluster_ctx: get_backend_volumes(namespace),
+        indexes=[
+            cluster.MULTICLUSTER["multicluster_index"]
+            for cluster in get_non_acm_cluster_config()
+        ],
+    )
+    backend_volumes = set()
+    for result in results.values():
+        if not result.ok:
+            raise result.error
+        backend_volumes.update(result.value.values())
 
-            if pvc_obj.backed_sc in [
-                constants.DEFAULT_STORAGECLASS_RBD,
-                constants.DEFAULT_EXTERNAL_MODE_STORAGECLASS_RBD,
-                constants.DEFAULT_CNV_CEPH_RBD_SC,
-            ]:
-                backend_volume = pvc_obj.get_rbd_image_name
-            elif pvc_obj.backed_sc in [
-                constants.DEFAULT_STORAGECLASS_CEPHFS,
-                constants.DEFAULT_EXTERNAL_MODE_STORAGECLASS_CEPHFS,
-            ]:
-                backend_volume = pvc_obj.get_cephfs_subvolume_name
-
-            backend_volumes.append(backend_volume)
-
-    backend_volumes = list(set(backend_volumes))
+    backend_volumes = list(backend_volumes)
     logger.info(f"Found {len(backend_volumes)} backend volumes: {backend_volumes}")
     return backend_volumes
 
 
-def verify_backend_volume_deletion(
-    backend_volumes,
+def get_backend_volume_inventory(
     cephblockpoolradosns=None,
     cephfssubvolumegroup=None,
     storageclient_uid=None,
 ):
     """
-    Check whether RBD images/CephFS subvolumes are deleted in the backend.
+    Get the inventory of the RBD images and CephFS subvolumes of the current
+    cluster in the pool, rados namespace and subvolume group used by the DR
+    workloads.
 
     Args:
-        backend_volumes (list): List of RBD images or CephFS subvolumes
         cephblockpoolradosns (str): The name of the cephblockpoolradosnamespace
         cephfssubvolumegroup (str): The name of the cephfilesystemsubvolumegroup
         storageclient_uid(string): The uid of the storageclient in the client cluster where the application is running.
             Applicable for provider - client configuration.
 
     Returns:
-        bool: True if volumes are deleted and False if volumes are not deleted
+        BackendVolumeInventory: The inventory
 
     Raises:
         NotFoundError: If the configuration is provider mode and the name of the cephblockpoolradosnamespace
             is not obtained
+
     """
     ocs_version = version.get_semantic_ocs_version_from_config()
-
-    ct_pod = get_ceph_tools_pod()
     rbd_pool_name = (
         (config.ENV_DATA.get("rbd_name") or RBD_NAME)
         if config.DEPLOYMENT["external_mode"]
@@ -1176,7 +1226,6 @@ def verify_backend_volume_deletion(
 
         if not cephbpradosns:
             raise NotFoundError("Could not identify the cephblockpoolradosnamespace")
-        namespace_param = f"--namespace {cephbpradosns}"
 
         subvolumegroup = (
             config.ENV_DATA.get("subvolumegroup_name", False) or cephfssubvolumegroup
@@ -1189,28 +1238,50 @@ def verify_backend_volume_deletion(
         if not subvolumegroup:
             raise NotFoundError("Couldn't identify the cephfilesystemsubvolumegroup")
     else:
-        namespace_param = ""
+        cephbpradosns = None
         subvolumegroup = "csi"
 
-    rbd_images = ct_pod.exec_cmd_on_pod(
-        f"rbd ls {rbd_pool_name} {namespace_param} --format json"
+    return BackendVolumeInventory(
+        rbd_pool=rbd_pool_name,
+        rados_namespace=cephbpradosns,
+        subvolumegroup=subvolumegroup,
     )
 
-    fs_name = ct_pod.exec_ceph_cmd("ceph fs ls")[0]["name"]
-    cephfs_cmd_output = ct_pod.exec_cmd_on_pod(
-        f"ceph fs subvolume ls {fs_name} --group_name {subvolumegroup}"
-    )
-    cephfs_subvolumes = [subvolume["name"] for subvolume in cephfs_cmd_output]
-
-    ceph_volumes = rbd_images + cephfs_subvolumes
-    logger.info(f"All backend volumes present in the cluster: {ceph_volumes}")
-    not_deleted_volumes = []
-    for backend_volume in backend_volumes:
-        if backend_volume in ceph_volumes:
-            not_deleted_volumes.append(backend_volume)
+
+def verify_backend_volume_deletion(
+    backend_volumes,
+    cephblockpoolradosns=None,
+    cephfssubvolumegroup=None,
+    storageclient_uid=None,
+    inventory=None,
+):
+    """
+    Check whether RBD images/CephFS subvolumes are deleted in the backend.
+
+    Args:
+        backend_volumes (list): List of RBD images or CephFS subvolumes
+        cephblockpoolradosns (str): The name of the cephblockpoolradosnamespace
+        cephfssubvolumegroup (str): The name of the cephfilesystemsubvolumegroup
+        storageclient_uid(string): The uid of the storageclient in the client cluster where the application is running.
+            Applicable for provider - client configuration.
+        inventory (BackendVolumeInventory): Inventory of the backend volumes
+            to refresh, a new one is created for the current cluster by default
+
+    Returns:
+        bool: True if volumes are deleted and False if volumes are not deleted
+
+    Raises:
+        NotFoundError: If the configuration is provider mode and the name of the cephblockpoolradosnamespace
+            is not obtained
+    """
+    if inventory is None:
+        inventory = get_backend_volume_inventory(
+            cephblockpoolradosns, cephfssubvolumegroup, storageclient_uid
+        )
+    not_deleted_volumes = inventory.existing(backend_volumes, refresh=True)
     if not_deleted_volumes:
         logger.info(
-            f"The following backend volumes were not deleted: {not_deleted_volumes}"
+            f"The following backend volumes were not deleted: {sorted(not_deleted_volumes)}"
         )
 
     return len(not_deleted_volumes) == 0
@@ -1232,6 +1303,7 @@ def wait_for_backend_volume_deletion(backend_volumes, timeout=600):
         sleep=10,
         func=verify_backend_volume_deletion,
         backend_volumes=backend_volumes,
+        inventory=get_backend_volume_inventory(),
     )
     if not sample.wait_for_func_status(result=True):
         error_msg = "Backend RBD images or CephFS subvolumes were not deleted"
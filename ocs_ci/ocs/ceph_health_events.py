@@ -0,0 +1,424 @@
+"""
+Event stream of the Ceph health check transitions.
+"""
+
+import logging
+import re
+import subprocess
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from ocs_ci.framework import config
+from ocs_ci.ocs.exceptions import CommandFailed, CephToolBoxNotFoundException
+
+log = logging.getLogger(__name__)
+
+HEALTH_OK = "HEALTH_OK"
+HEALTH_WARN = "HEALTH_WARN"
+HEALTH_ERR = "HEALTH_ERR"
+# cluster log level to health severity
+LEVEL_SEVERITY = {"WRN": HEALTH_WARN, "ERR": HEALTH_ERR}
+SEVERITY_ORDER = {HEALTH_OK: 0, HEALTH_WARN: 1, HEALTH_ERR: 2}
+
+# kinds of the health events
+CHECK_FAILED = "failed"
+CHECK_UPDATED = "updated"
+CHECK_CLEARED = "cleared"
+CLUSTER_HEALTHY = "healthy"
+OVERALL_STATUS = "overall"
+
+CLUSTER_LOG_REGEX = re.compile(
+    r"^(?P<stamp>\d{4}-\d\d-\d\d[T ]\S+)\s+(?P<who>\S+)"
+    r".*?\[(?P<level>DBG|INF|WRN|ERR|SEC)\]\s+(?P<message>.*?)\s*$"
+)
+MESSAGE_REGEXES = (
+    (
+        CHECK_FAILED,
+        re.compile(r"^Health check failed: (?P<summary>.*) \((?P<check>[A-Z0-9_]+)\)$"),
+    ),
+    (
+        CHECK_UPDATED,
+        re.compile(r"^Health check update: (?P<summary>.*) \((?P<check>[A-Z0-9_]+)\)$"),
+    ),
+    (
+        CHECK_CLEARED,
+        re.compile(
+            r"^Health check cleared: (?P<check>[A-Z0-9_]+) \(was: (?P<summary>.*)\)$"
+        ),
+    ),
+    (CLUSTER_HEALTHY, re.compile(r"^Cluster is now healthy$")),
+    (OVERALL_STATUS, re.compile(r"^overall (?P<status>HEALTH_[A-Z]+)(?P<summary>.*)$")),
+)
+
+
+@dataclass
+class HealthEvent:
+    """
+    Single health check transition.
+
+    Attributes:
+        timestamp (float): Local time when the event was received
+        kind (str): One of CHECK_FAILED, CHECK_UPDATED, CHECK_CLEARED,
+            CLUSTER_HEALTHY and OVERALL_STATUS
+        check (str): Name of the health check, e.g. "OSD_DOWN"
+        severity (str): HEALTH_WARN or HEALTH_ERR of the failed or updated
+            check, the status of the overall events, None otherwise
+        summary (str): Summary message of the health check
+        cluster_time (str): Time stamp of the cluster log line
+        source (str): "stream" for the `ceph -w` events, "resync" for the
+            events derived from `ceph status` after (re)connect
+
+    """
+
+    timestamp: float
+    kind: str
+    check: Optional[str] = None
+    severity: Optional[str] = None
+    summary: str = ""
+    cluster_time: str = ""
+    source: str = "stream"
+
+    def __str__(self):
+        return " ".join(
+            str(part)
+            for part in (
+                self.cluster_time
+                or time.strftime("%H:%M:%S", time.gmtime(self.timestamp)),
+                self.kind,
+                self.severity,
+                self.check,
+                self.summary,
+            )
+            if part
+        )
+
+
+def parse_cluster_log_line(line, timestamp=None):
+    """
+    Parse health event from the cluster log line printed by `ceph -w`.
+
+    Args:
+        line (str): The cluster log line
+        timestamp (float): Time when the line was received, now by default
+
+    Returns:
+        HealthEvent: The event, None if the line is not a health transition
+
+    """
+    match = CLUSTER_LOG_REGEX.match(line.strip())
+    if not match:
+        return None
+    for kind, regex in MESSAGE_REGEXES:
+        message_match = regex.match(match.group("message"))
+        if not message_match:
+            continue
+        groups = message_match.groupdict()
+        if kind == OVERALL_STATUS:
+            severity = groups["status"]
+        elif kind in (CHECK_FAILED, CHECK_UPDATED):
+            severity = LEVEL_SEVERITY.get(match.group("level"), HEALTH_WARN)
+        else:
+            severity = None
+        return HealthEvent(
+            timestamp=timestamp if timestamp is not None else time.time(),
+            kind=kind,
+            check=groups.get("check"),
+            severity=severity,
+            summary=groups.get("summary", "").strip(" :"),
+            cluster_time=match.group("stamp"),
+        )
+    return None
+
+
+class CephHealthEventStream(threading.Thread):
+    """
+    Background thread following `ceph -w` in the tools pod and recording the
+    health check transitions. Can be used as a context manager.
+    """
+
+    def __init__(self, namespace=None, reconnect_delay=5, resync=True):
+        """
+        Args:
+            namespace (str): Namespace of the tools pod, the cluster namespace
+                by default
+            reconnect_delay (float): Seconds to wait before reconnecting the
+                broken stream
+            resync (bool): True to resync the active health checks from
+                `ceph status` on every (re)connect
+
+        """
+        super().__init__(daemon=True, name="ceph-health-events")
+        self.namespace = namespace or config.ENV_DATA["cluster_namespace"]
+        self.reconnect_delay = reconnect_delay
+        self.resync_enabled = resync
+        self.cluster_index = config.cur_index
+        self.events = []
+        # check name: the latest failed or updated event of the active checks
+        self.active_checks = {}
+        self.connects = 0
+        self._subscribers = []
+        self._condition = threading.Condition()
+        self._stop_event = threading.Event()
+        self._proc = None
+
+    def subscribe(self, callback):
+        """
+        Call the callback with every new HealthEvent. The callback is called
+        from the stream thread, it should not block.
+
+        Args:
+            callback (callable): Function getting the HealthEvent
+
+        """
+        self._subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        """
+        Args:
+            callback (callable): Callback registered by subscribe()
+
+        """
+        self._subscribers.remove(callback)
+
+    def handle(self, event):
+        """
+        Record the event, update the active checks and notify subscribers.
+
+        Args:
+            event (HealthEvent): The event
+
+        """
+        with self._condition:
+            self.events.append(event)
+            if event.kind in (CHECK_FAILED, CHECK_UPDATED):
+                self.active_checks[event.check] = event
+            elif event.kind == CHECK_CLEARED:
+                self.active_checks.pop(event.check, None)
+            elif event.kind == CLUSTER_HEALTHY or event.severity == HEALTH_OK:
+                self.active_checks.clear()
+            self._condition.notify_all()
+        log.info(f"Ceph health event: {event}")
+        for callback in list(self._subscribers):
+            try:
+                callback(event)
+            except Exception as e:
+                log.exception(f"Ceph health event subscriber failed: {e}")
+
+    def feed(self, line):
+        """
+        Process one line of the `ceph -w` output.
+
+        Args:
+            line (str): The output line
+
+        Returns:
+            HealthEvent: The event, None if the line is not a health transition
+
+        """
+        event = parse_cluster_log_line(line)
+        if event:
+            self.handle(event)
+        return event
+
+    def resync(self, health):
+        """
+        Record the differences between the known active checks and the
+        health reported by the cluster as events.
+
+        Args:
+            health (dict): "health" section of the `ceph status` output
+
+        """
+        now = time.time()
+        checks = health.get("checks", {})
+        for name in set(self.active_checks) - set(checks):
+            self.handle(HealthEvent(now, CHECK_CLEARED, check=name, source="resync"))
+        for name, check in checks.items():
+            known = self.active_checks.get(name)
+            severity = check.get("severity", HEALTH_WARN)
+            summary = check.get("summary", {}).get("message", "")
+            if known and (known.severity, known.summary) == (severity, summary):
+                continue
+            self.handle(
+                HealthEvent(
+                    now,
+                    CHECK_UPDATED if known else CHECK_FAILED,
+                    check=name,
+                    severity=severity,
+                    summary=summary,
+                    source="resync",
+                )
+            )
+
+    def _resync_from_cluster(self):
+        # Import here to avoid circular loop
+        from ocs_ci.ocs.ceph_snapshot import get_ceph_snapshot
+
+        try:
+            snapshot = get_ceph_snapshot(namespace=self.namespace, max_age=0)
+        except CommandFailed as e:
+            log.warning(f"Failed to resync the Ceph health: {e}")
+            return
+        self.resync(snapshot.status["health"])
+
+    def _stream_command(self):
+        # Import here to avoid circular loop
+        from ocs_ci.ocs.resources.pod import get_ceph_tools_pod
+
+        try:
+            ct_pod = get_ceph_tools_pod(namespace=self.namespace)
+        except (AssertionError, CephToolBoxNotFoundException) as ex:
+            raise CommandFailed(ex)
+        return [
+            "oc",
+            "--kubeconfig",
+            config.RUN["kubeconfig"],
+            "-n",
+            self.namespace,
+            "exec",
+            ct_pod.name,
+            "--",
+            "ceph",
+            "-w",
+        ]
+
+    def _follow(self):
+        cmd = self._stream_command()
+        log.info(f"Following Ceph health events: {' '.join(cmd)}")
+        self._proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            errors="replace",
+        )
+        try:
+            for line in self._proc.stdout:
+                if self._stop_event.is_set():
+                    break
+                self.feed(line)
+        finally:
+            if self._proc.poll() is None:
+                self._proc.kill()
+            self._proc.wait()
+
+    def run(self):
+        with config.use(self.cluster_index):
+            while not self._stop_event.is_set():
+                self.connects += 1
+                if self.resync_enabled:
+                    self._resync_from_cluster()
+                try:
+                    self._follow()
+                except CommandFailed as e:
+                    log.warning(f"Can't follow Ceph health events: {e}")
+                except Exception as e:
+                    # keep following, e.g. on transient connection errors
+                    log.warning(f"Unexpected error following Ceph health events: {e}")
+                if self._stop_event.wait(self.reconnect_delay):
+                    break
+                log.warning("Ceph health event stream ended, reconnecting")
+        log.info("Ceph health event stream stopped")
+
+    def stop(self):
+        """
+        Stop following the events and wait for the thread to finish.
+        """
+        self._stop_event.set()
+        proc = self._proc
+        if proc is not None and proc.poll() is None:
+            proc.terminate()
+        if self.is_alive():
+            self.join(timeout=self.reconnect_delay + 60)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exception_type, value, traceback):
+        self.stop()
+
+    @property
+    def health_status(self):
+        """
+        str: Health status derived from the active checks, e.g. "HEALTH_WARN"
+        """
+        with self._condition:
+            severities = [event.severity for event in self.active_checks.values()]
+        return max([HEALTH_OK] + severities, key=lambda s: SEVERITY_ORDER.get(s, 1))
+
+    @property
+    def health(self):
+        """
+        str: Health in `ceph health` format, e.g. "HEALTH_WARN 1 osds down"
+        """
+        with self._condition:
+            summaries = [event.summary for event in self.active_checks.values()]
+        status = self.health_status
+        return f"{status} {'; '.join(summaries)}" if summaries else status
+
+    def events_of(self, check=None, severity=None, kind=None, since=None):
+        """
+        Get the recorded events matching all the given filters.
+
+        Args:
+            check (str): Name of the health check
+            severity (str): HEALTH_WARN or HEALTH_ERR
+            kind (str): Kind of the event, e.g. CHECK_FAILED
+            since (float): Keep only events received at this time or later
+
+        Returns:
+            list: The matching HealthEvent objects, oldest first
+
+        """
+        with self._condition:
+            events = list(self.events)
+        return [
+            event
+            for event in events
+            if (check is None or event.check == check)
+            and (severity is None or event.severity == severity)
+            and (kind is None or event.kind == kind)
+            and (since is None or event.timestamp >= since)
+        ]
+
+    def errors(self, since=None):
+        """
+        Args:
+            since (float): Keep only events received at this time or later
+
+        Returns:
+            list: HEALTH_ERR events
+
+        """
+        return self.events_of(severity=HEALTH_ERR, since=since)
+
+    def wait_for_event(self, predicate, timeout=300, since=None):
+        """
+        Wait for the event matching the predicate.
+
+        Args:
+            predicate (callable): Function getting HealthEvent and returning
+                True for the wanted one
+            timeout (float): Max time to wait in seconds
+            since (float): Consider also the events already received at this
+                time or later, only the new events by default
+
+        Returns:
+            HealthEvent: The matching event, None on timeout
+
+        """
+        deadline = time.time() + timeout
+        with self._condition:
+            position = 0 if since is not None else len(self.events)
+            while True:
+                for event in self.events[position:]:
+                    if (since is None or event.timestamp >= since) and predicate(event):
+                        return event
+                position = len(self.events)
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    return None
+                self._condition.wait(remaining)
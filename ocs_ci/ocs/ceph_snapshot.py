@@ -0,0 +1,367 @@
+"""
+Cached snapshots of the Ceph cluster state.
+"""
+
+import json
+import logging
+import threading
+import time
+
+from ocs_ci.framework import config
+from ocs_ci.ocs.exceptions import CommandFailed, CephToolBoxNotFoundException
+
+log = logging.getLogger(__name__)
+
+# default max age of the snapshot in seconds
+DEFAULT_SNAPSHOT_TTL = 10
+SECTION_SEPARATOR = "---ocs-ci-ceph-snapshot---"
+
+# sections of the combined command, the osdmap ones are fetched only when
+# the osdmap epoch differs from the cached one
+VOLATILE_SECTIONS = ("status", "df")
+OSDMAP_SECTIONS = ("osd_tree", "osd_dump")
+SECTION_COMMANDS = {
+    "status": "ceph status -f json",
+    "df": "ceph df -f json",
+    "osd_tree": "ceph osd tree -f json",
+    "osd_dump": "ceph osd dump -f json",
+}
+
+
+def build_snapshot_command(known_epoch=None):
+    """
+    Build the shell command fetching all the snapshot sections at once.
+
+    The command prints the sections separated by SECTION_SEPARATOR lines:
+    status, df, osdmap epoch and, only when the epoch is not known_epoch,
+    the osd tree and osd dump. Double quotes are not used, as the command is
+    passed to ``bash -c "..."``.
+
+    Args:
+        known_epoch (int): osdmap epoch of the cached osdmap sections
+
+    Returns:
+        str: The shell command
+
+    """
+    separator = f"; echo {SECTION_SEPARATOR}; "
+    parts = [SECTION_COMMANDS[section] for section in VOLATILE_SECTIONS]
+    # compact json of osd stat contains "epoch":<number>
+    parts.append(
+        "e=$(ceph osd stat -f json | grep -o 'epoch.:[0-9]*' | cut -d: -f2); echo $e"
+    )
+    osdmap = "".join(
+        f"echo {SECTION_SEPARATOR}; {SECTION_COMMANDS[section]}; "
+        for section in OSDMAP_SECTIONS
+    )
+    return f"{separator.join(parts)}; if [ x$e != x{known_epoch} ]; then {osdmap}fi"
+
+
+def parse_snapshot_output(output):
+    """
+    Parse the output of the command built by build_snapshot_command.
+
+    Args:
+        output (str): Output of the command
+
+    Returns:
+        dict: Parsed sections, osdmap sections are missing when they were
+            not fetched, "osdmap_epoch" is None when it was not found
+
+    Raises:
+        CommandFailed: If some of the sections can't be parsed
+
+    """
+    chunks = [chunk.strip() for chunk in output.split(SECTION_SEPARATOR)]
+    names = VOLATILE_SECTIONS + ("osdmap_epoch",) + OSDMAP_SECTIONS
+    if len(chunks) not in (len(names), len(names) - len(OSDMAP_SECTIONS)):
+        raise CommandFailed(
+            f"Unexpected output of the ceph snapshot command: {output[:1000]}"
+        )
+    sections = {}
+    for name, chunk in zip(names, chunks):
+        if name == "osdmap_epoch":
+            sections[name] = int(chunk) if chunk.isdigit() else None
+            continue
+        try:
+            sections[name] = json.loads(chunk)
+        except ValueError as e:
+            raise CommandFailed(
+                f"Failed to parse {SECTION_COMMANDS[name]} output: {e}, "
+                f"output: {chunk[:1000]}"
+            )
+    return sections
+
+
+class CephSnapshot(object):
+    """
+    State of the Ceph cluster at one moment, typed view of the `ceph status`,
+    `ceph df`, `ceph osd tree` and `ceph osd dump` outputs.
+    """
+
+    def __init__(self, status, df, osd_tree, osd_dump, osdmap_epoch=None):
+        """
+        Args:
+            status (dict): `ceph status` output
+            df (dict): `ceph df` output
+            osd_tree (dict): `ceph osd tree` output
+            osd_dump (dict): `ceph osd dump` output
+            osdmap_epoch (int): Epoch of the osdmap of osd_tree and osd_dump
+
+        """
+        self.status = status
+        self.df = df
+        self.osd_tree = osd_tree
+        self.osd_dump = osd_dump
+        self.osdmap_epoch = (
+            osdmap_epoch if osdmap_epoch is not None else osd_dump.get("epoch")
+        )
+        self.timestamp = time.time()
+
+    @property
+    def age(self):
+        """
+        float: Seconds since the snapshot was taken
+        """
+        return time.time() - self.timestamp
+
+    @property
+    def health_status(self):
+        """
+        str: Health status, e.g. "HEALTH_OK"
+        """
+        return self.status["health"]["status"]
+
+    @property
+    def is_health_ok(self):
+        """
+        bool: True if the health status is HEALTH_OK
+        """
+        return self.health_status == "HEALTH_OK"
+
+    @property
+    def health(self):
+        """
+        str: Health in `ceph health` format, e.g.
+            "HEALTH_WARN 1 osds down; Degraded data redundancy: ..."
+        """
+        checks = self.status["health"].get("checks", {})
+        messages = [
+            check.get("summary", {}).get("message", name)
+            for name, check in checks.items()
+        ]
+        if not messages:
+            return self.health_status
+        return f"{self.health_status} {'; '.join(messages)}"
+
+    @property
+    def epochs(self):
+        """
+        dict: Epochs of the cluster maps, e.g. {"osdmap": 45, "monmap": 3}
+        """
+        epochs = {"osdmap": self.osdmap_epoch}
+        for name in ("monmap", "fsmap", "mgrmap"):
+            epoch = self.status.get(name, {}).get("epoch")
+            if epoch is not None:
+                epochs[name] = epoch
+        return epochs
+
+    @property
+    def osd_nodes(self):
+        """
+        list: "osd" type nodes of the osd tree
+        """
+        return [node for node in self.osd_tree["nodes"] if node["type"] == "osd"]
+
+    @property
+    def num_osds(self):
+        """
+        int: Number of the osds in the osdmap
+        """
+        return len(self.osd_dump["osds"])
+
+    @property
+    def num_up_osds(self):
+        """
+        int: Number of the up osds
+        """
+        return sum(1 for osd in self.osd_dump["osds"] if osd["up"])
+
+    @property
+    def num_in_osds(self):
+        """
+        int: Number of the in osds
+        """
+        return sum(1 for osd in self.osd_dump["osds"] if osd["in"])
+
+    @property
+    def pools(self):
+        """
+        dict: Pool name to pool info from the osd dump
+        """
+        return {pool["pool_name"]: pool for pool in self.osd_dump["pools"]}
+
+    @property
+    def total_bytes(self):
+        """
+        int: Raw capacity of the cluster in bytes
+        """
+        return int(self.df["stats"]["total_bytes"])
+
+    @property
+    def total_used_bytes(self):
+        """
+        int: Raw used capacity of the cluster in bytes
+        """
+        return int(self.df["stats"]["total_used_raw_bytes"])
+
+
+class CephSnapshotCache(object):
+    """
+    Cache of the CephSnapshot of one cluster.
+    """
+
+    def __init__(self, namespace=None, ttl=DEFAULT_SNAPSHOT_TTL):
+        """
+        Args:
+            namespace (str): Namespace of the tools pod, the cluster namespace
+                by default
+            ttl (float): Default max age of the snapshot in seconds
+
+        """
+        self.namespace = namespace or config.ENV_DATA["cluster_namespace"]
+        self.ttl = ttl
+        self.snapshot = None
+        self.fetch_count = 0
+        self._lock = threading.Lock()
+
+    def _exec(self, command):
+        # Import here to avoid circular loop
+        from ocs_ci.ocs.resources.pod import get_ceph_tools_pod
+
+        try:
+            ct_pod = get_ceph_tools_pod(namespace=self.namespace)
+        except (AssertionError, CephToolBoxNotFoundException) as ex:
+            raise CommandFailed(ex)
+        return ct_pod.exec_sh_cmd_on_pod(command, timeout=180)
+
+    def refresh(self):
+        """
+        Fetch new snapshot from the cluster, the osd tree and osd dump are
+        reused from the previous snapshot if the osdmap epoch did not change.
+
+        Returns:
+            CephSnapshot: The new snapshot
+
+        Raises:
+            CommandFailed: If the snapshot can't be fetched
+
+        """
+        with self._lock:
+            previous = self.snapshot
+            known_epoch = previous.osdmap_epoch if previous else None
+            sections = parse_snapshot_output(
+                self._exec(build_snapshot_command(known_epoch))
+            )
+            self.fetch_count += 1
+            if "osd_dump" not in sections:
+                if previous is None or sections["osdmap_epoch"] != known_epoch:
+                    raise CommandFailed(
+                        "The osd tree and dump are missing in the ceph snapshot"
+                    )
+                log.debug(f"osdmap epoch {known_epoch} did not change")
+                sections["osd_tree"] = previous.osd_tree
+                sections["osd_dump"] = previous.osd_dump
+            self.snapshot = CephSnapshot(**sections)
+            return self.snapshot
+
+    def get(self, max_age=None):
+        """
+        Get the snapshot, the cached one if it is not older than max_age.
+
+        Args:
+            max_age (float): Max age of the snapshot in seconds, the cache
+                TTL by default, 0 to always fetch the current state
+
+        Returns:
+            CephSnapshot: The snapshot
+
+        """
+        max_age = self.ttl if max_age is None else max_age
+        snapshot = self.snapshot
+        if snapshot is not None and snapshot.age <= max_age:
+            return snapshot
+        return self.refresh()
+
+    def invalidate(self):
+        """
+        Make the next get() fetch the state from the cluster, the osdmap
+        sections are still reused while the osdmap epoch does not change.
+        """
+        snapshot = self.snapshot
+        if snapshot is not None:
+            # expire, but keep the osdmap sections for the epoch comparison
+            snapshot.timestamp = float("-inf")
+
+
+_caches = {}
+_caches_lock = threading.Lock()
+
+
+def get_ceph_snapshot_cache(namespace=None):
+    """
+    Get the snapshot cache of the current cluster.
+
+    Args:
+        namespace (str): Namespace of the tools pod, the cluster namespace
+            by default
+
+    Returns:
+        CephSnapshotCache: The cache
+
+    """
+    namespace = namespace or config.ENV_DATA["cluster_namespace"]
+    key = (config.cur_index, namespace)
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = CephSnapshotCache(namespace)
+            _caches[key] = cache
+        return cache
+
+
+def get_ceph_snapshot(namespace=None, max_age=None):
+    """
+    Get the Ceph state snapshot of the current cluster.
+
+    Args:
+        namespace (str): Namespace of the tools pod, the cluster namespace
+            by default
+        max_age (float): Max age of the snapshot in seconds, the cache TTL
+            by default, 0 to always fetch the current state
+
+    Returns:
+        CephSnapshot: The snapshot
+
+    """
+    return get_ceph_snapshot_cache(namespace).get(max_age=max_age)
+
+
+def invalidate_ceph_snapshot(namespace=None):
+    """
+    Invalidate the cached snapshots of the current cluster.
+
+    Args:
+        namespace (str): Namespace of the tools pod, all the namespaces of the
+            current cluster by default
+
+    """
+    with _caches_lock:
+        caches = [
+            cache
+            for (index, cache_namespace), cache in _caches.items()
+            if index == config.cur_index
+            and (namespace is None or cache_namespace == namespace)
+        ]
+    for cache in caches:
+        cache.invalidate()
@@ -10,19 +10,25 @@ import base64
 import json
 import logging
 import random
-import threading
 import yaml
 import time
 import os
 import pandas as pd
 import re
 import math
+import threading
 
 from datetime import datetime
 from semantic_version import Version
 from ocs_ci.utility.decorators import enable_high_recovery_during_rebalance_flag
 
 from ocs_ci.ocs.utils import thread_init_class
+from ocs_ci.ocs.ceph_health_events import HEALTH_ERR, CephHealthEventStream
+from ocs_ci.ocs.ceph_snapshot import (
+    DEFAULT_SNAPSHOT_TTL,
+    get_ceph_snapshot,
+    invalidate_ceph_snapshot,
+)
 
 import ocs_ci.ocs.resources.pod as pod
 from ocs_ci.ocs.exceptions import (
@@ -228,6 +234,8 @@ class CephCluster(object):
         self.noobaas = pod.get_noobaa_pods(self.noobaa_selector, self.namespace)
         self.rgws = pod.get_rgw_pods()
         self.toolbox = pod.get_ceph_tools_pod()
+        # the cluster was probably changed, cached Ceph state is not valid
+        invalidate_ceph_snapshot(self.namespace)
 
         # set port attrib on mon pods
         self.mons = list(map(self.set_port, self.mons))
@@ -607,6 +615,21 @@ class CephCluster(object):
         self.used_space = used_in_gb
         raise UnexpectedBehaviour("In Rados df, Used size is varying")
 
+    def get_ceph_snapshot(self, max_age=None):
+        """
+        Get the Ceph state snapshot (status, df, osd tree and osd dump) of
+        the cluster, the cached one if it is not older than max_age.
+
+        Args:
+            max_age (float): Max age of the cached snapshot in seconds, the
+                cache TTL by default, 0 to always query the cluster
+
+        Returns:
+            CephSnapshot: The snapshot
+
+        """
+        return get_ceph_snapshot(namespace=self.namespace, max_age=max_age)
+
     def get_ceph_health(self, detail=False):
         """
         Exec `ceph health` cmd on tools pod and return the status of the ceph
@@ -1073,11 +1096,13 @@ class MulticlusterCephHealthMonitor(object):
         pass
 
 
-class CephHealthMonitor(threading.Thread):
+class CephHealthMonitor(CephHealthEventStream):
     """
     Context manager class for monitoring ceph health status of CephCluster.
-    If CephCluster will get to HEALTH_ERROR state it will save the ceph status
-    to health_error_status variable and will stop monitoring.
+    The health check transitions are followed by the `ceph -w` event stream,
+    so also short HEALTH_ERR states are detected. If CephCluster gets to
+    HEALTH_ERR state it will save the ceph status to health_error_status
+    variable and the context manager will raise CephHealthException on exit.
 
     """
 
@@ -1087,7 +1112,8 @@ class CephHealthMonitor(threading.Thread):
 
         Args:
             ceph_cluster (CephCluster): Reference to CephCluster object.
-            sleep (int): Number of seconds to sleep between health checks.
+            sleep (int): Number of seconds to wait before reconnecting the
+                health event stream.
 
         """
         if isinstance(ceph_cluster, CephClusterMultiCluster):
@@ -1097,16 +1123,51 @@ class CephHealthMonitor(threading.Thread):
         self.health_error_status = None
         self.health_monitor_enabled = False
         self.latest_health_status = None
-        super(CephHealthMonitor, self).__init__()
+        self.error_status_thread = None
+        super(CephHealthMonitor, self).__init__(
+            namespace=ceph_cluster.namespace, reconnect_delay=sleep
+        )
+        self.subscribe(self.on_health_event)
+
+    def on_health_event(self, event):
+        """
+        Keep the latest health and save the ceph status on first HEALTH_ERR.
+        The ceph status is fetched in its own thread, the callback runs on
+        the stream thread and must not block reading of the events.
+
+        Args:
+            event (HealthEvent): The health event
+
+        """
+        self.latest_health_status = self.health
+        if event.severity == HEALTH_ERR and self.error_status_thread is None:
+            self.error_status_thread = threading.Thread(
+                target=self.save_error_status,
+                args=(event,),
+                daemon=True,
+                name="ceph-health-error-status",
+            )
+            self.error_status_thread.start()
+
+    def save_error_status(self, event):
+        """
+        Save the ceph status of the cluster in HEALTH_ERR state.
+
+        Args:
+            event (HealthEvent): The HEALTH_ERR event, saved instead of the
+                ceph status if the status can't be fetched
+
+        """
+        try:
+            self.health_error_status = self.ceph_cluster.get_ceph_status()
+        except exceptions.CommandFailed as e:
+            logger.warning(f"Failed to get ceph status: {e}")
+            self.health_error_status = str(event)
+        self.log_error_status()
 
     def run(self):
         self.health_monitor_enabled = True
-        while self.health_monitor_enabled and (not self.health_error_status):
-            time.sleep(self.sleep)
-            self.latest_health_status = self.ceph_cluster.get_ceph_health(detail=True)
-            if "HEALTH_ERROR" in self.latest_health_status:
-                self.health_error_status = self.ceph_cluster.get_ceph_status()
-                self.log_error_status()
+        super(CephHealthMonitor, self).run()
 
     def __enter__(self):
         self.start()
@@ -1117,21 +1178,25 @@ class CephHealthMonitor(threading.Thread):
 
         Raises:
             CephHealthException: If no other exception occurred during
-                execution of context manager and HEALTH_ERROR is detected
+                execution of context manager and HEALTH_ERR is detected
                 during the monitoring.
             exception_type: In case of exception raised during processing of
                 the context manager.
 
         """
         self.health_monitor_enabled = False
+        self.stop()
+        if self.error_status_thread is not None:
+            self.error_status_thread.join()
         if self.health_error_status:
             self.log_error_status()
         if exception_type:
             raise exception_type.with_traceback(value, traceback)
         if self.health_error_status:
             raise exceptions.CephHealthException(
-                f"During monitoring of Ceph health status hit HEALTH_ERROR: "
-                f"{self.health_error_status}"
+                f"During monitoring of Ceph health status hit HEALTH_ERR: "
+                f"{self.health_error_status}, health events: "
+                f"{'; '.join(str(event) for event in self.errors())}"
             )
 
         return True
@@ -2069,12 +2134,16 @@ def check_osds_in_hosts_are_up(osd_tree):
     return True
 
 
-def check_ceph_osd_tree():
+def check_ceph_osd_tree(max_age=0):
     """
     Checks whether an OSD tree is created/modified correctly.
     It is a summary of the previous functions: 'check_osd_tree_1az_vmware',
     'check_osd_tree_3az_cloud', 'check_osd_tree_1az_cloud'.
 
+    Args:
+        max_age (float): Max age in seconds of the cached Ceph state the osd
+            tree is taken from, 0 to always query the cluster
+
     Returns:
          bool: True, if the ceph osd tree is formed correctly. Else False
 
@@ -2083,8 +2152,7 @@ def check_ceph_osd_tree():
     number_of_osds = len(osd_pods)
     # 'ceph osd tree' should show the new osds under right nodes/hosts
     #  Verification is different for 3 AZ and 1 AZ configs
-    ct_pod = pod.get_ceph_tools_pod()
-    tree_output = ct_pod.exec_ceph_cmd(ceph_cmd="ceph osd tree")
+    tree_output = get_ceph_snapshot(max_age=max_age).osd_tree
     if config.ENV_DATA["platform"].lower() == constants.VSPHERE_PLATFORM:
         if is_flexible_scaling_enabled():
             return check_osd_tree_1az_vmware_flex(tree_output, number_of_osds)
@@ -2113,9 +2181,9 @@ def check_ceph_osd_tree_after_node_replacement():
         and all the OSD's are up. Else False
 
     """
-    ct_pod = pod.get_ceph_tools_pod()
-    osd_tree = ct_pod.exec_ceph_cmd(ceph_cmd="ceph osd tree")
-    if not check_ceph_osd_tree():
+    osd_tree = get_ceph_snapshot(max_age=0).osd_tree
+    # check the tree of the snapshot taken above
+    if not check_ceph_osd_tree(max_age=DEFAULT_SNAPSHOT_TTL):
         logger.warning("Incorrect ceph osd tree formation found")
         return False
 
@@ -2444,10 +2512,9 @@ def get_osd_dump(pool_name):
         dict: pool information from osd dump
 
     """
-    osd_dump_dict = pod.get_ceph_tools_pod().exec_ceph_cmd("ceph osd dump")
-    for pool in osd_dump_dict["pools"]:
-        if pool["pool_name"] == pool_name:
-            return pool
+    pool = get_ceph_snapshot(max_age=0).pools.get(pool_name)
+    if pool is not None:
+        return pool
     assert False, "Failed to get the pool information from osd dump"
 
 
@@ -3327,9 +3394,8 @@ def get_full_ratio_from_osd_dump():
     Returns:
         float: full ratio value
     """
-    ct_pod = pod.get_ceph_tools_pod()
     logger.info("Checking the values of ceph osd full ratios in osd map")
-    osd_dump_dict = ct_pod.exec_ceph_cmd("ceph osd dump")
+    osd_dump_dict = get_ceph_snapshot(max_age=0).osd_dump
     return float(osd_dump_dict["full_ratio"])
 
 
@@ -3,13 +3,13 @@ A module for cluster load related functionalities
 
 """
 
+import json
 import logging
+import math
 import time
 from datetime import datetime
 from uuid import uuid4
-import math
 
-from range_key_dict import RangeKeyDict
 from yaml.scanner import ScannerError
 
 from ocs_ci.utility.retry import retry
@@ -27,6 +27,14 @@ logger = logging.getLogger(__name__)
 cluster_load_thread = None
 cluster_load_error = None
 
+# FIO 'rate' of the pods created while searching for the cluster limit, large
+# enough for the IO to be limited by the cluster and not by FIO
+PROBE_RATE = "250M"
+# Boundaries of per pod FIO 'rate' (in KiB/s) set by the load controller, below
+# the minimum FIO pods are removed, above the maximum FIO pods are added
+MIN_POD_RATE_KB = 1024
+MAX_POD_RATE_KB = 250 * 1024
+
 
 def wrap_msg(msg):
     """
@@ -44,6 +52,164 @@ def wrap_msg(msg):
     return f"\n{marks}\n{msg}\n{marks}"
 
 
+def get_fio_block_size(args):
+    """
+    Get FIO block size from the FIO command line arguments
+
+    Args:
+        args (list): FIO arguments (e.g. ['--bs=128K', ...])
+
+    Returns:
+        int: The block size in bytes, 4KiB in case it is not set
+
+    """
+    units = {"K": 2**10, "M": 2**20, "G": 2**30}
+    for arg in args:
+        if arg.startswith("--bs="):
+            value = arg.split("=", 1)[1].upper().rstrip("IB")
+            if value[-1] in units:
+                return int(float(value[:-1]) * units[value[-1]])
+            return int(value)
+    return 4 * 2**10
+
+
+def fio_rate(rate_kb):
+    """
+    Format rate in KiB/s as FIO 'rate' value
+
+    Args:
+        rate_kb (float): The rate in KiB/s
+
+    Returns:
+        str: FIO 'rate' value (e.g. '2048K')
+
+    """
+    return f"{max(1, int(round(rate_kb)))}K"
+
+
+def proportional_rate(rate, measured, target, gain=1.0, max_step=2.0):
+    """
+    Calculate the next per pod rate of the load controller, proportionally
+    to the relative error between the measured and the target IOPS
+
+    Args:
+        rate (float): The current per pod rate
+        measured (float): The measured cluster IOPS
+        target (float): The target cluster IOPS
+        gain (float): The proportional gain, 1 for correcting the whole error
+            in one step
+        max_step (float): The maximal factor the rate can change by in one step
+
+    Returns:
+        float: The next per pod rate
+
+    """
+    if measured <= 0:
+        return rate * max_step
+    factor = 1 + gain * (target / measured - 1)
+    factor = min(max(factor, 1 / max_step), max_step)
+    return rate * factor
+
+
+class LoadCurve:
+    """
+    IOPS/latency curve of the cluster, sampled with every FIO pod added
+    while searching for the cluster limit
+
+    """
+
+    def __init__(self, baseline_iops=None):
+        """
+        Initializer for LoadCurve
+
+        Args:
+            baseline_iops (float): IOPS of the cluster before adding FIO pods
+
+        """
+        self.points = list()
+        self.previous_iops = baseline_iops
+        self.low_diff_counter = 0
+
+    @property
+    def latencies(self):
+        """
+        list: Latency values (ms) of all the points
+        """
+        return [latency for _, _, latency in self.points]
+
+    @property
+    def limit(self):
+        """
+        float: The highest IOPS reached, None if there are no points
+        """
+        return max((iops for _, iops, _ in self.points), default=None)
+
+    @property
+    def iops_diff(self):
+        """
+        float: IOPS difference (%) of the last point from the previous one
+        """
+        if not self.points or not self.previous_iops:
+            return math.inf
+        return (self.points[-1][1] / self.previous_iops * 100) - 100
+
+    def add(self, pods, iops, latency):
+        """
+        Add a point to the curve
+
+        Args:
+            pods (int): Number of FIO pods
+            iops (float): The cluster IOPS
+            latency (float): The cluster latency in ms
+
+        """
+        if self.points:
+            self.previous_iops = self.points[-1][1]
+        self.points.append((pods, iops, latency))
+        self.low_diff_counter += 1 if -15 < self.iops_diff < 10 else 0
+
+    def limit_reason(self):
+        """
+        Check whether the curve shows that the cluster limit has been reached
+
+        Returns:
+            str: The reason the limit is considered as reached, None if the
+                limit has not been reached yet
+
+        """
+        latency_vals = self.latencies
+        if not latency_vals:
+            return None
+        latency = latency_vals[-1]
+        if len(latency_vals) > 1 and latency > 250:
+            # Checking for an exponential growth. In case the latest latency sample
+            # value is more than 128 times the first latency value sample, we can conclude
+            # that the cluster limit in terms of IOPS, has been reached.
+            # See https://blog.docbert.org/vdbench-curve/ for more details.
+            # In other cases, when the first latency sample value is greater than 3 ms,
+            # the multiplication factor we check according to, is lower, in order to
+            # determine the cluster load faster.
+            if latency > latency_vals[0] * 2**7 or (
+                3 < latency_vals[0] < 50 and len(latency_vals) > 5
+            ):
+                return "The cluster limit was determined by latency growth"
+        # In case the latency is greater than 2 seconds,
+        # most chances the limit has been reached
+        elif latency > 2000:
+            return f"The limit was determined by the high latency - {latency} ms"
+        # For clusters that their nodes do not meet the minimum
+        # resource requirements, the cluster limit is being reached
+        # while the latency remains low. For that, the cluster limit
+        # needs to be determined by the following condition of IOPS
+        # diff between FIO pod creation iterations
+        elif self.low_diff_counter > 3:
+            return (
+                "Limit was determined by low IOPS diff between "
+                f"iterations - {self.iops_diff:.2f}%"
+            )
+        return None
+
+
 class ClusterLoad:
     """
     A class for cluster load functionalities
@@ -89,57 +255,108 @@ class ClusterLoad:
             self.pvc_size = 10
         self.sleep_time = 45
         self.target_pods_number = None
+        self.load_change_time = None
         if project_factory:
             project_name = f"{defaults.BG_LOAD_NAMESPACE}-{uuid4().hex[:5]}"
             self.project = project_factory(project_name=project_name)
 
-    def increase_load(self, rate, wait=True):
+    @staticmethod
+    def get_fio_template_args():
         """
-        Create a PVC, a service account and a DeploymentConfig of FIO pod
+        Get the FIO arguments of the FIO Deployment template
 
-        Args:
-            rate (str): FIO 'rate' value (e.g. '20M')
-            wait (bool): True for waiting for IO to kick in on the
-                newly created pod, False otherwise
+        Returns:
+            list: The FIO arguments
 
         """
-        pvc_obj = self.pvc_factory(
-            interface=constants.CEPHBLOCKPOOL,
-            project=self.project,
-            size=self.pvc_size,
-            volume_mode=constants.VOLUME_MODE_BLOCK,
-        )
-        self.pvc_objs.append(pvc_obj)
-        service_account = self.sa_factory(pvc_obj.project)
-
-        # Set new arguments with the updated file size to be used for
-        # DeploymentConfig of FIO pod creation
         fio_deployment_data = templating.load_yaml(constants.FIO_DEPLOYMENT_YAML)
-        args = (
+        return (
             fio_deployment_data.get("spec")
             .get("template")
             .get("spec")
             .get("containers")[0]
             .get("args")
         )
+
+    def get_fio_args(self, rate):
+        """
+        Get the FIO arguments of FIO pod, with file size matching the PVC size
+
+        Args:
+            rate (str): FIO 'rate' value (e.g. '20M')
+
+        Returns:
+            list: The FIO arguments
+
+        """
         new_args = [
             x
-            for x in args
+            for x in self.get_fio_template_args()
             if not x.startswith("--filesize=") and not x.startswith("--rate=")
         ]
         io_file_size = f"{self.pvc_size * 1000 - 200}M"
         new_args.append(f"--filesize={io_file_size}")
         new_args.append(f"--rate={rate}")
+        return new_args
+
+    def set_pods_rate(self, rate):
+        """
+        Change FIO 'rate' of all the running FIO pods in place, by patching
+        their Deployments. The PVCs are kept and the pods are re-created with
+        the new rate
+
+        Args:
+            rate (str): FIO 'rate' value (e.g. '20M')
+
+        """
+        # Recreate strategy, so the new pod does not wait for the block PVC
+        # to be released by the old one
+        params = json.dumps(
+            [
+                {
+                    "op": "replace",
+                    "path": "/spec/template/spec/containers/0/args",
+                    "value": self.get_fio_args(rate),
+                },
+                {"op": "add", "path": "/spec/strategy", "value": {"type": "Recreate"}},
+            ]
+        )
+        logger.info(f"Setting FIO rate {rate} on {len(self.dc_objs)} FIO pods")
+        for dc_obj in self.dc_objs:
+            dc_obj.ocp.patch(
+                resource_name=dc_obj.name, params=params, format_type="json"
+            )
+        self.load_change_time = time.time()
+
+    def increase_load(self, rate, wait=True):
+        """
+        Create a PVC, a service account and a DeploymentConfig of FIO pod
+
+        Args:
+            rate (str): FIO 'rate' value (e.g. '20M')
+            wait (bool): True for waiting for IO to kick in on the
+                newly created pod, False otherwise
+
+        """
+        pvc_obj = self.pvc_factory(
+            interface=constants.CEPHBLOCKPOOL,
+            project=self.project,
+            size=self.pvc_size,
+            volume_mode=constants.VOLUME_MODE_BLOCK,
+        )
+        self.pvc_objs.append(pvc_obj)
+        service_account = self.sa_factory(pvc_obj.project)
         dc_obj = self.pod_factory(
             pvc=pvc_obj,
             pod_dict_path=constants.FIO_DEPLOYMENT_YAML,
             raw_block_pv=True,
             service_account=service_account,
-            command_args=new_args,
+            command_args=self.get_fio_args(rate),
             status=None,
             deployment=True,
         )
         self.dc_objs.append(dc_obj)
+        self.load_change_time = time.time()
         if wait:
             logger.info(
                 f"Waiting {self.sleep_time} seconds for IO to kick-in on the newly "
@@ -164,6 +381,7 @@ class ClusterLoad:
         self.pvc_objs[-1].delete()
         self.pvc_objs[-1].ocp.wait_for_delete(self.pvc_objs[-1].name)
         self.pvc_objs.remove(self.pvc_objs[-1])
+        self.load_change_time = time.time()
         if wait:
             logger.info(
                 f"Waiting {self.sleep_time} seconds for IO to drop after "
@@ -181,104 +399,56 @@ class ClusterLoad:
                 newly created pod, False otherwise
 
         """
-        self.increase_load(rate=rate, wait=wait)
+        self.increase_load(rate=rate, wait=False)
         self.previous_iops = self.current_iops
-        self.current_iops = self.calc_trim_metric_mean(metric=constants.IOPS_QUERY)
+        if wait:
+            self.current_iops = self.wait_for_steady_metric(
+                metric=constants.IOPS_QUERY, since=self.load_change_time
+            )
+        else:
+            self.current_iops = self.calc_window_metric_mean(
+                metric=constants.IOPS_QUERY, window=30
+            )
         msg = f"Current: {self.current_iops:.2f} || Previous: {self.previous_iops:.2f}"
         logger.info(f"IOPS:{wrap_msg(msg)}")
         self.print_metrics()
 
-    def reach_cluster_load_percentage(self):
+    def find_cluster_limit(self, timeout=60 * 30):
         """
-        Reach the cluster limit and then drop to the given target percentage.
-        The number of pods needed for the desired target percentage is determined by
-        creating pods one by one, while examining the cluster latency. Once the latency
-        is greater than 250 ms and it is growing exponentially, it means that
-        the cluster limit has been reached.
-        Then, dropping to the target percentage by deleting all pods and re-creating
-        ones with smaller value of FIO 'rate' param.
-        This leaves the number of pods needed running IO for cluster load to
-        be around the desired percentage.
+        Find the cluster IOPS limit by creating FIO pods one by one, with a
+        large value of FIO 'rate' arg, while sampling the IOPS/latency curve
+        of the cluster. Once the latency is greater than 250 ms and it is
+        growing exponentially, it means that the cluster limit has been reached.
+        The FIO pods are kept running.
 
-        """
-        if not self.target_percentage:
-            logger.warning("The target percentage was not provided. Breaking")
-            return
-        if not 0.1 < self.target_percentage < 0.95:
-            logger.warning(
-                f"The target percentage is {self.target_percentage * 100}% which is "
-                "not within the accepted range. Therefore, IO will not be started"
-            )
-            return
-        low_diff_counter = 0
-        cluster_limit = None
-        latency_vals = list()
-        time_to_wait = 60 * 30
-        time_before = time.time()
+        Args:
+            timeout (int): Time in seconds for determining the limit
 
-        self.current_iops = self.get_query(query=constants.IOPS_QUERY)
+        Returns:
+            float: The cluster IOPS limit
 
-        # Creating FIO DeploymentConfig pods one by one, with a large value of FIO
-        # 'rate' arg. This in order to determine the cluster limit faster.
-        # Once determined, these pods will be deleted. Then, new FIO DC pods will be
-        # created, with a smaller value of 'rate' param. This in order to be more
-        # accurate with reaching the target percentage
+        """
+        curve = LoadCurve(baseline_iops=self.current_iops)
+        time_before = time.time()
         while True:
             wait = False if len(self.dc_objs) <= 1 else True
-            self.increase_load_and_print_data(rate="250M", wait=wait)
-            if self.current_iops > self.previous_iops:
-                cluster_limit = self.current_iops
-
-            latency = self.calc_trim_metric_mean(metric=constants.LATENCY_QUERY) * 1000
-            latency_vals.append(latency)
-            logger.info(f"Latency values: {latency_vals}")
-
-            iops_diff = (self.current_iops / self.previous_iops * 100) - 100
-            low_diff_counter += 1 if -15 < iops_diff < 10 else 0
-
-            cluster_used_space = get_percent_used_capacity()
-
-            if len(latency_vals) > 1 and latency > 250:
-                # Checking for an exponential growth. In case the latest latency sample
-                # value is more than 128 times the first latency value sample, we can conclude
-                # that the cluster limit in terms of IOPS, has been reached.
-                # See https://blog.docbert.org/vdbench-curve/ for more details.
-                # In other cases, when the first latency sample value is greater than 3 ms,
-                # the multiplication factor we check according to, is lower, in order to
-                # determine the cluster load faster.
-                if latency > latency_vals[0] * 2**7 or (
-                    3 < latency_vals[0] < 50 and len(latency_vals) > 5
-                ):
-                    logger.info(
-                        wrap_msg("The cluster limit was determined by latency growth")
-                    )
-                    break
-
-            # In case the latency is greater than 2 seconds,
-            # most chances the limit has been reached
-            elif latency > 2000:
-                logger.info(
-                    wrap_msg(
-                        f"The limit was determined by the high latency - {latency} ms"
-                    )
+            self.increase_load_and_print_data(rate=PROBE_RATE, wait=wait)
+            latency = (
+                self.calc_window_metric_mean(
+                    metric=constants.LATENCY_QUERY, since=self.load_change_time
                 )
-                break
+                * 1000
+            )
+            curve.add(len(self.dc_objs), self.current_iops, latency)
+            logger.info(f"Latency values: {curve.latencies}")
 
-            # For clusters that their nodes do not meet the minimum
-            # resource requirements, the cluster limit is being reached
-            # while the latency remains low. For that, the cluster limit
-            # needs to be determined by the following condition of IOPS
-            # diff between FIO pod creation iterations
-            elif low_diff_counter > 3:
-                logger.warning(
-                    wrap_msg(
-                        "Limit was determined by low IOPS diff between "
-                        f"iterations - {iops_diff:.2f}%"
-                    )
-                )
+            reason = curve.limit_reason()
+            if reason:
+                logger.info(wrap_msg(reason))
                 break
 
-            elif cluster_used_space > 60:
+            cluster_used_space = get_percent_used_capacity()
+            if cluster_used_space > 60:
                 logger.warning(
                     wrap_msg(
                         f"Cluster used space is {cluster_used_space}%. Could "
@@ -287,59 +457,108 @@ class ClusterLoad:
                     )
                 )
                 break
-            if time.time() > time_before + time_to_wait:
+            if time.time() > time_before + timeout:
                 logger.warning(
                     wrap_msg(
-                        "Could not determine the cluster IOPS limit within"
-                        f"the given {time_to_wait} seconds timeout. Breaking"
+                        "Could not determine the cluster IOPS limit within "
+                        f"the given {timeout} seconds timeout. Breaking"
                     )
                 )
                 break
+        return curve.limit
 
-        self.cluster_limit = cluster_limit
-        logger.info(wrap_msg(f"The cluster IOPS limit is {self.cluster_limit:.2f}"))
-        logger.info("Deleting all DC FIO pods that have large FIO rate")
-        while self.dc_objs:
+    def converge_load(self, target_iops, tolerance=0.1, timeout=60 * 15):
+        """
+        Bring the cluster load to the target IOPS with the running FIO pods.
+        The per pod FIO 'rate' is set from the target IOPS and then corrected
+        proportionally to the measured IOPS error. The number of FIO pods is
+        adjusted only when the per pod rate gets out of its boundaries.
+
+        Args:
+            target_iops (float): The target cluster IOPS
+            tolerance (float): The accepted relative IOPS error
+            timeout (int): Time in seconds for reaching the target
+
+        Returns:
+            bool: True if the target was reached within the tolerance,
+                False otherwise
+
+        """
+        block_size = get_fio_block_size(self.get_fio_template_args())
+        rate_kb = target_iops / len(self.dc_objs) * block_size / 2**10
+        while rate_kb < MIN_POD_RATE_KB and len(self.dc_objs) > 1:
+            rate_kb = rate_kb * len(self.dc_objs) / (len(self.dc_objs) - 1)
             self.decrease_load(wait=False)
+        time_before = time.time()
+        while True:
+            self.rate = fio_rate(rate_kb)
+            self.set_pods_rate(self.rate)
+            self.previous_iops = self.current_iops
+            self.current_iops = self.wait_for_steady_metric(
+                metric=constants.IOPS_QUERY, since=self.load_change_time
+            )
+            error = self.current_iops / target_iops - 1
+            msg = (
+                f"FIO pods: {len(self.dc_objs)} || Rate: {self.rate} || IOPS: "
+                f"{self.current_iops:.2f} || Target: {target_iops:.2f} "
+                f"({error * 100:+.2f}%)"
+            )
+            logger.info(f"Load controller:{wrap_msg(msg)}")
+            self.print_metrics()
+            if abs(error) <= tolerance:
+                return True
+            if time.time() > time_before + timeout:
+                logger.warning(
+                    wrap_msg(
+                        f"Could not reach the target load within the given {timeout} "
+                        f"seconds timeout, the load is off by {error * 100:.2f}%"
+                    )
+                )
+                return False
+            rate_kb = proportional_rate(rate_kb, self.current_iops, target_iops)
+            if rate_kb < MIN_POD_RATE_KB and len(self.dc_objs) > 1:
+                rate_kb = rate_kb * len(self.dc_objs) / (len(self.dc_objs) - 1)
+                self.decrease_load(wait=False)
+            elif rate_kb > MAX_POD_RATE_KB:
+                rate_kb = rate_kb * len(self.dc_objs) / (len(self.dc_objs) + 1)
+                self.increase_load(rate=fio_rate(rate_kb), wait=False)
 
-        target_iops = self.cluster_limit * self.target_percentage
+    def reach_cluster_load_percentage(self):
+        """
+        Reach the cluster limit and then converge to the given target percentage.
+        The cluster limit is determined by creating pods one by one, while
+        examining the cluster latency (see find_cluster_limit).
+        Then, instead of re-creating the pods, the FIO 'rate' of the running pods
+        is lowered and corrected in closed loop, according to the measured IOPS,
+        until the cluster load is around the desired percentage.
 
-        range_map = RangeKeyDict(
-            {
-                (0, 500): (6, 0.82, 0.4),
-                (500, 1000): (8, 0.84, 0.45),
-                (1000, 1500): (10, 0.86, 0.5),
-                (1500, 2000): (12, 0.88, 0.55),
-                (2000, 2500): (14, 0.90, 0.6),
-                (2500, 3000): (16, 0.92, 0.65),
-                (3000, 3500): (18, 0.94, 0.7),
-                (3500, math.inf): (20, 0.96, 0.75),
-            }
-        )
-        self.rate = f"{range_map[target_iops][0]}M"
-        # Creating the first pod of small FIO 'rate' param, to speed up the process.
-        # In the meantime, the load will drop, following the deletion of the
-        # FIO pods with large FIO 'rate' param
-        logger.info(
-            "Creating FIO pods, one by one, until the target percentage is reached"
-        )
-        self.increase_load_and_print_data(rate=self.rate)
+        """
+        if not self.target_percentage:
+            logger.warning("The target percentage was not provided. Breaking")
+            return
+        if not 0.1 < self.target_percentage < 0.95:
+            logger.warning(
+                f"The target percentage is {self.target_percentage * 100}% which is "
+                "not within the accepted range. Therefore, IO will not be started"
+            )
+            return
+
+        self.current_iops = self.get_query(query=constants.IOPS_QUERY)
+        self.cluster_limit = self.find_cluster_limit()
+        logger.info(wrap_msg(f"The cluster IOPS limit is {self.cluster_limit:.2f}"))
+
+        target_iops = self.cluster_limit * self.target_percentage
         msg = (
             f"The target load, in IOPS, is: {target_iops}, which is "
             f"{self.target_percentage*100}% of the {self.cluster_limit} cluster limit"
         )
         logger.info(wrap_msg(msg))
-
-        while self.current_iops < target_iops * range_map[target_iops][1]:
-            wait = (
-                False
-                if self.current_iops < target_iops * range_map[target_iops][2]
-                else True
+        if self.converge_load(target_iops):
+            msg = (
+                f"The target load, of {self.target_percentage * 100}%, has been "
+                "reached"
             )
-            self.increase_load_and_print_data(rate=self.rate, wait=wait)
-
-        msg = f"The target load, of {self.target_percentage * 100}%, has been reached"
-        logger.info(wrap_msg(msg))
+            logger.info(wrap_msg(msg))
         self.target_pods_number = len(self.dc_objs)
 
     @retry((IndexError, ScannerError), tries=15, delay=5, backoff=1)
@@ -384,6 +603,101 @@ class ClusterLoad:
             time.sleep(5)
         return round(get_trim_mean(vals), 5)
 
+    @retry((IndexError, KeyError, ScannerError), tries=15, delay=5, backoff=1)
+    def get_metric_window(self, metric, start, end, step=5):
+        """
+        Get values of a given metric over a time window, with single
+        Prometheus range query
+
+        Args:
+            metric (str): The metric query
+            start (float): The window start timestamp
+            end (float): The window end timestamp
+            step (int): The resolution of the window in seconds
+
+        Returns:
+            list: The metric values (floats), oldest first
+
+        """
+        result = self.prometheus_api.query_range(
+            metric, start, end, step, validate=False, mute_logs=True
+        )
+        if not result:
+            return list()
+        return [float(value) for _, value in result[0]["values"]]
+
+    def calc_window_metric_mean(self, metric, since=None, window=60, step=5):
+        """
+        Get the trimmed mean of a given metric over the latest time window
+
+        Args:
+            metric (str): The metric to calculate the average result for
+            since (float): Timestamp the window should not start before,
+                e.g. the time of the latest load change
+            window (int): The maximal length of the window in seconds
+            step (int): The resolution of the window in seconds
+
+        Returns:
+            float: The average result for the metric
+
+        """
+        end = time.time()
+        start = end - window
+        if since:
+            start = min(max(start, since), end - step)
+        vals = self.get_metric_window(metric, start, end, step)
+        if not vals:
+            return round(self.get_query(metric, mute_logs=True), 5)
+        return round(get_trim_mean(vals), 5)
+
+    def wait_for_steady_metric(
+        self, metric, since, settle=30, window=60, step=5, tolerance=0.05, timeout=180
+    ):
+        """
+        Wait for a given metric to settle after a load change and get its
+        trimmed mean. The metric is re-evaluated over a sliding window starting
+        after the load change, until the means of the older and the newer half
+        of the window are within the tolerance.
+
+        Args:
+            metric (str): The metric to wait for
+            since (float): Timestamp of the load change
+            settle (int): Time in seconds after the load change not taken into
+                account, as the metrics are rates over 1 minute
+            window (int): The maximal length of the window in seconds
+            step (int): The resolution of the window in seconds
+            tolerance (float): The accepted relative difference of the
+                window halves
+            timeout (int): Time in seconds from the load change to wait for
+                the metric to settle
+
+        Returns:
+            float: The trimmed mean of the metric over the window
+
+        """
+        min_samples = 4
+        vals = list()
+        while True:
+            now = time.time()
+            start = max(since + settle, now - window)
+            if now - start >= step * (min_samples - 1):
+                vals = self.get_metric_window(metric, start, now, step)
+            if len(vals) >= min_samples:
+                half = len(vals) // 2
+                older = sum(vals[:half]) / half
+                newer = sum(vals[half:]) / (len(vals) - half)
+                if abs(newer - older) <= tolerance * max(abs(older), abs(newer)):
+                    return round(get_trim_mean(vals), 5)
+            if now > since + timeout:
+                logger.debug(
+                    f"Metric {metric} did not settle within {timeout} seconds "
+                    "after the load change"
+                )
+                if vals:
+                    return round(get_trim_mean(vals), 5)
+                return round(self.get_query(metric, mute_logs=True), 5)
+            time.sleep(step)
+
     def print_metrics(self, mute_logs=False):
         """
         Print metrics
@@ -435,7 +749,7 @@ class ClusterLoad:
         to make sure that cluster load is around the target percentage
 
         """
-        latency = self.calc_trim_metric_mean(constants.LATENCY_QUERY, mute_logs=True)
+        latency = self.calc_window_metric_mean(constants.LATENCY_QUERY, window=30)
         if latency > 0.25 and len(self.dc_objs) > 0:
             msg = (
                 f"Latency is too high - {latency * 1000:.2f} ms."
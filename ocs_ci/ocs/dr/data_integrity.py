@@ -0,0 +1,252 @@
+"""
+Parallel data integrity verification of the DR workloads.
+"""
+
+import logging
+import time
+from concurrent.futures import as_completed
+from dataclasses import dataclass, field
+
+from ocs_ci.framework import ConfigContextThreadPoolExecutor
+from ocs_ci.helpers.cnv_helpers import cal_md5sum_vm
+
+log = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 10
+DEFAULT_HASHFILE = "/mnt/test/hashfile"
+STATUS_OK = "OK"
+STATUS_FAILED = "FAILED"
+
+
+def parse_md5sum_check(output):
+    """
+    Parse the output of `md5sum -c`.
+
+    Args:
+        output (str): Output of the command, lines like "<file>: OK" or
+            "<file>: FAILED"
+
+    Returns:
+        dict: Status of the check keyed by the file name
+
+    """
+    files = {}
+    for line in (output or "").splitlines():
+        name, sep, status = line.rpartition(": ")
+        if sep and status.startswith((STATUS_OK, STATUS_FAILED)):
+            files[name] = status.strip()
+    return files
+
+
+@dataclass
+class IntegrityResult:
+    """
+    Result of the data integrity check of one pod or VM.
+
+    Attributes:
+        target (str): Name of the pod or VM
+        files (dict): Status of the check keyed by the file name
+        error (str): Error which prevented the check
+        duration (float): Duration of the check in seconds
+
+    """
+
+    target: str
+    files: dict = field(default_factory=dict)
+    error: str = None
+    duration: float = None
+
+    @property
+    def mismatched(self):
+        """
+        list: Files whose checksum did not match or couldn't be read
+        """
+        return [name for name, status in self.files.items() if status != STATUS_OK]
+
+    @property
+    def ok(self):
+        return self.error is None and bool(self.files) and not self.mismatched
+
+
+@dataclass
+class IntegrityReport:
+    """
+    Results of the data integrity checks of all the targets.
+    """
+
+    results: list
+
+    @property
+    def ok(self):
+        return all(result.ok for result in self.results)
+
+    @property
+    def failed(self):
+        """
+        list: Results of the targets which failed the check
+        """
+        return [result for result in self.results if not result.ok]
+
+    @property
+    def mismatches(self):
+        """
+        dict: Mismatched files keyed by the target name
+        """
+        return {
+            result.target: result.mismatched
+            for result in self.results
+            if result.mismatched
+        }
+
+    def summary(self):
+        """
+        Returns:
+            str: Human readable report of the failed targets
+
+        """
+        lines = [
+            f"Data integrity check failed on {len(self.failed)} of "
+            f"{len(self.results)} targets"
+        ]
+        for result in self.failed:
+            if result.error:
+                lines.append(f"{result.target}: {result.error}")
+            elif not result.files:
+                lines.append(f"{result.target}: no files were verified")
+            for name in result.mismatched:
+                lines.append(f"{result.target}: {name}: {result.files[name]}")
+        return "\n".join(lines)
+
+
+class DataIntegrityVerifier(object):
+    """
+    Runs the data integrity checks of many targets in parallel.
+    """
+
+    def __init__(self, max_workers=DEFAULT_MAX_WORKERS, timeout=600):
+        """
+        Args:
+            max_workers (int): Maximum number of the targets checked at once
+            timeout (int): Timeout of the check of one target in seconds
+
+        """
+        self.max_workers = max_workers
+        self.timeout = timeout
+
+    @staticmethod
+    def _check(target, check):
+        result = IntegrityResult(target)
+        start = time.time()
+        try:
+            result.files = check()
+        except Exception as ex:
+            result.error = str(ex)
+        result.duration = time.time() - start
+        return result
+
+    def run(self, checks):
+        """
+        Run the checks in parallel and log every result when it arrives.
+
+        Args:
+            checks (dict): Function without arguments returning the status
+                of the files (see parse_md5sum_check) keyed by the target name
+
+        Returns:
+            IntegrityReport: Results of all the targets in the order of the
+                checks
+
+        """
+        results = {}
+        if not checks:
+            return IntegrityReport([])
+        with ConfigContextThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(checks))
+        ) as executor:
+            futures = [
+                executor.submit(self._check, target, check)
+                for target, check in checks.items()
+            ]
+            for future in as_completed(futures):
+                result = future.result()
+                results[result.target] = result
+                if result.ok:
+                    log.info(
+                        f"{result.target}: All files checksums value matches "
+                        f"({len(result.files)} files, {result.duration:.1f}s)"
+                    )
+                elif result.error:
+                    log.error(
+                        f"{result.target}: Data integrity check failed: "
+                        f"{result.error}"
+                    )
+                else:
+                    log.error(
+                        f"{result.target}: One or more files or datas are "
+                        f"modified: {result.mismatched}"
+                    )
+        return IntegrityReport([results[target] for target in checks])
+
+    def verify_pods(self, pods, path=DEFAULT_HASHFILE):
+        """
+        Verify the md5sum values of the files listed in the hashfile of
+        every pod.
+
+        Args:
+            pods (list): Pod objects of the workload
+            path (str): Path of the hashfile in the pods
+
+        Returns:
+            IntegrityReport: The report
+
+        """
+
+        def check(pod_obj):
+            # md5sum exits with non zero code on mismatch, the per file
+            # statuses are in the output
+            output = pod_obj.exec_cmd_on_pod(
+                command=f"md5sum -c {path}",
+                out_yaml_format=False,
+                timeout=self.timeout,
+                ignore_error=True,
+            )
+            return parse_md5sum_check(output)
+
+        return self.run(
+            {pod_obj.name: (lambda pod_obj=pod_obj: check(pod_obj)) for pod_obj in pods}
+        )
+
+    def verify_vms(self, cnv_workloads, file_name, md5sum_original):
+        """
+        Compare the md5sum of the file on every VM with the original one.
+
+        Args:
+            cnv_workloads (list): Workloads, each containing vm_obj,
+                vm_username and workload_name
+            file_name (str): Name/path of the file
+            md5sum_original (list): Original MD5 checksums of the file, in the
+                order of the workloads
+
+        Returns:
+            IntegrityReport: The report
+
+        """
+
+        def check(cnv_wl, expected):
+            md5sum_new = cal_md5sum_vm(
+                cnv_wl.vm_obj, file_path=file_name, username=cnv_wl.vm_username
+            )
+            log.info(
+                f"Comparing original checksum: {expected} of {file_name} with "
+                f"{md5sum_new} on {cnv_wl.workload_name}"
+            )
+            return {file_name: STATUS_OK if md5sum_new == expected else STATUS_FAILED}
+
+        return self.run(
+            {
+                cnv_wl.workload_name: (
+                    lambda cnv_wl=cnv_wl, expected=expected: check(cnv_wl, expected)
+                )
+                for cnv_wl, expected in zip(cnv_workloads, md5sum_original)
+            }
+        )
@@ -12,7 +12,7 @@ from subprocess import TimeoutExpired
 
 from ocs_ci.framework import config
 from ocs_ci.helpers import dr_helpers, helpers
-from ocs_ci.helpers.cnv_helpers import create_vm_secret, cal_md5sum_vm
+from ocs_ci.helpers.cnv_helpers import create_vm_secret
 from ocs_ci.helpers.dr_helpers import (
     generate_kubeobject_capture_interval,
     get_cluster_set_name,
@@ -23,6 +23,7 @@ from ocs_ci.helpers.helpers import (
 )
 from ocs_ci.ocs import constants, ocp
 from ocs_ci.ocs.cnv.virtual_machine import VirtualMachine
+from ocs_ci.ocs.dr.data_integrity import DataIntegrityVerifier, DEFAULT_MAX_WORKERS
 from ocs_ci.ocs.exceptions import (
     TimeoutExpiredError,
     CommandFailed,
@@ -1153,18 +1154,16 @@ def validate_data_integrity_vm(
         md5sum_original (list): List of original MD5 checksums for the file.
         app_state (str): State of the app FailOver/Relocate to log it during validation
 
+    Raises:
+        AssertionError: If the checksum differs on any of the VMs, with the
+            report of all the VMs
+
     """
-    for count, cnv_wl in enumerate(cnv_workloads):
-        md5sum_new = cal_md5sum_vm(
-            cnv_wl.vm_obj, file_path=file_name, username=cnv_wl.vm_username
-        )
-        log.info(
-            f"Comparing original checksum: {md5sum_original[count]} of {file_name} with {md5sum_new}"
-            f" on {cnv_wl.workload_name}after {app_state}"
-        )
-        assert (
-            md5sum_original[count] == md5sum_new
-        ), f"Failed: MD5 comparison after {app_state}"
+    log.info(f"Validating data integrity of {len(cnv_workloads)} VMs after {app_state}")
+    report = DataIntegrityVerifier().verify_vms(
+        cnv_workloads, file_name, md5sum_original
+    )
+    assert report.ok, f"Failed: MD5 comparison after {app_state}\n{report.summary()}"
 
 
 class BusyboxDiscoveredApps(DRWorkload):
@@ -1560,31 +1559,36 @@ class BusyboxDiscoveredApps(DRWorkload):
             run_cmd(f"oc delete project {self.workload_namespace}")
 
 
-def validate_data_integrity(namespace, path="/mnt/test/hashfile", timeout=600):
+def validate_data_integrity(
+    namespace,
+    path="/mnt/test/hashfile",
+    timeout=600,
+    max_workers=DEFAULT_MAX_WORKERS,
+):
     """
     Verifies the md5sum values of files are OK
 
+    The pods are verified in parallel and all of them are verified even if
+    some of them fail.
+
     Args:
         namespace (str): Namespace where the workload running
         path (str): Path of the hashfile saved of each files
         timeout (int): Time taken in seconds to run command inside pod
+        max_workers (int): Maximum number of pods verified at once
 
-    Raises: If there is a mismatch in md5sum value or None
+    Raises:
+        CommandFailed: If there is a mismatch in md5sum value on any pod, the
+            message lists the mismatched files of all the pods
 
     """
     all_pods = get_all_pods(namespace=namespace)
-    for pod_obj in all_pods:
-        log.info("Verify the md5sum values are OK")
-        cmd = f"md5sum -c {path}"
-        try:
-            pod_obj.exec_cmd_on_pod(command=cmd, out_yaml_format=False, timeout=timeout)
-            log.info(f"Pod {pod_obj.name}: All files checksums value matches")
-        except CommandFailed as ex:
-            if "computed checksums did NOT match" in str(ex):
-                log.error(
-                    f"Pod {pod_obj.name}: One or more files or datas are modified"
-                )
-            raise ex
+    log.info(f"Verify the md5sum values are OK on {len(all_pods)} pods")
+    report = DataIntegrityVerifier(
+        max_workers=max_workers, timeout=timeout
+    ).verify_pods(all_pods, path)
+    if not report.ok:
+        raise CommandFailed(report.summary())
 
 
 class CnvWorkloadDiscoveredApps(DRWorkload):
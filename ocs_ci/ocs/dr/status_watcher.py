@@ -0,0 +1,212 @@
+"""
+Concurrent DR status watcher.
+"""
+
+import logging
+import time
+from dataclasses import dataclass, field
+
+from ocs_ci.framework import config
+from ocs_ci.ocs.exceptions import TimeoutExpiredError
+from ocs_ci.ocs.utils import get_active_acm_index, get_non_acm_cluster_config
+from ocs_ci.utility.multicluster import run_on_clusters
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SLEEP = 5
+
+
+@dataclass
+class StatusWatch:
+    """
+    One watched status of one cluster.
+
+    Attributes:
+        index (int): Config index of the cluster
+        name (str): Description of the status, used in the logs and errors
+        probe (callable): Function fetching the status, runs in the context
+            of the cluster
+        condition (callable): Function getting the value of the probe and
+            returning True when the status converged
+        kwargs (dict): Keyword arguments of the probe
+        value: Last value of the probe
+        error (Exception): Last error of the probe
+        converged_at (float): Time when the status converged
+
+    """
+
+    index: int
+    name: str
+    probe: object
+    condition: object = bool
+    kwargs: dict = field(default_factory=dict)
+    value: object = None
+    error: Exception = None
+    converged_at: float = None
+
+    @property
+    def converged(self):
+        return self.converged_at is not None
+
+
+class DRStatusWatcher(object):
+    """
+    Waits until the watched statuses of all the clusters converge, polling
+    the clusters in parallel.
+    """
+
+    def __init__(self, sleep=DEFAULT_SLEEP):
+        """
+        Args:
+            sleep (int): Time in seconds between the polling rounds
+
+        """
+        self.sleep = sleep
+        self.watches = {}
+        self.rounds = 0
+
+    def watch(self, index, name, probe, condition=bool, **kwargs):
+        """
+        Add the watched status of the cluster.
+
+        Args:
+            index (int): Config index of the cluster
+            name (str): Description of the status
+            probe (callable): Function fetching the status
+            condition (callable): Function getting the value of the probe and
+                returning True when the status converged, the truth of the
+                value by default
+            kwargs: Keyword arguments of the probe
+
+        Returns:
+            DRStatusWatcher: The watcher, to allow chaining of the calls
+
+        """
+        self.watches.setdefault(index, []).append(
+            StatusWatch(index, name, probe, condition, kwargs)
+        )
+        return self
+
+    def watch_managed_clusters(self, name, probe, condition=bool, **kwargs):
+        """
+        Add the watched status of every managed (non ACM) cluster.
+
+        Args:
+            name (str): Description of the status
+            probe (callable): Function fetching the status
+            condition (callable): Function deciding if the status converged
+            kwargs: Keyword arguments of the probe
+
+        Returns:
+            DRStatusWatcher: The watcher
+
+        """
+        for cluster in get_non_acm_cluster_config():
+            self.watch(
+                cluster.MULTICLUSTER["multicluster_index"],
+                name,
+                probe,
+                condition,
+                **kwargs,
+            )
+        return self
+
+    def watch_hub(self, name, probe, condition=bool, **kwargs):
+        """
+        Add the watched status of the active hub cluster.
+
+        Args:
+            name (str): Description of the status
+            probe (callable): Function fetching the status
+            condition (callable): Function deciding if the status converged
+            kwargs: Keyword arguments of the probe
+
+        Returns:
+            DRStatusWatcher: The watcher
+
+        """
+        return self.watch(get_active_acm_index(), name, probe, condition, **kwargs)
+
+    @property
+    def pending(self):
+        """
+        list: Watches which didn't converge yet
+        """
+        return [
+            watch
+            for watches in self.watches.values()
+            for watch in watches
+            if not watch.converged
+        ]
+
+    def _poll_cluster(self, cluster_ctx):
+        """
+        Check the pending watches of one cluster in order, stop at the first
+        one which didn't converge.
+        """
+        for watch in self.watches[cluster_ctx.index]:
+            if watch.converged:
+                continue
+            try:
+                watch.value = watch.probe(**watch.kwargs)
+                watch.error = None
+            except Exception as ex:
+                logger.warning(
+                    f"Failed to get {watch.name} on cluster {cluster_ctx.name}: {ex}"
+                )
+                watch.error = ex
+                return
+            if not watch.condition(watch.value):
+                logger.info(
+                    f"Waiting for {watch.name} on cluster {cluster_ctx.name}, "
+                    f"current value: {watch.value}"
+                )
+                return
+            watch.converged_at = time.time()
+            logger.info(f"{watch.name} converged on cluster {cluster_ctx.name}")
+
+    def poll(self):
+        """
+        Run one polling round on all the clusters with pending watches.
+
+        Returns:
+            list: Watches which didn't converge yet
+
+        """
+        indexes = sorted({watch.index for watch in self.pending})
+        if indexes:
+            self.rounds += 1
+            run_on_clusters(self._poll_cluster, indexes=indexes)
+        return self.pending
+
+    def wait(self, timeout):
+        """
+        Wait until all the watched statuses converge.
+
+        Args:
+            timeout (int): Time in seconds to wait
+
+        Returns:
+            bool: True when all the statuses converged
+
+        Raises:
+            TimeoutExpiredError: If any status didn't converge in time, the
+                message names the clusters and the statuses
+
+        """
+        deadline = time.time() + timeout
+        while self.poll():
+            if time.time() + self.sleep > deadline:
+                pending = ", ".join(
+                    f"{watch.name} on cluster "
+                    f"{config.clusters[watch.index].ENV_DATA['cluster_name']} "
+                    f"(last value: {watch.error or watch.value})"
+                    for watch in self.pending
+                )
+                error_msg = (
+                    f"DR status did not converge within {timeout} seconds: {pending}"
+                )
+                logger.error(error_msg)
+                raise TimeoutExpiredError(error_msg)
+            time.sleep(self.sleep)
+        return True
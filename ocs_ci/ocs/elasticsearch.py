@@ -12,6 +12,8 @@ import json
 import logging
 import os
 import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 # 3rd party modules
 from elasticsearch import Elasticsearch, helpers, exceptions as esexp
@@ -37,72 +39,203 @@ es_log = logging.getLogger("elasticsearch")
 es_log.setLevel(logging.CRITICAL)
 
 
-def elasticsearch_load(connection, target_path):
+# bulk loading defaults, documents of the dumps are small so the chunks are
+# limited mainly by the number of documents
+BULK_CHUNK_SIZE = 1000
+BULK_MAX_CHUNK_BYTES = 10 * 1024 * 1024
+BULK_THREAD_COUNT = 4
+BULK_MAX_WORKERS = 4
+BULK_PROGRESS_INTERVAL = 10000
+# number of failed documents reported per index
+BULK_MAX_ERRORS = 10
+
+
+def get_data_from_text_file(json_file):
     """
-    Load all data from target_path/results into an elasticsearch (es) server.
+    Stream the documents stored in a dump file, one json document per line.
+    The file is read lazily, so the memory used does not depend on the size
+    of the dump. Lines which are not valid json are logged and skipped.
+
+    Args:
+        json_file (str): the file name to look for docs in
+
+    Yields:
+        dict: the documents as json dicts
+
+    """
+    with open(str(json_file), encoding="utf8", errors="ignore") as fd:
+        for num, line in enumerate(fd):
+            doc = line.strip()
+            if not doc:
+                continue
+            try:
+                yield json.loads(doc)
+            except json.decoder.JSONDecodeError as err:
+                log.error(
+                    f"ERROR for num: {num} -- JSONDecodeError: {err} for doc: {doc}"
+                )
+
+
+def get_dump_data_files(target_path):
+    """
+    Get the data files of the dump, mapping files are skipped.
 
     Args:
-        connection (obj): an elasticsearch connection object
         target_path (str): the path where data was dumped into
 
     Returns:
-        bool: True if loading data succeed, False otherwise
+        dict: index name to the data file path
 
     """
+    results_dir = os.path.join(target_path, "results")
+    if not os.path.isdir(results_dir):
+        return {}
+    return {
+        file_name.split(".")[0]: os.path.join(results_dir, file_name)
+        for file_name in sorted(os.listdir(results_dir))
+        if ".data." in file_name  # load only data files and not mapping info
+    }
+
+
+def bulk_load_file(
+    connection,
+    file_name,
+    index,
+    chunk_size=BULK_CHUNK_SIZE,
+    max_chunk_bytes=BULK_MAX_CHUNK_BYTES,
+    thread_count=BULK_THREAD_COUNT,
+    max_retries=3,
+    progress_interval=BULK_PROGRESS_INTERVAL,
+):
+    """
+    Stream documents of one dump file into the ES index. The chunks are sent
+    by parallel_bulk from thread_count threads, with one thread streaming_bulk
+    is used which retries the chunks rejected with 429 (too many requests).
+    Failures do not stop the load, they are counted and reported.
 
-    # define a function that will load a text file
-    def get_data_from_text_file(json_file):
-        """
-        This function will return a list of docs stored in a text file.
-        the function is working as a generator, and return the records
-        one at a time.
+    Args:
+        connection (obj): an elasticsearch connection object
+        file_name (str): the dump file of the index
+        index (str): the index to load the documents into
+        chunk_size (int): number of documents in one bulk request
+        max_chunk_bytes (int): maximal size of one bulk request in bytes
+        thread_count (int): number of threads sending the bulk requests
+        max_retries (int): number of retries of rejected documents, used
+            only with one thread
+        progress_interval (int): log the progress after every this number
+            of processed documents
 
-        Args:
-            json_file (str): the file name to look for docs in
+    Returns:
+        dict: with ``index``, ``loaded``, ``failed``, ``errors`` (sample of
+            the failures) and ``duration`` keys
 
-        Returns:
-             list : list of documents as json dicts
+    """
+    result = {"index": index, "loaded": 0, "failed": 0, "errors": [], "duration": 0}
+    start_time = time.time()
+    kwargs = {
+        "chunk_size": chunk_size,
+        "max_chunk_bytes": max_chunk_bytes,
+        "raise_on_error": False,
+        "raise_on_exception": False,
+        "index": index,
+    }
+    actions = get_data_from_text_file(file_name)
+    if thread_count > 1:
+        responses = helpers.parallel_bulk(
+            connection, actions, thread_count=thread_count, **kwargs
+        )
+    else:
+        responses = helpers.streaming_bulk(
+            connection, actions, max_retries=max_retries, **kwargs
+        )
+    try:
+        for ok, item in responses:
+            if ok:
+                result["loaded"] += 1
+            else:
+                result["failed"] += 1
+                if len(result["errors"]) < BULK_MAX_ERRORS:
+                    # item is {op_type: {"status": .., "error": .., ..}}
+                    info = next(iter(item.values()))
+                    result["errors"].append(
+                        {
+                            "status": info.get("status"),
+                            "error": str(info.get("error"))[:500],
+                        }
+                    )
+            processed = result["loaded"] + result["failed"]
+            if processed % progress_interval == 0:
+                log.info(
+                    f"Loading {index}: {result['loaded']} documents loaded, "
+                    f"{result['failed']} failed"
+                )
+    except Exception as err:
+        # e.g. the connection was lost, the rest of the file is not loaded
+        log.error(f"Elasticsearch bulk load of {index} ERROR: {err}")
+        result["errors"].append(str(err))
+        result["failed"] += 1
+    result["duration"] = time.time() - start_time
+    log.info(
+        f"Loaded {result['loaded']} documents into {index} in "
+        f"{result['duration']:.1f} sec, {result['failed']} failed"
+    )
+    if result["failed"]:
+        log.error(f"Failures of {index} bulk load: {result['errors']}")
+    return result
+
+
+def elasticsearch_load(
+    connection,
+    target_path,
+    chunk_size=BULK_CHUNK_SIZE,
+    thread_count=BULK_THREAD_COUNT,
+    max_workers=BULK_MAX_WORKERS,
+):
+    """
+    Load all data from target_path/results into an elasticsearch (es) server.
 
-        """
+    The dump files are streamed, so the memory used does not depend on the
+    size of the dump, and up to max_workers indices are loaded concurrently.
 
-        docs = [
-            l.strip() for l in open(str(json_file), encoding="utf8", errors="ignore")
-        ]
-        log.info(f"String docs length: {len(docs)}")
+    Args:
+        connection (obj): an elasticsearch connection object
+        target_path (str): the path where data was dumped into
+        chunk_size (int): number of documents in one bulk request
+        thread_count (int): number of threads sending bulk requests per index
+        max_workers (int): number of indices loaded concurrently
 
-        for num, doc in enumerate(docs):
-            try:
-                dict_doc = json.loads(doc)
-                yield dict_doc
-            except json.decoder.JSONDecodeError as err:
-                # print the errors
-                log.error(
-                    f"ERROR for num: {num} -- JSONDecodeError: {err} for doc: {doc}"
-                )
+    Returns:
+        bool: True if loading data succeed, False otherwise
 
-    all_files = run_command(f"ls {target_path}/results/", out_format="list")
-    if "Error in command" in all_files:
+    """
+    data_files = get_dump_data_files(target_path)
+    if not data_files:
         log.error("There is No data to load into ES server")
         return False
-    else:
-        if connection is None:
-            log.warning("There is no elasticsearch server to load data into")
-            return False
-        log.info(f"The ES connection is {connection}")
-        for ind in all_files:
-            if ".data." in ind:  # load only data files and not mapping info
-                file_name = f"{target_path}/results/{ind}"
-                ind_name = ind.split(".")[0]
-                log.info(f"Loading the {ind} data into the ES server")
-
-                try:
-                    resp = helpers.bulk(
-                        connection, get_data_from_text_file(file_name), index=ind_name
-                    )
-                    log.info(f"helpers.bulk() RESPONSE: {resp}")
-                except Exception as err:
-                    log.error(f"Elasticsearch helpers.bulk() ERROR:{err}")
-        return True
+    if connection is None:
+        log.warning("There is no elasticsearch server to load data into")
+        return False
+    log.info(f"The ES connection is {connection}")
+    log.info(f"Loading {len(data_files)} indices into the ES server")
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(
+                bulk_load_file,
+                connection,
+                file_name,
+                index,
+                chunk_size=chunk_size,
+                thread_count=thread_count,
+            )
+            for index, file_name in data_files.items()
+        ]
+        results = [future.result() for future in futures]
+    loaded = sum(r["loaded"] for r in results)
+    failed = [r["index"] for r in results if r["failed"]]
+    log.info(f"Loaded {loaded} documents into {len(results)} indices")
+    if failed:
+        log.error(f"Some documents were not loaded into indices: {failed}")
+    return True
 
 
 class ElasticSearch(object):
@@ -0,0 +1,184 @@
+"""
+Paged reader of the performance results stored in Elasticsearch.
+"""
+
+import logging
+
+from elasticsearch import exceptions as ESExp
+
+log = logging.getLogger(__name__)
+
+DEFAULT_PAGE_SIZE = 1000
+DEFAULT_KEEP_ALIVE = "2m"
+
+
+class ESReader:
+    """
+    Lazy paged reader of one Elasticsearch index (or index pattern).
+    """
+
+    def __init__(
+        self,
+        connection,
+        index,
+        page_size=DEFAULT_PAGE_SIZE,
+        keep_alive=DEFAULT_KEEP_ALIVE,
+        use_pit=True,
+    ):
+        """
+        Args:
+            connection (Elasticsearch): Elasticsearch connection object
+            index (str): Name of the index (or index pattern) to read
+            page_size (int): Number of hits fetched by one request
+            keep_alive (str): How long the server keeps the PIT / scroll
+                context between the requests
+            use_pit (bool): Page with point in time, when False (or when the
+                server does not support PIT) the scroll API is used
+
+        """
+        self.es = connection
+        self.index = index
+        self.page_size = page_size
+        self.keep_alive = keep_alive
+        self.use_pit = use_pit
+
+    def _search_kwargs(self, query, source):
+        kwargs = {"query": query or {"match_all": {}}, "size": self.page_size}
+        if source is not None:
+            kwargs["source"] = source
+        return kwargs
+
+    def _open_pit(self):
+        """
+        Open point in time of the index.
+
+        Returns:
+            str: PIT id, None if the server does not support PIT
+
+        """
+        try:
+            response = self.es.open_point_in_time(
+                index=self.index, keep_alive=self.keep_alive
+            )
+            return response["id"]
+        except (ESExp.ApiError, ESExp.TransportError, KeyError) as err:
+            log.debug(f"Point in time is not available, using scroll: {err}")
+            return None
+
+    def _iter_pit(self, pit_id, query, source, sort):
+        kwargs = self._search_kwargs(query, source)
+        # _shard_doc is the cheapest tiebreaker which makes the order total
+        kwargs["sort"] = list(sort or []) + ["_shard_doc"]
+        search_after = None
+        try:
+            while True:
+                if search_after is not None:
+                    kwargs["search_after"] = search_after
+                response = self.es.search(
+                    pit={"id": pit_id, "keep_alive": self.keep_alive}, **kwargs
+                )
+                hits = response["hits"]["hits"]
+                yield from hits
+                if len(hits) < self.page_size:
+                    return
+                # the PIT id can change between the requests
+                pit_id = response.get("pit_id", pit_id)
+                search_after = hits[-1]["sort"]
+        finally:
+            try:
+                self.es.close_point_in_time(id=pit_id)
+            except (ESExp.ApiError, ESExp.TransportError) as err:
+                log.debug(f"Failed to close point in time: {err}")
+
+    def _iter_scroll(self, query, source, sort):
+        kwargs = self._search_kwargs(query, source)
+        # without explicit sort, _doc is the most efficient scroll order
+        kwargs["sort"] = list(sort or ["_doc"])
+        response = self.es.search(index=self.index, scroll=self.keep_alive, **kwargs)
+        scroll_id = response.get("_scroll_id")
+        try:
+            while True:
+                hits = response["hits"]["hits"]
+                yield from hits
+                if not scroll_id or len(hits) < self.page_size:
+                    return
+                response = self.es.scroll(scroll_id=scroll_id, scroll=self.keep_alive)
+                scroll_id = response.get("_scroll_id", scroll_id)
+        finally:
+            if scroll_id:
+                try:
+                    self.es.clear_scroll(scroll_id=scroll_id)
+                except (ESExp.ApiError, ESExp.TransportError) as err:
+                    log.debug(f"Failed to clear scroll: {err}")
+
+    def iter_hits(self, query=None, source=None, sort=None):
+        """
+        Yield all the hits matching the query, page by page.
+
+        Args:
+            query (dict): Query DSL (the value of the "query" key), all the
+                documents by default
+            source (list): Names of the fields to fetch, the whole documents
+                by default, False to fetch no fields
+            sort (list): Sort order of the hits, index order by default
+
+        Yields:
+            dict: The hits, with "_id", "_index" and "_source" keys
+
+        """
+        pit_id = self._open_pit() if self.use_pit else None
+        if pit_id:
+            yield from self._iter_pit(pit_id, query, source, sort)
+        else:
+            yield from self._iter_scroll(query, source, sort)
+
+    def iter_sources(self, query=None, source=None, sort=None):
+        """
+        Yield ``_source`` of all the documents matching the query.
+
+        Args:
+            query (dict): Query DSL, all the documents by default
+            source (list): Names of the fields to fetch, all by default
+            sort (list): Sort order of the documents, index order by default
+
+        Yields:
+            dict: The documents
+
+        """
+        for hit in self.iter_hits(query, source=source, sort=sort):
+            yield hit.get("_source", {})
+
+    def count(self, query=None):
+        """
+        Number of the documents matching the query.
+
+        Args:
+            query (dict): Query DSL, all the documents by default
+
+        Returns:
+            int: Number of the documents
+
+        """
+        response = self.es.count(index=self.index, query=query or {"match_all": {}})
+        return response["count"]
+
+    def aggregate(self, query, aggregations):
+        """
+        Compute aggregations by the server, no documents are fetched.
+
+        Args:
+            query (dict): Query DSL selecting the documents, all by default
+            aggregations (dict): Aggregations DSL, e.g.
+                {"iops": {"percentiles": {"field": "iops"}}}
+
+        Returns:
+            dict: Results of the aggregations by their names
+
+        """
+        response = self.es.search(
+            index=self.index,
+            query=query or {"match_all": {}},
+            aggs=aggregations,
+            size=0,
+        )
+        return response.get("aggregations", {})
@@ -18,7 +18,6 @@ import textwrap
 import time
 
 import pytest
-import yaml
 
 from ocs_ci.framework import config
 from ocs_ci.helpers.helpers import default_storage_class
@@ -29,6 +28,11 @@ from ocs_ci.ocs.exceptions import UnexpectedVolumeType
 from ocs_ci.ocs.resources import pod
 from ocs_ci.ocs.resources.objectconfigfile import ObjectConfFile
 from ocs_ci.utility.utils import run_cmd, TimeoutSampler
+from ocs_ci.utility.workload_log_parser import (
+    FioLogParser,
+    fio_latency_histogram,
+    follow_pod_logs,
+)
 from ocs_ci.utility.workloadfixture import measure_operation
 
 
@@ -109,20 +113,7 @@ def fio_to_dict(fio_output):
     """ "
     Parse fio output and provide parsed dict it as a result.
     """
-    fio_output_lines = fio_output.splitlines()
-    line_num = 0
-    for line_num, line in enumerate(fio_output_lines):
-        if line == "{":
-            break
-        else:
-            logger.info(line)
-    fio_parseable_output = "\n".join(fio_output_lines[line_num:])
-    try:
-        fio_report = yaml.safe_load(fio_parseable_output)
-    except yaml.parser.ParserError as ex:
-        logger.error("json output from fio can't be parsed: %s", ex)
-        raise ex
-    return fio_report
+    return FioLogParser().feed_text(fio_output)
 
 
 def get_timeout(fio_min_mbps, pvc_size):
@@ -236,16 +227,17 @@ def write_data_via_fio(fio_job_file, write_timeout, pvc_size, target_percentage)
         fio_job_file.project.namespace, write_timeout, error_msg
     )
 
-    ocp_pod = ocp.OCP(kind="Pod", namespace=fio_job_file.project.namespace)
-    fio_output = ocp_pod.get_logs(pod_name)
-
-    # parse fio output
-    fio_report = fio_to_dict(fio_output)
+    # stream and parse fio output
+    fio_report = follow_pod_logs(
+        pod_name, fio_job_file.project.namespace, FioLogParser(), follow=False
+    )
 
     logger.debug(fio_report)
+    latency_histogram = fio_latency_histogram(fio_report)
     if fio_report is not None:
         disk_util = fio_report.get("disk_util")
         logger.info("fio disk_util stats: %s", disk_util)
+        logger.info("fio clat stats: %s", latency_histogram.summary())
     else:
         logger.warning("fio report is empty")
 
@@ -254,6 +246,7 @@ def write_data_via_fio(fio_job_file, write_timeout, pvc_size, target_percentage)
     result = {
         "fio_job_start": fio_job_start_ts,
         "fio": fio_report,
+        "latency_histogram": latency_histogram.to_dict(),
         "pvc_size": pvc_size,
         "target_p": target_percentage,
         "namespace": fio_job_file.project.namespace,
@@ -0,0 +1,200 @@
+"""
+Ceph health gate with cached verdicts.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+
+from ocs_ci.framework import config
+from ocs_ci.ocs.ceph_snapshot import get_ceph_snapshot
+from ocs_ci.ocs.exceptions import CommandFailed
+
+log = logging.getLogger(__name__)
+
+# default max age in seconds of the verdict which can be reused
+DEFAULT_REUSE_WINDOW = 120
+
+
+@dataclass
+class HealthVerdict:
+    """
+    Verdict of the passed health check.
+
+    Attributes:
+        timestamp (float): Time when the check passed
+        signature (tuple): Change signal of the cluster at that time
+        phase (str): Phase of the check, e.g. "setup" or "teardown"
+
+    """
+
+    timestamp: float
+    signature: tuple
+    phase: str
+
+    @property
+    def age(self):
+        """
+        float: Seconds since the check passed
+        """
+        return time.time() - self.timestamp
+
+
+def health_signature(snapshot):
+    """
+    Build the change signal of the cluster from the Ceph state snapshot.
+
+    Args:
+        snapshot (CephSnapshot): The snapshot
+
+    Returns:
+        tuple: Health status, names of the health checks and the epochs of
+            the cluster maps
+
+    """
+    checks = tuple(sorted(snapshot.status["health"].get("checks", {})))
+    return (
+        snapshot.health_status,
+        checks,
+        tuple(sorted(snapshot.epochs.items())),
+    )
+
+
+class HealthGate(object):
+    """
+    Runs the health check only when the cluster could have changed since the
+    last passed check. The change signal comes from the Ceph cluster of the
+    gate's namespace only, checks of other clusters (e.g. the
+    multi-storagecluster external one) must not be run through the gate.
+    """
+
+    def __init__(self, namespace=None, window=None):
+        """
+        Args:
+            namespace (str): Namespace of the tools pod, the cluster namespace
+                by default
+            window (float): Max age of the reused verdict in seconds,
+                RUN["health_check_reuse_window"] by default, 0 disables the
+                reuse
+
+        """
+        self.namespace = namespace
+        self._window = window
+        self.verdict = None
+        self.checks = 0
+        self.reused = 0
+        self._lock = threading.Lock()
+
+    @property
+    def window(self):
+        """
+        float: Max age of the reused verdict in seconds
+        """
+        if self._window is not None:
+            return self._window
+        return config.RUN.get("health_check_reuse_window", DEFAULT_REUSE_WINDOW)
+
+    def signature(self, max_age=None):
+        """
+        Args:
+            max_age (float): Max age of the Ceph state snapshot in seconds, the
+                snapshot cache TTL by default, 0 to query the cluster
+
+        Returns:
+            tuple: Current change signal, None if it can't be fetched
+
+        """
+        try:
+            return health_signature(
+                get_ceph_snapshot(namespace=self.namespace, max_age=max_age)
+            )
+        except (CommandFailed, KeyError) as ex:
+            log.warning(f"Failed to get the Ceph health change signal: {ex}")
+            return None
+
+    def can_reuse(self, signature):
+        """
+        Args:
+            signature (tuple): Current change signal
+
+        Returns:
+            bool: True if the last verdict is valid for the signal
+
+        """
+        verdict = self.verdict
+        return (
+            verdict is not None
+            and signature is not None
+            and verdict.signature == signature
+            and verdict.age <= self.window
+        )
+
+    def invalidate(self):
+        """
+        Drop the verdict, the next check will run the full health check.
+        """
+        self.verdict = None
+
+    def check(self, health_check, phase, fresh=False):
+        """
+        Run the health check unless the verdict of the previous passed check
+        is still valid.
+
+        Args:
+            health_check (callable): Full health check without arguments,
+                raising an exception when the cluster is not healthy
+            phase (str): Phase of the check, e.g. "setup" or "teardown"
+            fresh (bool): True to fetch the change signal from the cluster,
+                the cached Ceph state snapshot is used otherwise
+
+        Returns:
+            The return value of the health check, True if the verdict was
+                reused
+
+        """
+        with self._lock:
+            if self.window > 0:
+                signature = self.signature(max_age=0 if fresh else None)
+                if self.can_reuse(signature):
+                    self.reused += 1
+                    log.info(
+                        f"Ceph health verdict of {self.verdict.phase} "
+                        f"{self.verdict.age:.0f}s ago reused at {phase}, "
+                        "cluster health state did not change"
+                    )
+                    return True
+            self.verdict = None
+            self.checks += 1
+            result = health_check()
+            if result and self.window > 0:
+                # the health check refreshed the snapshot, so the signal comes
+                # from the cache
+                signature = self.signature()
+                if signature is not None:
+                    self.verdict = HealthVerdict(time.time(), signature, phase)
+            return result
+
+
+_gates = {}
+_gates_lock = threading.Lock()
+
+
+def get_health_gate(namespace=None):
+    """
+    Get the health gate of the current cluster.
+
+    Args:
+        namespace (str): Namespace of the tools pod, the cluster namespace
+            by default
+
+    Returns:
+        HealthGate: The gate
+
+    """
+    namespace = namespace or config.ENV_DATA["cluster_namespace"]
+    key = (config.cur_index, namespace)
+    with _gates_lock:
+        if key not in _gates:
+            _gates[key] = HealthGate(namespace)
+        return _gates[key]
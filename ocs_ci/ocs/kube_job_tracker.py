@@ -0,0 +1,409 @@
+# -*- coding: utf8 -*-
+"""
+Event driven progress tracking of objects created in bulk via kube job.
+"""
+
+import json
+import logging
+import subprocess
+import threading
+import time
+from datetime import datetime, timezone
+
+import yaml
+from scipy.stats import scoreatpercentile
+
+from ocs_ci.framework import config
+from ocs_ci.ocs import constants
+from ocs_ci.ocs.exceptions import TimeoutExpiredError
+
+logger = logging.getLogger(__name__)
+
+LATENCY_PERCENTILES = (50, 95, 99)
+K8S_TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+
+def is_object_ready(obj):
+    """
+    Decide whether given k8s object of kube job reached its ready state.
+
+    Args:
+        obj (dict): k8s object as returned by ``oc get -o json``
+
+    Returns:
+        bool: True if the object is ready, False otherwise
+
+    """
+    kind = obj.get("kind")
+    status = obj.get("status") or {}
+    if kind == constants.PVC:
+        return status.get("phase") == constants.STATUS_BOUND
+    if kind == constants.POD:
+        return status.get("phase") == constants.STATUS_RUNNING
+    # For DeploymentConfig and Deployment there is no Running status so
+    # checking it based on availableReplicas
+    return bool(status.get("availableReplicas"))
+
+
+def get_creation_time(obj):
+    """
+    Get creation time of given k8s object.
+
+    Args:
+        obj (dict): k8s object as returned by ``oc get -o json``
+
+    Returns:
+        float: Creation time as seconds since the epoch, None if the object
+            has no valid creationTimestamp
+
+    """
+    created = obj.get("metadata", {}).get("creationTimestamp")
+    try:
+        created = datetime.strptime(created, K8S_TIMESTAMP_FORMAT)
+    except (TypeError, ValueError):
+        return None
+    return created.replace(tzinfo=timezone.utc).timestamp()
+
+
+def get_kube_job_objs(kube_job_obj):
+    """
+    Load k8s objects defined in the yaml file of the kube job.
+
+    Args:
+        kube_job_obj (ObjectConfFile): Kube job object
+
+    Returns:
+        list: k8s object dicts in the order of the kube job yaml file
+
+    """
+    return [
+        obj for obj in yaml.safe_load_all(kube_job_obj.yaml_file.read_text()) if obj
+    ]
+
+
+def get_kube_job_obj_names(kube_job_obj):
+    """
+    Get names of the objects defined in the kube job.
+
+    Args:
+        kube_job_obj (ObjectConfFile): Kube job object
+
+    Returns:
+        list: Names of the objects in the order of the kube job yaml file
+
+    """
+    return [obj["metadata"]["name"] for obj in get_kube_job_objs(kube_job_obj)]
+
+
+def latency_stats(latencies, percentiles=LATENCY_PERCENTILES):
+    """
+    Compute percentile statistics of given latencies.
+
+    Args:
+        latencies (list): Latency values in seconds
+        percentiles (tuple): Percentiles to compute
+
+    Returns:
+        dict: e.g. {"p50": 1.2, "p95": 3.4, "p99": 4.1, "max": 4.3}, values are
+            None when no latency was measured
+
+    """
+    stats = {f"p{p}": None for p in percentiles}
+    stats["max"] = None
+    if not latencies:
+        return stats
+    for p in percentiles:
+        stats[f"p{p}"] = round(float(scoreatpercentile(latencies, p)), 3)
+    stats["max"] = round(max(latencies), 3)
+    return stats
+
+
+class KubeJobProgressTracker:
+    """
+    Live ready/not ready tracking of the objects of a kube job batch.
+    """
+
+    def __init__(
+        self, kube_job_obj, namespace, names=None, ready_condition=is_object_ready
+    ):
+        """
+        Args:
+            kube_job_obj (ObjectConfFile): Kube job whose objects are tracked
+            namespace (str): Namespace where the kube job objects are created
+            names (list): Names of the objects to track, by default all the
+                objects from the kube job yaml file are tracked
+            ready_condition (function): Function which takes k8s object dict
+                and returns True if the object is ready
+
+        """
+        self.kube_job_obj = kube_job_obj
+        self.namespace = namespace
+        self.ready_condition = ready_condition
+        objs = get_kube_job_objs(kube_job_obj)
+        if names is None:
+            names = [obj["metadata"]["name"] for obj in objs]
+        self.names = list(names)
+        tracked = set(self.names)
+        self.kinds = sorted(
+            {obj["kind"] for obj in objs if obj["metadata"]["name"] in tracked}
+        )
+        self.not_ready = set(self.names)
+        self.ready = set()
+        self.latencies = {}
+        self.created = {}
+        self.start_time = None
+        self.end_time = None
+        self._cond = threading.Condition()
+        self._stopped = threading.Event()
+        self._procs = {}
+        self._threads = []
+
+    @property
+    def is_complete(self):
+        """
+        bool: True when all tracked objects are ready
+        """
+        with self._cond:
+            return not self.not_ready
+
+    def _watch_cmd(self, kind):
+        """
+        Build command watching all objects of given kind in the namespace.
+
+        Args:
+            kind (str): Kind of the objects to watch
+
+        Returns:
+            list: oc command
+
+        """
+        return [
+            "oc",
+            "--kubeconfig",
+            config.RUN["kubeconfig"],
+            "get",
+            kind,
+            "-n",
+            self.namespace,
+            "--watch",
+            "--output-watch-events",
+            "-o",
+            "json",
+        ]
+
+    def handle_object(self, obj, timestamp=None):
+        """
+        Update ready/not ready sets according to the observed object state.
+
+        Args:
+            obj (dict): k8s object as returned by ``oc get -o json``
+            timestamp (float): time.time() when the state was observed
+
+        """
+        name = obj.get("metadata", {}).get("name")
+        if name is None or obj.get("kind") not in self.kinds:
+            return
+        timestamp = timestamp or time.time()
+        ready = self.ready_condition(obj)
+        created = get_creation_time(obj)
+        with self._cond:
+            if created is not None:
+                self.created[name] = created
+            if name in self.not_ready and ready:
+                self.not_ready.discard(name)
+                self.ready.add(name)
+                # latency is measured from the creation of the object, the
+                # start of the tracker is used only when it's not known
+                created = self.created.get(name, self.start_time)
+                self.latencies[name] = max(0.0, timestamp - created)
+                if not self.not_ready:
+                    self.end_time = timestamp
+                self._cond.notify_all()
+            elif name in self.ready and not ready:
+                # object went back to not ready state (e.g. pod restarted)
+                logger.warning(f"{obj['kind']} {name} is not ready anymore")
+                self.ready.discard(name)
+                self.not_ready.add(name)
+                self.latencies.pop(name, None)
+                self.end_time = None
+
+    def handle_event(self, event, timestamp=None):
+        """
+        Process one event of the ``oc get --watch --output-watch-events`` stream.
+
+        Args:
+            event (dict): Watch event with ``type`` and ``object`` keys
+            timestamp (float): time.time() when the event was received
+
+        """
+        if event.get("type") == "DELETED":
+            return
+        self.handle_object(event.get("object", {}), timestamp)
+
+    def consume_stream(self, stream):
+        """
+        Read stream of concatenated json watch events and process them.
+
+        Args:
+            stream (file): Text stream with output of the watch command
+
+        """
+        decoder = json.JSONDecoder()
+        buf = ""
+        for line in stream:
+            buf += line
+            while buf:
+                buf = buf.lstrip()
+                try:
+                    event, idx = decoder.raw_decode(buf)
+                except ValueError:
+                    # incomplete json document, read more data
+                    break
+                buf = buf[idx:]
+                self.handle_event(event)
+            if self._stopped.is_set() or self.is_complete:
+                break
+
+    def _watch(self, kind):
+        """
+        Keep the watch of given kind open until tracking is stopped or the
+        batch is complete, restarting the watch when oc exits.
+
+        Args:
+            kind (str): Kind of the objects to watch
+
+        """
+        while not (self._stopped.is_set() or self.is_complete):
+            proc = subprocess.Popen(
+                self._watch_cmd(kind),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+            )
+            self._procs[kind] = proc
+            self.consume_stream(proc.stdout)
+            if proc.poll() is None:
+                proc.terminate()
+            proc.wait()
+            if not (self._stopped.is_set() or self.is_complete):
+                logger.warning(
+                    f"Watch of {kind} in namespace {self.namespace} ended "
+                    f"with rc {proc.returncode}: {proc.stderr.read().strip()}, "
+                    "restarting it"
+                )
+                time.sleep(1)
+
+    def start(self):
+        """
+        Start watching the objects of the kube job. The latency is measured
+        from the creationTimestamp of the objects, the time of the start is
+        used for the objects without it.
+
+        Returns:
+            KubeJobProgressTracker: self
+
+        """
+        self.start_time = time.time()
+        self._stopped.clear()
+        for kind in self.kinds:
+            thread = threading.Thread(
+                target=self._watch, args=(kind,), daemon=True, name=f"watch-{kind}"
+            )
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    def stop(self):
+        """
+        Stop all the watches.
+        """
+        self._stopped.set()
+        for proc in self._procs.values():
+            if proc.poll() is None:
+                proc.terminate()
+        for thread in self._threads:
+            thread.join(timeout=10)
+        self._threads = []
+        with self._cond:
+            self._cond.notify_all()
+
+    def wait(self, timeout=300):
+        """
+        Wait until all tracked objects are ready, returns the moment the batch
+        is complete.
+
+        Args:
+            timeout (int): Time in seconds to wait for the batch
+
+        Returns:
+            list: Names of the ready objects in the order of the kube job
+
+        Raises:
+            TimeoutExpiredError: If not all the objects are ready in time
+
+        """
+        if self.start_time is None:
+            self.start()
+        deadline = time.time() + timeout
+        with self._cond:
+            while self.not_ready:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    break
+                self._cond.wait(timeout=remaining)
+            not_ready = sorted(self.not_ready)
+        if not_ready:
+            raise TimeoutExpiredError(
+                timeout,
+                f"{len(not_ready)} out of {len(self.names)} objects of kube job "
+                f"{self.kube_job_obj.name} not ready in {timeout} seconds: "
+                f"{not_ready}",
+            )
+        self.stop()
+        return [name for name in self.names if name in self.ready]
+
+    def summary(self):
+        """
+        Throughput and latency statistics of the tracked batch.
+
+        Returns:
+            dict: Summary with ``total``, ``ready``, ``elapsed`` (seconds
+                since the first object was created), ``throughput`` (ready
+                objects per second) and percentiles of time to ready state
+                (seconds)
+
+        """
+        with self._cond:
+            latencies = list(self.latencies.values())
+            ready_count = len(self.ready)
+            end_time = self.end_time or time.time()
+            created = list(self.created.values())
+        if self.start_time is not None:
+            created.append(self.start_time)
+        elapsed = max(0.0, end_time - min(created)) if created else 0
+        summary = {
+            "total": len(self.names),
+            "ready": ready_count,
+            "elapsed": round(elapsed, 3),
+            "throughput": round(ready_count / elapsed, 3) if elapsed else None,
+        }
+        summary.update(latency_stats(latencies))
+        return summary
+
+    def log_summary(self):
+        """
+        Log throughput and latency statistics of the tracked batch.
+
+        Returns:
+            dict: Summary as returned by :py:meth:`summary`
+
+        """
+        summary = self.summary()
+        logger.info(
+            f"Kube job {self.kube_job_obj.name} ({', '.join(self.kinds)}): "
+            f"{summary['ready']}/{summary['total']} ready in {summary['elapsed']}s, "
+            f"throughput {summary['throughput']}/s, time to ready "
+            f"p50 {summary['p50']}s p95 {summary['p95']}s p99 {summary['p99']}s "
+            f"max {summary['max']}s"
+        )
+        return summary
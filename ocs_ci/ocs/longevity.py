@@ -21,6 +21,7 @@ from ocs_ci.ocs.scale_lib import (
     check_all_pod_reached_running_state_in_kube_job,
 )
 from ocs_ci.ocs.resources.objectconfigfile import ObjectConfFile
+from ocs_ci.ocs.longevity_pipeline import LongevityPipeline
 from ocs_ci.ocs.pgsql import Postgresql
 from ocs_ci.ocs.couchbase import CouchBase
 from ocs_ci.ocs.cosbench import Cosbench
@@ -73,6 +74,7 @@ STAGE_0_NAMESPACE = "ever-running-project"
 STAGE_2_NAMESPACE_PREFIX = "stage-2-cycle-"
 STAGE_3_NAMESPACE_PREFIX = "stage-3-cycle-"
 STAGE_4_NAMESPACE_PREFIX = "stage-4-cycle-"
+STAGE_PIPELINED_NAMESPACE_PREFIX = "stage-pipelined-batch-"
 
 
 class Longevity(object):
@@ -1004,6 +1006,121 @@ class Longevity(object):
                 f"###########[SLEEPING FOR {delay} SECONDS BEFORE STARTING NEXT STAGE3 CYCLE]###########"
             )
 
+    def stage_pipelined(
+        self,
+        num_of_pvc=30,
+        pvc_size=None,
+        run_time=1440,
+        max_objects_in_flight=None,
+        collect_cluster_sanity_checks=True,
+    ):
+        """
+        Pipelined bulk PVC and APP pod churn - all supported types (RBD, CephFS,
+        RBD-block)
+
+        Unlike the sequential cycles of stage_3, the creation of the batch N+1
+        overlaps the validation of the batch N and the deletion of the batch
+        N-1, every batch in its own namespace. The number of the PVCs and pods
+        in flight stays at max_objects_in_flight.
+
+        Args:
+            num_of_pvc (int): Bulk PVC count of every PVC type in one batch
+            pvc_size (str): size of all pvcs to be created with Gi suffix (e.g. 10Gi).
+            If None, random size pvc will be created
+            run_time (int): The amount of time new batches are created (in minutes)
+            max_objects_in_flight (int): Maximum number of the PVCs and pods
+                created and not yet deleted, three batches by default
+            collect_cluster_sanity_checks (bool): If True, collects the cluster level sanity checks
+
+        Returns:
+            dict: Report of the pipeline with the throughput and latency of
+                every step (see LongevityPipeline.run)
+
+        """
+
+        # the kube job yaml files of the overlapping batches share
+        # self.tmp_path, their names have to be unique per batch
+        def create_batch(index):
+            proj_obj = create_project(
+                project_name=f"{STAGE_PIPELINED_NAMESPACE_PREFIX}{index}"
+            )
+            batch = {"index": index, "project": proj_obj, "kube_jobs": []}
+            pvc_dict_list = self.construct_stage_builder_bulk_pvc_creation_yaml(
+                num_of_pvcs=num_of_pvc, pvc_size=pvc_size
+            )
+            batch["kube_jobs"] = self.construct_stage_builder_kube_job(
+                obj_dict_list=pvc_dict_list,
+                namespace=proj_obj.namespace,
+                kube_job_name=f"pipelined_pvc_job_profile-{index}",
+            )
+            try:
+                self.create_stage_builder_kube_job(
+                    kube_job_obj_list=batch["kube_jobs"], namespace=proj_obj.namespace
+                )
+            except Exception:
+                delete_batch(batch)
+                raise
+            return batch
+
+        def validate_batch(batch):
+            namespace = batch["project"].namespace
+            pvc_bound_list = self.get_pvc_bound_list(
+                pvc_job_file_list=batch["kube_jobs"],
+                namespace=namespace,
+                pvc_count=num_of_pvc,
+            )
+            pods_dict_list = self.construct_stage_builder_bulk_pod_creation_yaml(
+                pvc_list=pvc_bound_list, namespace=namespace
+            )
+            pod_job_file_list = self.construct_stage_builder_kube_job(
+                obj_dict_list=pods_dict_list,
+                namespace=namespace,
+                kube_job_name=f"pipelined_pods_job_profile-{batch['index']}",
+            )
+            # pods are deleted before the PVCs they use
+            batch["kube_jobs"] = pod_job_file_list + batch["kube_jobs"]
+            self.create_stage_builder_kube_job(
+                kube_job_obj_list=pod_job_file_list, namespace=namespace
+            )
+            self.validate_pods_in_kube_job_reached_running_state(
+                kube_job_obj=pod_job_file_list[0], namespace=namespace
+            )
+
+        def delete_batch(batch):
+            proj_obj = batch["project"]
+            try:
+                self.delete_stage_builder_kube_job(
+                    kube_job_obj_list=batch["kube_jobs"],
+                    namespace=proj_obj.namespace,
+                )
+            finally:
+                # the namespace deletion removes whatever the kube jobs left
+                proj_obj.delete(resource_name=proj_obj.namespace)
+                proj_obj.wait_for_delete(proj_obj.namespace, timeout=600)
+
+        if collect_cluster_sanity_checks:
+            log.info("Cluster sanity checks at the beginning of the stage")
+            self.collect_cluster_sanity_checks_outputs(
+                dir_name="Beginning_of_the_stage"
+            )
+        # 4 PVC types, every PVC attached to a pod
+        batch_size = 4 * num_of_pvc * 2
+        pipeline = LongevityPipeline(
+            create_batch,
+            validate_batch,
+            delete_batch,
+            batch_size=batch_size,
+            max_in_flight=max_objects_in_flight,
+        )
+        try:
+            report = pipeline.run(run_time=run_time)
+        finally:
+            switch_to_default_rook_cluster_project()
+            if collect_cluster_sanity_checks:
+                log.info("Collecting cluster sanity checks at the end of the stage")
+                self.collect_cluster_sanity_checks_outputs(dir_name="End_of_the_stage")
+        return report
+
     def stage_4(
         self,
         project_factory,
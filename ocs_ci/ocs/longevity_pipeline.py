@@ -0,0 +1,279 @@
+"""
+Pipelined create -> validate -> delete churn for longevity testing.
+"""
+
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+
+from ocs_ci.framework import ConfigContextThreadPoolExecutor
+from ocs_ci.ocs.exceptions import UnexpectedBehaviour
+from ocs_ci.utility.histogram import LatencyHistogram
+
+log = logging.getLogger(__name__)
+
+CREATE = "create"
+VALIDATE = "validate"
+DELETE = "delete"
+STEPS = (CREATE, VALIDATE, DELETE)
+REPORT_PERCENTILES = (50, 90, 99)
+# batches in flight by default: one being created, validated and deleted
+DEFAULT_DEPTH = 3
+
+
+@dataclass
+class PipelineBatch:
+    """
+    Batch of objects moving through the pipeline.
+
+    Attributes:
+        index (int): Sequence number of the batch
+        objects (int): Number of the objects in the batch
+        handle: Value returned by the create function, passed to the validate
+            and delete functions
+        validated (bool): True when the validation passed
+        error (Exception): Error of the create or validate step
+
+    """
+
+    index: int
+    objects: int
+    handle: object = None
+    validated: bool = False
+    error: Exception = None
+
+    @property
+    def deletable(self):
+        return self.validated or self.error is not None
+
+
+class StepStats(object):
+    """
+    Throughput and latency statistics of one step of the pipeline.
+    """
+
+    def __init__(self, name):
+        """
+        Args:
+            name (str): Name of the step
+
+        """
+        self.name = name
+        self.batches = 0
+        self.objects = 0
+        self.failures = 0
+        self.latency = LatencyHistogram(unit="ms")
+
+    def record(self, objects, duration, ok=True):
+        """
+        Record one batch processed by the step.
+
+        Args:
+            objects (int): Number of the objects in the batch
+            duration (float): Duration of the step in seconds
+            ok (bool): False if the step failed
+
+        """
+        self.batches += 1
+        if ok:
+            self.objects += objects
+        else:
+            self.failures += 1
+        self.latency.record(duration * 1000)
+
+    def summary(self, elapsed):
+        """
+        Args:
+            elapsed (float): Wall time of the pipeline in seconds
+
+        Returns:
+            dict: Batches, objects, failures, throughput in objects per minute
+                and the latency summary in milliseconds
+
+        """
+        return {
+            "batches": self.batches,
+            "objects": self.objects,
+            "failures": self.failures,
+            "objects_per_min": (
+                round(self.objects * 60 / elapsed, 2) if elapsed > 0 else None
+            ),
+            "latency": self.latency.summary(REPORT_PERCENTILES),
+        }
+
+
+class LongevityPipeline(object):
+    """
+    Runs the create, validate and delete steps of consecutive batches
+    concurrently with a bounded number of objects in flight.
+    """
+
+    def __init__(self, create, validate, delete, batch_size, max_in_flight=None):
+        """
+        Args:
+            create (callable): Function getting the batch index, creating the
+                objects of the batch and returning the handle of the batch
+            validate (callable): Function getting the handle, raising an
+                exception if the objects of the batch are not as expected
+            delete (callable): Function getting the handle and deleting the
+                objects of the batch
+            batch_size (int): Number of the objects in one batch
+            max_in_flight (int): Maximum number of the objects created and not
+                deleted yet, three batches by default
+
+        """
+        self.create = create
+        self.validate = validate
+        self.delete = delete
+        self.batch_size = batch_size
+        self.max_in_flight = max_in_flight or DEFAULT_DEPTH * batch_size
+        self.capacity = max(1, self.max_in_flight // batch_size)
+        self.stats = {step: StepStats(step) for step in STEPS}
+        self.errors = []
+
+    def _timed(self, step, batch, func, *args):
+        """
+        Run the step of the batch in the worker thread.
+
+        Returns:
+            tuple: Value of the function (None on failure), error, duration
+
+        """
+        start = time.time()
+        try:
+            value, error = func(*args), None
+        except Exception as ex:
+            log.error(f"Longevity pipeline: {step} of batch {batch.index} failed: {ex}")
+            value, error = None, ex
+        return value, error, time.time() - start
+
+    def _plan(self, alive, draining):
+        """
+        Select the batches processed in the next tick.
+
+        Returns:
+            tuple: Batch to delete, batch to validate (or None) and True if a
+                new batch should be created
+
+        """
+        to_delete = None
+        if draining or len(alive) + 1 >= self.capacity:
+            to_delete = next((batch for batch in alive if batch.deletable), None)
+        to_validate = next((batch for batch in alive if not batch.deletable), None)
+        create = not draining and len(alive) + 1 <= self.capacity
+        return to_delete, to_validate, create
+
+    def run(self, run_time=None, max_batches=None):
+        """
+        Run the pipeline until the run time passed or the number of batches
+        was created, then drain it: validate and delete all the remaining
+        batches. No new batch is created after a failure.
+
+        Args:
+            run_time (float): Time in minutes to create new batches
+            max_batches (int): Maximum number of the batches to create
+
+        Returns:
+            dict: Report with the summary of every step (see
+                StepStats.summary) and the elapsed time
+
+        Raises:
+            UnexpectedBehaviour: If any step of any batch failed, raised after
+                the pipeline was drained
+
+        """
+        if run_time is None and max_batches is None:
+            raise ValueError("Either run_time or max_batches has to be provided")
+        start = time.time()
+        end_time = start + run_time * 60 if run_time is not None else None
+        alive = deque()
+        next_index = 0
+        draining = False
+        log.info(
+            f"Starting longevity pipeline with batches of {self.batch_size} objects, "
+            f"max {self.max_in_flight} objects ({self.capacity} batches) in flight"
+        )
+        with ConfigContextThreadPoolExecutor(
+            max_workers=len(STEPS), thread_name_prefix="longevity-pipeline"
+        ) as executor:
+            while True:
+                if not draining and (
+                    self.errors
+                    or (end_time is not None and time.time() >= end_time)
+                    or (max_batches is not None and next_index >= max_batches)
+                ):
+                    log.info("Longevity pipeline: no more batches, draining")
+                    draining = True
+                to_delete, to_validate, create = self._plan(alive, draining)
+                if not (to_delete or to_validate or create):
+                    break
+                futures = {}
+                if to_delete:
+                    futures[DELETE] = (
+                        to_delete,
+                        executor.submit(
+                            self._timed,
+                            DELETE,
+                            to_delete,
+                            self.delete,
+                            to_delete.handle,
+                        ),
+                    )
+                if to_validate:
+                    futures[VALIDATE] = (
+                        to_validate,
+                        executor.submit(
+                            self._timed,
+                            VALIDATE,
+                            to_validate,
+                            self.validate,
+                            to_validate.handle,
+                        ),
+                    )
+                if create:
+                    batch = PipelineBatch(next_index, self.batch_size)
+                    next_index += 1
+                    futures[CREATE] = (
+                        batch,
+                        executor.submit(
+                            self._timed, CREATE, batch, self.create, batch.index
+                        ),
+                    )
+                self._collect(futures, alive)
+        elapsed = time.time() - start
+        report = {step: stats.summary(elapsed) for step, stats in self.stats.items()}
+        report["elapsed"] = round(elapsed, 2)
+        for step in STEPS:
+            summary = report[step]
+            log.info(
+                f"Longevity pipeline {step}: {summary['objects']} objects in "
+                f"{summary['batches']} batches, {summary['objects_per_min']} "
+                f"objects/min, latency {summary['latency']}"
+            )
+        if self.errors:
+            raise UnexpectedBehaviour(
+                f"Longevity pipeline failed: {'; '.join(self.errors)}"
+            )
+        return report
+
+    def _collect(self, futures, alive):
+        """
+        Wait for the steps of the tick and update the batches.
+        """
+        for step, (batch, future) in futures.items():
+            value, error, duration = future.result()
+            self.stats[step].record(batch.objects, duration, ok=error is None)
+            if error is not None:
+                self.errors.append(f"{step} of batch {batch.index}: {error}")
+            if step == CREATE:
+                batch.handle = value
+                batch.error = error
+                if error is None:
+                    alive.append(batch)
+            elif step == VALIDATE:
+                batch.error = error
+                batch.validated = error is None
+            else:
+                # the failed deletion is reported, the batch is not retried
+                alive.remove(batch)
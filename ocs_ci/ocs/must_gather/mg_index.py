@@ -0,0 +1,195 @@
+"""
+Index of the must-gather directory tree.
+"""
+
+import hashlib
+import logging
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 8
+
+
+class MustGatherIndex(object):
+    """
+    Files and directories of the must-gather tree, indexed by their name.
+    """
+
+    def __init__(self, root, max_workers=DEFAULT_MAX_WORKERS):
+        """
+        Args:
+            root (str): Root directory of the must-gather
+            max_workers (int): Number of threads reading the file contents
+
+        """
+        self.root = root
+        self.max_workers = max_workers
+        # full path: size of all the files
+        self.files = {}
+        # full paths of all the directories, in top-down walk order
+        self.dirs = []
+        # file name: full paths with that name, in top-down walk order
+        self.names = {}
+        # directory path: names of its files and subdirectories
+        self.children = {}
+        self._fingerprints = {}
+        self._all_paths = None
+        self._joined_paths = None
+        self.build()
+
+    def build(self):
+        """
+        Traverse the must-gather tree once and record all the entries.
+        """
+        for dir_name, subdirs, files in os.walk(self.root):
+            self.dirs.append(dir_name)
+            self.children[dir_name] = subdirs + files
+            for name in files:
+                path = os.path.join(dir_name, name)
+                try:
+                    size = os.stat(path).st_size
+                except OSError as e:
+                    logger.warning(f"Can't stat {path}: {e}")
+                    continue
+                self.files[path] = size
+                self.names.setdefault(name, []).append(path)
+        logger.info(
+            f"Indexed {len(self.files)} files in {len(self.dirs)} directories "
+            f"of {self.root}"
+        )
+
+    def find(self, name):
+        """
+        Find the file by its name, the first one in top-down walk order.
+
+        Args:
+            name (str): File name
+
+        Returns:
+            str: Full path of the file, None if there is no such file
+
+        """
+        paths = self.names.get(name)
+        return paths[0] if paths else None
+
+    def find_dir(self, pattern):
+        """
+        Find the directory by regular expression.
+
+        Args:
+            pattern (str): Regular expression matched against the full path
+
+        Returns:
+            str: Full path of the first matching directory, None if none matches
+
+        """
+        regex = re.compile(pattern)
+        for dir_name in self.dirs:
+            if regex.search(dir_name):
+                return dir_name
+        return None
+
+    def empty_files(self):
+        """
+        Returns:
+            list: Full paths of all the empty files
+
+        """
+        return [path for path, size in self.files.items() if size == 0]
+
+    @property
+    def all_paths(self):
+        """
+        list: Full paths of all the files and directories, except the root
+        """
+        if self._all_paths is None:
+            self._all_paths = [
+                os.path.join(dir_name, name)
+                for dir_name in self.dirs
+                for name in self.children[dir_name]
+            ]
+        return self._all_paths
+
+    def contains_path(self, path):
+        """
+        Check whether some file or directory path contains the given string,
+        e.g. ``/ceph_logs/journal_``.
+
+        Args:
+            path (str): Part of the path to look for
+
+        Returns:
+            bool: True if some path contains it
+
+        """
+        if "\n" in path:
+            return any(path in full_path for full_path in self.all_paths)
+        if self._joined_paths is None:
+            # one string scan per query instead of a loop over the paths
+            self._joined_paths = "\n".join(self.all_paths)
+        return path in self._joined_paths
+
+    def check_contents(self, paths, check):
+        """
+        Run content check of the files in parallel.
+
+        Args:
+            paths (list): Full paths of the files to check
+            check (callable): Function getting the file content (str) and
+                returning True if the content is as expected
+
+        Returns:
+            dict: {path: result of the check}, None if the file can't be read
+
+        """
+
+        def run_check(path):
+            try:
+                with open(path, "r") as f:
+                    return check(f.read())
+            except Exception as e:
+                logger.error(f"There is no option to read {path}, error: {e}")
+                return None
+
+        paths = list(paths)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return dict(zip(paths, executor.map(run_check, paths)))
+
+    def fingerprint(self, path):
+        """
+        Content fingerprint of the file, computed once and cached.
+
+        Args:
+            path (str): Full path of the file
+
+        Returns:
+            str: Hex digest of the file content
+
+        """
+        digest = self._fingerprints.get(path)
+        if digest is None:
+            hasher = hashlib.blake2b(digest_size=16)
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    hasher.update(chunk)
+            digest = hasher.hexdigest()
+            self._fingerprints[path] = digest
+        return digest
+
+    def fingerprints(self, paths=None):
+        """
+        Content fingerprints of the files, computed in parallel.
+
+        Args:
+            paths (list): Full paths of the files, all the files by default
+
+        Returns:
+            dict: {path: hex digest}
+
+        """
+        paths = list(self.files if paths is None else paths)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return dict(zip(paths, executor.map(self.fingerprint, paths)))
@@ -14,6 +14,7 @@ from ocs_ci.ocs.must_gather.const_must_gather import (
     GATHER_COMMANDS_VERSION,
     GATHER_COMMANDS_LOG,
 )
+from ocs_ci.ocs.must_gather.mg_index import MustGatherIndex
 from ocs_ci.utility import version
 from ocs_ci.ocs.constants import MANAGED_SERVICE_PLATFORMS
 
@@ -36,6 +37,7 @@ class MustGather(object):
         self.files_content_issue = list()
         self.ocs_version = version.get_semantic_ocs_version_from_config()
         self.full_paths = list()
+        self._index = None
 
     @property
     def log_type(self):
@@ -61,6 +63,23 @@ class MustGather(object):
             dir_name=temp_folder, ocp=False, ocs_flags=ocs_flags, mg_options=mg_options
         )
         self.root = temp_folder + "_ocs_logs"
+        self._index = None
+
+    @property
+    def index(self):
+        """
+        MustGatherIndex: Index of the must gather dir, built on first use
+        """
+        if self._index is None or self._index.root != self.root:
+            self._index = MustGatherIndex(self.root)
+        return self._index
+
+    def refresh_index(self):
+        """
+        Drop the index, so it is built again after the must gather dir changed
+
+        """
+        self._index = None
 
     def search_file_path(self):
         """
@@ -80,12 +99,11 @@ class MustGather(object):
         else:
             files = GATHER_COMMANDS_VERSION[ocs_version][self.type_log]
         for file in files:
-            self.files_not_exist.append(file)
-            for dir_name, subdir_list, files_list in os.walk(self.root):
-                if file in files_list:
-                    self.files_path[file] = os.path.join(dir_name, file)
-                    self.files_not_exist.remove(file)
-                    break
+            file_path = self.index.find(file)
+            if file_path is None:
+                self.files_not_exist.append(file)
+            else:
+                self.files_path[file] = file_path
 
     def validate_file_size(self):
         """
@@ -94,15 +112,11 @@ class MustGather(object):
         """
         if self.type_log != "OTHERS":
             return
-        for path, subdirs, files in os.walk(self.root):
-            for file in files:
-                file_path = os.path.join(path, file)
-                if (
-                    Path(file_path).stat().st_size == 0
-                    and "noobaa-db-pg-0-init.log" not in file_path
-                ):
-                    logger.error(f"log file {file} empty!")
-                    self.empty_files.append(file)
+        for file_path in self.index.empty_files():
+            if "noobaa-db-pg-0-init.log" not in file_path:
+                file = os.path.basename(file_path)
+                logger.error(f"log file {file} empty!")
+                self.empty_files.append(file)
 
     def validate_expected_files(self):
         """
@@ -113,13 +127,19 @@ class MustGather(object):
         # https://bugzilla.redhat.com/show_bug.cgi?id=2125204
         # https://bugzilla.redhat.com/show_bug.cgi?id=2049204
         # self.verify_ceph_file_content()
+        yaml_files = {}
         for file, file_path in self.files_path.items():
             if not Path(file_path).is_file():
                 self.files_not_exist.append(file)
             elif re.search(r"\.yaml$", file):
-                with open(file_path, "r") as f:
-                    if "kind" not in f.read().lower():
-                        self.files_content_issue.append(file)
+                yaml_files[file_path] = file
+        results = self.index.check_contents(
+            yaml_files, lambda content: "kind" in content.lower()
+        )
+        for file_path, file in yaml_files.items():
+            # unreadable file is a content issue as well
+            if not results[file_path]:
+                self.files_content_issue.append(file)
 
     def verify_ceph_file_content(self):
         """
@@ -131,16 +151,17 @@ class MustGather(object):
         if self.type_log != "CEPH" or self.ocs_version < version.VERSION_4_9:
             return
         pattern = re.compile("exit code [1-9]+")
-        for root, dirs, files in os.walk(self.root):
-            for file in files:
-                try:
-                    with open(os.path.join(root, file), "r") as f:
-                        data_file = f.read()
-                    exit_code_error = pattern.findall(data_file.lower())
-                    if len(exit_code_error) > 0 and "gather-debug" not in file:
-                        self.files_content_issue.append(os.path.join(root, file))
-                except Exception as e:
-                    logger.error(f"There is no option to read {file}, error: {e}")
+        paths = [
+            path
+            for path in self.index.files
+            if "gather-debug" not in os.path.basename(path)
+        ]
+        results = self.index.check_contents(
+            paths, lambda content: not pattern.search(content.lower())
+        )
+        for path, result in results.items():
+            if result is False:
+                self.files_content_issue.append(path)
 
     def print_must_gather_debug(self) -> None:
         try:
@@ -165,14 +186,11 @@ class MustGather(object):
             if pattern is False:
                 pod_names.append(pod.name)
 
-        for dir_name, subdir_list, files_list in os.walk(self.root):
-            if re.search("openshift-storage/pods$", dir_name):
-                pod_path = dir_name
-                break
+        pod_path = self.index.find_dir("openshift-storage/pods$")
 
         pod_files = []
         logger.info("Get pod names on openshift-storage/pods directory")
-        for pod_file in os.listdir(pod_path):
+        for pod_file in self.index.children[pod_path]:
             pattern = self.check_pod_name_pattern(pod_file)
             if pattern is False:
                 pod_files.append(pod_file)
@@ -239,16 +257,17 @@ class MustGather(object):
         if self.type_log == "OTHERS" and ocs_version >= version.VERSION_4_6:
             flag = False
             logger.info("Verify noobaa_diagnostics folder exist")
-            for path, subdirs, files in os.walk(self.root):
-                for file in files:
-                    if re.search(r"noobaa_diagnostics_.*.tar.gz", file):
-                        flag = True
-                        logger.info(f"Extract noobaa_diagnostics dir {file}")
-                        path_noobaa_diag = os.path.join(path, file)
-                        files_noobaa_diag = tarfile.open(path_noobaa_diag)
-                        files_noobaa_diag.extractall(path)
-                        break
-            if not flag:
+            for path_noobaa_diag in list(self.index.files):
+                file = os.path.basename(path_noobaa_diag)
+                if re.search(r"noobaa_diagnostics_.*.tar.gz", file):
+                    flag = True
+                    logger.info(f"Extract noobaa_diagnostics dir {file}")
+                    files_noobaa_diag = tarfile.open(path_noobaa_diag)
+                    files_noobaa_diag.extractall(os.path.dirname(path_noobaa_diag))
+            if flag:
+                # the extracted files are not in the index yet
+                self.refresh_index()
+            else:
                 logger.error("noobaa_diagnostics.tar.gz does not exist")
                 self.files_not_exist.append("noobaa_diagnostics.tar.gz")
 
@@ -257,10 +276,7 @@ class MustGather(object):
         Get all paths in must gather dir
 
         """
-        for root, dirs, files in os.walk(self.root):
-            for name in files + dirs:
-                full_path = os.path.join(root, name)
-                self.full_paths.append(full_path)
+        self.full_paths.extend(self.index.all_paths)
 
     def verify_paths_in_dir(self, paths):
         """
@@ -274,15 +290,7 @@ class MustGather(object):
             list: the paths do not exist in mg dir
 
         """
-        paths_exist = []
-        for path in paths:
-            status = False
-            for full_path in self.full_paths:
-                if path in full_path:
-                    status = True
-            if not status:
-                paths_exist.append(path)
-        return paths_exist
+        return [path for path in paths if not self.index.contains_path(path)]
 
     def verify_paths_not_in_dir(self, paths):
         """
@@ -296,15 +304,7 @@ class MustGather(object):
             list: the paths exist in mg dir
 
         """
-        paths_not_exist = []
-        for path in paths:
-            status = True
-            for full_path in self.full_paths:
-                if path in full_path:
-                    status = False
-            if not status:
-                paths_not_exist.append(path)
-        return paths_not_exist
+        return [path for path in paths if self.index.contains_path(path)]
 
     def validate_must_gather(self):
         """
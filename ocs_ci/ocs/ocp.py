@@ -181,14 +181,27 @@ class OCP(object):
             str: If out_yaml_format is False.
 
         """
-        # switch to a context where the resource was created
-        original_context = None
+        # run the command in the context of the cluster where the resource was
+        # created, bound to this thread only, so the global context is never
+        # switched
         if (
-            config.cluster_ctx.MULTICLUSTER.get("multicluster_index")
+            self.cluster_context is not None
+            and config.cluster_ctx.MULTICLUSTER.get("multicluster_index")
             != self.cluster_context
         ):
-            original_context = config.cluster_ctx.MULTICLUSTER.get("multicluster_index")
-            config.switch_ctx(self.cluster_context)
+            with config.use(self.cluster_context):
+                return self.exec_oc_cmd(
+                    command,
+                    out_yaml_format=out_yaml_format,
+                    secrets=secrets,
+                    timeout=timeout,
+                    ignore_error=ignore_error,
+                    silent=silent,
+                    cluster_config=cluster_config,
+                    skip_tls_verify=skip_tls_verify,
+                    output_file=output_file,
+                    **kwargs,
+                )
 
         oc_cmd = "oc "
         env_kubeconfig = None
@@ -234,8 +247,6 @@ class OCP(object):
         if out_yaml_format:
             return yaml.safe_load(out)
 
-        if original_context:
-            config.switch_ctx(original_context)
         return out
 
     @retry(CommandFailed, tries=3, delay=30, backoff=1)
@@ -9,6 +9,7 @@ import time
 
 from elasticsearch import Elasticsearch, exceptions as ESExp
 from ocs_ci.ocs.defaults import ELASTICSEARCE_SCHEME
+from ocs_ci.ocs.es_reader import ESReader
 
 log = logging.getLogger(__name__)
 
@@ -74,10 +75,13 @@ class PerfResult:
                 "Cannot connect to ES server {}:{}".format(self.server, self.port)
             )
 
-    def es_read(self):
+    def es_read(self, source=None):
         """
         Reading all test results from the elastic-search server
 
+        Args:
+            source (list): names of the fields to read, all fields by default
+
         Return:
             list: list of results
 
@@ -86,10 +90,51 @@ class PerfResult:
 
         """
 
-        query = {"query": {"match": {"uuid": self.uuid}}}
-        results = self.es.search(index=self.index, body=query)
-        assert results["hits"]["hits"], "Results not found in Elasticsearch"
-        return results["hits"]["hits"]
+        results = list(self.es_iter(source=source))
+        assert results, "Results not found in Elasticsearch"
+        return results
+
+    def es_iter(self, query=None, source=None, index=None):
+        """
+        Lazily iterate over all the results of the test (or of the given
+        query) in the elastic-search server, page by page, so the number of
+        results is not limited by the search hits limit.
+
+        Args:
+            query (dict): query to run, the results of this test by default
+            source (list): names of the fields to read, all fields by default
+            index (str): the index to read, self.index by default
+
+        Yields:
+            dict: the results (hits)
+
+        """
+
+        if query is None:
+            query = {"match": {"uuid": self.uuid}}
+        reader = ESReader(self.es, index or self.index)
+        yield from reader.iter_hits(query, source=source)
+
+    def es_aggregate(self, aggregations, query=None, index=None):
+        """
+        Compute aggregations of the results by the elastic-search server,
+        e.g. statistics of previous runs, without reading the documents.
+
+        Args:
+            aggregations (dict): the aggregations to compute
+            query (dict): query selecting the results, the results of this
+                test by default
+            index (str): the index to read, self.index by default
+
+        Returns:
+            dict: results of the aggregations by their names
+
+        """
+
+        if query is None:
+            query = {"match": {"uuid": self.uuid}}
+        reader = ESReader(self.es, index or self.index)
+        return reader.aggregate(query, aggregations)
 
     def dump_to_file(self):
         """
@@ -151,6 +196,21 @@ class PerfResult:
 
         self.results.update({key: value})
 
+    def add_histogram(self, key, histogram):
+        """
+        Adding latency histogram to the results. The serialized histogram is
+        stored under the key, so histograms of multiple tests can be merged
+        later, and its summary (count, min, max, mean and percentiles) under
+        <key>_summary.
+
+        Args:
+            key (str): String which will be the key for the histogram
+            histogram (LatencyHistogram): The histogram to add
+
+        """
+        self.add_key(key, histogram.to_dict())
+        self.add_key(f"{key}_summary", histogram.summary())
+
     def results_link(self):
         """
         Create a link to the results of the test in the elasticsearch serer
@@ -21,6 +21,7 @@ from ocs_ci.ocs import benchmark_operator, constants, defaults, exceptions, node
 from ocs_ci.ocs.cluster import CephCluster
 from ocs_ci.ocs.defaults import ELASTICSEARCE_SCHEME
 from ocs_ci.ocs.elasticsearch import elasticsearch_load
+from ocs_ci.ocs.es_reader import ESReader
 from ocs_ci.ocs.exceptions import (
     CommandFailed,
     MissingRequiredConfigKeyError,
@@ -571,14 +572,16 @@ class PASTest(BaseTest):
                 log.warning("Cannot upload data into the Main ES server")
                 return False
 
-    def read_from_es(self, es, index, uuid):
+    def read_from_es(self, es, index, uuid, source=None):
         """
-        Reading all results from elasticsearch server
+        Reading all results from elasticsearch server, the results are read
+        page by page so all of them are returned regardless of their number.
 
         Args:
             es (dict): dictionary with elasticsearch info  {server, port}
             index (str): the index name to read from the elasticsearch server
             uuid (str): the test UUID to find in the elasticsearch server
+            source (list): names of the fields to read, all fields by default
 
         Returns:
             list : list of all results
@@ -594,14 +597,10 @@ class PASTest(BaseTest):
                 }
             ]
         )
-        query = {"size": 1000, "query": {"match": {"uuid": uuid}}}
+        reader = ESReader(con, index)
 
         try:
-            results = con.search(index=index, body=query)
-            full_data = []
-            for res in results["hits"]["hits"]:
-                full_data.append(res["_source"])
-            return full_data
+            return list(reader.iter_sources({"match": {"uuid": uuid}}, source=source))
 
         except Exception as e:
             log.warning(f"{index} Not found in the Internal ES. ({e})")
@@ -35,7 +35,9 @@ from ocs_ci.helpers.helpers import (
     storagecluster_independent_check,
     validate_pv_delete,
 )
+from ocs_ci.utility.histogram import LatencyHistogram
 from ocs_ci.utility.spreadsheet.spreadsheet_api import GoogleSpreadSheetAPI
+from ocs_ci.utility.workload_log_parser import PgbenchLogParser, WorkloadLogCollector
 from ocs_ci.ocs.ocp import switch_to_project
 
 log = logging.getLogger(__name__)
@@ -52,6 +54,8 @@ class Postgresql(BenchmarkOperator):
 
         """
         super().__init__(**kwargs)
+        self.pgbench_log_collector = None
+        self.pgbench_latency_histograms = {}
         BenchmarkOperator.deploy(self)
 
     def setup_postgresql(self, replicas, sc_name=None):
@@ -303,6 +307,73 @@ class Postgresql(BenchmarkOperator):
                 error_msg = f"{pgbench_pod_obj.name} did not reach to {status} state after {timeout} sec\n{output}"
                 log.error(error_msg)
                 raise UnexpectedBehaviour(error_msg)
+        if status == constants.STATUS_RUNNING:
+            # parse the results while pgbench is running
+            self.follow_pgbench_logs(pgbench_pod_objs)
+
+    def follow_pgbench_logs(self, pgbench_pods):
+        """
+        Start following logs of running pgbench pods, so their results are
+        parsed while pgbench runs and are ready once it completes
+
+        Args:
+            pgbench_pods (list): List of pgbench pods
+
+        """
+        if self.pgbench_log_collector is None:
+            self.pgbench_log_collector = WorkloadLogCollector(
+                BMO_NAME, PgbenchLogParser
+            )
+        for pgbench_pod in pgbench_pods:
+            self.pgbench_log_collector.follow(pgbench_pod.name)
+
+    def get_pgbench_results(self, pgbench_pods, timeout=600):
+        """
+        Get parsed results of pgbench pods. Logs of the pods which were not
+        followed while running are fetched and parsed concurrently
+
+        Args:
+            pgbench_pods (list): List of completed pgbench pods
+            timeout (int): Time in seconds to wait for the logs
+
+        Returns:
+            dict: pgbench pod name as key and its parsed output (see
+                :py:func:`ocs_ci.utility.utils.parse_pgsql_logs`) as value
+
+        """
+        followed = self.pgbench_log_collector
+        pod_names = [pgbench_pod.name for pgbench_pod in pgbench_pods]
+        results = {}
+        if followed and set(pod_names) & set(followed.pods):
+            results.update(followed.wait(timeout=timeout, raise_errors=False))
+        collector = WorkloadLogCollector(BMO_NAME, PgbenchLogParser, follow=False)
+        for pod_name in pod_names:
+            if pod_name not in results:
+                collector.follow(pod_name)
+        results.update(collector.wait(timeout=timeout))
+        for parsers in (followed.parsers if followed else {}, collector.parsers):
+            for pod_name, parser in parsers.items():
+                if pod_name in results:
+                    self.pgbench_latency_histograms[pod_name] = parser.histogram()
+        return {pod_name: results[pod_name] for pod_name in pod_names}
+
+    def get_pgbench_latency_histogram(self, pgbench_pods):
+        """
+        Get latency histogram of pgbench pods, merged into one. Results of the
+        pods have to be fetched by get_pgbench_results() first
+
+        Args:
+            pgbench_pods (list): List of pgbench pods
+
+        Returns:
+            LatencyHistogram: Latency histogram (us)
+
+        """
+        return LatencyHistogram.merged(
+            self.pgbench_latency_histograms[pgbench_pod.name]
+            for pgbench_pod in pgbench_pods
+            if pgbench_pod.name in self.pgbench_latency_histograms
+        )
 
     def validate_pgbench_run(self, pgbench_pods, print_table=True):
         """
@@ -316,10 +387,10 @@ class Postgresql(BenchmarkOperator):
 
         """
         all_pgbench_pods_output = []
+        pgbench_results = self.get_pgbench_results(pgbench_pods)
         for pgbench_pod in pgbench_pods:
             log.info(f"pgbench_client_pod===={pgbench_pod.name}====")
-            output = run_cmd(f"oc logs {pgbench_pod.name} -n {BMO_NAME}")
-            pg_output = utils.parse_pgsql_logs(output)
+            pg_output = pgbench_results[pgbench_pod.name]
             log.info("*******PGBench output log*********\n" f"{pg_output}")
             for data in pg_output:
                 run_id = list(data.keys())
@@ -329,6 +400,11 @@ class Postgresql(BenchmarkOperator):
                     )
             log.info(f"PGBench on {pgbench_pod.name} completed successfully")
             all_pgbench_pods_output.append((pg_output, pgbench_pod.name))
+        latency_histogram = self.get_pgbench_latency_histogram(pgbench_pods)
+        log.info(
+            f"PGBench latency of {len(pgbench_pods)} pods: "
+            f"{latency_histogram.summary()}"
+        )
 
         if print_table:
             pgbench_pod_table = PrettyTable()
@@ -456,9 +532,9 @@ class Postgresql(BenchmarkOperator):
             "tps_incl",
             "tps_excl",
         ]
+        pgbench_results = self.get_pgbench_results(pgbench_pods)
         for pgbench_pod in pgbench_pods:
-            output = run_cmd(f"oc logs {pgbench_pod.name} -n {BMO_NAME}")
-            pg_output = utils.parse_pgsql_logs(output)
+            pg_output = pgbench_results[pgbench_pod.name]
             for pod_output in pg_output:
                 for pod in pod_output.values():
                     pgbench_pod_table.add_row(
@@ -4,8 +4,7 @@ Pillowfight Class to run various workloads and scale tests
 
 import logging
 import tempfile
-import re
-from os import listdir
+from os import listdir, remove
 from os.path import join
 from shutil import rmtree
 from ocs_ci.utility.spreadsheet.spreadsheet_api import GoogleSpreadSheetAPI
@@ -16,6 +15,12 @@ from ocs_ci.ocs import constants
 from ocs_ci.ocs.utils import get_pod_name_by_pattern
 from ocs_ci.utility.utils import TimeoutSampler
 from ocs_ci.utility import utils, templating
+from ocs_ci.utility.histogram import LatencyHistogram
+from ocs_ci.utility.workload_log_parser import (
+    PillowfightLogParser,
+    WorkloadLogCollector,
+    pillowfight_latency_histogram,
+)
 
 log = logging.getLogger(__name__)
 
@@ -57,6 +62,7 @@ class PillowFight(object):
         self.ocp = OCP()
         self.up_check = OCP(namespace=constants.COUCHBASE_OPERATOR)
         self.logs = tempfile.mkdtemp(prefix="pf_logs_")
+        self.results = {}
 
     def run_pillowfights(
         self, replicas=1, num_items=None, num_threads=None, num_of_cycles=None
@@ -99,14 +105,17 @@ class PillowFight(object):
     def wait_for_pillowfights_to_complete(self, timeout=1800):
         """
         Wait for the pillowfights to complete.
-        Run oc logs on the results and save the logs in self.logs directory
+        Logs of the pillowfight pods are followed and parsed while they run and
+        saved in self.logs directory
 
         Raises:
             Exception: If pillowfight fails to reach completed state
 
         """
         self.pods_info = {}
-        ocp_local = OCP(namespace=self.namespace)
+        collector = WorkloadLogCollector(
+            self.namespace, PillowfightLogParser, logs_dir=self.logs
+        )
         for pillowfight_pods in TimeoutSampler(
             timeout,
             9,
@@ -124,27 +133,56 @@ class PillowFight(object):
                         if pf_completion_info == constants.STATUS_COMPLETED:
                             counter += 1
                             self.pods_info.update({pf_pod: pf_completion_info})
+                            collector.follow(pf_pod)
                     elif "running" in pf_status:
-                        pass
+                        collector.follow(pf_pod)
                 if counter == self.replicas:
                     break
             except IndexError:
                 log.info("Pillowfight not yet completed")
 
         log.info(self.pods_info)
+        results = collector.wait(timeout=timeout)
         for pod, pf_completion_info in self.pods_info.items():
             if pf_completion_info == "Completed":
-                pf_endlog = f"{pod}.log"
-                pf_log = join(self.logs, pf_endlog)
-                data_from_log = ocp_local.exec_oc_cmd(
-                    f"logs -f {pod} --ignore-errors", out_yaml_format=False
-                )
-                data_from_log = data_from_log.replace("\x00", "")
-                with open(pf_log, "w") as fd:
-                    fd.write(data_from_log)
-
+                self.results[f"{pod}.log"] = results[pod]
             elif pf_completion_info == "Error":
                 raise Exception("Pillowfight failed to complete")
+        # keep only logs of the completed pods
+        for pod in collector.pods:
+            if pod not in self.pods_info:
+                remove(collector.log_path(pod))
+
+    def get_log_results(self, path):
+        """
+        Get parsed results of pillowfight log saved in self.logs directory
+
+        Args:
+            path (str): Name of the log file
+
+        Returns:
+            dict: ops per sec and response time information, see
+                parse_pillowfight_log()
+
+        """
+        if path not in self.results:
+            with open(join(self.logs, path), "r") as fdesc:
+                self.results[path] = PillowfightLogParser().feed_lines(fdesc)
+        return self.results[path]
+
+    def get_latency_histogram(self):
+        """
+        Get response time histogram of all the pillowfight logs saved in
+        self.logs directory, merged into one
+
+        Returns:
+            LatencyHistogram: Response time histogram (us)
+
+        """
+        return LatencyHistogram.merged(
+            pillowfight_latency_histogram(self.get_log_results(path))
+            for path in listdir(self.logs)
+        )
 
     def analyze_all(self):
         """
@@ -152,12 +190,12 @@ class PillowFight(object):
 
         """
         for path in listdir(self.logs):
-            full_path = join(self.logs, path)
-            log.info(f"Analyzing {full_path}")
-            with open(full_path, "r") as fdesc:
-                data_from_log = fdesc.read()
-            log_data = self.parse_pillowfight_log(data_from_log)
+            log.info(f"Analyzing {join(self.logs, path)}")
+            log_data = self.get_log_results(path)
             self.sanity_check(log_data)
+        log.info(
+            f"Pillowfight response times: {self.get_latency_histogram().summary()}"
+        )
 
     def sanity_check(self, stats):
         """
@@ -201,30 +239,8 @@ class PillowFight(object):
         # So what's left is a list of OPS/SEC values and a histogram of
         # response times.  This routine organizes that data.
 
-        ops_per_sec = []
-        resp_hist = {}
         log.info("*******Couchbase raw output log*********\n" f"{data_from_log}")
-        lines = data_from_log.split("\n")
-        for dline in lines:
-            try:
-                if dline.startswith("OPS/SEC"):
-                    dfields = dline.split(" ")
-                    dnumb = int(dfields[-1].strip())
-                    ops_per_sec.append(dnumb)
-                if re.match("^\\[\\d+ +- \\d+ *\\][um]s \\|#* - \\d+", dline):
-                    for element in ["[", "]", "|", "-", "#"]:
-                        dline = dline.replace(element, " ")
-                    parts = dline.split()
-                    i1 = int(parts[0])
-                    i2 = int(parts[1])
-                    if parts[2] == "ms":
-                        i1 *= 1000
-                        i2 *= 1000
-                    resp_hist[i2] = {"minindx": i1, "number": int(parts[3])}
-            except ValueError:
-                log.info(f"{dline} -- contains invalid data")
-        ret_data = {"opspersec": ops_per_sec, "resptimes": resp_hist}
-        return ret_data
+        return PillowfightLogParser().feed_text(data_from_log)
 
     def export_pfoutput_to_googlesheet(self, sheet_name, sheet_index):
         """
@@ -239,10 +255,7 @@ class PillowFight(object):
         g_sheet = GoogleSpreadSheetAPI(sheet_name=sheet_name, sheet_index=sheet_index)
         log.info("Exporting pf data to google spreadsheet")
         for path in listdir(self.logs):
-            full_path = join(self.logs, path)
-            with open(full_path, "r") as fdesc:
-                data_from_log = fdesc.read()
-            log_data = self.parse_pillowfight_log(data_from_log)
+            log_data = self.get_log_results(path)
 
             g_sheet.insert_row(
                 [
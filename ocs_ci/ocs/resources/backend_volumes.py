@@ -0,0 +1,169 @@
+"""
+Inventory of the Ceph backend volumes (RBD images and CephFS subvolumes).
+"""
+
+import logging
+
+from ocs_ci.ocs import constants
+from ocs_ci.ocs.exceptions import CommandFailed
+from ocs_ci.ocs.resources.pod import get_ceph_tools_pod
+from ocs_ci.ocs.resources.pv import get_all_pvs
+
+logger = logging.getLogger(__name__)
+
+# prefix of the PVCs created by VolSync which have no backend volume of the
+# workload
+VOLSYNC_PREFIX = "volsync"
+
+
+def backend_volume_name(pv):
+    """
+    Get the name of the backend volume from the CSI attributes of the PV.
+
+    Args:
+        pv (dict): PV data
+
+    Returns:
+        str: Name of the RBD image or CephFS subvolume, None if the PV is not
+            backed by the Ceph CSI driver
+
+    """
+    attributes = (pv.get("spec", {}).get("csi") or {}).get("volumeAttributes") or {}
+    return attributes.get("imageName") or attributes.get("subvolumeName")
+
+
+def get_backend_volumes(namespace, pvs=None):
+    """
+    Map the PVCs of the namespace to their backend volumes with one PV listing.
+
+    Args:
+        namespace (str): The namespace of the PVCs
+        pvs (list): PV data to use instead of listing the PVs of the cluster
+
+    Returns:
+        dict: Backend volume name keyed by the PVC name
+
+    """
+    if pvs is None:
+        pvs = get_all_pvs().get("items", [])
+    volumes = {}
+    for pv in pvs:
+        claim = pv.get("spec", {}).get("claimRef") or {}
+        if claim.get("namespace") != namespace:
+            continue
+        if claim.get("name", "").startswith(VOLSYNC_PREFIX):
+            continue
+        name = backend_volume_name(pv)
+        if name:
+            volumes[claim["name"]] = name
+    return volumes
+
+
+class BackendVolumeInventory(object):
+    """
+    Listed RBD images and CephFS subvolumes of one pool, rados namespace and
+    subvolume group of the current cluster.
+    """
+
+    def __init__(
+        self,
+        rbd_pool=constants.DEFAULT_CEPHBLOCKPOOL,
+        rados_namespace=None,
+        subvolumegroup="csi",
+        fs_name=None,
+        ct_pod=None,
+    ):
+        """
+        Args:
+            rbd_pool (str): Name of the RBD pool
+            rados_namespace (str): Name of the rados namespace in the pool
+            subvolumegroup (str): Name of the CephFS subvolume group
+            fs_name (str): Name of the CephFS, the first filesystem by default
+            ct_pod (Pod): Ceph tools pod, looked up by default and again
+                after a failed listing (e.g. the tools pod was restarted)
+
+        """
+        self.rbd_pool = rbd_pool
+        self.rados_namespace = rados_namespace
+        self.subvolumegroup = subvolumegroup
+        self._fs_name = fs_name
+        self._ct_pod = ct_pod
+        self._lookup_ct_pod = ct_pod is None
+        self.images = set()
+        self.subvolumes = set()
+        self.refreshes = 0
+
+    @property
+    def ct_pod(self):
+        """
+        Pod: Ceph tools pod
+        """
+        if self._ct_pod is None:
+            self._ct_pod = get_ceph_tools_pod()
+        return self._ct_pod
+
+    @property
+    def fs_name(self):
+        """
+        str: Name of the CephFS
+        """
+        if self._fs_name is None:
+            self._fs_name = self.ct_pod.exec_ceph_cmd("ceph fs ls")[0]["name"]
+        return self._fs_name
+
+    def refresh(self):
+        """
+        List the RBD images and CephFS subvolumes in the backend.
+
+        Returns:
+            set: Names of all the listed backend volumes
+
+        Raises:
+            CommandFailed: If the listing failed, the tools pod is looked up
+                again by the next refresh
+
+        """
+        namespace_param = (
+            f" --namespace {self.rados_namespace}" if self.rados_namespace else ""
+        )
+        try:
+            images = set(
+                self.ct_pod.exec_cmd_on_pod(
+                    f"rbd ls {self.rbd_pool}{namespace_param} --format json"
+                )
+                or []
+            )
+            subvolumes = {
+                subvolume["name"]
+                for subvolume in self.ct_pod.exec_cmd_on_pod(
+                    f"ceph fs subvolume ls {self.fs_name} "
+                    f"--group_name {self.subvolumegroup}"
+                )
+                or []
+            }
+        except CommandFailed:
+            if self._lookup_ct_pod:
+                self._ct_pod = None
+            raise
+        self.images = images
+        self.subvolumes = subvolumes
+        self.refreshes += 1
+        volumes = self.images | self.subvolumes
+        logger.info(f"{len(volumes)} backend volumes present in the cluster")
+        return volumes
+
+    def existing(self, volumes, refresh=False):
+        """
+        Get the volumes which are present in the backend.
+
+        Args:
+            volumes (iterable): Names of the RBD images or CephFS subvolumes
+            refresh (bool): True to list the backend volumes before the check
+
+        Returns:
+            set: Names of the volumes which still exist
+
+        """
+        if refresh or not self.refreshes:
+            self.refresh()
+        return set(volumes) & (self.images | self.subvolumes)
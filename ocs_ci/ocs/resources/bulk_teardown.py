@@ -0,0 +1,321 @@
+"""
+Bulk teardown of the resources created by the factories.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from ocs_ci.ocs import constants
+from ocs_ci.ocs.exceptions import CommandFailed, TimeoutExpiredError
+from ocs_ci.ocs.ocp import OCP
+from ocs_ci.utility.utils import TimeoutSampler
+
+log = logging.getLogger(__name__)
+
+# Stages of the teardown, the resources of unknown kinds are deleted in the
+# OTHER_STAGE
+DELETE_STAGES = (
+    (
+        constants.POD,
+        constants.DEPLOYMENT,
+        constants.DEPLOYMENTCONFIG,
+        constants.STATEFULSET,
+        constants.JOB,
+    ),
+    (constants.VOLUMESNAPSHOT,),
+    (constants.PVC,),
+    (constants.PV,),
+    (),
+    ("Project", constants.NAMESPACE),
+)
+PVC_STAGE = 2
+PV_STAGE = 3
+OTHER_STAGE = 4
+STAGE_OF_KIND = {
+    kind.lower(): stage for stage, kinds in enumerate(DELETE_STAGES) for kind in kinds
+}
+CLUSTER_SCOPED_KINDS = (
+    "project",
+    constants.NAMESPACE.lower(),
+    constants.PV.lower(),
+    constants.STORAGECLASS.lower(),
+)
+PROTECTED_NAMES = (
+    constants.DEFAULT_STORAGECLASS_CEPHFS,
+    constants.DEFAULT_STORAGECLASS_RBD,
+)
+# Max number of the names passed to one `oc delete`
+DEFAULT_BATCH_SIZE = 100
+
+
+@dataclass
+class TeardownGroup:
+    """
+    Resources of one kind in one namespace of one cluster.
+
+    Attributes:
+        stage (int): Index of the stage in DELETE_STAGES
+        kind (str): Kind of the resources
+        ocp (OCP): OCP object used to run the commands of the group
+        names (list): Names of the resources to delete
+        resources (list): Registered objects, marked as deleted after the
+            delete command succeeded
+        expected (list): Names of the resources deleted by the cluster, e.g.
+            the PVs of the deleted PVCs, they are only waited for
+        error (Exception): Error of the delete command
+
+    """
+
+    stage: int
+    kind: str
+    ocp: OCP
+    names: List[str] = field(default_factory=list)
+    resources: list = field(default_factory=list)
+    expected: List[str] = field(default_factory=list)
+    error: Optional[Exception] = field(default=None, repr=False)
+
+    @property
+    def namespace(self):
+        return self.ocp.namespace
+
+
+def resource_name(resource):
+    """
+    Args:
+        resource (OCS or OCP): Resource object
+
+    Returns:
+        str: Name of the resource, the namespace for the Project OCP objects
+
+    """
+    if isinstance(resource, OCP):
+        if resource.kind.lower() == "project":
+            return resource.namespace
+        return resource.resource_name
+    return resource.name
+
+
+class BulkTeardown(object):
+    """
+    Deletes the registered resources in bulk.
+    """
+
+    def __init__(
+        self,
+        timeout=300,
+        sleep=3,
+        delete_retained_pvs=False,
+        ignore_delete_errors=False,
+        batch_size=DEFAULT_BATCH_SIZE,
+    ):
+        """
+        Args:
+            timeout (int): Time in seconds to wait for the resources of one
+                stage to be deleted
+            sleep (int): Time in seconds between the checks of the remaining
+                resources
+            delete_retained_pvs (bool): True to change the reclaim policy of
+                the PVs with the Retain policy to Delete, so they are deleted
+                with their PVCs
+            ignore_delete_errors (bool): True to only log the failed delete
+                commands, they are raised after the whole teardown otherwise
+            batch_size (int): Max number of the names in one delete command
+
+        """
+        self.timeout = timeout
+        self.sleep = sleep
+        self.delete_retained_pvs = delete_retained_pvs
+        self.ignore_delete_errors = ignore_delete_errors
+        self.batch_size = batch_size
+        self.groups = {}
+
+    def _group(self, stage, kind, ocp_obj):
+        namespace = None if kind.lower() in CLUSTER_SCOPED_KINDS else ocp_obj.namespace
+        key = (
+            stage,
+            kind.lower(),
+            namespace,
+            ocp_obj.cluster_kubeconfig,
+            ocp_obj.cluster_context,
+        )
+        if key not in self.groups:
+            group_ocp = OCP(
+                kind=kind,
+                namespace=namespace,
+                cluster_kubeconfig=ocp_obj.cluster_kubeconfig,
+            )
+            group_ocp.cluster_context = ocp_obj.cluster_context
+            self.groups[key] = TeardownGroup(stage, kind, group_ocp)
+        return self.groups[key]
+
+    def register(self, resources):
+        """
+        Register the resources to delete.
+
+        Args:
+            resources (OCS, OCP or list): Resource object or list of them
+
+        """
+        if not isinstance(resources, (list, tuple)):
+            resources = [resources]
+        for resource in resources:
+            if getattr(resource, "is_deleted", False):
+                continue
+            name = resource_name(resource)
+            if not name or name in PROTECTED_NAMES:
+                continue
+            ocp_obj = resource if isinstance(resource, OCP) else resource.ocp
+            kind = resource.kind
+            stage = STAGE_OF_KIND.get(kind.lower(), OTHER_STAGE)
+            group = self._group(stage, kind, ocp_obj)
+            if name not in group.names:
+                group.names.append(name)
+            group.resources.append(resource)
+
+    def _register_backed_pvs(self, group):
+        """
+        Register the PVs of the PVCs in the group, the PVs with the Retain
+        reclaim policy are registered only if delete_retained_pvs is set.
+        """
+        pvcs = group.ocp.exec_oc_cmd(f"get {group.kind} -o yaml", silent=True)
+        pv_names = [
+            pvc["spec"].get("volumeName")
+            for pvc in pvcs.get("items", [])
+            if pvc["metadata"]["name"] in group.names
+            and pvc.get("spec", {}).get("volumeName")
+        ]
+        if not pv_names:
+            return
+        pv_ocp = OCP(kind=constants.PV, cluster_kubeconfig=group.ocp.cluster_kubeconfig)
+        pv_ocp.cluster_context = group.ocp.cluster_context
+        pvs = pv_ocp.exec_oc_cmd(
+            f"get {constants.PV} {' '.join(pv_names)} -o yaml --ignore-not-found",
+            silent=True,
+        )
+        if isinstance(pvs, dict) and pvs.get("kind") != "List":
+            pvs = {"items": [pvs]}
+        pv_group = self._group(PV_STAGE, constants.PV, pv_ocp)
+        for pv in (pvs or {}).get("items", []):
+            name = pv["metadata"]["name"]
+            policy = pv.get("spec", {}).get("persistentVolumeReclaimPolicy")
+            if policy == constants.RECLAIM_POLICY_RETAIN:
+                if not self.delete_retained_pvs:
+                    continue
+                log.info(f"Changing reclaim policy of {constants.PV} {name} to Delete")
+                patch_param = '{"spec":{"persistentVolumeReclaimPolicy":"Delete"}}'
+                pv_ocp.exec_oc_cmd(f"patch {constants.PV} {name} -p '{patch_param}'")
+            # PVs are deleted by the provisioner, they are only waited for
+            if name not in pv_group.names + pv_group.expected:
+                pv_group.expected.append(name)
+
+    def _delete(self, group):
+        """
+        Delete all the resources of the group without waiting.
+        """
+        if not group.names:
+            return
+        where = f" in namespace {group.namespace}" if group.namespace else ""
+        log.info(
+            f"Deleting {len(group.names)} {group.kind}{where}: "
+            f"{', '.join(group.names)}"
+        )
+        try:
+            for i in range(0, len(group.names), self.batch_size):
+                names = " ".join(group.names[i : i + self.batch_size])
+                group.ocp.exec_oc_cmd(
+                    f"delete {group.kind} {names} --ignore-not-found --wait=false",
+                    out_yaml_format=False,
+                )
+        except CommandFailed as ex:
+            log.warning(f"Failed to delete {group.kind} {group.names}: {ex}")
+            group.error = ex
+            return
+        for resource in group.resources:
+            if hasattr(resource, "set_deleted"):
+                resource.set_deleted()
+
+    def remaining(self, group):
+        """
+        Args:
+            group (TeardownGroup): Group of the resources
+
+        Returns:
+            list: Names of the resources of the group which still exist
+
+        """
+        if not (group.names or group.expected):
+            return []
+        out = group.ocp.exec_oc_cmd(
+            f"get {group.kind} -o name", out_yaml_format=False, silent=True
+        )
+        existing = {line.split("/")[-1] for line in out.split()}
+        return [name for name in group.names + group.expected if name in existing]
+
+    def _wait(self, groups):
+        """
+        Wait for the deletion of all the groups, every group is listed once
+        per check.
+
+        Raises:
+            TimeoutExpiredError: If some resources are not deleted in time
+
+        """
+        waiting = list(groups)
+
+        def check():
+            remaining = {}
+            for group in waiting:
+                names = self.remaining(group)
+                if names:
+                    remaining[(group.kind, group.namespace)] = names
+            waiting[:] = [
+                group for group in waiting if (group.kind, group.namespace) in remaining
+            ]
+            return remaining
+
+        try:
+            for remaining in TimeoutSampler(self.timeout, self.sleep, check):
+                if not remaining:
+                    return
+                log.info(f"Waiting for the deletion of {remaining}")
+        except TimeoutExpiredError:
+            raise TimeoutExpiredError(
+                self.timeout,
+                f"Resources were not deleted in {self.timeout} seconds: {check()}",
+            )
+
+    def run(self):
+        """
+        Delete all the registered resources, stage by stage.
+
+        Raises:
+            CommandFailed: If some delete command failed and the errors are
+                not ignored
+            TimeoutExpiredError: If some resources are not deleted in time
+
+        """
+        errors = []
+        done = set()
+        while True:
+            pending = [key for key in self.groups if key not in done]
+            if not pending:
+                break
+            stage = min(key[0] for key in pending)
+            stage_keys = [key for key in pending if key[0] == stage]
+            if stage == PVC_STAGE:
+                for key in stage_keys:
+                    self._register_backed_pvs(self.groups[key])
+            to_wait = []
+            for key in stage_keys:
+                done.add(key)
+                group = self.groups[key]
+                self._delete(group)
+                if group.error:
+                    errors.append(group.error)
+                else:
+                    to_wait.append(group)
+            self._wait(to_wait)
+        self.groups.clear()
+        if errors and not self.ignore_delete_errors:
+            raise errors[0]
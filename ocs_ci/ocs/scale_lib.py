@@ -20,7 +20,15 @@ from ocs_ci.ocs.ocp import wait_for_cluster_connectivity
 from ocs_ci.utility.utils import ocsci_log_path, ceph_health_check
 from ocs_ci.ocs import constants, cluster, machine, node
 from ocs_ci.ocs.resources.objectconfigfile import ObjectConfFile
-from ocs_ci.ocs.exceptions import CommandFailed, ResourceWrongStatusException
+from ocs_ci.ocs.kube_job_tracker import (
+    KubeJobProgressTracker,
+    get_kube_job_obj_names,
+)
+from ocs_ci.ocs.exceptions import (
+    CommandFailed,
+    ResourceWrongStatusException,
+    TimeoutExpiredError,
+)
 from ocs_ci.ocs.node import get_nodes, get_worker_nodes, wait_for_nodes_status
 from ocs_ci.ocs.exceptions import (
     UnavailableResourceException,
@@ -1265,11 +1273,15 @@ def check_all_pvc_reached_bound_state_in_kube_job(
     """
     Function to check either bulk created PVCs reached Bound state using kube_job
 
+    The PVCs of the kube job are watched, so the function returns the moment
+    the last PVC reaches Bound state.
+
     Args:
         kube_job_obj (obj): Kube Job Object
         namespace (str): Namespace of PVC's created
         no_of_pvc (int): Bulk PVC count
-        timeout: a timeout for all the pvc in kube job to reach bound status
+        timeout: a timeout for all the pvc in kube job to reach bound status,
+            the overall wait time is timeout*10 secs
 
     Returns:
         pvc_bound_list (list): List of all PVCs which is in Bound state.
@@ -1278,42 +1290,20 @@ def check_all_pvc_reached_bound_state_in_kube_job(
         If not all PVC reached to Bound state.
 
     """
-    # Check all the PVC reached Bound state
-    pvc_bound_list, pvc_not_bound_list = ([], [])
-    while_iteration_count = 0
-    while True:
-        # Get kube_job obj and fetch either all PVC's are in Bound state
-        # If not bound adding those PVCs to pvc_not_bound_list
-        job_get_output = kube_job_obj.get(namespace=namespace)
-        for i in range(no_of_pvc):
-            status = job_get_output["items"][i]["status"]["phase"]
-            logger.info(
-                f"pvc {job_get_output['items'][i]['metadata']['name']} status {status}"
-            )
-            if status != "Bound":
-                pvc_not_bound_list.append(
-                    job_get_output["items"][i]["metadata"]["name"]
-                )
-
-        # Check the length of pvc_not_bound_list to decide either all PVCs reached Bound state
-        # If not then wait for timeout secs and re-iterate while loop
-        if len(pvc_not_bound_list):
-            time.sleep(timeout)
-            while_iteration_count += 1
-            # Breaking while loop after 10 Iteration i.e. after timeout*10 secs of wait_time
-            # And if PVCs still not in bound state then there will be assert.
-            if while_iteration_count >= 10:
-                assert logger.error(
-                    f" Listed PVCs took more than {timeout * 10} secs to bound {pvc_not_bound_list}"
-                )
-                break
-            pvc_not_bound_list.clear()
-            continue
-        elif not len(pvc_not_bound_list):
-            for i in range(no_of_pvc):
-                pvc_bound_list.append(job_get_output["items"][i]["metadata"]["name"])
-            logger.info("All PVCs in Bound state")
-            break
+    tracker = KubeJobProgressTracker(
+        kube_job_obj, namespace, names=get_kube_job_obj_names(kube_job_obj)[:no_of_pvc]
+    ).start()
+    try:
+        pvc_bound_list = tracker.wait(timeout=timeout * 10)
+    except TimeoutExpiredError:
+        raise AssertionError(
+            f"Listed PVCs took more than {timeout * 10} secs to bound "
+            f"{sorted(tracker.not_ready)}"
+        )
+    finally:
+        tracker.stop()
+    tracker.log_summary()
+    logger.info("All PVCs in Bound state")
     return pvc_bound_list
 
 
@@ -1342,11 +1332,15 @@ def check_all_pod_reached_running_state_in_kube_job(
     """
     Function to check either bulk created PODs reached Running state using kube_job
 
+    The PODs (or DC configs) of the kube job are watched, so the function
+    returns the moment the last POD reaches Running state.
+
     Args:
         kube_job_obj (obj): Kube Job Object
         namespace (str): Namespace of PVC's created
         no_of_pod (int): POD count
-        timeout (sec): Timeout between each POD iteration check
+        timeout (sec): Timeout between each POD iteration check, the overall
+            wait time is timeout*13 secs
 
     Returns:
         pod_running_list (list): List of all PODs reached running state.
@@ -1355,78 +1349,41 @@ def check_all_pod_reached_running_state_in_kube_job(
         If not all POD reached Running state.
 
     """
-
-    # Check all the POD reached Running state
-    pod_running_list, pod_not_running_list = ([], [])
-    while_iteration_count = 0
-    dc_pod = 0
-    while True:
-        # Get kube_job obj and fetch either all PODs are in Running state
-        # If not Running, adding those PODs to pod_not_running_list
-        job_get_output = kube_job_obj.get(namespace=namespace)
-        for i in range(no_of_pod):
-            if job_get_output["items"][0]["kind"] == constants.POD:
-                pod_type = constants.POD
-            else:
-                pod_type = None
-                dc_pod = 1
-            if pod_type:
-                status = job_get_output["items"][i]["status"]["phase"]
-                logger.info(
-                    f"POD {job_get_output['items'][i]['metadata']['name']} status {status}"
-                )
-                if status != "Running":
-                    pod_not_running_list.append(
-                        job_get_output["items"][i]["metadata"]["name"]
-                    )
-            else:
-                # For DC config there is no Running status so checking it based on
-                # availableReplicas, basically this will be 1 if pod is running and
-                # the value will be 0 in-case of pod not in running state
-                status = job_get_output["items"][i]["status"]["availableReplicas"]
-                logger.info(
-                    f"DC Config {job_get_output['items'][i]['metadata']['name']} "
-                    f"available running pods {status}"
-                )
-                if not status:
-                    pod_not_running_list.append(
-                        job_get_output["items"][i]["metadata"]["name"]
+    tracker = KubeJobProgressTracker(
+        kube_job_obj, namespace, names=get_kube_job_obj_names(kube_job_obj)[:no_of_pod]
+    ).start()
+    # For DC config there is no Running status so the tracker checks it based
+    # on availableReplicas, pods of DC which are not available in timeout*10
+    # secs are deleted, to check either pods can come up after delete. Plain
+    # pods get the whole timeout*13 secs at once
+    dc_pod = constants.POD not in tracker.kinds
+    try:
+        try:
+            pod_running_list = tracker.wait(
+                timeout=timeout * 10 if dc_pod else timeout * 13
+            )
+        except TimeoutExpiredError:
+            if not dc_pod:
+                raise
+            ocp_obj = OCP()
+            for i in sorted(tracker.not_ready):
+                try:
+                    cmd = f"delete pod {i} -n {namespace}"
+                    ocp_obj.exec_oc_cmd(command=cmd, timeout=120)
+                except CommandFailed as e:
+                    logger.warning(
+                        f"Failed to delete the pod {i} due to the error {str(e)}"
                     )
-
-        # Check the length of pod_not_running_list to decide either all PODs reached
-        # Running state, If not then wait for 30secs and re-iterate while loop
-        if len(pod_not_running_list):
-            time.sleep(timeout)
-            while_iteration_count += 1
-
-            # Delete the dc pods which are not in running state
-            # To check either pods can come up after delete
-            if while_iteration_count == 10 and dc_pod:
-                ocp_obj = OCP()
-                for i in pod_not_running_list:
-                    try:
-                        cmd = f"delete pod {i} -n {namespace}"
-                        ocp_obj.exec_oc_cmd(command=cmd, timeout=120)
-                    except CommandFailed as e:
-                        logger.warning(
-                            f"Failed to delete the pod {i} due to the error {str(e)}"
-                        )
-
-            # Breaking while loop after 13 Iteration i.e. after 30*13 secs of wait_time
-            # And if PODs are still not in Running state then there will be assert.
-            if while_iteration_count >= 13:
-                assert logger.error(
-                    f" Listed PODs took more than 390secs for Running {pod_not_running_list}"
-                )
-                break
-            pod_not_running_list.clear()
-            continue
-        elif not len(pod_not_running_list):
-            for i in range(no_of_pod):
-                pod_running_list.append(job_get_output["items"][i]["metadata"]["name"])
-            logger.info("All PODs are in Running state")
-            break
-
+            pod_running_list = tracker.wait(timeout=timeout * 3)
+    except TimeoutExpiredError:
+        raise AssertionError(
+            f"Listed PODs took more than {timeout * 13}secs for Running "
+            f"{sorted(tracker.not_ready)}"
+        )
+    finally:
+        tracker.stop()
+    tracker.log_summary()
+    logger.info("All PODs are in Running state")
     return pod_running_list
 
 
@@ -0,0 +1,86 @@
+import pytest
+
+from ocs_ci.ocs.exceptions import CommandFailed
+from ocs_ci.ocs.resources import backend_volumes
+from ocs_ci.ocs.resources.backend_volumes import (
+    BackendVolumeInventory,
+    get_backend_volumes,
+)
+
+
+def pv(name, namespace, pvc, **attributes):
+    return {
+        "metadata": {"name": name},
+        "spec": {
+            "claimRef": {"namespace": namespace, "name": pvc},
+            "csi": {"volumeAttributes": attributes},
+        },
+    }
+
+
+class ToolsPod:
+    def __init__(self, images, subvolumes):
+        self.images = images
+        self.subvolumes = subvolumes
+        self.commands = []
+
+    def exec_ceph_cmd(self, command):
+        self.commands.append(command)
+        return [{"name": "ocs-storagecluster-cephfilesystem"}]
+
+    def exec_cmd_on_pod(self, command):
+        self.commands.append(command)
+        if self.images is None:
+            raise CommandFailed("error: unable to upgrade connection")
+        if command.startswith("rbd ls"):
+            return list(self.images)
+        return [{"name": name} for name in self.subvolumes]
+
+
+def test_backend_volumes_from_pv_listing():
+    pvs = [pv(f"pv-{i}", "app", f"pvc-{i}", imageName=f"csi-vol-{i}") for i in range(3)]
+    pvs += [
+        pv("pv-fs", "app", "pvc-fs", subvolumeName="csi-vol-fs"),
+        pv("pv-other", "other", "pvc-0", imageName="csi-vol-other"),
+        pv("pv-volsync", "app", "volsync-pvc-0-src", imageName="csi-vol-snap"),
+        {"metadata": {"name": "pv-local"}, "spec": {"local": {"path": "/mnt"}}},
+    ]
+    assert get_backend_volumes("app", pvs=pvs) == {
+        "pvc-0": "csi-vol-0",
+        "pvc-1": "csi-vol-1",
+        "pvc-2": "csi-vol-2",
+        "pvc-fs": "csi-vol-fs",
+    }
+
+
+def test_inventory_reports_remaining_volumes():
+    volumes = [f"csi-vol-{i}" for i in range(100)] + ["csi-vol-fs"]
+    ct_pod = ToolsPod(images=volumes[:-1] + ["unrelated"], subvolumes=["csi-vol-fs"])
+    inventory = BackendVolumeInventory(
+        rbd_pool="pool", rados_namespace="ns", ct_pod=ct_pod
+    )
+    assert inventory.existing(volumes) == set(volumes)
+    assert ct_pod.commands == [
+        "rbd ls pool --namespace ns --format json",
+        "ceph fs ls",
+        "ceph fs subvolume ls ocs-storagecluster-cephfilesystem --group_name csi",
+    ]
+
+    ct_pod.images = ["csi-vol-7", "unrelated"]
+    ct_pod.subvolumes = []
+    assert inventory.existing(volumes) == set(volumes)
+    assert inventory.existing(volumes, refresh=True) == {"csi-vol-7"}
+    # the filesystem name is resolved once, two execs per refresh
+    assert len(ct_pod.commands) == 5
+
+
+def test_inventory_looks_up_restarted_tools_pod(monkeypatch):
+    restarted = ToolsPod(images=None, subvolumes=[])
+    new = ToolsPod(images=["csi-vol-0"], subvolumes=[])
+    pods = [restarted, new]
+    monkeypatch.setattr(backend_volumes, "get_ceph_tools_pod", lambda: pods.pop(0))
+    inventory = BackendVolumeInventory(fs_name="cephfs")
+    with pytest.raises(CommandFailed):
+        inventory.existing(["csi-vol-0", "csi-vol-1"], refresh=True)
+    assert inventory.existing(["csi-vol-0", "csi-vol-1"], refresh=True) == {"csi-vol-0"}
+    assert not pods
@@ -0,0 +1,115 @@
+import shlex
+
+import pytest
+
+from ocs_ci.ocs import constants
+from ocs_ci.ocs.ocp import OCP
+from ocs_ci.ocs.resources.bulk_teardown import BulkTeardown
+from ocs_ci.ocs.resources.ocs import OCS
+
+
+class FakeCluster:
+    """
+    Deletes the objects asynchronously: an object disappears after the
+    following list of its kind, the PVs disappear when their PVC is gone.
+    """
+
+    def __init__(self):
+        self.objects = {}
+        self.deleting = set()
+        self.commands = []
+
+    def add(self, kind, namespace, name, **spec):
+        self.objects[(kind.lower(), namespace, name)] = spec
+
+    def exec_oc_cmd(self, ocp_obj, command, out_yaml_format=True, **kwargs):
+        self.commands.append(command)
+        args = shlex.split(command)
+        verb, kind = args[0], args[1].lower()
+        namespace = ocp_obj.namespace
+        if verb == "delete":
+            names = [arg for arg in args[2:] if not arg.startswith("--")]
+            for name in names:
+                self.deleting.add((kind, namespace, name))
+            return ""
+        if verb == "patch":
+            self.objects[(kind, namespace, args[2])]["reclaim"] = "Delete"
+            return ""
+        names = [arg for arg in args[2:] if not arg.startswith("-")][:-1]
+        self._progress(kind)
+        items = [
+            {
+                "metadata": {"name": name},
+                "spec": {
+                    "volumeName": spec.get("pv"),
+                    "persistentVolumeReclaimPolicy": spec.get("reclaim"),
+                },
+            }
+            for (obj_kind, obj_namespace, name), spec in self.objects.items()
+            if obj_kind == kind
+            and obj_namespace == namespace
+            and (not names or name in names)
+        ]
+        if out_yaml_format:
+            return {"kind": "List", "items": items}
+        return "\n".join(f"{kind}/{item['metadata']['name']}" for item in items)
+
+    def _progress(self, kind):
+        for key in list(self.deleting):
+            if key[0] == kind:
+                spec = self.objects.pop(key, {})
+                self.deleting.discard(key)
+                pv = spec.get("pv")
+                pv_key = (constants.PV.lower(), None, pv)
+                if pv and self.objects.get(pv_key, {}).get("reclaim") == "Delete":
+                    self.deleting.add(pv_key)
+
+
+@pytest.fixture
+def cluster(monkeypatch):
+    fake = FakeCluster()
+    monkeypatch.setattr(
+        OCP,
+        "exec_oc_cmd",
+        lambda self, command, **kwargs: fake.exec_oc_cmd(self, command, **kwargs),
+    )
+    return fake
+
+
+def ocs(kind, name, namespace="ns1"):
+    return OCS(kind=kind, metadata={"name": name, "namespace": namespace})
+
+
+def test_bulk_teardown_in_dependency_order(cluster):
+    resources = []
+    for i in range(20):
+        reclaim = "Retain" if i == 0 else "Delete"
+        cluster.add(constants.PV, None, f"pv-{i}", reclaim=reclaim)
+        cluster.add(constants.PVC, "ns1", f"pvc-{i}", pv=f"pv-{i}")
+        cluster.add(constants.POD, "ns1", f"pod-{i}")
+        resources += [ocs(constants.PVC, f"pvc-{i}"), ocs(constants.POD, f"pod-{i}")]
+    cluster.add("project", None, "ns1")
+    project = OCP(kind="Project", namespace="ns1")
+    teardown = BulkTeardown(sleep=0.01, timeout=1, delete_retained_pvs=True)
+    teardown.register(resources + [project])
+    teardown.run()
+    assert not cluster.objects
+    assert all(resource.is_deleted for resource in resources)
+    deletes = [command for command in cluster.commands if command.startswith("delete")]
+    assert [command.split()[1] for command in deletes] == [
+        constants.POD,
+        constants.PVC,
+        "Project",
+    ]
+    assert deletes[0].endswith("--ignore-not-found --wait=false")
+    # the number of the commands doesn't depend on the number of the objects
+    assert len(cluster.commands) < 15
+
+
+def test_bulk_teardown_keeps_retained_pvs(cluster):
+    cluster.add(constants.PV, None, "pv-0", reclaim="Retain")
+    cluster.add(constants.PVC, "ns1", "pvc-0", pv="pv-0")
+    teardown = BulkTeardown(sleep=0.01, timeout=1)
+    teardown.register(ocs(constants.PVC, "pvc-0"))
+    teardown.run()
+    assert list(cluster.objects) == [("persistentvolume", None, "pv-0")]
@@ -0,0 +1,148 @@
+# -*- coding: utf8 -*-
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from ocs_ci.ocs.ceph_health_events import (
+    CHECK_CLEARED,
+    CHECK_FAILED,
+    CHECK_UPDATED,
+    HEALTH_ERR,
+    HEALTH_OK,
+    HEALTH_WARN,
+    OVERALL_STATUS,
+    CephHealthEventStream,
+    parse_cluster_log_line,
+)
+from ocs_ci.ocs.cluster import CephHealthMonitor
+from ocs_ci.ocs.exceptions import CephHealthException, CommandFailed
+
+CEPH_W_OUTPUT = "\n".join(
+    [
+        "  cluster:",
+        "    id:     5b2a8b57-2f1a-4d7e-9d5e-1c4d0cb5ad11",
+        "    health: HEALTH_OK",
+        "",
+        "2024-05-02T10:00:00.000000+0000 mon.a [INF] overall HEALTH_OK",
+        "2024-05-02T10:00:01.123456+0000 mon.a [WRN] Health check failed: "
+        "1 osds down (OSD_DOWN)",
+        "2024-05-02T10:00:02.000000+0000 mon.a (mon.0) 412 : cluster [ERR] "
+        "Health check update: Reduced data availability: 4 pgs inactive "
+        "(PG_AVAILABILITY)",
+        "2024-05-02T10:00:03.000000+0000 osd.1 [INF] osd.1 boot",
+        "2024-05-02T10:00:31.000000+0000 mon.a [INF] Health check cleared: "
+        "PG_AVAILABILITY (was: Reduced data availability: 4 pgs inactive)",
+    ]
+)
+
+
+class FakeStream(CephHealthEventStream):
+    """
+    Event stream following the prepared output instead of the tools pod.
+    """
+
+    def __init__(self, output_file):
+        super().__init__(namespace="openshift-storage", reconnect_delay=0.1)
+        self.output_file = str(output_file)
+        self.cluster_health = {"status": HEALTH_WARN, "checks": {}}
+
+    def _stream_command(self):
+        if self.connects > 1:
+            raise CommandFailed("tools pod not found")
+        return ["cat", self.output_file]
+
+    def _resync_from_cluster(self):
+        self.resync(self.cluster_health)
+
+
+def test_parse_cluster_log_line():
+    lines = CEPH_W_OUTPUT.splitlines()
+    assert parse_cluster_log_line(lines[0]) is None
+    overall = parse_cluster_log_line(lines[4], timestamp=1.0)
+    assert (overall.kind, overall.severity, overall.timestamp) == (
+        OVERALL_STATUS,
+        HEALTH_OK,
+        1.0,
+    )
+    failed = parse_cluster_log_line(lines[5])
+    assert (failed.kind, failed.check, failed.severity, failed.summary) == (
+        CHECK_FAILED,
+        "OSD_DOWN",
+        HEALTH_WARN,
+        "1 osds down",
+    )
+    assert failed.cluster_time == "2024-05-02T10:00:01.123456+0000"
+    update = parse_cluster_log_line(lines[6])
+    assert (update.kind, update.severity) == (CHECK_UPDATED, HEALTH_ERR)
+    assert parse_cluster_log_line(lines[7]) is None
+    cleared = parse_cluster_log_line(lines[8])
+    assert (cleared.kind, cleared.check) == (CHECK_CLEARED, "PG_AVAILABILITY")
+
+
+def test_stream_records_transitions(tmp_path):
+    output_file = tmp_path / "ceph-w.log"
+    output_file.write_text(CEPH_W_OUTPUT)
+    stream = FakeStream(output_file)
+    received = []
+    stream.subscribe(received.append)
+    with stream:
+        cleared = stream.wait_for_event(
+            lambda event: event.kind == CHECK_CLEARED, timeout=30, since=0
+        )
+        # reconnect after the stream ended resyncs from the cluster state
+        resynced = stream.wait_for_event(
+            lambda event: event.source == "resync", timeout=30, since=0
+        )
+    assert cleared.check == "PG_AVAILABILITY"
+    assert resynced.kind == CHECK_CLEARED
+    assert resynced.check == "OSD_DOWN"
+    assert received == stream.events
+    assert [event.check for event in stream.errors()] == ["PG_AVAILABILITY"]
+    assert stream.health == HEALTH_OK
+    assert not stream.is_alive()
+
+
+def test_resync_reports_missed_checks():
+    stream = CephHealthEventStream(namespace="openshift-storage")
+    health = {
+        "status": HEALTH_ERR,
+        "checks": {
+            "MON_DOWN": {
+                "severity": HEALTH_ERR,
+                "summary": {"message": "1/3 mons down"},
+            }
+        },
+    }
+    stream.resync(health)
+    stream.resync(health)
+    assert len(stream.events) == 1
+    assert stream.health == "HEALTH_ERR 1/3 mons down"
+    stream.resync({"status": HEALTH_OK, "checks": {}})
+    assert stream.events[-1].kind == CHECK_CLEARED
+    assert stream.health_status == HEALTH_OK
+
+
+def test_health_monitor_fetches_status_outside_stream_thread():
+    fetching = threading.Event()
+    release = threading.Event()
+
+    def get_ceph_status():
+        fetching.set()
+        release.wait(5)
+        return "HEALTH_ERR 4 pgs inactive"
+
+    monitor = CephHealthMonitor(
+        SimpleNamespace(namespace="openshift-storage", get_ceph_status=get_ceph_status)
+    )
+    start = time.time()
+    for line in CEPH_W_OUTPUT.splitlines():
+        monitor.feed(line)
+    # the HEALTH_ERR event didn't block reading of the following events
+    assert time.time() - start < 1
+    assert fetching.wait(5)
+    assert "PG_AVAILABILITY" not in monitor.active_checks
+    release.set()
+    with pytest.raises(CephHealthException, match="HEALTH_ERR 4 pgs inactive"):
+        monitor.__exit__(None, None, None)
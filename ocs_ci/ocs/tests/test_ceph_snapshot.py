@@ -0,0 +1,136 @@
+# -*- coding: utf8 -*-
+
+import json
+
+import pytest
+
+from ocs_ci.ocs import ceph_snapshot
+from ocs_ci.ocs.ceph_snapshot import (
+    SECTION_SEPARATOR,
+    CephSnapshotCache,
+    parse_snapshot_output,
+)
+from ocs_ci.ocs.exceptions import CephHealthException, CommandFailed
+from ocs_ci.utility import utils
+from ocs_ci.utility.utils import ceph_health_check_base
+
+STATUS_WARN = {
+    "health": {
+        "status": "HEALTH_WARN",
+        "checks": {
+            "RECENT_CRASH": {
+                "severity": "HEALTH_WARN",
+                "summary": {"message": "1 daemons have recently crashed"},
+            },
+            "OSD_DOWN": {
+                "severity": "HEALTH_WARN",
+                "summary": {"message": "1 osds down"},
+            },
+        },
+    },
+    "monmap": {"epoch": 3},
+}
+STATUS_OK = {"health": {"status": "HEALTH_OK", "checks": {}}, "monmap": {"epoch": 3}}
+DF = {"stats": {"total_bytes": 300, "total_used_raw_bytes": 30}}
+OSD_TREE = {"nodes": [{"id": -1, "type": "root"}, {"id": 0, "type": "osd"}]}
+OSD_DUMP = {
+    "epoch": 45,
+    "osds": [{"osd": 0, "up": 1, "in": 1}, {"osd": 1, "up": 0, "in": 1}],
+    "pools": [{"pool_name": "rbd", "size": 3}],
+}
+
+
+def snapshot_output(status, epoch, osdmap=True):
+    sections = [json.dumps(status), json.dumps(DF), str(epoch)]
+    if osdmap:
+        sections += [json.dumps(OSD_TREE), json.dumps(OSD_DUMP)]
+    return f"\n{SECTION_SEPARATOR}\n".join(sections)
+
+
+class FakeCache(CephSnapshotCache):
+    """
+    Snapshot cache serving the prepared outputs instead of the tools pod.
+    """
+
+    def __init__(self, epochs, statuses):
+        super().__init__(namespace="openshift-storage", ttl=60)
+        self.epochs = list(epochs)
+        self.statuses = list(statuses)
+        self.commands = []
+
+    def _exec(self, command):
+        self.commands.append(command)
+        epoch = self.epochs.pop(0)
+        return snapshot_output(
+            self.statuses.pop(0), epoch, f"x{epoch} " not in f"{command} "
+        )
+
+
+def test_parse_snapshot_output():
+    sections = parse_snapshot_output(snapshot_output(STATUS_OK, 45))
+    assert sections["osdmap_epoch"] == 45
+    assert sections["osd_dump"] == OSD_DUMP
+    sections = parse_snapshot_output(snapshot_output(STATUS_OK, 45, osdmap=False))
+    assert "osd_tree" not in sections
+    with pytest.raises(CommandFailed):
+        parse_snapshot_output(f"{{}}\n{SECTION_SEPARATOR}\nError EACCES\n")
+
+
+def test_snapshot_views():
+    cache = FakeCache([45], [STATUS_WARN])
+    snapshot = cache.get()
+    assert snapshot.health == (
+        "HEALTH_WARN 1 daemons have recently crashed; 1 osds down"
+    )
+    assert not snapshot.is_health_ok
+    assert snapshot.epochs == {"osdmap": 45, "monmap": 3}
+    assert (snapshot.num_osds, snapshot.num_up_osds, snapshot.num_in_osds) == (
+        2,
+        1,
+        2,
+    )
+    assert snapshot.pools["rbd"]["size"] == 3
+    assert snapshot.osd_nodes == [{"id": 0, "type": "osd"}]
+    assert snapshot.total_bytes == 300
+
+
+def test_cache_ttl_and_epochs():
+    cache = FakeCache([45, 45, 46], [STATUS_WARN, STATUS_OK, STATUS_OK])
+    first = cache.get()
+    assert cache.get() is first
+    assert cache.fetch_count == 1
+
+    cache.invalidate()
+    second = cache.get()
+    assert second.is_health_ok
+    # osdmap did not change, the osd tree and dump were not fetched again
+    assert "x45 ]" in cache.commands[1]
+    assert second.osd_tree is first.osd_tree
+
+    third = cache.get(max_age=0)
+    assert third.osdmap_epoch == 46
+    assert third.osd_tree is not first.osd_tree
+    assert cache.fetch_count == 3
+
+
+def test_health_check_queries_cluster_by_default(monkeypatch):
+    cache = FakeCache([45, 45], [STATUS_OK, STATUS_OK])
+    monkeypatch.setattr(ceph_snapshot, "get_ceph_snapshot_cache", lambda ns: cache)
+    monkeypatch.setattr(
+        ceph_snapshot, "invalidate_ceph_snapshot", lambda ns: cache.invalidate()
+    )
+    health = ["HEALTH_OK", "HEALTH_WARN 1 osds down"]
+    monkeypatch.setattr(utils, "run_ceph_health_cmd", lambda ns: health.pop(0))
+    # the hot paths opt into the cached state explicitly
+    assert ceph_health_check_base(namespace="openshift-storage", max_age=60)
+    assert cache.fetch_count == 1
+    # by default only the ceph health is fetched
+    assert ceph_health_check_base(namespace="openshift-storage")
+    # the cluster got degraded right after the cached HEALTH_OK
+    with pytest.raises(CephHealthException):
+        ceph_health_check_base(namespace="openshift-storage")
+    assert not health
+    assert cache.fetch_count == 1
+    # the failed check expired the cached HEALTH_OK
+    assert ceph_health_check_base(namespace="openshift-storage", max_age=60)
+    assert cache.fetch_count == 2
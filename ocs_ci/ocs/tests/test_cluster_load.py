@@ -0,0 +1,74 @@
+# -*- coding: utf8 -*-
+
+import pytest
+
+from ocs_ci.ocs.cluster_load import (
+    LoadCurve,
+    fio_rate,
+    get_fio_block_size,
+    proportional_rate,
+)
+
+
+@pytest.mark.parametrize(
+    "args,expected",
+    [
+        (["--name=fio", "--bs=128K", "--rate=15M"], 128 * 1024),
+        (["--bs=1M"], 1024**2),
+        (["--bs=4KiB"], 4096),
+        (["--bs=512"], 512),
+        (["--name=fio"], 4096),
+    ],
+)
+def test_get_fio_block_size(args, expected):
+    assert get_fio_block_size(args) == expected
+
+
+def test_fio_rate():
+    assert fio_rate(2048.4) == "2048K"
+    assert fio_rate(0.1) == "1K"
+
+
+def test_proportional_rate():
+    # full correction of the error within the step limit
+    assert proportional_rate(100, measured=800, target=1000) == 125
+    assert proportional_rate(100, measured=1000, target=800) == 80
+    # step is limited to factor of 2 in both directions
+    assert proportional_rate(100, measured=100, target=1000) == 200
+    assert proportional_rate(100, measured=1000, target=100) == 50
+    assert proportional_rate(100, measured=0, target=100) == 200
+    # half gain corrects half of the error
+    assert proportional_rate(100, measured=800, target=1000, gain=0.5) == 112.5
+
+
+def test_load_curve_latency_growth():
+    curve = LoadCurve(baseline_iops=10)
+    for pods, iops, latency in [(1, 1000, 1), (2, 2000, 10), (3, 2100, 300)]:
+        curve.add(pods, iops, latency)
+    assert "latency growth" in curve.limit_reason()
+    assert curve.limit == 2100
+
+
+def test_load_curve_high_latency():
+    curve = LoadCurve(baseline_iops=10)
+    curve.add(1, 1000, 2500)
+    assert "high latency" in curve.limit_reason()
+
+
+def test_load_curve_low_iops_diff():
+    curve = LoadCurve(baseline_iops=10)
+    curve.add(1, 1000, 1)
+    assert curve.limit_reason() is None
+    for pods in range(2, 6):
+        curve.add(pods, 1000 + pods, 1)
+    assert curve.low_diff_counter == 4
+    assert "low IOPS diff" in curve.limit_reason()
+
+
+def test_load_curve_not_reached():
+    curve = LoadCurve()
+    assert curve.limit is None
+    assert curve.limit_reason() is None
+    curve.add(1, 1000, 1)
+    curve.add(2, 2000, 2)
+    assert curve.limit_reason() is None
@@ -0,0 +1,70 @@
+import threading
+import time
+
+
+from ocs_ci.ocs.dr.data_integrity import DataIntegrityVerifier, parse_md5sum_check
+from ocs_ci.ocs.exceptions import CommandFailed
+
+
+class FakePod:
+    running = 0
+    max_running = 0
+    lock = threading.Lock()
+
+    def __init__(self, name, output=None, error=None):
+        self.name = name
+        self.output = output
+        self.error = error
+
+    def exec_cmd_on_pod(self, command, **kwargs):
+        assert kwargs["ignore_error"]
+        with FakePod.lock:
+            FakePod.running += 1
+            FakePod.max_running = max(FakePod.max_running, FakePod.running)
+        time.sleep(0.1)
+        with FakePod.lock:
+            FakePod.running -= 1
+        if self.error:
+            raise CommandFailed(self.error)
+        return self.output
+
+
+def test_parse_md5sum_check():
+    output = (
+        "/mnt/test/file1: OK\n"
+        "/mnt/test/file 2: FAILED\n"
+        "/mnt/test/file3: FAILED open or read\n"
+        "md5sum: WARNING: 1 computed checksum did NOT match\n"
+    )
+    assert parse_md5sum_check(output) == {
+        "/mnt/test/file1": "OK",
+        "/mnt/test/file 2": "FAILED",
+        "/mnt/test/file3": "FAILED open or read",
+    }
+
+
+def test_all_pods_verified_with_bounded_workers():
+    ok_output = "/mnt/test/file1: OK\n/mnt/test/file2: OK\n"
+    pods = [FakePod(f"busybox-{i}", ok_output) for i in range(12)]
+    pods[3] = FakePod("busybox-3", "/mnt/test/file1: OK\n/mnt/test/file2: FAILED\n")
+    pods[7] = FakePod("busybox-7", error="pod not found")
+    pods[9] = FakePod("busybox-9", "")
+
+    start = time.time()
+    report = DataIntegrityVerifier(max_workers=4).verify_pods(pods)
+    assert time.time() - start < 0.8
+    assert FakePod.max_running == 4
+
+    assert not report.ok
+    assert [result.target for result in report.results] == [pod.name for pod in pods]
+    assert [result.target for result in report.failed] == [
+        "busybox-3",
+        "busybox-7",
+        "busybox-9",
+    ]
+    assert report.mismatches == {"busybox-3": ["/mnt/test/file2"]}
+    summary = report.summary()
+    assert "failed on 3 of 12 targets" in summary
+    assert "busybox-3: /mnt/test/file2: FAILED" in summary
+    assert "busybox-7: pod not found" in summary
+    assert "busybox-9: no files were verified" in summary
@@ -0,0 +1,133 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from ocs_ci.framework import Config, config
+from ocs_ci.helpers import dr_helpers
+from ocs_ci.ocs.dr import status_watcher
+from ocs_ci.ocs.dr.status_watcher import DRStatusWatcher
+from ocs_ci.ocs.exceptions import TimeoutExpiredError
+
+
+@pytest.fixture
+def clusters(monkeypatch):
+    cluster_configs = []
+    for i in range(3):
+        cluster = Config()
+        cluster.ENV_DATA["cluster_name"] = f"cluster-{i}"
+        cluster.MULTICLUSTER["multicluster_index"] = i
+        cluster_configs.append(cluster)
+    monkeypatch.setattr(config, "clusters", cluster_configs)
+    monkeypatch.setattr(config, "cur_index", 0)
+    monkeypatch.setattr(
+        status_watcher, "get_non_acm_cluster_config", lambda: cluster_configs[:2]
+    )
+    monkeypatch.setattr(status_watcher, "get_active_acm_index", lambda: 2)
+    return cluster_configs
+
+
+class Images:
+    """
+    Replaying images of the cluster, one more image every call.
+    """
+
+    def __init__(self):
+        self.calls = {}
+
+    def replaying(self):
+        name = config.ENV_DATA["cluster_name"]
+        self.calls[name] = self.calls.get(name, 0) + 1
+        time.sleep(0.05)
+        return self.calls[name]
+
+
+def test_clusters_polled_in_parallel(clusters):
+    images = Images()
+    watcher = DRStatusWatcher(sleep=0.01)
+    watcher.watch_managed_clusters(
+        "replaying images", images.replaying, condition=lambda count: count >= 5
+    )
+    watcher.watch_hub("sync time", lambda: "2026-01-01T00:00:00Z")
+    start = time.time()
+    assert watcher.wait(timeout=10)
+    # the rounds on the clusters overlap, so the wait is not the sum
+    assert time.time() - start < 0.5
+    assert images.calls == {"cluster-0": 5, "cluster-1": 5}
+    assert watcher.rounds == 5
+    assert not watcher.pending
+
+
+def test_watches_of_cluster_checked_in_order(clusters):
+    counts = {"vr": 0}
+    states = []
+
+    def vr_count():
+        counts["vr"] += 1
+        return counts["vr"]
+
+    def vr_state():
+        states.append(counts["vr"])
+        return True
+
+    watcher = DRStatusWatcher(sleep=0.01)
+    watcher.watch(0, "VR count", vr_count, condition=lambda count: count == 3)
+    watcher.watch(0, "VR state", vr_state)
+    watcher.wait(timeout=10)
+    # the state is checked only after the count converged, and only once
+    assert states == [3]
+
+
+def test_timeout_names_pending_clusters(clusters):
+    watcher = DRStatusWatcher(sleep=0.01)
+    watcher.watch_managed_clusters(
+        "mirroring status",
+        lambda: config.ENV_DATA["cluster_name"] == "cluster-0",
+    )
+    with pytest.raises(TimeoutExpiredError) as excinfo:
+        watcher.wait(timeout=0.1)
+    assert "mirroring status on cluster cluster-1" in str(excinfo.value)
+    assert "cluster-0" not in str(excinfo.value)
+
+
+def test_resources_waited_on_both_clusters_at_once(clusters, monkeypatch):
+    calls = []
+    timeouts = []
+
+    def wait_for_creation(pvc_count, pod_count, namespace, timeout=900):
+        time.sleep(0.3)
+        calls.append(("creation", config.ENV_DATA["cluster_name"], namespace))
+        timeouts.append(timeout)
+
+    def wait_for_deletion(namespace, timeout=1000):
+        time.sleep(0.3)
+        calls.append(("deletion", config.ENV_DATA["cluster_name"], namespace))
+        timeouts.append(timeout)
+        raise TimeoutExpiredError("VRG resource not deleted")
+
+    monkeypatch.setattr(
+        dr_helpers, "wait_for_all_resources_creation", wait_for_creation
+    )
+    monkeypatch.setattr(
+        dr_helpers, "wait_for_all_resources_deletion", wait_for_deletion
+    )
+    workloads = [
+        SimpleNamespace(
+            workload_namespace=f"ns-{i}", workload_pvc_count=2, workload_pod_count=2
+        )
+        for i in range(2)
+    ]
+    start = time.time()
+    with pytest.raises(TimeoutExpiredError, match="VRG resource not deleted"):
+        dr_helpers.wait_for_all_resources_on_clusters(
+            workloads, "cluster-1", "cluster-0"
+        )
+    # the creation wait doesn't wait for the deletion wait to finish
+    assert time.time() - start < 0.9
+    assert sorted(calls) == [
+        ("creation", "cluster-1", "ns-0"),
+        ("creation", "cluster-1", "ns-1"),
+        ("deletion", "cluster-0", "ns-0"),
+    ]
+    # the default timeout of every wait is kept
+    assert sorted(timeouts) == [900, 900, 1000]
@@ -0,0 +1,128 @@
+# -*- coding: utf8 -*-
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from elasticsearch import Elasticsearch
+
+from ocs_ci.ocs.elasticsearch import (
+    bulk_load_file,
+    elasticsearch_load,
+    get_data_from_text_file,
+)
+
+
+class FakeESHandler(BaseHTTPRequestHandler):
+    """
+    Minimal stand-in of the ES bulk API, documents with "reject" field are
+    refused with mapping error.
+    """
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, body):
+        data = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("X-Elastic-Product", "Elasticsearch")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        lines = [json.loads(line) for line in body.splitlines() if line.strip()]
+        index = self.path.strip("/").split("/")[0]
+        items = []
+        for action, doc in zip(lines[::2], lines[1::2]):
+            doc_index = action["index"].get("_index", index)
+            if doc.get("reject"):
+                items.append(
+                    {
+                        "index": {
+                            "_index": doc_index,
+                            "status": 400,
+                            "error": {"type": "mapper_parsing_exception"},
+                        }
+                    }
+                )
+                continue
+            self.server.docs.setdefault(doc_index, []).append(doc)
+            items.append({"index": {"_index": doc_index, "status": 201}})
+        with self.server.lock:
+            self.server.requests += 1
+        self._reply({"took": 1, "errors": False, "items": items})
+
+    do_PUT = do_POST
+
+
+@pytest.fixture
+def es_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeESHandler)
+    server.docs = {}
+    server.requests = 0
+    server.lock = threading.Lock()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def connection(es_server):
+    return Elasticsearch(f"http://127.0.0.1:{es_server.server_address[1]}")
+
+
+def write_dump(path, index, docs):
+    results = path / "results"
+    results.mkdir(exist_ok=True)
+    with open(results / f"{index}.data.json", "w") as fd:
+        for doc in docs:
+            fd.write(f"{json.dumps(doc)}\n")
+    (results / f"{index}.mapping.json").write_text("{}")
+
+
+def test_get_data_from_text_file(tmp_path):
+    dump = tmp_path / "dump.json"
+    dump.write_text('{"a": 1}\n\nnot json\n{"a": 2}\n')
+    assert list(get_data_from_text_file(dump)) == [{"a": 1}, {"a": 2}]
+
+
+@pytest.mark.parametrize("thread_count", [1, 3])
+def test_bulk_load_file(tmp_path, es_server, connection, thread_count):
+    docs = [{"num": i} for i in range(250)]
+    docs[10]["reject"] = True
+    write_dump(tmp_path, "fio", docs)
+    result = bulk_load_file(
+        connection,
+        str(tmp_path / "results" / "fio.data.json"),
+        "fio",
+        chunk_size=20,
+        thread_count=thread_count,
+        progress_interval=100,
+    )
+    assert result["loaded"] == 249
+    assert result["failed"] == 1
+    assert len(result["errors"]) == 1
+    assert es_server.requests == 13
+    assert sorted(d["num"] for d in es_server.docs["fio"]) == [
+        i for i in range(250) if i != 10
+    ]
+
+
+def test_elasticsearch_load(tmp_path, es_server, connection):
+    write_dump(tmp_path, "ripsaw-fio-results", [{"num": i} for i in range(30)])
+    write_dump(tmp_path, "ripsaw-smallfile", [{"num": i} for i in range(5)])
+    assert elasticsearch_load(connection, str(tmp_path), chunk_size=10)
+    assert len(es_server.docs["ripsaw-fio-results"]) == 30
+    assert len(es_server.docs["ripsaw-smallfile"]) == 5
+
+
+def test_elasticsearch_load_no_data(tmp_path, connection):
+    assert not elasticsearch_load(connection, str(tmp_path))
+    write_dump(tmp_path, "fio", [{"num": 1}])
+    assert not elasticsearch_load(None, str(tmp_path))
@@ -0,0 +1,85 @@
+# -*- coding: utf8 -*-
+
+import pytest
+from elasticsearch import exceptions as ESExp
+
+from ocs_ci.ocs.es_reader import ESReader
+
+
+class FakeES:
+    """
+    Elasticsearch connection stand-in serving the documents in pages.
+    """
+
+    def __init__(self, docs, pit=True):
+        self.docs = docs
+        self.pit = pit
+        self.searches = []
+        self.closed = []
+
+    def _page(self, start, size):
+        hits = [
+            {"_id": str(i), "_source": doc, "sort": [i]}
+            for i, doc in enumerate(self.docs[start : start + size], start)
+        ]
+        return {"hits": {"hits": hits}}
+
+    def open_point_in_time(self, index, keep_alive):
+        if not self.pit:
+            raise ESExp.TransportError("PIT not supported")
+        return {"id": "pit-1"}
+
+    def close_point_in_time(self, id):
+        self.closed.append(id)
+
+    def search(self, **kwargs):
+        self.searches.append(kwargs)
+        start = kwargs["search_after"][0] + 1 if "search_after" in kwargs else 0
+        response = self._page(start, kwargs.get("size", 10))
+        if "scroll" in kwargs:
+            self.scroll_size = kwargs["size"]
+            self.scroll_pos = len(response["hits"]["hits"])
+            response["_scroll_id"] = "scroll-1"
+        if "aggs" in kwargs:
+            response["aggregations"] = {"total": {"value": len(self.docs)}}
+        return response
+
+    def scroll(self, scroll_id, scroll):
+        response = self._page(self.scroll_pos, self.scroll_size)
+        self.scroll_pos += len(response["hits"]["hits"])
+        response["_scroll_id"] = scroll_id
+        return response
+
+    def clear_scroll(self, scroll_id):
+        self.closed.append(scroll_id)
+
+
+@pytest.mark.parametrize("pit", [True, False])
+def test_iter_sources_reads_all_pages(pit):
+    docs = [{"num": i} for i in range(25)]
+    es = FakeES(docs, pit=pit)
+    reader = ESReader(es, "fio", page_size=10)
+    assert list(reader.iter_sources({"match": {"uuid": "x"}})) == docs
+    assert es.closed == (["pit-1"] if pit else ["scroll-1"])
+
+
+def test_iter_hits_is_lazy_and_filters_source():
+    es = FakeES([{"num": i} for i in range(25)])
+    reader = ESReader(es, "fio", page_size=10)
+    hits = reader.iter_hits(source=["num"])
+    assert next(hits)["_id"] == "0"
+    assert len(es.searches) == 1
+    assert es.searches[0]["source"] == ["num"]
+    assert es.searches[0]["sort"] == ["_shard_doc"]
+    assert es.searches[0]["pit"]["id"] == "pit-1"
+    hits.close()
+    assert es.closed == ["pit-1"]
+
+
+def test_aggregate():
+    es = FakeES([{"num": i} for i in range(5)])
+    reader = ESReader(es, "fio")
+    aggs = {"total": {"value_count": {"field": "num"}}}
+    assert reader.aggregate(None, aggs) == {"total": {"value": 5}}
+    assert es.searches[0]["size"] == 0
+    assert es.searches[0]["aggs"] == aggs
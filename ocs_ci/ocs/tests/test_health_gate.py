@@ -0,0 +1,74 @@
+import pytest
+
+from ocs_ci.ocs import health_gate
+from ocs_ci.ocs.ceph_snapshot import CephSnapshot
+from ocs_ci.ocs.exceptions import CephHealthException
+from ocs_ci.ocs.health_gate import HealthGate
+
+
+class Cluster:
+    def __init__(self):
+        self.status = "HEALTH_OK"
+        self.checks = {}
+        self.osdmap_epoch = 10
+        self.fetches = []
+
+    def snapshot(self, namespace=None, max_age=None):
+        self.fetches.append(max_age)
+        status = {"health": {"status": self.status, "checks": self.checks}}
+        return CephSnapshot(status, {}, {}, {}, osdmap_epoch=self.osdmap_epoch)
+
+
+@pytest.fixture
+def cluster(monkeypatch):
+    cluster = Cluster()
+    monkeypatch.setattr(health_gate, "get_ceph_snapshot", cluster.snapshot)
+    return cluster
+
+
+def test_verdict_reused_until_cluster_changes(cluster):
+    gate = HealthGate(namespace="openshift-storage", window=60)
+    calls = []
+
+    def health_check():
+        calls.append(cluster.status)
+        if cluster.status != "HEALTH_OK":
+            raise CephHealthException(cluster.status)
+        return True
+
+    assert gate.check(health_check, "setup")
+    assert gate.check(health_check, "teardown", fresh=True)
+    assert gate.check(health_check, "setup")
+    assert len(calls) == 1
+    assert gate.reused == 2
+    # teardown always fetches the change signal from the cluster
+    assert 0 in cluster.fetches
+
+    cluster.osdmap_epoch = 11
+    assert gate.check(health_check, "setup")
+    assert len(calls) == 2
+
+    cluster.status = "HEALTH_WARN"
+    cluster.checks = {"OSD_DOWN": {}}
+    with pytest.raises(CephHealthException):
+        gate.check(health_check, "teardown", fresh=True)
+    assert gate.verdict is None
+    cluster.status = "HEALTH_OK"
+    cluster.checks = {}
+    assert gate.check(health_check, "setup")
+    assert len(calls) == 4
+
+
+def test_verdict_expires(cluster):
+    gate = HealthGate(window=60)
+    calls = []
+    gate.check(lambda: calls.append(1) or True, "setup")
+    gate.verdict.timestamp -= 61
+    gate.check(lambda: calls.append(1) or True, "setup")
+    assert len(calls) == 2
+
+    disabled = HealthGate(window=0)
+    for _ in range(2):
+        disabled.check(lambda: calls.append(1) or True, "setup")
+    assert len(calls) == 4
+    assert disabled.verdict is None
@@ -0,0 +1,120 @@
+# -*- coding: utf8 -*-
+
+import io
+import json
+import threading
+
+import pytest
+
+from ocs_ci.ocs import constants, scale_lib
+from ocs_ci.ocs.exceptions import TimeoutExpiredError
+from ocs_ci.ocs.kube_job_tracker import KubeJobProgressTracker, latency_stats
+from ocs_ci.ocs.resources.objectconfigfile import ObjectConfFile
+
+
+def pvc_dict(name, phase="Pending"):
+    return {
+        "apiVersion": "v1",
+        "kind": constants.PVC,
+        "metadata": {"name": name},
+        "status": {"phase": phase},
+    }
+
+
+@pytest.fixture
+def kube_job(tmp_path):
+    pvcs = [pvc_dict(f"pvc-{i}") for i in range(3)]
+    return ObjectConfFile("test", pvcs, None, tmp_path)
+
+
+def test_tracker_names_and_kinds(kube_job):
+    tracker = KubeJobProgressTracker(kube_job, "ns")
+    assert tracker.names == ["pvc-0", "pvc-1", "pvc-2"]
+    assert tracker.kinds == [constants.PVC]
+    assert tracker.not_ready == {"pvc-0", "pvc-1", "pvc-2"}
+
+
+def test_tracker_consume_stream(kube_job):
+    tracker = KubeJobProgressTracker(kube_job, "ns", names=["pvc-0", "pvc-1"])
+    tracker.start_time = 100.0
+    events = [
+        {"type": "ADDED", "object": pvc_dict("pvc-0", "Bound")},
+        {"type": "ADDED", "object": pvc_dict("pvc-1")},
+        {"type": "ADDED", "object": pvc_dict("pvc-2", "Bound")},
+    ]
+    # oc prints pretty printed json documents one after another
+    stream = io.StringIO("".join(json.dumps(e, indent=4) + "\n" for e in events))
+    tracker.consume_stream(stream)
+    assert tracker.ready == {"pvc-0"}
+    assert tracker.not_ready == {"pvc-1"}
+    tracker.handle_event(
+        {"type": "MODIFIED", "object": pvc_dict("pvc-1", "Bound")}, timestamp=104.0
+    )
+    assert tracker.is_complete
+    assert tracker.latencies["pvc-1"] == 4.0
+    assert tracker.end_time == 104.0
+
+
+def test_tracker_latency_since_creation(kube_job):
+    # the tracker started 30 seconds after the objects were created
+    tracker = KubeJobProgressTracker(kube_job, "ns")
+    tracker.start_time = 1700000030.0
+    for i, name in enumerate(tracker.names):
+        pvc = pvc_dict(name, "Bound")
+        pvc["metadata"]["creationTimestamp"] = "2023-11-14T22:13:20Z"
+        tracker.handle_object(pvc, timestamp=1700000031.0 + i)
+    assert tracker.latencies == {"pvc-0": 31.0, "pvc-1": 32.0, "pvc-2": 33.0}
+    summary = tracker.summary()
+    assert summary["elapsed"] == 33.0
+    assert summary["p50"] == 32.0
+
+
+def test_tracker_wait_returns_on_completion(kube_job):
+    tracker = KubeJobProgressTracker(kube_job, "ns")
+    tracker.start_time = 0.0
+    tracker.stop = lambda: None
+
+    def bind_all():
+        for i, name in enumerate(tracker.names):
+            tracker.handle_object(pvc_dict(name, "Bound"), timestamp=float(i + 1))
+
+    threading.Timer(0.1, bind_all).start()
+    assert tracker.wait(timeout=10) == ["pvc-0", "pvc-1", "pvc-2"]
+    summary = tracker.summary()
+    assert summary["ready"] == summary["total"] == 3
+    assert summary["elapsed"] == 3.0
+    assert summary["throughput"] == 1.0
+    assert summary["p50"] == 2.0
+
+
+def test_tracker_wait_timeout(kube_job):
+    tracker = KubeJobProgressTracker(kube_job, "ns")
+    tracker.start_time = 0.0
+    with pytest.raises(TimeoutExpiredError):
+        tracker.wait(timeout=0.1)
+
+
+def test_latency_stats():
+    assert latency_stats([]) == {"p50": None, "p95": None, "p99": None, "max": None}
+    stats = latency_stats(list(range(1, 101)))
+    assert stats["p50"] == 50.5
+    assert stats["max"] == 100
+
+
+def test_pod_kube_job_waits_whole_timeout(tmp_path, monkeypatch):
+    pod = {"apiVersion": "v1", "kind": constants.POD, "metadata": {"name": "pod-0"}}
+    kube_job = ObjectConfFile("pods", [pod], None, tmp_path)
+    waits = []
+
+    def wait(self, timeout=300):
+        waits.append(timeout)
+        raise TimeoutExpiredError(timeout)
+
+    monkeypatch.setattr(KubeJobProgressTracker, "start", lambda self: self)
+    monkeypatch.setattr(KubeJobProgressTracker, "stop", lambda self: None)
+    monkeypatch.setattr(KubeJobProgressTracker, "wait", wait)
+    with pytest.raises(AssertionError, match="more than 390secs"):
+        scale_lib.check_all_pod_reached_running_state_in_kube_job(
+            kube_job, "ns", no_of_pod=1, timeout=30
+        )
+    assert waits == [390]
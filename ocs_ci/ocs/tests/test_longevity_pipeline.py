@@ -0,0 +1,212 @@
+import threading
+import time
+
+import pytest
+import yaml
+
+from ocs_ci.ocs import longevity
+from ocs_ci.ocs.exceptions import CommandFailed, UnexpectedBehaviour
+from ocs_ci.ocs.longevity_pipeline import LongevityPipeline
+from ocs_ci.ocs.resources import objectconfigfile
+
+
+class FakeCluster:
+    """
+    Records the steps of the batches and the objects in flight.
+    """
+
+    def __init__(self, batch_size, fail_validate=None):
+        self.batch_size = batch_size
+        self.fail_validate = fail_validate
+        self.events = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def step(self, name, index):
+        with self.lock:
+            self.events.append((name, index, "start"))
+        time.sleep(0.05)
+        with self.lock:
+            self.events.append((name, index, "end"))
+
+    def create(self, index):
+        with self.lock:
+            self.in_flight += self.batch_size
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        self.step("create", index)
+        return index
+
+    def validate(self, index):
+        self.step("validate", index)
+        if index == self.fail_validate:
+            raise AssertionError(f"pods of batch {index} not running")
+
+    def delete(self, index):
+        self.step("delete", index)
+        with self.lock:
+            self.in_flight -= self.batch_size
+
+    def ticks(self):
+        """
+        Group the steps started together, a step ends before the next tick.
+        """
+        ticks, current, running = [], [], 0
+        for name, index, phase in self.events:
+            if phase == "start":
+                current.append((name, index))
+                running += 1
+            else:
+                running -= 1
+                if not running:
+                    ticks.append(sorted(current))
+                    current = []
+        return ticks
+
+
+def test_pipeline_overlaps_steps_with_bounded_objects():
+    cluster = FakeCluster(batch_size=10)
+    pipeline = LongevityPipeline(
+        cluster.create, cluster.validate, cluster.delete, batch_size=10
+    )
+    start = time.time()
+    report = pipeline.run(max_batches=5)
+    # 5 batches take 7 ticks instead of 15 sequential steps
+    assert time.time() - start < 0.6
+    assert cluster.max_in_flight == 30
+    assert cluster.in_flight == 0
+    assert cluster.ticks() == [
+        [("create", 0)],
+        [("create", 1), ("validate", 0)],
+        [("create", 2), ("delete", 0), ("validate", 1)],
+        [("create", 3), ("delete", 1), ("validate", 2)],
+        [("create", 4), ("delete", 2), ("validate", 3)],
+        [("delete", 3), ("validate", 4)],
+        [("delete", 4)],
+    ]
+    for step in ("create", "validate", "delete"):
+        assert report[step]["batches"] == 5
+        assert report[step]["objects"] == 50
+        assert report[step]["failures"] == 0
+        assert report[step]["objects_per_min"] > 0
+        assert report[step]["latency"]["count"] == 5
+        assert report[step]["latency"]["min"] >= 50
+
+
+def test_pipeline_drains_on_failure():
+    cluster = FakeCluster(batch_size=10, fail_validate=1)
+    pipeline = LongevityPipeline(
+        cluster.create,
+        cluster.validate,
+        cluster.delete,
+        batch_size=10,
+        max_in_flight=40,
+    )
+    with pytest.raises(UnexpectedBehaviour, match="validate of batch 1"):
+        pipeline.run(max_batches=10)
+    assert cluster.max_in_flight <= 40
+    # no new batch after the failure, all the created batches are deleted
+    created = {index for name, index, _ in cluster.events if name == "create"}
+    deleted = {index for name, index, _ in cluster.events if name == "delete"}
+    assert created == deleted
+    assert len(created) < 10
+    assert pipeline.stats["validate"].failures == 1
+
+
+class FakeOC:
+    """
+    Stand-in of `oc create/get/delete -f` keeping the objects per namespace.
+    """
+
+    def __init__(self):
+        self.objects = {}
+        self.lock = threading.Lock()
+
+    def run_cmd(self, cmd, timeout=None):
+        command, path, namespace = cmd[3], cmd[5], cmd[7]
+        with open(path) as f:
+            names = [doc["metadata"]["name"] for doc in yaml.safe_load_all(f)]
+        # let the steps of the other batches run meanwhile
+        time.sleep(0.02)
+        with self.lock:
+            existing = self.objects.setdefault(namespace, set())
+            if command == "create":
+                existing.update(names)
+                return ""
+            missing = set(names) - existing
+            if missing:
+                raise CommandFailed(f"{sorted(missing)} not found in {namespace}")
+            if command == "delete":
+                existing.difference_update(names)
+                return ""
+            return yaml.dump({"items": [{"metadata": {"name": n}} for n in names]})
+
+
+class FakeProject:
+    def __init__(self, project_name, deleted):
+        self.namespace = project_name
+        self.deleted = deleted
+
+    def delete(self, resource_name):
+        self.deleted.append(resource_name)
+
+    def wait_for_delete(self, resource_name, timeout):
+        pass
+
+
+def test_stage_pipelined_batches_use_own_kube_job_files(monkeypatch, tmp_path):
+    fake_oc = FakeOC()
+    deleted = []
+    counter = iter(range(10**6))
+
+    def names_in_kube_job(kube_job_obj, namespace, **kwargs):
+        return [
+            item["metadata"]["name"] for item in kube_job_obj.get(namespace)["items"]
+        ]
+
+    def pvc_dicts(num_of_pvcs, pvc_size):
+        return [
+            [{"metadata": {"name": f"pvc-{next(counter)}"}} for _ in range(num_of_pvcs)]
+            for _ in range(4)
+        ]
+
+    def pod_dicts(pvc_list, namespace):
+        return [[{"metadata": {"name": f"pod-{pvc}"}} for pvc in pvc_list]]
+
+    monkeypatch.setattr(objectconfigfile, "run_cmd", fake_oc.run_cmd)
+    monkeypatch.setitem(objectconfigfile.config.RUN, "kubeconfig", "kubeconfig")
+    monkeypatch.setattr(
+        longevity,
+        "create_project",
+        lambda project_name: FakeProject(project_name, deleted),
+    )
+    monkeypatch.setattr(
+        longevity, "switch_to_default_rook_cluster_project", lambda: None
+    )
+    monkeypatch.setattr(
+        longevity, "check_all_pvc_reached_bound_state_in_kube_job", names_in_kube_job
+    )
+    monkeypatch.setattr(
+        longevity, "check_all_pod_reached_running_state_in_kube_job", names_in_kube_job
+    )
+    long = longevity.Longevity.__new__(longevity.Longevity)
+    long.tmp_path = tmp_path
+    monkeypatch.setattr(
+        long, "construct_stage_builder_bulk_pvc_creation_yaml", pvc_dicts
+    )
+    monkeypatch.setattr(
+        long, "construct_stage_builder_bulk_pod_creation_yaml", pod_dicts
+    )
+
+    # batches overlap for about a second of creation
+    report = long.stage_pipelined(
+        num_of_pvc=2, run_time=0.02, collect_cluster_sanity_checks=False
+    )
+    assert report["create"]["batches"] >= 2
+    assert report["create"]["failures"] == 0
+    assert report["delete"]["batches"] == report["create"]["batches"]
+    assert deleted == [
+        f"{longevity.STAGE_PIPELINED_NAMESPACE_PREFIX}{index}"
+        for index in range(report["create"]["batches"])
+    ]
+    assert not any(fake_oc.objects.values())
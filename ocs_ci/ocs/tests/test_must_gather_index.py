@@ -0,0 +1,55 @@
+# -*- coding: utf8 -*-
+
+import os
+
+import pytest
+
+from ocs_ci.ocs.must_gather.mg_index import MustGatherIndex
+
+
+@pytest.fixture
+def mg_dir(tmp_path):
+    files = {
+        "quay-io/ceph/must_gather_commands/ceph_status": "HEALTH_OK",
+        "quay-io/ceph/ceph_logs/journal_compute-1/log.log": "exit code 2",
+        "quay-io/namespaces/openshift-storage/pods/rook-ceph-mon-a/mon.log": "",
+        "quay-io/namespaces/openshift-storage/pods/rook-ceph-osd-0/osd.log": "x",
+        "quay-io/namespaces/openshift-storage/storagecluster.yaml": "kind: X",
+        "quay-io/namespaces/openshift-storage/cephcluster.yaml": "spec: {}",
+    }
+    for path, content in files.items():
+        full_path = tmp_path / path
+        full_path.parent.mkdir(parents=True, exist_ok=True)
+        full_path.write_text(content)
+    return str(tmp_path)
+
+
+def test_index(mg_dir):
+    index = MustGatherIndex(mg_dir)
+    assert len(index.files) == 6
+    assert index.find("ceph_status") == os.path.join(
+        mg_dir, "quay-io/ceph/must_gather_commands/ceph_status"
+    )
+    assert index.find("missing") is None
+    assert [os.path.basename(p) for p in index.empty_files()] == ["mon.log"]
+    pods = index.find_dir("openshift-storage/pods$")
+    assert sorted(index.children[pods]) == ["rook-ceph-mon-a", "rook-ceph-osd-0"]
+    assert index.contains_path("/ceph_logs/journal_")
+    assert index.contains_path("/pods/rook-ceph-osd-0")
+    assert not index.contains_path("/ceph_logs/kernel_")
+
+
+def test_check_contents_and_fingerprints(mg_dir):
+    index = MustGatherIndex(mg_dir, max_workers=2)
+    yaml_files = [p for p in index.files if p.endswith(".yaml")]
+    results = index.check_contents(yaml_files, lambda content: "kind" in content)
+    assert {os.path.basename(p): r for p, r in results.items()} == {
+        "storagecluster.yaml": True,
+        "cephcluster.yaml": False,
+    }
+    missing = os.path.join(mg_dir, "missing")
+    assert index.check_contents([missing], bool) == {missing: None}
+    fingerprints = index.fingerprints()
+    assert len(fingerprints) == 6
+    assert len(set(fingerprints.values())) == 6
+    assert index.fingerprint(yaml_files[0]) == fingerprints[yaml_files[0]]
@@ -0,0 +1,290 @@
+"""
+Fault Scheduling Engine
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class FaultAction:
+    """
+    Single fault to be applied on a single target.
+
+    Attributes:
+        target (str): Name of the target (e.g. node name)
+        description (str): Description of the fault for logs
+        apply (callable): Function without arguments injecting the fault
+        remove (callable): Function without arguments removing the fault,
+            None for blocking actions
+        duration (float): Time in seconds to hold the fault on the target
+        offset (float): Time in seconds from the start of the plan when the
+            fault should be applied
+    """
+
+    target: str
+    description: str
+    apply: Callable
+    remove: Optional[Callable] = None
+    duration: float = 0
+    offset: float = 0
+
+
+@dataclass
+class FaultRecord:
+    """
+    Timestamps and result of single FaultAction execution.
+    """
+
+    target: str
+    description: str
+    scheduled: float
+    start: Optional[float] = None
+    stop: Optional[float] = None
+    applied: bool = False
+    removed: bool = False
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def lateness(self):
+        """
+        float: Seconds between the planned and the actual fault start
+        """
+        if self.start is None:
+            return None
+        return self.start - self.scheduled
+
+    @property
+    def effective_duration(self):
+        """
+        float: Seconds the fault was active on the target
+        """
+        if self.start is None or self.stop is None:
+            return None
+        return self.stop - self.start
+
+
+@dataclass
+class FaultRunResult:
+    """
+    Result of the fault plan execution.
+    """
+
+    records: List[FaultRecord]
+    max_skew: float
+
+    @property
+    def skew(self):
+        """
+        float: Spread of the fault start lateness across all applied targets
+        """
+        lateness = [r.lateness for r in self.records if r.applied]
+        if not lateness:
+            return 0
+        return max(lateness) - min(lateness)
+
+    @property
+    def within_skew(self):
+        """
+        bool: True if all the faults started within allowed skew
+        """
+        return self.skew <= self.max_skew
+
+    @property
+    def failed(self):
+        """
+        list: Records of the actions which hit an error
+        """
+        return [r for r in self.records if r.errors]
+
+    @property
+    def applied_targets(self):
+        """
+        set: Names of the targets where the fault was applied
+        """
+        return {r.target for r in self.records if r.applied}
+
+    def log_summary(self):
+        """
+        Log per target timing of the executed fault plan.
+        """
+        for r in sorted(self.records, key=lambda r: (r.start or 0, r.target)):
+            duration = r.effective_duration
+            log.info(
+                f"[{r.target}] {r.description}: applied={r.applied} "
+                f"removed={r.removed} lateness={_fmt(r.lateness)}s "
+                f"effective duration={_fmt(duration)}s errors={r.errors}"
+            )
+        log.info(
+            f"Fault plan with {len(self.records)} actions finished, "
+            f"start skew {self.skew:.2f}s (allowed {self.max_skew}s), "
+            f"{len(self.failed)} actions with errors"
+        )
+
+
+def _fmt(value):
+    return "n/a" if value is None else f"{value:.2f}"
+
+
+class FaultScheduler:
+    """
+    Runs fault plans concurrently and records per target timing.
+    """
+
+    def __init__(self, max_workers=64, max_skew=5):
+        """
+        Args:
+            max_workers (int): Maximum number of actions running concurrently
+            max_skew (float): Allowed spread in seconds of the actual fault
+                start across the targets
+
+        """
+        self.max_workers = max_workers
+        self.max_skew = max_skew
+        self.stop_event = threading.Event()
+        # number of the actions which didn't finish yet, across all the runs
+        self._running = 0
+        self._idle = threading.Condition()
+
+    def _action_done(self):
+        with self._idle:
+            self._running -= 1
+            self._idle.notify_all()
+
+    def _run_action(self, action, record, stop_event):
+        """
+        Apply, hold and remove single fault action.
+
+        Args:
+            action (FaultAction): Action to run
+            record (FaultRecord): Record to fill with timing and result
+            stop_event (threading.Event): Event interrupting the hold time
+
+        """
+        try:
+            self._apply_and_remove(action, record, stop_event)
+        finally:
+            self._action_done()
+
+    def _apply_and_remove(self, action, record, stop_event):
+        delay = record.scheduled - time.time()
+        if stop_event.is_set() or (delay > 0 and stop_event.wait(delay)):
+            return
+        log.info(f"[{action.target}] Applying {action.description}")
+        try:
+            start = time.time()
+            action.apply()
+            if action.remove is None:
+                # blocking action, fault was active for the whole apply call
+                record.start, record.stop = start, time.time()
+            else:
+                record.start = time.time()
+            record.applied = True
+        except Exception as e:
+            log.error(f"[{action.target}] Failed to apply {action.description}: {e}")
+            record.errors.append(f"apply: {e}")
+        if action.remove is None:
+            return
+        try:
+            if record.applied:
+                hold = record.start + action.duration - time.time()
+                if hold > 0:
+                    stop_event.wait(hold)
+        finally:
+            # remove the fault even when apply failed as it might be
+            # partially applied
+            log.info(f"[{action.target}] Removing {action.description}")
+            try:
+                action.remove()
+                record.removed = True
+            except Exception as e:
+                log.error(
+                    f"[{action.target}] Failed to remove {action.description}: {e}"
+                )
+                record.errors.append(f"remove: {e}")
+            if record.applied:
+                record.stop = time.time()
+
+    def run(self, actions, stop_event=None):
+        """
+        Run fault plan, all actions concurrently according to their offsets.
+
+        Args:
+            actions (list): FaultAction objects of the plan
+            stop_event (threading.Event): Event which interrupts the plan, held
+                faults are removed right away when set. Scheduler's own
+                stop_event is used when not provided.
+
+        Returns:
+            FaultRunResult: Per target timing of the plan execution
+
+        """
+        if stop_event is None:
+            self.stop_event.clear()
+            stop_event = self.stop_event
+        result = FaultRunResult(records=[], max_skew=self.max_skew)
+        if not actions:
+            return result
+        t0 = time.time()
+        for action in actions:
+            result.records.append(
+                FaultRecord(
+                    target=action.target,
+                    description=action.description,
+                    scheduled=t0 + action.offset,
+                )
+            )
+        workers = min(self.max_workers, len(actions))
+        log.info(
+            f"Running fault plan with {len(actions)} actions on "
+            f"{len({a.target for a in actions})} targets using {workers} workers"
+        )
+        with self._idle:
+            self._running += len(actions)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self._run_action, action, record, stop_event)
+                for action, record in zip(actions, result.records)
+            ]
+            try:
+                for future in futures:
+                    future.result()
+            except BaseException:
+                # interrupted, release held faults so they are removed now
+                stop_event.set()
+                raise
+        result.log_summary()
+        if not result.within_skew:
+            log.warning(
+                f"Fault start skew {result.skew:.2f}s exceeded allowed "
+                f"{self.max_skew}s"
+            )
+        return result
+
+    def stop(self):
+        """
+        Interrupt running plan, held faults are removed immediately.
+        """
+        self.stop_event.set()
+
+    def join(self, timeout=None):
+        """
+        Wait until all the actions of the running plans finished, including
+        the removal of the faults and the blocking actions which can't be
+        interrupted.
+
+        Args:
+            timeout (float): Time in seconds to wait, no limit by default
+
+        Returns:
+            bool: True if no action is running, False on timeout
+
+        """
+        with self._idle:
+            return self._idle.wait_for(lambda: self._running == 0, timeout)
@@ -2,6 +2,7 @@ import time
 import random
 import logging
 import subprocess
+from functools import partial
 from ocs_ci.ocs import ocp
 from ocs_ci.ocs.exceptions import (
     CommandFailed,
@@ -10,6 +11,7 @@ from ocs_ci.ocs.exceptions import (
 )
 from ocs_ci.utility.utils import ceph_health_check
 from ocs_ci.ocs.platform_nodes import PlatformNodesFactory
+from ocs_ci.resiliency.fault_scheduler import FaultAction, FaultScheduler
 
 log = logging.getLogger(__name__)
 
@@ -22,7 +24,13 @@ class NetworkFaults(PlatformNodesFactory):
     """
 
     def __init__(
-        self, nodes, interface_types=["default"], duration=30, iterations=4, pause=15
+        self,
+        nodes,
+        interface_types=["default"],
+        duration=30,
+        iterations=4,
+        pause=15,
+        scheduler=None,
     ):
         """
         Initializes the NetworkFaults object.
@@ -33,12 +41,16 @@ class NetworkFaults(PlatformNodesFactory):
             duration (int): Time in seconds to hold the fault per iteration.
             iterations (int): Number of iterations to apply the fault.
             pause (int): Pause duration in seconds between fault iterations.
+            scheduler (FaultScheduler): Engine applying the faults concurrently on
+                all the selected nodes, new one is created if not provided.
         """
         super().__init__()
         self.nodes = nodes
         self.duration = duration
         self.iterations = iterations
         self.pause = pause
+        self.scheduler = scheduler or FaultScheduler()
+        self.fault_results = []
         self.ocp_obj = ocp.OCP()
         self.platform_node_obj = self.get_nodes_platform()
         self.node_interfaces = self._get_all_node_network_interfaces(interface_types)
@@ -135,35 +147,16 @@ class NetworkFaults(PlatformNodesFactory):
             count = min(len(remaining_nodes), random.randint(1, len(self.nodes)))
             selected_nodes = random.sample(remaining_nodes, count)
 
-            for node in selected_nodes:
-                interfaces = self.node_interfaces.get(node.name, [])
-                for iface in interfaces:
-                    log.info(
-                        f"[Iteration {i+1}] Applying {description} on {node.name}/{iface}"
-                    )
-                    cmd = f"tc qdisc replace dev {iface} root netem {netem_command}"
-                    try:
-                        self.ocp_obj.exec_oc_debug_cmd(node=node.name, cmd_list=[cmd])
-                        covered_nodes.add(node.name)
-                    except (CommandFailed, subprocess.TimeoutExpired) as e:
-                        log.error(f"Failed to apply fault on {node.name}/{iface}: {e}")
-
-            log.info(f"[Iteration {i+1}] Holding fault for {self.duration}s")
-            time.sleep(self.duration)
-
-            for node in selected_nodes:
-                interfaces = self.node_interfaces.get(node.name, [])
-                for iface in interfaces:
-                    log.info(
-                        f"[Iteration {i+1}] Removing fault from {node.name}/{iface}"
-                    )
-                    cmd = f"tc qdisc del dev {iface} root"
-                    try:
-                        self.ocp_obj.exec_oc_debug_cmd(node=node.name, cmd_list=[cmd])
-                    except (CommandFailed, subprocess.TimeoutExpired) as e:
-                        log.error(
-                            f"Failed to remove fault from {node.name}/{iface}: {e}"
-                        )
+            log.info(
+                f"[Iteration {i+1}] Applying {description} on "
+                f"{', '.join(node.name for node in selected_nodes)} "
+                f"for {self.duration}s"
+            )
+            result = self.scheduler.run(
+                self.build_fault_plan(description, netem_command, selected_nodes)
+            )
+            self.fault_results.append(result)
+            covered_nodes.update(result.applied_targets)
 
             if i < self.iterations - 1:
                 log.info(
@@ -174,45 +167,112 @@ class NetworkFaults(PlatformNodesFactory):
         log.info("All iterations completed. Clearing any residual faults.")
         self._remove_faults_all_nodes()
 
+    def _exec_on_node_interfaces(self, node, cmd_template):
+        """
+        Runs tc command on all the interfaces of the node in single debug pod.
+
+        Args:
+            node (OCS): Node object.
+            cmd_template (str): Command with {iface} placeholder.
+
+        Returns:
+            str: Output of the command.
+        """
+        interfaces = self.node_interfaces.get(node.name, [])
+        if not interfaces:
+            return ""
+        cmd_list = [cmd_template.format(iface=iface) for iface in interfaces]
+        return self.ocp_obj.exec_oc_debug_cmd(node=node.name, cmd_list=cmd_list)
+
+    def build_fault_plan(self, description, netem_command, nodes=None, offset=0):
+        """
+        Builds fault plan applying the netem fault on all interfaces of the nodes.
+        The plan can be run by FaultScheduler alone or together with plans of other
+        scenarios.
+
+        Args:
+            description (str): Description of the fault type for logs.
+            netem_command (str): Netem command string to simulate the fault.
+            nodes (list): Node objects, all nodes of this object by default.
+            offset (int): Time in seconds from the start of the plan to apply the fault.
+
+        Returns:
+            list: FaultAction objects, one per node.
+        """
+        nodes = self.nodes if nodes is None else nodes
+        return [
+            FaultAction(
+                target=node.name,
+                description=description,
+                apply=partial(
+                    self._exec_on_node_interfaces,
+                    node,
+                    f"tc qdisc replace dev {{iface}} root netem {netem_command}",
+                ),
+                remove=partial(
+                    self._exec_on_node_interfaces, node, "tc qdisc del dev {iface} root"
+                ),
+                duration=self.duration,
+                offset=offset,
+            )
+            for node in nodes
+            if self.node_interfaces.get(node.name)
+        ]
+
     def _remove_faults_all_nodes(self):
         """
         Removes all netem qdiscs from all interfaces on all nodes,
         and verifies that the faults have been successfully cleared.
         """
         log.info("Performing cleanup of all interfaces on all nodes")
+        self.scheduler.run(
+            [
+                FaultAction(
+                    target=node.name,
+                    description="netem cleanup",
+                    apply=partial(self._remove_faults_node, node),
+                )
+                for node in self.nodes
+            ]
+        )
+        time.sleep(5)
+        log.info("All fault configurations attempted and verified.")
 
-        for node in self.nodes:
-            interfaces = self.node_interfaces.get(node.name, [])
-            for iface in interfaces:
-                cmd_del = f"tc qdisc del dev {iface} root || true"
-                try:
-                    self.ocp_obj.exec_oc_debug_cmd(node=node.name, cmd_list=[cmd_del])
-                    log.debug(f"Deleted qdisc on {node.name}/{iface}")
-                except (CommandFailed, subprocess.TimeoutExpired) as e:
-                    log.warning(f"Could not delete qdisc on {node.name}/{iface}: {e}")
-                    continue
+    def _remove_faults_node(self, node):
+        """
+        Removes all netem qdiscs from all interfaces on the node,
+        and verifies that the faults have been successfully cleared.
 
-                # Verify removal
-                cmd_verify = f"tc qdisc show dev {iface}"
-                try:
-                    output = self.ocp_obj.exec_oc_debug_cmd(
-                        node=node.name, cmd_list=[cmd_verify]
+        Args:
+            node (OCS): Node object.
+        """
+        for iface in self.node_interfaces.get(node.name, []):
+            cmd_del = f"tc qdisc del dev {iface} root || true"
+            try:
+                self.ocp_obj.exec_oc_debug_cmd(node=node.name, cmd_list=[cmd_del])
+                log.debug(f"Deleted qdisc on {node.name}/{iface}")
+            except (CommandFailed, subprocess.TimeoutExpired) as e:
+                log.warning(f"Could not delete qdisc on {node.name}/{iface}: {e}")
+                continue
+
+            # Verify removal
+            cmd_verify = f"tc qdisc show dev {iface}"
+            try:
+                output = self.ocp_obj.exec_oc_debug_cmd(
+                    node=node.name, cmd_list=[cmd_verify]
+                )
+                if "netem" in output:
+                    log.error(
+                        f"Verification failed: netem still active on {node.name}/{iface}"
                     )
-                    if "netem" in output:
-                        log.error(
-                            f"Verification failed: netem still active on {node.name}/{iface}"
-                        )
-                    else:
-                        log.info(
-                            f"Verified: netem successfully removed from {node.name}/{iface}"
-                        )
-                except (CommandFailed, subprocess.TimeoutExpired) as e:
-                    log.warning(
-                        f"Could not verify qdisc status on {node.name}/{iface}: {e}"
+                else:
+                    log.info(
+                        f"Verified: netem successfully removed from {node.name}/{iface}"
                     )
-
-        time.sleep(5)
-        log.info("All fault configurations attempted and verified.")
+            except (CommandFailed, subprocess.TimeoutExpired) as e:
+                log.warning(
+                    f"Could not verify qdisc status on {node.name}/{iface}: {e}"
+                )
 
     def network_packet_loss(self, percentage=25):
         """Simulates packet loss on all nodes.
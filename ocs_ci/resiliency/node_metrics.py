@@ -0,0 +1,213 @@
+"""
+Continuous node metrics collection for resiliency and longevity runs.
+"""
+
+import logging
+import threading
+import time
+
+from ocs_ci.ocs import constants
+from ocs_ci.ocs.exceptions import CommandFailed
+from ocs_ci.ocs.ocp import OCP
+from ocs_ci.utility.timeseries import TimeSeriesStore
+
+log = logging.getLogger(__name__)
+
+# node-exporter queries evaluated for all the nodes at once, instance label
+# of node-exporter metrics holds the node name
+NODE_EXPORTER_QUERIES = {
+    "cpu_percent": (
+        '100 * (1 - avg by (instance) (rate(node_cpu_seconds_total{mode="idle"}[1m])))'
+    ),
+    "memory_percent": (
+        "100 * (1 - node_memory_MemAvailable_bytes / node_memory_MemTotal_bytes)"
+    ),
+    "disk_read_bytes": "sum by (instance) (rate(node_disk_read_bytes_total[1m]))",
+    "disk_write_bytes": "sum by (instance) (rate(node_disk_written_bytes_total[1m]))",
+    "network_rx_bytes": (
+        'sum by (instance) (rate(node_network_receive_bytes_total{device!="lo"}[1m]))'
+    ),
+    "network_tx_bytes": (
+        'sum by (instance) (rate(node_network_transmit_bytes_total{device!="lo"}[1m]))'
+    ),
+}
+
+
+class PrometheusNodeMetricsSource:
+    """
+    Samples node-exporter metrics of all the nodes via Prometheus, one instant
+    query per metric.
+    """
+
+    def __init__(self, queries=None, prometheus=None):
+        """
+        Args:
+            queries (dict): Metric name to PromQL query returning one value per
+                instance, NODE_EXPORTER_QUERIES by default
+            prometheus (PrometheusAPI): Prometheus API object, created when not
+                provided
+
+        """
+        self.queries = queries or NODE_EXPORTER_QUERIES
+        self._prometheus = prometheus
+
+    @property
+    def prometheus(self):
+        if self._prometheus is None:
+            from ocs_ci.utility.prometheus import PrometheusAPI
+
+            self._prometheus = PrometheusAPI()
+        return self._prometheus
+
+    def sample(self):
+        """
+        Get current values of all the metrics.
+
+        Returns:
+            dict: {node name: {metric: value}}
+
+        """
+        samples = {}
+        for metric, query in self.queries.items():
+            result = self.prometheus.query(query, mute_logs=True)
+            for item in result:
+                node = item["metric"].get("instance")
+                if node is None:
+                    continue
+                samples.setdefault(node, {})[metric] = float(item["value"][1])
+        return samples
+
+
+class MetricsAPINodeMetricsSource:
+    """
+    Samples CPU and memory usage of all the nodes from the in-cluster metrics
+    API with single `oc adm top nodes` call.
+    """
+
+    def __init__(self):
+        self.ocp_obj = OCP(kind=constants.NODE)
+
+    def sample(self):
+        """
+        Get current CPU and memory usage of all the nodes.
+
+        Returns:
+            dict: {node name: {"cpu_percent": value, "memory_percent": value}}
+
+        """
+        out = self.ocp_obj.exec_oc_cmd(
+            "adm top nodes --no-headers", out_yaml_format=False, silent=True
+        )
+        samples = {}
+        for line in out.splitlines():
+            # NAME CPU(cores) CPU% MEMORY(bytes) MEMORY%
+            fields = line.split()
+            if len(fields) < 5 or "%" not in fields[2]:
+                continue
+            samples[fields[0]] = {
+                "cpu_percent": float(fields[2].rstrip("%")),
+                "memory_percent": float(fields[4].rstrip("%")),
+            }
+        return samples
+
+
+class NodeMetricsCollector(threading.Thread):
+    """
+    Background thread sampling node metrics at configured rate into
+    TimeSeriesStore. Can be used as a context manager.
+    """
+
+    def __init__(self, source=None, interval=15, nodes=None, store=None):
+        """
+        Args:
+            source (object): Object with sample() method returning
+                {node: {metric: value}}, PrometheusNodeMetricsSource by default
+            interval (int): Number of seconds between samples
+            nodes (list): Names of the nodes to keep, all nodes by default
+            store (TimeSeriesStore): Store for the samples, new one with raw
+                samples kept for one hour is created by default
+
+        """
+        super().__init__(daemon=True, name="node-metrics-collector")
+        self.source = source or PrometheusNodeMetricsSource()
+        self.interval = interval
+        self.nodes = set(nodes) if nodes else None
+        self.store = store or TimeSeriesStore(raw_size=max(1, int(3600 / interval)))
+        self.failed_samples = 0
+        self._stop_event = threading.Event()
+
+    def collect(self):
+        """
+        Take one sample of all the metrics and store it.
+        """
+        timestamp = time.time()
+        samples = self.source.sample()
+        for node, metrics in samples.items():
+            if self.nodes is not None and node not in self.nodes:
+                continue
+            for metric, value in metrics.items():
+                self.store.add(node, metric, timestamp, value)
+
+    def run(self):
+        log.info(
+            f"Starting node metrics collection every {self.interval}s using "
+            f"{type(self.source).__name__}"
+        )
+        while not self._stop_event.is_set():
+            started = time.time()
+            try:
+                self.collect()
+            except (CommandFailed, ValueError, KeyError) as e:
+                self.failed_samples += 1
+                log.warning(f"Failed to collect node metrics: {e}")
+            except Exception as e:
+                # keep collecting, e.g. on transient connection errors
+                self.failed_samples += 1
+                log.warning(f"Unexpected error during node metrics collection: {e}")
+            self._stop_event.wait(max(0, self.interval - (time.time() - started)))
+        log.info("Node metrics collection stopped")
+
+    def stop(self):
+        """
+        Stop the collection and wait for the thread to finish.
+        """
+        self._stop_event.set()
+        if self.is_alive():
+            self.join(timeout=self.interval + 60)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exception_type, value, traceback):
+        self.stop()
+
+    def stats(self, node, metric, t0=None, t1=None):
+        """
+        Statistics of the node metric over window [t0, t1].
+
+        Args:
+            node (str): Node name
+            metric (str): Metric name, e.g. "cpu_percent"
+            t0 (float): Window start timestamp, the oldest data by default
+            t1 (float): Window end timestamp, the newest data by default
+
+        Returns:
+            dict: with ``count``, ``min``, ``max``, ``avg`` and ``last`` keys
+
+        """
+        return self.store.stats(node, metric, t0, t1)
+
+    def window_stats(self, t0=None, t1=None):
+        """
+        Statistics of all the collected metrics over window [t0, t1].
+
+        Args:
+            t0 (float): Window start timestamp, the oldest data by default
+            t1 (float): Window end timestamp, the newest data by default
+
+        Returns:
+            dict: {node: {metric: stats}}
+
+        """
+        return self.store.window_stats(t0, t1)
@@ -18,8 +18,10 @@ cluster and its workloads under real-world conditions.
 import logging
 import random
 import subprocess
+from functools import partial
 
 from ocs_ci.ocs.platform_nodes import PlatformNodesFactory
+from ocs_ci.resiliency.fault_scheduler import FaultAction, FaultScheduler
 from ocs_ci.resiliency.network_faults import NetworkFaults
 from ocs_ci.ocs.node import get_nodes
 from ocs_ci.ocs import constants
@@ -41,17 +43,79 @@ class PlatformFailures(PlatformNodesFactory):
         "PLATFORM_NETWORK_FAULTS": "_run_simulate_network_faults",
     }
 
-    def __init__(self, failure_data):
+    def __init__(self, failure_data, scheduler=None):
         """
         Initialize the PlatformFailures class.
 
         Args:
             failure_data (dict): Configuration containing scenario parameters.
+            scheduler (FaultScheduler): Engine running the failures and recording
+                their timing, new one is created if not provided.
         """
         super().__init__()
         self.platform_node_obj = self.get_nodes_platform()
         self.failure_data = failure_data
         self.nodes = get_nodes()
+        self.scheduler = scheduler or FaultScheduler()
+        self.fault_results = []
+
+    def build_instance_failure_plan(self, nodes=None, offset=0):
+        """
+        Builds fault plan restarting the nodes by stop and start, all the nodes
+        of the plan are restarted concurrently.
+
+        Args:
+            nodes (list): Node objects, all cluster nodes by default.
+            offset (int): Time in seconds from the start of the plan to restart the nodes.
+
+        Returns:
+            list: FaultAction objects, one per node.
+        """
+        nodes = self.nodes if nodes is None else nodes
+        return [
+            FaultAction(
+                target=node.name,
+                description="instance restart",
+                apply=partial(
+                    self.platform_node_obj.restart_nodes_by_stop_and_start, [node]
+                ),
+                offset=offset,
+            )
+            for node in nodes
+        ]
+
+    def build_network_failure_plan(
+        self, nodes=None, duration=20, stagger=None, offset=0
+    ):
+        """
+        Builds fault plan disabling network interface of the nodes on platform level.
+
+        Args:
+            nodes (list): Node objects, all cluster nodes by default.
+            duration (int): Time in seconds to keep the interface disabled.
+            stagger (int): Time in seconds between failures of two consecutive
+                nodes, by default the failures do not overlap. Use 0 to fail
+                network of all the nodes at once.
+            offset (int): Time in seconds from the start of the plan to the first failure.
+
+        Returns:
+            list: FaultAction objects, one per node.
+        """
+        nodes = self.nodes if nodes is None else nodes
+        stagger = duration + 10 if stagger is None else stagger
+        return [
+            FaultAction(
+                target=node.name,
+                description=f"platform network failure for {duration}s",
+                apply=partial(
+                    self.platform_node_obj.disable_nodes_network_temporarily,
+                    [node],
+                    duration=duration,
+                ),
+                offset=offset + i * stagger,
+            )
+            for i, node in enumerate(nodes)
+        ]
 
     def _run_platform_instance_failure(self):
         """
@@ -66,7 +130,9 @@ class PlatformFailures(PlatformNodesFactory):
 
         for i, node in enumerate(available_nodes, start=1):
             log.info(f"Iteration {i}: Restarting node {node.name}")
-            self.platform_node_obj.restart_nodes_by_stop_and_start([node])
+            self.fault_results.append(
+                self.scheduler.run(self.build_instance_failure_plan([node]))
+            )
 
         log.info("Platform instance failure scenario completed.")
 
@@ -84,8 +150,8 @@ class PlatformFailures(PlatformNodesFactory):
         on all cluster nodes temporarily.
         """
         log.info("Running Failure Case: PLATFORM_NETWORK_FAILURES.")
-        self.platform_node_obj.disable_nodes_network_temporarily(
-            self.nodes, duration=20
+        self.fault_results.append(
+            self.scheduler.run(self.build_network_failure_plan(duration=20))
         )
         log.info("Completed simulation of network interface failure.")
 
@@ -146,8 +212,11 @@ class PlatformFailures(PlatformNodesFactory):
                 f"[{label}] Simulating faults on nodes: [{node_names}] with interfaces: {interfaces}"
             )
             try:
-                nf = NetworkFaults(nodes, interface_types=interfaces)
+                nf = NetworkFaults(
+                    nodes, interface_types=interfaces, scheduler=self.scheduler
+                )
                 nf.run()
+                self.fault_results.extend(nf.fault_results)
                 log.info(f"[{label}] Completed fault simulation.")
             except (ValueError, CommandFailed, subprocess.TimeoutExpired) as e:
                 log.error(f"[{label}] Error during simulation: {e}")
@@ -3,11 +3,13 @@ import subprocess
 import random
 import threading
 import logging
+from functools import partial
 from ocs_ci.ocs.exceptions import (
     CommandFailed,
     NoRunningCephToolBoxException,
 )
 from ocs_ci.ocs import ocp
+from ocs_ci.resiliency.fault_scheduler import FaultAction, FaultScheduler
 from ocs_ci.utility.utils import ceph_health_check
 
 log = logging.getLogger(__name__)
@@ -16,16 +18,19 @@ log = logging.getLogger(__name__)
 class PlatformStress:
     """A class to perform stress testing on OpenShift cluster nodes using stress-ng."""
 
-    def __init__(self, nodes):
+    def __init__(self, nodes, scheduler=None):
         """Initializes PlatformStress with the given nodes.
 
         Args:
             nodes (list): List of node objects to perform stress testing on.
+            scheduler (FaultScheduler, optional): Engine running the stress on all
+                selected nodes concurrently. New one is created if not provided.
         """
         self.nodes = nodes
         self.ocp_obj = ocp.OCP()
         self.run_status = False  # Flag to control stress test execution
-        self.active_threads = []  # To keep track of active threads
+        self.scheduler = scheduler or FaultScheduler()
+        self.fault_results = []  # Timing of the executed stress plans
         self.stop_event = threading.Event()  # Event to signal threads to stop
         log.info("Initialized PlatformStress with nodes: %s", [n.name for n in nodes])
 
@@ -186,6 +191,29 @@ class PlatformStress:
             timeout,
         )
 
+    def build_stress_plan(self, stress_func, nodes=None, timeout=60, offset=0):
+        """Builds fault plan running given stress function on the nodes.
+
+        Args:
+            stress_func (callable): One of the stress methods, e.g. cpu_stress.
+            nodes (list, optional): Node objects, all nodes of this object by default.
+            timeout (int, optional): Timeout in seconds for the stress command. Defaults to 60.
+            offset (int, optional): Time in seconds from the start of the plan to start the stress.
+
+        Returns:
+            list: FaultAction objects, one per node.
+        """
+        nodes = self.nodes if nodes is None else nodes
+        return [
+            FaultAction(
+                target=node.name,
+                description=stress_func.__name__,
+                apply=partial(stress_func, node, timeout=timeout),
+                offset=offset,
+            )
+            for node in nodes
+        ]
+
     def _run_random_stress_loop(self, timeout=0, node_selection="ALL"):
         """Internal method that runs in a loop to apply random stress tests.
 
@@ -219,29 +247,46 @@ class PlatformStress:
                 [n.name for n in subset_nodes],
             )
 
-            for node in subset_nodes:
-                if self.stop_event.is_set():
-                    break
-                thread = threading.Thread(
-                    target=selected, args=(node,), kwargs={"timeout": current_timeout}
-                )
-                thread.start()
-                self.active_threads.append(thread)
-                log.info(
-                    "Started thread for %s on node: %s", selected.__name__, node.name
+            # Run the stress on all selected nodes at once and wait for it to
+            # complete or to be interrupted by stop event
+            self.fault_results.append(
+                self.scheduler.run(
+                    self.build_stress_plan(selected, subset_nodes, current_timeout),
+                    stop_event=self.stop_event,
                 )
-
-            # Wait for current stress tests to complete or stop event
-            for thread in list(self.active_threads):
-                if self.stop_event.is_set():
-                    break
-                thread.join(timeout=1)
-                if not thread.is_alive():
-                    self.active_threads.remove(thread)
+            )
 
             if not ceph_health_check(fix_ceph_health=True):
                 log.error("Ceph health check failed after scenario execution.")
 
+    def get_stress_load_stats(self, collector):
+        """Gets node load measured during each executed stress run.
+
+        Args:
+            collector (NodeMetricsCollector): Collector running during the stress.
+
+        Returns:
+            list: Dicts with stress description, node name, start, stop and
+                stats of the node metrics over the stress window.
+        """
+        load_stats = []
+        for result in self.fault_results:
+            for record in result.records:
+                if not record.applied:
+                    continue
+                load_stats.append(
+                    {
+                        "stress": record.description,
+                        "node": record.target,
+                        "start": record.start,
+                        "stop": record.stop,
+                        "stats": collector.window_stats(record.start, record.stop).get(
+                            record.target, {}
+                        ),
+                    }
+                )
+        return load_stats
+
     def start_random_stress(self, timeout=0, node_selection="ALL"):
         """Starts random stress tests in the background.
 
@@ -284,11 +329,10 @@ class PlatformStress:
         if hasattr(self, "background_thread") and self.background_thread.is_alive():
             self.background_thread.join(timeout=10)
 
-        # Wait for active stress threads to finish
-        for thread in list(self.active_threads):
-            thread.join(timeout=5)
-            if not thread.is_alive():
-                self.active_threads.remove(thread)
+        # Wait for active stress actions to finish, running stress-ng can't be
+        # interrupted, it ends on its own timeout
+        log.info("Waiting for active stress actions to finish")
+        self.scheduler.join()
 
         log.info("All stress tests have been stopped")
         return True
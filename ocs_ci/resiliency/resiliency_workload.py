@@ -15,6 +15,7 @@ import fauxfactory
 
 from ocs_ci.ocs import constants
 from ocs_ci.utility.utils import run_cmd
+from ocs_ci.utility.workload_log_parser import FioTextLogParser
 from ocs_ci.workloads.vdbench import VdbenchWorkload as VdbenchWorkloadImpl
 
 log = logging.getLogger(__name__)
@@ -191,6 +192,26 @@ class FioWorkload(Workload):
             log.error("Failed to fetch FIO output: %s", e)
             return ""
 
+    def get_latency_histogram(self, fio_output=None):
+        """
+        Get completion latency histogram of the FIO workload, built from the
+        clat percentiles of the FIO output. Histograms of multiple workloads
+        can be merged with LatencyHistogram.merged().
+
+        Args:
+            fio_output (str): FIO output as returned by get_fio_results(),
+                fetched from the pod if not provided
+
+        Returns:
+            LatencyHistogram: Completion latency histogram (us)
+
+        """
+        if fio_output is None:
+            fio_output = self.get_fio_results()
+        parser = FioTextLogParser()
+        parser.feed_text(fio_output)
+        return parser.histogram()
+
     def _apply_yaml(self, action, ignore_errors=False, *args):
         """
         Apply or delete the FIO workload YAML.
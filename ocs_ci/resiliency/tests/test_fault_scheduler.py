@@ -0,0 +1,125 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from ocs_ci.resiliency import platform_stress
+from ocs_ci.resiliency.fault_scheduler import FaultAction, FaultScheduler
+from ocs_ci.resiliency.platform_stress import PlatformStress
+
+
+class FakeFault:
+    """
+    Fault of one target recording the concurrency and the removal.
+    """
+
+    running = 0
+    max_running = 0
+    lock = threading.Lock()
+
+    def __init__(self, target, apply_time=0.0, error=None):
+        self.target = target
+        self.apply_time = apply_time
+        self.error = error
+        self.applied = False
+        self.removed = False
+
+    def apply(self):
+        with FakeFault.lock:
+            FakeFault.running += 1
+            FakeFault.max_running = max(FakeFault.max_running, FakeFault.running)
+        time.sleep(self.apply_time)
+        with FakeFault.lock:
+            FakeFault.running -= 1
+        if self.error:
+            raise RuntimeError(self.error)
+        self.applied = True
+
+    def remove(self):
+        self.removed = True
+
+    def action(self, duration, offset=0):
+        return FaultAction(
+            target=self.target,
+            description="packet loss",
+            apply=self.apply,
+            remove=self.remove,
+            duration=duration,
+            offset=offset,
+        )
+
+
+def test_faults_applied_concurrently():
+    FakeFault.max_running = 0
+    faults = [FakeFault(f"node-{i}", apply_time=0.2) for i in range(5)]
+    start = time.time()
+    result = FaultScheduler().run([fault.action(duration=0.3) for fault in faults])
+    assert time.time() - start < 1
+    assert FakeFault.max_running == 5
+    assert result.applied_targets == {fault.target for fault in faults}
+    assert all(fault.removed for fault in faults)
+    assert not result.failed
+
+
+def test_hold_time_measured_from_actual_start():
+    slow, fast = FakeFault("slow", apply_time=0.4), FakeFault("fast")
+    result = FaultScheduler().run([slow.action(0.3), fast.action(0.3)])
+    records = {record.target: record for record in result.records}
+    for record in records.values():
+        assert record.effective_duration == pytest.approx(0.3, abs=0.1)
+    assert records["slow"].stop - records["fast"].stop == pytest.approx(0.4, abs=0.1)
+
+
+def test_faults_removed_on_error_and_interrupt():
+    failing = FakeFault("failing", error="debug pod failed")
+    held = FakeFault("held")
+    scheduler = FaultScheduler()
+    threading.Timer(0.2, scheduler.stop).start()
+    start = time.time()
+    result = scheduler.run([failing.action(60), held.action(60)])
+    # the held fault was released by the interrupt, not by its duration
+    assert time.time() - start < 1
+    assert failing.removed and held.removed
+    assert [record.target for record in result.failed] == ["failing"]
+    assert result.failed[0].errors == ["apply: debug pod failed"]
+    assert result.applied_targets == {"held"}
+
+
+def test_skew_reporting():
+    actions = [
+        FakeFault("slow", apply_time=0.3).action(0),
+        FakeFault("fast").action(0),
+        # started later by the plan, its lateness is still about 0
+        FakeFault("offset").action(0, offset=0.2),
+    ]
+    result = FaultScheduler(max_skew=0.1).run(actions)
+    assert result.skew == pytest.approx(0.3, abs=0.1)
+    assert not result.within_skew
+    result.max_skew = 1
+    assert result.within_skew
+
+
+def test_platform_stress_stop_waits_for_stress(monkeypatch):
+    finished = []
+
+    def stress(node, timeout):
+        time.sleep(0.5)
+        finished.append(node.name)
+
+    monkeypatch.setattr(platform_stress, "ceph_health_check", lambda **kwargs: True)
+    nodes = [SimpleNamespace(name=f"node-{i}") for i in range(3)]
+    stress_obj = PlatformStress(nodes)
+    for name in ("cpu_stress", "memory_stress", "io_stress", "network_stress"):
+        setattr(stress_obj, name, stress)
+    stress_obj.all_stress = stress
+    assert stress_obj.start_random_stress(timeout=1)
+    time.sleep(0.1)
+    # the stress outlives the join timeout of the background thread
+    background_thread = stress_obj.background_thread
+    stress_obj.background_thread = SimpleNamespace(
+        is_alive=lambda: True, join=lambda timeout: None
+    )
+    assert stress_obj.stop()
+    assert sorted(finished) == ["node-0", "node-1", "node-2"]
+    background_thread.join()
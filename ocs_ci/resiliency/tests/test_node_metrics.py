@@ -0,0 +1,102 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from ocs_ci.ocs.exceptions import CommandFailed
+from ocs_ci.resiliency import node_metrics
+from ocs_ci.resiliency.node_metrics import (
+    MetricsAPINodeMetricsSource,
+    NodeMetricsCollector,
+    PrometheusNodeMetricsSource,
+)
+from ocs_ci.utility.timeseries import TimeSeriesStore
+
+
+class FakeSource:
+    """
+    Source returning growing CPU usage of two nodes, the second call fails.
+    """
+
+    def __init__(self):
+        self.calls = []
+
+    def sample(self):
+        self.calls.append(time.time())
+        if len(self.calls) == 2:
+            raise CommandFailed("metrics API not available")
+        value = float(len(self.calls))
+        return {
+            "compute-0": {"cpu_percent": value},
+            "compute-1": {"cpu_percent": value * 2},
+        }
+
+
+def test_collector_samples_at_interval_and_stops():
+    source = FakeSource()
+    with NodeMetricsCollector(source=source, interval=0.1) as collector:
+        time.sleep(0.55)
+    stopped = time.time()
+    assert not collector.is_alive()
+    assert 5 <= len(source.calls) <= 7
+    intervals = [b - a for a, b in zip(source.calls, source.calls[1:])]
+    assert all(interval == pytest.approx(0.1, abs=0.05) for interval in intervals)
+    # no sample after the stop
+    assert source.calls[-1] <= stopped
+    # the failed sample is skipped, collection continues
+    assert collector.failed_samples == 1
+    stats = collector.stats("compute-0", "cpu_percent")
+    assert stats["count"] == len(source.calls) - 1
+    assert stats["min"] == 1.0
+
+
+def test_collector_downsamples_into_store(monkeypatch):
+    clock = SimpleNamespace(now=0.0)
+    monkeypatch.setattr(node_metrics, "time", SimpleNamespace(time=lambda: clock.now))
+    store = TimeSeriesStore(raw_size=10, resolutions=((60, 100),))
+    collector = NodeMetricsCollector(
+        source=FakeSource(), interval=10, nodes=["compute-0"], store=store
+    )
+    collector.source.calls = [None, None]
+    # 6000 seconds of samples, much more than the raw retention
+    for i in range(600):
+        clock.now = i * 10.0
+        collector.collect()
+    series = store.series[("compute-0", "cpu_percent")]
+    assert len(series.raw) == 10
+    assert list(collector.window_stats()) == ["compute-0"]
+    stats = collector.stats("compute-0", "cpu_percent")
+    assert stats["count"] == 600
+    assert stats["min"] == 3.0
+    assert stats["max"] == 602.0
+    # the recent window is answered from the raw samples
+    assert collector.stats("compute-0", "cpu_percent", 5950, 5990)["count"] == 5
+
+
+def test_prometheus_source():
+    def query(query, mute_logs):
+        return [
+            {"metric": {"instance": "compute-0"}, "value": [0, "12.5"]},
+            {"metric": {}, "value": [0, "1"]},
+        ]
+
+    source = PrometheusNodeMetricsSource(
+        queries={"cpu_percent": "cpu", "memory_percent": "memory"},
+        prometheus=SimpleNamespace(query=query),
+    )
+    assert source.sample() == {
+        "compute-0": {"cpu_percent": 12.5, "memory_percent": 12.5}
+    }
+
+
+def test_metrics_api_source():
+    source = MetricsAPINodeMetricsSource()
+    source.ocp_obj = SimpleNamespace(
+        exec_oc_cmd=lambda *args, **kwargs: (
+            "compute-0   1200m   30%   8000Mi   50%\n"
+            "compute-1   <unknown>   <unknown>   <unknown>   <unknown>\n"
+        )
+    )
+    assert source.sample() == {
+        "compute-0": {"cpu_percent": 30.0, "memory_percent": 50.0}
+    }
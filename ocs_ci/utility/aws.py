@@ -1951,19 +1951,21 @@ class AWS(object):
         """
         return self.s3_client.list_buckets()["Buckets"]
 
-    def get_buckets_to_delete(self, bucket_prefix, hours):
+    def get_buckets_to_delete(self, bucket_prefix, hours, buckets=None):
         """
         Get the bucket with prefix which are older than given hours
 
         Args:
             bucket_prefix (str): prefix for the buckets to fetch
             hours (int): fetch buckets that are older than to the specified number of hours
+            buckets (list): Buckets as returned by list_buckets() to filter,
+                listed when not provided
 
         """
         buckets_to_delete = []
         # Get the current date in UTC
         current_date = datetime.now(timezone.utc)
-        all_buckets = self.list_buckets()
+        all_buckets = self.list_buckets() if buckets is None else buckets
         for bucket in all_buckets:
             bucket_name = bucket["Name"]
 
@@ -0,0 +1,793 @@
+"""
+Local fake Kubernetes API server with an `oc` shim.
+"""
+
+import copy
+import json
+import logging
+import os
+import re
+import stat
+import sys
+import tempfile
+import threading
+import uuid
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import yaml
+
+log = logging.getLogger(__name__)
+
+DEFAULT_NAMESPACE = "openshift-storage"
+URL_ENV_VARIABLE = "OCS_CI_FAKE_KUBE_URL"
+
+KIND_ALIASES = {
+    "po": "Pod",
+    "pod": "Pod",
+    "pods": "Pod",
+    "pvc": "PersistentVolumeClaim",
+    "persistentvolumeclaim": "PersistentVolumeClaim",
+    "persistentvolumeclaims": "PersistentVolumeClaim",
+    "pv": "PersistentVolume",
+    "persistentvolume": "PersistentVolume",
+    "persistentvolumes": "PersistentVolume",
+    "no": "Node",
+    "node": "Node",
+    "nodes": "Node",
+    "ns": "Namespace",
+    "namespace": "Namespace",
+    "namespaces": "Namespace",
+}
+CLUSTER_SCOPED_KINDS = (
+    "Node",
+    "Namespace",
+    "PersistentVolume",
+    "StorageClass",
+    "Proxy",
+)
+# AGE column of the table output
+TABLE_AGE = "5m"
+
+# oc shim, it is run by the python running the benchmark so it doesn't depend
+# on the python in PATH
+OC_SHIM = """#!{python}
+import json, os, sys, urllib.request
+
+args = sys.argv[1:]
+files = {{}}
+for index, arg in enumerate(args[:-1]):
+    if arg in ("-f", "--filename"):
+        path = args[index + 1]
+        paths = (
+            sorted(os.path.join(path, name) for name in os.listdir(path))
+            if os.path.isdir(path)
+            else [path]
+        )
+        for file_path in paths:
+            with open(file_path) as f:
+                files[file_path] = f.read()
+request = urllib.request.Request(
+    os.environ["{url_variable}"] + "/oc",
+    data=json.dumps({{"args": args, "files": files}}).encode(),
+    method="POST",
+)
+with urllib.request.urlopen(request) as response:
+    result = json.loads(response.read())
+sys.stdout.write(result["stdout"])
+sys.stderr.write(result["stderr"])
+sys.exit(result["rc"])
+"""
+
+
+def _now():
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def pod_template(name, namespace, node, labels=None):
+    """
+    Running pod resembling the ODF pods in size and structure.
+
+    Args:
+        name (str): Name of the pod
+        namespace (str): Namespace of the pod
+        node (str): Name of the node of the pod
+        labels (dict): Labels of the pod
+
+    Returns:
+        dict: The pod
+
+    """
+    return {
+        "apiVersion": "v1",
+        "kind": "Pod",
+        "metadata": {
+            "name": name,
+            "namespace": namespace,
+            "labels": labels or {"app": "benchmark"},
+            "annotations": {"openshift.io/scc": "restricted-v2"},
+        },
+        "spec": {
+            "nodeName": node,
+            "containers": [
+                {
+                    "name": "main",
+                    "image": "quay.io/ocsci/nginx:latest",
+                    "command": ["/bin/sh", "-c", "sleep infinity"],
+                    "resources": {
+                        "limits": {"cpu": "500m", "memory": "512Mi"},
+                        "requests": {"cpu": "100m", "memory": "128Mi"},
+                    },
+                    "volumeMounts": [
+                        {
+                            "mountPath": "/var/run/secrets/kubernetes.io/serviceaccount",
+                            "name": "kube-api-access",
+                            "readOnly": True,
+                        }
+                    ],
+                }
+            ],
+            "volumes": [{"name": "kube-api-access", "projected": {"sources": []}}],
+        },
+        "status": {
+            "phase": "Running",
+            "podIP": "10.128.0.10",
+            "conditions": [
+                {"type": condition, "status": "True"}
+                for condition in (
+                    "Initialized",
+                    "Ready",
+                    "ContainersReady",
+                    "PodScheduled",
+                )
+            ],
+            "containerStatuses": [
+                {"name": "main", "ready": True, "restartCount": 0, "started": True}
+            ],
+        },
+    }
+
+
+def pvc_template(name, namespace, storage_class="ocs-storagecluster-ceph-rbd"):
+    """
+    Bound PVC.
+
+    Args:
+        name (str): Name of the PVC
+        namespace (str): Namespace of the PVC
+        storage_class (str): Name of the storage class
+
+    Returns:
+        dict: The PVC
+
+    """
+    return {
+        "apiVersion": "v1",
+        "kind": "PersistentVolumeClaim",
+        "metadata": {"name": name, "namespace": namespace},
+        "spec": {
+            "accessModes": ["ReadWriteOnce"],
+            "resources": {"requests": {"storage": "1Gi"}},
+            "storageClassName": storage_class,
+            "volumeMode": "Filesystem",
+        },
+        "status": {"phase": "Bound", "capacity": {"storage": "1Gi"}},
+    }
+
+
+def node_template(name, role="worker"):
+    """
+    Ready node.
+
+    Args:
+        name (str): Name of the node
+        role (str): Role of the node, e.g. "worker"
+
+    Returns:
+        dict: The node
+
+    """
+    return {
+        "apiVersion": "v1",
+        "kind": "Node",
+        "metadata": {
+            "name": name,
+            "labels": {
+                "kubernetes.io/hostname": name,
+                f"node-role.kubernetes.io/{role}": "",
+                "cluster.ocs.openshift.io/openshift-storage": "",
+            },
+        },
+        "spec": {},
+        "status": {
+            "addresses": [{"type": "InternalIP", "address": "10.0.0.1"}],
+            "conditions": [{"type": "Ready", "status": "True"}],
+            "nodeInfo": {"kubeletVersion": "v1.30.0"},
+        },
+    }
+
+
+def match_selector(labels, selector):
+    """
+    Check the labels against the label selector.
+
+    Args:
+        labels (dict): Labels of the resource
+        selector (str): Selector, e.g. "app=rook-ceph-osd,osd!=0,topology"
+
+    Returns:
+        bool: True if the labels match
+
+    """
+    for requirement in filter(None, (part.strip() for part in selector.split(","))):
+        if "!=" in requirement:
+            key, value = requirement.split("!=", 1)
+            if labels.get(key) == value:
+                return False
+        elif "=" in requirement:
+            key, value = re.split("==?", requirement, maxsplit=1)
+            if labels.get(key) != value:
+                return False
+        elif requirement.startswith("!"):
+            if requirement[1:] in labels:
+                return False
+        elif requirement not in labels:
+            return False
+    return True
+
+
+def match_field_selector(resource, selector):
+    """
+    Check the resource against the field selector.
+
+    Args:
+        resource (dict): The resource
+        selector (str): Selector, e.g. "status.phase=Running"
+
+    Returns:
+        bool: True if the resource matches
+
+    """
+    for requirement in filter(None, (part.strip() for part in selector.split(","))):
+        negate = "!=" in requirement
+        path, value = re.split("!=|==?", requirement, maxsplit=1)
+        actual = resource
+        for key in path.split("."):
+            actual = actual.get(key) if isinstance(actual, dict) else None
+        if (str(actual) == value) == negate:
+            return False
+    return True
+
+
+class OcCommandError(Exception):
+    """
+    Error reported by the fake `oc` with its stderr and return code.
+    """
+
+    def __init__(self, message, rc=1):
+        super().__init__(message)
+        self.rc = rc
+
+
+class FakeKubeState(object):
+    """
+    In-memory resources and the `oc` command interpreter working with them.
+    """
+
+    def __init__(self):
+        # (kind, namespace, name): resource
+        self.resources = {}
+        self.calls = Counter()
+        self._lock = threading.Lock()
+        self._resource_version = 0
+        self.add_cluster_defaults()
+
+    def add_cluster_defaults(self):
+        """
+        Add the cluster wide objects every cluster has, e.g. the proxy
+        configuration read by the Pod objects.
+        """
+        self.add(
+            {
+                "apiVersion": "config.openshift.io/v1",
+                "kind": "Proxy",
+                "metadata": {"name": "cluster"},
+                "spec": {"trustedCA": {"name": ""}},
+                "status": {},
+            },
+            exist_ok=True,
+        )
+
+    def add(self, resource, namespace=None, exist_ok=False):
+        """
+        Add the resource, fill in the server side metadata.
+
+        Args:
+            resource (dict): The resource
+            namespace (str): Namespace to use if the resource has none
+            exist_ok (bool): True to replace the existing resource
+
+        Returns:
+            dict: The stored resource
+
+        Raises:
+            OcCommandError: If the resource already exists
+
+        """
+        resource = copy.deepcopy(resource)
+        kind = resource["kind"]
+        metadata = resource.setdefault("metadata", {})
+        if kind in CLUSTER_SCOPED_KINDS:
+            metadata.pop("namespace", None)
+        else:
+            metadata["namespace"] = (
+                metadata.get("namespace") or namespace or DEFAULT_NAMESPACE
+            )
+        key = (kind, metadata.get("namespace"), metadata["name"])
+        with self._lock:
+            if key in self.resources and not exist_ok:
+                raise OcCommandError(
+                    f'Error from server (AlreadyExists): {kind.lower()}s "{key[2]}" '
+                    "already exists"
+                )
+            self._resource_version += 1
+            metadata.setdefault("uid", str(uuid.uuid4()))
+            metadata.setdefault("creationTimestamp", _now())
+            metadata["resourceVersion"] = str(self._resource_version)
+            if kind == "PersistentVolumeClaim":
+                resource.setdefault("status", {})["phase"] = "Bound"
+            elif kind == "Pod":
+                resource.setdefault("status", {}).setdefault("phase", "Running")
+            self.resources[key] = resource
+        return resource
+
+    def seed(self, pods=0, pvcs=0, nodes=0, namespace=DEFAULT_NAMESPACE):
+        """
+        Add the given number of running pods, bound PVCs and ready nodes.
+
+        Args:
+            pods (int): Number of pods
+            pvcs (int): Number of PVCs
+            nodes (int): Number of worker nodes
+            namespace (str): Namespace of the pods and PVCs
+
+        """
+        node_names = [f"worker-{i}" for i in range(nodes)] or ["worker-0"]
+        for i in range(nodes):
+            self.add(node_template(node_names[i]))
+        for i in range(pods):
+            node = node_names[i % len(node_names)]
+            self.add(pod_template(f"benchmark-pod-{i}", namespace, node))
+        for i in range(pvcs):
+            self.add(pvc_template(f"benchmark-pvc-{i}", namespace))
+
+    def clear(self):
+        """
+        Remove all the resources except the cluster defaults and reset the
+        counters.
+        """
+        with self._lock:
+            self.resources.clear()
+            self.calls.clear()
+        self.add_cluster_defaults()
+
+    def list(self, kind, namespace=None, selector=None, field_selector=None):
+        """
+        Args:
+            kind (str): Kind of the resources
+            namespace (str): Namespace, all namespaces if None
+            selector (str): Label selector
+            field_selector (str): Field selector
+
+        Returns:
+            list: Matching resources sorted by namespace and name
+
+        """
+        with self._lock:
+            items = [
+                resource
+                for (res_kind, res_namespace, _), resource in sorted(
+                    self.resources.items(),
+                    key=lambda item: (item[0][1] or "", item[0][2]),
+                )
+                if res_kind == kind
+                and (namespace is None or res_namespace in (namespace, None))
+            ]
+        if selector:
+            items = [
+                item
+                for item in items
+                if match_selector(item["metadata"].get("labels", {}), selector)
+            ]
+        if field_selector:
+            items = [
+                item for item in items if match_field_selector(item, field_selector)
+            ]
+        return items
+
+    def run(self, args, files=None):
+        """
+        Run the `oc` command.
+
+        Args:
+            args (list): Arguments of the command, without the "oc"
+            files (dict): Path: content of the files passed by -f
+
+        Returns:
+            tuple: stdout (str), stderr (str), return code (int)
+
+        """
+        options, positional = parse_oc_args(args)
+        verb = positional[0] if positional else ""
+        self.calls[verb] += 1
+        try:
+            if verb == "get":
+                stdout = self._get(positional[1:], options)
+            elif verb in ("create", "apply"):
+                stdout = self._create(files or {}, options, exist_ok=verb == "apply")
+            elif verb == "delete":
+                stdout = self._delete(positional[1:], files or {}, options)
+            elif verb == "plugin":
+                raise OcCommandError("error: unable to find any kubectl plugins")
+            elif verb == "version":
+                stdout = "Client Version: 4.18.0\nServer Version: 4.18.0\n"
+            elif verb == "whoami":
+                stdout = "kube:admin\n"
+            else:
+                raise OcCommandError(f'error: unknown command "{verb}" for "oc"')
+        except OcCommandError as e:
+            return "", f"{e}\n", e.rc
+        return stdout, "", 0
+
+    def _namespace(self, kind, options):
+        if kind in CLUSTER_SCOPED_KINDS or "all_namespaces" in options:
+            return None
+        return options.get("namespace", DEFAULT_NAMESPACE)
+
+    def _get(self, positional, options):
+        if not positional:
+            raise OcCommandError("error: You must specify the type of resource to get.")
+        kind = resolve_kind(positional[0])
+        namespace = self._namespace(kind, options)
+        if len(positional) > 1:
+            key = (kind, namespace, positional[1])
+            with self._lock:
+                resource = self.resources.get(key)
+            if resource is None:
+                raise OcCommandError(
+                    f"Error from server (NotFound): {kind.lower()}s "
+                    f'"{positional[1]}" not found'
+                )
+            items, single = [resource], True
+        else:
+            items = self.list(
+                kind,
+                namespace,
+                options.get("selector"),
+                options.get("field_selector"),
+            )
+            single = False
+        output = options.get("output")
+        if output in ("yaml", "json"):
+            data = (
+                items[0]
+                if single
+                else {
+                    "apiVersion": "v1",
+                    "kind": "List",
+                    "items": items,
+                    "metadata": {"resourceVersion": ""},
+                }
+            )
+            if output == "json":
+                return json.dumps(data, indent=4) + "\n"
+            return yaml.safe_dump(data, default_flow_style=False)
+        if output == "name":
+            return "".join(
+                f"{kind.lower()}/{item['metadata']['name']}\n" for item in items
+            )
+        if not items:
+            return ""
+        return format_table(kind, items)
+
+    def _create(self, files, options, exist_ok=False):
+        if not files:
+            raise OcCommandError("error: must specify one of -f and -k")
+        created = []
+        for content in files.values():
+            for document in yaml.safe_load_all(content):
+                if not document:
+                    continue
+                documents = (
+                    document["items"] if document.get("kind") == "List" else [document]
+                )
+                for resource in documents:
+                    created.append(
+                        self.add(resource, options.get("namespace"), exist_ok)
+                    )
+        if options.get("output") == "yaml":
+            data = (
+                created[0]
+                if len(created) == 1
+                else {"apiVersion": "v1", "kind": "List", "items": created}
+            )
+            return yaml.safe_dump(data, default_flow_style=False)
+        action = "configured" if exist_ok else "created"
+        return "".join(
+            f"{item['kind'].lower()}/{item['metadata']['name']} {action}\n"
+            for item in created
+        )
+
+    def _delete(self, positional, files, options):
+        keys = []
+        for content in files.values():
+            for document in yaml.safe_load_all(content):
+                if not document:
+                    continue
+                kind = document["kind"]
+                metadata = document["metadata"]
+                namespace = self._namespace(kind, options)
+                if namespace is not None:
+                    namespace = metadata.get("namespace") or namespace
+                keys.append((kind, namespace, metadata["name"]))
+        if len(positional) > 1:
+            kind = resolve_kind(positional[0])
+            keys += [
+                (kind, self._namespace(kind, options), name) for name in positional[1:]
+            ]
+        output = []
+        with self._lock:
+            for key in keys:
+                if self.resources.pop(key, None) is None:
+                    raise OcCommandError(
+                        f"Error from server (NotFound): {key[0].lower()}s "
+                        f'"{key[2]}" not found'
+                    )
+                output.append(f'{key[0].lower()} "{key[2]}" deleted\n')
+        return "".join(output)
+
+
+def resolve_kind(name):
+    """
+    Args:
+        name (str): Kind, its plural or short name, e.g. "pvc"
+
+    Returns:
+        str: The kind, e.g. "PersistentVolumeClaim"
+
+    """
+    name = name.split(".")[0]
+    return KIND_ALIASES.get(name.lower(), name[:1].upper() + name[1:])
+
+
+def parse_oc_args(args):
+    """
+    Split `oc` arguments into the options and positional arguments.
+
+    Args:
+        args (list): Arguments of the command, without the "oc"
+
+    Returns:
+        tuple: options (dict), positional arguments (list)
+
+    """
+    option_names = {
+        "-n": "namespace",
+        "--namespace": "namespace",
+        "-o": "output",
+        "--output": "output",
+        "-l": "selector",
+        "--selector": "selector",
+        "--field-selector": "field_selector",
+        "--kubeconfig": "kubeconfig",
+        "-f": "filename",
+        "--filename": "filename",
+    }
+    options = {}
+    positional = []
+    args = list(args)
+    while args:
+        arg = args.pop(0)
+        name, _, value = arg.partition("=")
+        if name in option_names:
+            options[option_names[name]] = (
+                value if value else (args.pop(0) if args else "")
+            )
+        elif arg in ("-A", "--all-namespaces"):
+            options["all_namespaces"] = True
+        elif arg.startswith("-"):
+            # flags without value, e.g. --insecure-skip-tls-verify
+            continue
+        else:
+            positional.append(arg)
+    return options, positional
+
+
+def format_table(kind, items):
+    """
+    Format the resources the way `oc get` does without -o.
+
+    Args:
+        kind (str): Kind of the resources
+        items (list): The resources
+
+    Returns:
+        str: The table
+
+    """
+    if kind == "Pod":
+        header = ["NAME", "READY", "STATUS", "RESTARTS", "AGE"]
+        rows = [
+            [
+                item["metadata"]["name"],
+                "1/1",
+                item.get("status", {}).get("phase", "Pending"),
+                "0",
+                TABLE_AGE,
+            ]
+            for item in items
+        ]
+    elif kind == "PersistentVolumeClaim":
+        header = [
+            "NAME",
+            "STATUS",
+            "VOLUME",
+            "CAPACITY",
+            "ACCESS MODES",
+            "STORAGECLASS",
+            "AGE",
+        ]
+        rows = [
+            [
+                item["metadata"]["name"],
+                item.get("status", {}).get("phase", "Pending"),
+                f"pvc-{item['metadata'].get('uid', '')}",
+                item["spec"]["resources"]["requests"]["storage"],
+                "RWO",
+                item["spec"].get("storageClassName") or "",
+                TABLE_AGE,
+            ]
+            for item in items
+        ]
+    elif kind == "Node":
+        header = ["NAME", "STATUS", "ROLES", "AGE", "VERSION"]
+        rows = [
+            [item["metadata"]["name"], "Ready", "worker", TABLE_AGE, "v1.30.0"]
+            for item in items
+        ]
+    else:
+        header = ["NAME", "AGE"]
+        rows = [[item["metadata"]["name"], TABLE_AGE] for item in items]
+    widths = [
+        max(len(str(row[i])) for row in [header] + rows) for i in range(len(header))
+    ]
+    return "".join(
+        "   ".join(
+            str(value).ljust(width) for value, width in zip(row, widths)
+        ).rstrip()
+        + "\n"
+        for row in [header] + rows
+    )
+
+
+class FakeKubeAPIServer(object):
+    """
+    HTTP server answering the `oc` shim from the FakeKubeState. Can be used as
+    a context manager.
+    """
+
+    def __init__(self, host="127.0.0.1", port=0):
+        """
+        Args:
+            host (str): Address to listen on
+            port (int): Port to listen on, any free port by default
+
+        """
+        self.state = FakeKubeState()
+        state = self.state
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                stdout, stderr, rc = state.run(body["args"], body.get("files"))
+                data = json.dumps({"stdout": stdout, "stderr": stderr, "rc": rc})
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data.encode())))
+                self.end_headers()
+                self.wfile.write(data.encode())
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+        self.url = f"http://{host}:{self.httpd.server_address[1]}"
+        self._thread = None
+        self._bin_dir = None
+
+    def start(self):
+        """
+        Start serving in a background thread.
+        """
+        self._thread = threading.Thread(
+            target=self.httpd.serve_forever, daemon=True, name="fake-kube-api"
+        )
+        self._thread.start()
+        log.info(f"Fake Kubernetes API server listening on {self.url}")
+
+    def stop(self):
+        """
+        Stop the server.
+        """
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exception_type, value, traceback):
+        self.stop()
+
+    def seed(self, pods=0, pvcs=0, nodes=0, namespace=DEFAULT_NAMESPACE):
+        """
+        See FakeKubeState.seed.
+        """
+        self.state.seed(pods=pods, pvcs=pvcs, nodes=nodes, namespace=namespace)
+
+    @property
+    def stats(self):
+        """
+        Counter: Number of the handled `oc` invocations per verb
+        """
+        return self.state.calls
+
+    def write_oc_shim(self, bin_dir):
+        """
+        Write the `oc` shim pointing to this server.
+
+        Args:
+            bin_dir (str): Directory for the shim
+
+        Returns:
+            str: Path of the shim
+
+        """
+        path = os.path.join(bin_dir, "oc")
+        with open(path, "w") as f:
+            f.write(
+                OC_SHIM.format(python=sys.executable, url_variable=URL_ENV_VARIABLE)
+            )
+        os.chmod(
+            path, os.stat(path).st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH
+        )
+        return path
+
+    @contextmanager
+    def oc_in_path(self):
+        """
+        Put the `oc` shim in front of PATH for the duration of the with block.
+
+        Yields:
+            str: Path of the shim
+
+        """
+        original_path = os.environ.get("PATH", "")
+        original_url = os.environ.get(URL_ENV_VARIABLE)
+        with tempfile.TemporaryDirectory(prefix="fake-oc-") as bin_dir:
+            shim = self.write_oc_shim(bin_dir)
+            os.environ["PATH"] = f"{bin_dir}{os.pathsep}{original_path}"
+            os.environ[URL_ENV_VARIABLE] = self.url
+            try:
+                yield shim
+            finally:
+                os.environ["PATH"] = original_path
+                if original_url is None:
+                    os.environ.pop(URL_ENV_VARIABLE, None)
+                else:
+                    os.environ[URL_ENV_VARIABLE] = original_url
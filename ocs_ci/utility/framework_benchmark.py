@@ -0,0 +1,480 @@
+"""
+Benchmark of the framework's own overhead.
+"""
+
+import argparse
+import copy
+import json
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Callable
+
+import yaml
+from tabulate import tabulate
+
+from ocs_ci.framework import config
+from ocs_ci.ocs import constants
+from ocs_ci.utility.fake_kube import DEFAULT_NAMESPACE, FakeKubeAPIServer
+
+log = logging.getLogger(__name__)
+
+DEFAULT_SCALES = (10, 50)
+DEFAULT_TOLERANCE = 0.25
+# counters compared exactly against the baseline, they are deterministic
+EXACT_METRICS = ("forks", "oc_calls", "yaml_loads", "sleep_seconds")
+# metrics compared with the tolerance
+MEASURED_METRICS = ("wall_time", "peak_memory")
+# packages whose time.sleep calls are recorded
+FRAMEWORK_PACKAGES = ("ocs_ci.", "tests.")
+
+
+class OverheadCounters(object):
+    """
+    Context manager counting the forked subprocesses, yaml.safe_load calls
+    and time.sleep seconds of the code run inside of it.
+    """
+
+    def __init__(self, real_sleep=False, trace_memory=False):
+        """
+        Args:
+            real_sleep (bool): True to really sleep in the framework code,
+                the requested sleep is only recorded by default
+            trace_memory (bool): True to measure peak memory by tracemalloc
+
+        """
+        self.real_sleep = real_sleep
+        self.trace_memory = trace_memory
+        self.forks = Counter()
+        self.yaml_loads = 0
+        self.sleep_seconds = 0.0
+        self.peak_memory = None
+        self._originals = None
+
+    def __enter__(self):
+        counters = self
+        originals = (subprocess.Popen, yaml.safe_load, time.sleep)
+        original_popen, original_safe_load, original_sleep = originals
+
+        class CountingPopen(original_popen):
+            def __init__(self, args, *popen_args, **kwargs):
+                command = args if isinstance(args, str) else " ".join(args[:2])
+                counters.forks[command.split("/")[-1]] += 1
+                super().__init__(args, *popen_args, **kwargs)
+
+        def counting_safe_load(stream):
+            counters.yaml_loads += 1
+            return original_safe_load(stream)
+
+        def recording_sleep(seconds):
+            # only the sleeps of the framework are recorded, e.g. the
+            # subprocess module polls the child with short sleeps
+            caller = sys._getframe(1).f_globals.get("__name__", "")
+            if not caller.startswith(FRAMEWORK_PACKAGES):
+                return original_sleep(seconds)
+            counters.sleep_seconds += seconds
+            if counters.real_sleep:
+                original_sleep(seconds)
+
+        self._originals = originals
+        subprocess.Popen = CountingPopen
+        yaml.safe_load = counting_safe_load
+        time.sleep = recording_sleep
+        if self.trace_memory:
+            tracemalloc.start()
+        return self
+
+    def __exit__(self, exception_type, value, traceback):
+        if self.trace_memory:
+            self.peak_memory = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        subprocess.Popen, yaml.safe_load, time.sleep = self._originals
+
+    @property
+    def total_forks(self):
+        """
+        int: Number of all the forked subprocesses
+        """
+        return sum(self.forks.values())
+
+
+@dataclass
+class BenchmarkCase:
+    """
+    Framework helper to measure.
+
+    Attributes:
+        name (str): Name of the case
+        run (callable): Function getting the scale and running the helper
+        seed (callable): Function getting the FakeKubeAPIServer and the scale
+            and seeding the resources the helper works with
+
+    """
+
+    name: str
+    run: Callable
+    seed: Callable = lambda server, scale: None
+
+
+@dataclass
+class BenchmarkResult:
+    """
+    Measured overhead of one case at one scale.
+    """
+
+    case: str
+    scale: int
+    wall_time: float
+    forks: int
+    oc_calls: dict = field(default_factory=dict)
+    yaml_loads: int = 0
+    sleep_seconds: float = 0.0
+    peak_memory: int = None
+
+
+def _run_ocp_get(scale):
+    from ocs_ci.ocs.ocp import OCP
+
+    items = OCP(kind=constants.POD, namespace=DEFAULT_NAMESPACE).get()["items"]
+    assert len(items) == scale
+
+
+def _run_wait_for_resource(scale):
+    from ocs_ci.ocs.ocp import OCP
+
+    assert OCP(kind=constants.POD, namespace=DEFAULT_NAMESPACE).wait_for_resource(
+        condition=constants.STATUS_RUNNING,
+        selector="app=benchmark",
+        resource_count=scale,
+        timeout=60,
+    )
+
+
+def _run_get_all_pods(scale):
+    from ocs_ci.ocs.resources.pod import get_all_pods
+
+    assert len(get_all_pods(namespace=DEFAULT_NAMESPACE)) == scale
+
+
+def _run_get_node_objs(scale):
+    from ocs_ci.ocs.node import get_node_objs
+
+    assert len(get_node_objs()) == scale
+
+
+def _run_create_multiple_pvcs(scale, burst=False):
+    from ocs_ci.helpers.helpers import create_multiple_pvcs
+
+    pvcs, _ = create_multiple_pvcs(
+        sc_name=constants.DEFAULT_STORAGECLASS_RBD,
+        namespace=DEFAULT_NAMESPACE,
+        number_of_pvc=scale,
+        burst=burst,
+    )
+    assert len(pvcs) == scale
+
+
+CASES = {
+    case.name: case
+    for case in (
+        BenchmarkCase(
+            "ocp_get", _run_ocp_get, lambda server, scale: server.seed(pods=scale)
+        ),
+        BenchmarkCase(
+            "ocp_wait_for_resource",
+            _run_wait_for_resource,
+            lambda server, scale: server.seed(pods=scale),
+        ),
+        BenchmarkCase(
+            "get_all_pods",
+            _run_get_all_pods,
+            lambda server, scale: server.seed(pods=scale),
+        ),
+        BenchmarkCase(
+            "get_node_objs",
+            _run_get_node_objs,
+            lambda server, scale: server.seed(nodes=scale),
+        ),
+        BenchmarkCase("create_multiple_pvcs", _run_create_multiple_pvcs),
+        BenchmarkCase(
+            "create_multiple_pvcs_burst",
+            lambda scale: _run_create_multiple_pvcs(scale, burst=True),
+        ),
+    )
+}
+
+
+@contextmanager
+def preserved_config(sections=("ENV_DATA", "DEPLOYMENT", "RUN")):
+    """
+    Restore the config sections after the with block, the helpers cache some
+    of the cluster state there (e.g. the proxy configuration).
+
+    Args:
+        sections (tuple): Names of the config sections to restore
+
+    """
+    saved = {name: copy.deepcopy(getattr(config, name)) for name in sections}
+    try:
+        yield
+    finally:
+        for name, data in saved.items():
+            section = getattr(config, name)
+            section.clear()
+            section.update(data)
+
+
+@contextmanager
+def benchmark_environment(server):
+    """
+    Point the framework config to a dummy cluster directory and put the `oc`
+    shim of the server in PATH for the duration of the with block.
+
+    Args:
+        server (FakeKubeAPIServer): The running fake API server
+
+    """
+    with tempfile.TemporaryDirectory(
+        prefix="framework-benchmark-"
+    ) as cluster_path, preserved_config():
+        kubeconfig = os.path.join(
+            cluster_path, config.RUN.get("kubeconfig_location", "auth/kubeconfig")
+        )
+        os.makedirs(os.path.dirname(kubeconfig), exist_ok=True)
+        with open(kubeconfig, "w") as f:
+            yaml.safe_dump({"apiVersion": "v1", "kind": "Config"}, f)
+        config.ENV_DATA["cluster_path"] = cluster_path
+        config.RUN["kubeconfig"] = kubeconfig
+        config.RUN["resource_checker"] = False
+        with server.oc_in_path():
+            yield
+
+
+class FrameworkBenchmark(object):
+    """
+    Runs the benchmark cases at the given scales against the fake API server.
+    """
+
+    def __init__(self, cases=None, scales=DEFAULT_SCALES, trace_memory=True, repeat=1):
+        """
+        Args:
+            cases (list): Names of the cases to run, all the CASES by default
+            scales (list): Numbers of the seeded resources
+            trace_memory (bool): True to measure the peak memory in a separate
+                run of every case
+            repeat (int): Number of the timed runs, the best wall time is
+                reported
+
+        """
+        unknown = set(cases or ()) - set(CASES)
+        if unknown:
+            raise ValueError(f"Unknown benchmark cases: {', '.join(sorted(unknown))}")
+        self.cases = [CASES[name] for name in cases] if cases else list(CASES.values())
+        self.scales = list(scales)
+        self.trace_memory = trace_memory
+        self.repeat = max(1, repeat)
+
+    def _measure(self, server, case, scale, trace_memory):
+        server.state.clear()
+        case.seed(server, scale)
+        server.stats.clear()
+        with preserved_config(), OverheadCounters(
+            trace_memory=trace_memory
+        ) as counters:
+            start = time.perf_counter()
+            case.run(scale)
+            wall_time = time.perf_counter() - start
+        return counters, wall_time, dict(server.stats)
+
+    def run_case(self, server, case, scale):
+        """
+        Measure one case at one scale.
+
+        Args:
+            server (FakeKubeAPIServer): The running fake API server
+            case (BenchmarkCase): The case
+            scale (int): Number of the seeded resources
+
+        Returns:
+            BenchmarkResult: The result
+
+        """
+        # untimed run warms up the imports and lazy one time initializations,
+        # e.g. of the version checks
+        self._measure(server, case, scale, False)
+        peak_memory = None
+        if self.trace_memory:
+            peak_memory = self._measure(server, case, scale, True)[0].peak_memory
+        runs = [self._measure(server, case, scale, False) for _ in range(self.repeat)]
+        counters, _, oc_calls = runs[-1]
+        result = BenchmarkResult(
+            case=case.name,
+            scale=scale,
+            wall_time=round(min(run[1] for run in runs), 3),
+            forks=counters.total_forks,
+            oc_calls=oc_calls,
+            yaml_loads=counters.yaml_loads,
+            sleep_seconds=counters.sleep_seconds,
+            peak_memory=peak_memory,
+        )
+        log.info(f"Benchmark result: {result}")
+        return result
+
+    def run(self):
+        """
+        Run all the cases at all the scales.
+
+        Returns:
+            list: BenchmarkResult objects
+
+        """
+        results = []
+        with FakeKubeAPIServer() as server, benchmark_environment(server):
+            for case in self.cases:
+                for scale in self.scales:
+                    results.append(self.run_case(server, case, scale))
+        return results
+
+
+def compare_results(results, baseline, tolerance=DEFAULT_TOLERANCE):
+    """
+    Compare the results against the baseline.
+
+    The counters (forks, oc calls, yaml loads, sleep) are deterministic, any
+    increase is a regression. Wall time and peak memory are regressions when
+    they grow more than the tolerance.
+
+    Args:
+        results (list): BenchmarkResult objects
+        baseline (list): Baseline results as dicts, e.g. loaded from JSON
+        tolerance (float): Allowed relative growth of the measured metrics
+
+    Returns:
+        list: Descriptions of the regressions, empty if there is none
+
+    """
+    baseline = {(item["case"], item["scale"]): item for item in baseline}
+    regressions = []
+    for result in results:
+        reference = baseline.get((result.case, result.scale))
+        if reference is None:
+            continue
+        current = asdict(result)
+        for metric in EXACT_METRICS + MEASURED_METRICS:
+            value, expected = current.get(metric), reference.get(metric)
+            if value is None or expected is None:
+                continue
+            if metric == "oc_calls":
+                value, expected = sum(value.values()), sum(expected.values())
+            limit = (
+                expected * (1 + tolerance) if metric in MEASURED_METRICS else expected
+            )
+            if value > limit:
+                regressions.append(
+                    f"{result.case} at scale {result.scale}: {metric} {value} > "
+                    f"{expected}"
+                )
+    return regressions
+
+
+def format_results(results):
+    """
+    Args:
+        results (list): BenchmarkResult objects
+
+    Returns:
+        str: Table of the results
+
+    """
+    rows = [
+        [
+            result.case,
+            result.scale,
+            f"{result.wall_time:.3f}",
+            result.forks,
+            " ".join(
+                f"{verb}:{count}" for verb, count in sorted(result.oc_calls.items())
+            ),
+            result.yaml_loads,
+            result.sleep_seconds,
+            "" if result.peak_memory is None else f"{result.peak_memory / 2**20:.1f}",
+        ]
+        for result in results
+    ]
+    headers = [
+        "case",
+        "scale",
+        "wall time [s]",
+        "forks",
+        "oc calls",
+        "yaml loads",
+        "sleep [s]",
+        "peak memory [MiB]",
+    ]
+    return tabulate(rows, headers=headers)
+
+
+def main(argv=None):
+    """
+    Entry point of the framework-benchmark command.
+    """
+    parser = argparse.ArgumentParser(
+        description="Measure the overhead of the ocs-ci helpers against a fake "
+        "Kubernetes API server"
+    )
+    parser.add_argument(
+        "--cases",
+        help=f"Comma separated cases to run, all by default: {', '.join(CASES)}",
+    )
+    parser.add_argument(
+        "--scales",
+        default=",".join(str(scale) for scale in DEFAULT_SCALES),
+        help="Comma separated numbers of the seeded resources",
+    )
+    parser.add_argument("--output", help="Path of the JSON file for the results")
+    parser.add_argument("--baseline", help="JSON results to compare with")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help="Allowed relative growth of the wall time and peak memory",
+    )
+    parser.add_argument(
+        "--no-memory",
+        action="store_true",
+        help="Don't measure the peak memory",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=1,
+        help="Number of the timed runs of every case, the best time is reported",
+    )
+    parser.add_argument("--verbose", action="store_true", help="Log the commands")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING)
+
+    benchmark = FrameworkBenchmark(
+        cases=args.cases.split(",") if args.cases else None,
+        scales=[int(scale) for scale in args.scales.split(",")],
+        trace_memory=not args.no_memory,
+        repeat=args.repeat,
+    )
+    results = benchmark.run()
+    print(format_results(results))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump([asdict(result) for result in results], f, indent=2)
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare_results(results, json.load(f), args.tolerance)
+        if regressions:
+            print("Regressions against the baseline:\n" + "\n".join(regressions))
+            sys.exit(1)
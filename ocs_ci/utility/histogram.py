@@ -0,0 +1,282 @@
+"""
+Mergeable latency histograms.
+"""
+
+DEFAULT_SUB_BUCKET_BITS = 8
+DEFAULT_PERCENTILES = (50, 90, 95, 99, 99.9)
+
+
+def percentile_key(percentile):
+    """
+    Name of the percentile in results, e.g. "p99" or "p99_9". Dots are not
+    used as Elasticsearch treats them as object path separators.
+
+    Args:
+        percentile (float): Percentile
+
+    Returns:
+        str: Name of the percentile
+
+    """
+    return f"p{percentile:g}".replace(".", "_")
+
+
+class LatencyHistogram:
+    """
+    Sparse log-linear histogram of integer latency values, the relative error
+    of a recorded value is bounded by ``2 ** -(sub_bucket_bits - 1)``.
+    """
+
+    def __init__(self, unit="us", sub_bucket_bits=DEFAULT_SUB_BUCKET_BITS):
+        """
+        Args:
+            unit (str): Unit of the recorded values, histograms can be merged
+                only with histograms of the same unit
+            sub_bucket_bits (int): Precision of the histogram, number of
+                linear buckets per power of two is 2 ** (sub_bucket_bits - 1)
+
+        """
+        self.unit = unit
+        self.sub_bucket_bits = sub_bucket_bits
+        self.counts = {}
+        self.total = 0
+        self.sum = 0
+        self.min = None
+        self.max = None
+
+    def bucket_index(self, value):
+        """
+        Index of the bucket the value falls into.
+
+        Args:
+            value (int): Non negative value
+
+        Returns:
+            int: Bucket index
+
+        """
+        bits = self.sub_bucket_bits
+        if value < 1 << bits:
+            return value
+        shift = value.bit_length() - bits
+        half = 1 << (bits - 1)
+        return (1 << bits) + (shift - 1) * half + (value >> shift) - half
+
+    def bucket_range(self, index):
+        """
+        Range of values of the bucket.
+
+        Args:
+            index (int): Bucket index
+
+        Returns:
+            tuple: The lowest and the highest value of the bucket
+
+        """
+        bits = self.sub_bucket_bits
+        if index < 1 << bits:
+            return index, index
+        half = 1 << (bits - 1)
+        shift, offset = divmod(index - (1 << bits), half)
+        shift += 1
+        low = (half + offset) << shift
+        return low, low + (1 << shift) - 1
+
+    def record(self, value, count=1):
+        """
+        Record value.
+
+        Args:
+            value (float): The value, rounded to integer
+            count (int): Number of occurrences of the value
+
+        """
+        if count <= 0:
+            return
+        value = max(0, int(round(value)))
+        index = self.bucket_index(value)
+        self.counts[index] = self.counts.get(index, 0) + count
+        self.total += count
+        self.sum += value * count
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def record_percentiles(self, percentiles, total):
+        """
+        Approximate the distribution from reported percentiles (e.g. fio
+        ``clat`` percentiles). The share of samples between two consecutive
+        percentiles is recorded at the higher percentile value, so the
+        reported percentiles are preserved within the histogram precision.
+
+        Args:
+            percentiles (dict): {percentile (float or str): value}
+            total (int): Number of samples the percentiles were computed from
+
+        """
+        recorded = 0
+        value = None
+        for percentile, value in sorted((float(p), v) for p, v in percentiles.items()):
+            count = int(round(total * percentile / 100)) - recorded
+            if count > 0:
+                self.record(value, count)
+                recorded += count
+        if value is not None and recorded < total:
+            # samples above the highest reported percentile
+            self.record(value, total - recorded)
+
+    def merge(self, other):
+        """
+        Add counts of the other histogram into this one.
+
+        Args:
+            other (LatencyHistogram): Histogram of the same unit and precision
+
+        Returns:
+            LatencyHistogram: self
+
+        Raises:
+            ValueError: If the histograms are not compatible
+
+        """
+        if (other.unit, other.sub_bucket_bits) != (self.unit, self.sub_bucket_bits):
+            raise ValueError(
+                f"Can't merge histogram of {other.unit} with precision "
+                f"{other.sub_bucket_bits} into histogram of {self.unit} with "
+                f"precision {self.sub_bucket_bits}"
+            )
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.total += other.total
+        self.sum += other.sum
+        if other.min is not None:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+        if other.max is not None:
+            self.max = other.max if self.max is None else max(self.max, other.max)
+        return self
+
+    def __iadd__(self, other):
+        return self.merge(other)
+
+    @classmethod
+    def merged(cls, histograms, unit="us", sub_bucket_bits=DEFAULT_SUB_BUCKET_BITS):
+        """
+        Merge histograms into a new one.
+
+        Args:
+            histograms (iterable): LatencyHistogram objects
+            unit (str): Unit of the histograms
+            sub_bucket_bits (int): Precision of the histograms
+
+        Returns:
+            LatencyHistogram: The merged histogram
+
+        """
+        result = cls(unit=unit, sub_bucket_bits=sub_bucket_bits)
+        for histogram in histograms:
+            result.merge(histogram)
+        return result
+
+    @property
+    def mean(self):
+        """
+        float: Mean of the recorded values, None if empty
+        """
+        return self.sum / self.total if self.total else None
+
+    def value_at_percentile(self, percentile):
+        """
+        Value at the given percentile, reported as the highest value of the
+        bucket (capped by the maximal recorded value).
+
+        Args:
+            percentile (float): Percentile (0-100)
+
+        Returns:
+            int: The value, None if the histogram is empty
+
+        """
+        if not self.total:
+            return None
+        target = max(1, -(-self.total * percentile // 100))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= target:
+                return min(self.bucket_range(index)[1], self.max)
+        return self.max
+
+    def percentiles(self, percentiles=DEFAULT_PERCENTILES):
+        """
+        Values at the given percentiles.
+
+        Args:
+            percentiles (tuple): Percentiles to compute
+
+        Returns:
+            dict: e.g. {"p50": 840, "p99": 4200, "p99_9": 9100}
+
+        """
+        return {percentile_key(p): self.value_at_percentile(p) for p in percentiles}
+
+    def summary(self, percentiles=DEFAULT_PERCENTILES):
+        """
+        Summary of the histogram.
+
+        Args:
+            percentiles (tuple): Percentiles to compute
+
+        Returns:
+            dict: with ``unit``, ``count``, ``min``, ``max``, ``mean`` and the
+                percentile keys
+
+        """
+        summary = {
+            "unit": self.unit,
+            "count": self.total,
+            "min": self.min,
+            "max": self.max,
+            "mean": self.mean,
+        }
+        summary.update(self.percentiles(percentiles))
+        return summary
+
+    def to_dict(self):
+        """
+        Serialize the histogram, buckets are stored as two lists so the
+        document has a fixed set of fields.
+
+        Returns:
+            dict: Serialized histogram
+
+        """
+        indexes = sorted(self.counts)
+        return {
+            "unit": self.unit,
+            "sub_bucket_bits": self.sub_bucket_bits,
+            "total": self.total,
+            "sum": self.sum,
+            "min": self.min,
+            "max": self.max,
+            "buckets": indexes,
+            "counts": [self.counts[i] for i in indexes],
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Deserialize the histogram.
+
+        Args:
+            data (dict): Histogram serialized by to_dict()
+
+        Returns:
+            LatencyHistogram: The histogram
+
+        """
+        histogram = cls(unit=data["unit"], sub_bucket_bits=data["sub_bucket_bits"])
+        histogram.counts = dict(zip(data["buckets"], data["counts"]))
+        histogram.total = data["total"]
+        histogram.sum = data["sum"]
+        histogram.min = data["min"]
+        histogram.max = data["max"]
+        return histogram
@@ -13,7 +13,6 @@ import platform
 import shlex
 import tempfile
 import subprocess
-from subprocess import CalledProcessError
 from semantic_version import Version
 import base64
 
@@ -38,6 +37,7 @@ from ocs_ci.helpers import helpers
 from ocs_ci.ocs.resources import storage_cluster
 from ocs_ci.utility import templating, version
 from ocs_ci.utility.retry import retry
+from ocs_ci.utility.vault_client import get_vault_client, kv_secret_data
 from ocs_ci.utility.utils import (
     download_file,
     delete_file,
@@ -251,18 +251,14 @@ class Vault(KMS):
             bool: True if exists else False
 
         """
-        if config.ENV_DATA.get("vault_hcp"):
-            cmd = f"vault namespace lookup -namespace={constants.VAULT_HCP_NAMESPACE} {vault_namespace}"
-        else:
-            cmd = f"vault namespace lookup {vault_namespace}"
-        proc = subprocess.Popen(
-            shlex.split(cmd), stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+        parent = (
+            constants.VAULT_HCP_NAMESPACE if config.ENV_DATA.get("vault_hcp") else None
         )
-        out, err = proc.communicate()
-        if proc.returncode:
-            if "Namespace not found" in err:
-                return False
-        return True
+        try:
+            return get_vault_client().namespace_exists(vault_namespace, parent=parent)
+        except VaultOperationError as ex:
+            logger.warning(f"Vault namespace {vault_namespace} lookup failed: {ex}")
+            return True
 
     def vault_backend_path_exists(self, backend_path):
         """
@@ -275,13 +271,9 @@ class Vault(KMS):
             bool: True if exists else False
 
         """
-        cmd = "vault secrets list --format=json"
-        out = subprocess.check_output(shlex.split(cmd))
-        json_out = json.loads(out)
-        for path in json_out.keys():
-            if backend_path in path:
-                return True
-        return False
+        return any(
+            backend_path in path for path in get_vault_client().secrets_engines()
+        )
 
     def create_namespace(self, vault_namespace):
         """
@@ -978,35 +970,36 @@ class Vault(KMS):
             self.get_vault_namespace()
             os.environ["VAULT_NAMESPACE"] = self.vault_namespace
         self.get_vault_backend_path()
-        kvlist = vault_kv_list(self.vault_backend_path)
-
-        # Check osd keys are present
-        osds = pod.get_osd_pods()
-        for osd in osds:
-            pvc = (
-                osd.get()
-                .get("metadata")
-                .get("labels")
-                .get(constants.CEPH_ROOK_IO_PVC_LABEL)
-            )
-            if any(pvc in k for k in kvlist):
-                logger.info(f"Vault: Found key for {pvc}")
-            else:
-                logger.error(f"Vault: Key not found for {pvc}")
-                raise NotFoundError("Vault key not found")
 
-        # Check for NOOBAA key
+        # osd and noobaa keys are checked with a single listing of the path
+        osd_pvcs = [
+            osd.get()
+            .get("metadata")
+            .get("labels")
+            .get(constants.CEPH_ROOK_IO_PVC_LABEL)
+            for osd in pod.get_osd_pods()
+        ]
         noobaa_key_path = (
             constants.NOOBAA_BACKEND_SECRET
             if version.get_semantic_ocs_version_from_config() >= version.VERSION_4_18
             else constants.VAULT_NOOBAA_ROOT_SECRET_PATH
         )
+        missing = missing_keys_in_path(
+            osd_pvcs + [noobaa_key_path], self.vault_backend_path
+        )
 
-        if any(noobaa_key_path in k for k in kvlist):
-            logger.info("Found Noobaa root secret path")
-        else:
+        # Check osd keys are present
+        for pvc in osd_pvcs:
+            if pvc in missing:
+                logger.error(f"Vault: Key not found for {pvc}")
+                raise NotFoundError("Vault key not found")
+            logger.info(f"Vault: Found key for {pvc}")
+
+        # Check for NOOBAA key
+        if noobaa_key_path in missing:
             logger.error("Noobaa root secret path not found")
             raise NotFoundError("Vault key for noobaa not found")
+        logger.info("Found Noobaa root secret path")
 
         # Check kms enabled
         if not is_kms_enabled():
@@ -1335,37 +1328,31 @@ class Vault(KMS):
         Returns:
             secret (str): passphrase stored in the vault KMS for given device handle.
         """
-        if not self.csi_vault_backend_path:
-            self.get_vault_backend_path(
-                resource_configmap=constants.VAULT_KMS_CSI_CONNECTION_DETAILS
-            )
+        return self.get_pv_secrets([device_handle])[device_handle]
 
-        cmd = f"vault kv get -format=json {self.csi_vault_backend_path}/{device_handle}"
-        out = subprocess.check_output(shlex.split(cmd))
-        json_out = json.loads(out)
+    def get_pv_secrets(self, device_handles):
+        """
+        Get secrets stored in the vault KMS for many device handles, all of
+        them are read over the same Vault connection.
 
-        def find_passphrase(obj):
-            """
-            Recursively searches for the 'passphrase' key in the JSON object.
-            """
-            if isinstance(obj, dict):
-                for key, value in obj.items():
-                    if key == "passphrase":
-                        return value
-                    elif isinstance(value, dict) or isinstance(value, list):
-                        result = find_passphrase(value)
-                        if result:
-                            return result
-            elif isinstance(obj, list):
-                for item in obj:
-                    result = find_passphrase(item)
-                    if result:
-                        return result
-            return None
+        Args:
+            device_handles (list): PV device handle strings
 
-        secret = find_passphrase(json_out)
+        Returns:
+            dict: Device handle: passphrase, None if the secret is not found
 
-        return secret
+        """
+        if not self.csi_vault_backend_path:
+            self.get_vault_backend_path(
+                resource_configmap=constants.VAULT_KMS_CSI_CONNECTION_DETAILS
+            )
+        client = get_vault_client()
+        return {
+            device_handle: kv_secret_data(
+                client.kv_get(f"{self.csi_vault_backend_path}/{device_handle}")
+            ).get("passphrase")
+            for device_handle in device_handles
+        }
 
     def get_osd_secret(self, device_handle):
         """Fetch the OSD encryption key for the given device handle from Vault.
@@ -2401,10 +2388,7 @@ def vault_kv_list(path):
         list: of kv present in the path
 
     """
-    cmd = f"vault kv list -format=json {path}"
-    out = subprocess.check_output(shlex.split(cmd))
-    json_out = json.loads(out)
-    return json_out
+    return get_vault_client().kv_list(path)
 
 
 def is_key_present_in_path(key, path):
@@ -2419,15 +2403,28 @@ def is_key_present_in_path(key, path):
         (bool): True if key is present in the backend path
     """
     try:
-        kvlist = vault_kv_list(path=path)
-    except CalledProcessError:
-        return False
-    if any(key in k for k in kvlist):
-        return True
-    else:
+        return not missing_keys_in_path([key], path)
+    except VaultOperationError:
         return False
 
 
+def missing_keys_in_path(keys, path):
+    """
+    Check the presence of many keys in the backend path with a single listing
+    of the path
+
+    Args:
+        keys (list): Names of the keys, a listed key containing the name is
+            accepted too
+        path (str): Vault backend path name
+
+    Returns:
+        list: Names of the keys which are not present in the backend path
+
+    """
+    return get_vault_client().missing_keys(path, keys)
+
+
 def get_encryption_kmsid():
     """
     Get encryption kmsid from 'csi-kms-connection-details'
@@ -2591,24 +2588,13 @@ def fetch_osd_secret_from_vault(device_handle, vault_backend_path):
 
     secret_key = f"rook-ceph-osd-encryption-key-{device_handle}"
 
-    # Construct the Vault command
-    cmd = f"vault kv get -format=json {vault_backend_path}/{secret_key}"
-
     try:
-        # Execute the command and capture the output
-        logger.info(f"Getting OSD secrets from vault : {cmd}")
-        out = subprocess.check_output(
-            shlex.split(cmd), stderr=subprocess.STDOUT, text=True
-        )
-
-        # Parse the JSON response
-        json_out = json.loads(out)
-
-        # Retrieve the secret
-        data_section = json_out.get("data", {})
-        secret = data_section.get("data", {}).get(
-            secret_key, data_section.get(secret_key)
+        logger.info(
+            f"Getting OSD secrets from vault : {vault_backend_path}/{secret_key}"
         )
+        secret = kv_secret_data(
+            get_vault_client().kv_get(f"{vault_backend_path}/{secret_key}")
+        ).get(secret_key)
 
         if not secret:
             raise UnexpectedBehaviour(
@@ -2616,10 +2602,8 @@ def fetch_osd_secret_from_vault(device_handle, vault_backend_path):
             )
 
         return secret
-    except subprocess.CalledProcessError as e:
-        logger.error(f"Error executing Vault command: {e.output.strip()}")
-    except json.JSONDecodeError as e:
-        logger.error(f"Invalid JSON output from Vault command. : {e}")
+    except VaultOperationError as e:
+        logger.error(f"Error reading the secret from Vault: {e}")
 
     return None
 
@@ -2636,22 +2620,10 @@ def fetch_noobaa_secret_from_vault(vault_backend_path):
     Raises:
         UnexpectedBehaviour : If the NooBaa secret key is not found in the Vault response.
     """
-    # Construct the Vault command
-    cmd = f"vault kv get -format=json {vault_backend_path}/{constants.NOOBAA_BACKEND_SECRET}"
-
+    secret_path = f"{vault_backend_path}/{constants.NOOBAA_BACKEND_SECRET}"
     try:
-        logger.info(f"Getting NooBaa secrets from vault : {cmd}")
-
-        # Execute the command and capture the output
-        out = subprocess.check_output(
-            shlex.split(cmd), stderr=subprocess.STDOUT, text=True
-        )
-
-        # Parse the JSON response
-        json_out = json.loads(out)
-
-        # Retrieve the secret
-        data_section = json_out.get("data", {}).get("data", json_out.get("data", {}))
+        logger.info(f"Getting NooBaa secrets from vault : {secret_path}")
+        data_section = kv_secret_data(get_vault_client().kv_get(secret_path))
         key = data_section.get("active_root_key")
         secret = data_section.get(data_section.get("active_root_key"))
 
@@ -2661,9 +2633,7 @@ def fetch_noobaa_secret_from_vault(vault_backend_path):
             )
 
         return (key, secret)
-    except subprocess.CalledProcessError as e:
-        logger.error(f"Error executing Vault command: {e.output.strip()}")
-    except json.JSONDecodeError as e:
-        logger.error(f"Invalid JSON output from Vault command. {e}")
+    except VaultOperationError as e:
+        logger.error(f"Error reading the secret from Vault: {e}")
 
     return (None, None)
@@ -4,9 +4,14 @@ All multicluster specific utility functions and classes can be here
 """
 
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass
 import logging
+import os
+import time
 
-from ocs_ci.framework import config as ocsci_config
+from ocs_ci.framework import config as ocsci_config, config_safe_thread_pool_task
+from ocs_ci.ocs.exceptions import TimeoutExpiredError
 from ocs_ci.ocs.utils import (
     get_non_acm_cluster_indexes,
     get_primary_cluster_index,
@@ -248,3 +253,144 @@ def get_multicluster_upgrade_parametrizer():
     return multicluster_upgrade_parametrizer[
         ocsci_config.MULTICLUSTER["multicluster_mode"]
     ]()
+
+
+@dataclass(frozen=True)
+class ClusterContext:
+    """
+    Immutable snapshot of cluster specific data passed to the tasks running
+    on multiple clusters in parallel, so the tasks do not need to read it from
+    the global config.
+    """
+
+    index: int
+    name: str
+    kubeconfig: str
+    namespace: str
+
+
+@dataclass
+class ClusterTaskResult:
+    """
+    Result of the task executed on one cluster by run_on_clusters.
+    """
+
+    index: int
+    cluster_name: str
+    value: object = None
+    error: Exception = None
+    duration: float = None
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+def get_cluster_context(index):
+    """
+    Get immutable context of the cluster with given config index
+
+    Args:
+        index (int): Cluster config index
+
+    Returns:
+        ClusterContext: context of the cluster
+
+    """
+    cluster = ocsci_config.clusters[index]
+    kubeconfig = cluster.RUN.get("kubeconfig") or os.path.join(
+        cluster.ENV_DATA.get("cluster_path", ""),
+        cluster.RUN.get("kubeconfig_location", ""),
+    )
+    return ClusterContext(
+        index=index,
+        name=cluster.ENV_DATA.get("cluster_name"),
+        kubeconfig=kubeconfig,
+        namespace=cluster.ENV_DATA.get("cluster_namespace"),
+    )
+
+
+def _run_cluster_task(cluster_ctx, task, args, kwargs):
+    """
+    Run the task on one cluster and wrap the outcome into ClusterTaskResult.
+    Executed in the config safe thread using the cluster's config index.
+    """
+    result = ClusterTaskResult(index=cluster_ctx.index, cluster_name=cluster_ctx.name)
+    start = time.time()
+    try:
+        result.value = task(cluster_ctx, *args, **kwargs)
+    except Exception as ex:
+        log.error(f"Task {task.__name__} failed on cluster {cluster_ctx.name}: {ex}")
+        result.error = ex
+    result.duration = time.time() - start
+    return result
+
+
+def run_on_clusters(
+    task, *args, indexes=None, skip_index=None, timeout=None, max_workers=None, **kwargs
+):
+    """
+    Run the task on multiple clusters in parallel. Every task runs in its own
+    thread bound to the cluster's config index (see
+    :func:`ocs_ci.framework.config_safe_thread_pool_task`), so the task can use
+    the config object and the resource objects as usual without switching the
+    global context, and gets immutable ClusterContext as first argument.
+
+    Failure on one cluster doesn't stop the task on the other clusters, the
+    error is returned in the cluster's result instead.
+
+    Args:
+        task (function): Function to run, called as task(cluster_ctx, *args, **kwargs)
+        indexes (list): Config indexes of the clusters, all clusters by default
+        skip_index (int or list): Config index(es) of the clusters to skip
+        timeout (int): Time in seconds to wait for all the tasks, tasks not
+            finished in time get TimeoutExpiredError as their error
+        max_workers (int): Maximum number of clusters processed at once, all
+            selected clusters by default
+
+    Returns:
+        dict: ClusterTaskResult objects keyed by the cluster config index
+
+    """
+    if indexes is None:
+        indexes = list(range(len(ocsci_config.clusters)))
+    if not isinstance(skip_index, list):
+        skip_index = [skip_index]
+    indexes = [index for index in indexes if index not in skip_index]
+    if not indexes:
+        return {}
+    contexts = [get_cluster_context(index) for index in indexes]
+    log.info(
+        f"Running {task.__name__} on clusters: {', '.join(c.name or str(c.index) for c in contexts)}"
+    )
+    results = {}
+    executor = ThreadPoolExecutor(max_workers=max_workers or len(contexts))
+    futures = {
+        executor.submit(
+            config_safe_thread_pool_task,
+            cluster_ctx.index,
+            _run_cluster_task,
+            cluster_ctx,
+            task,
+            args,
+            kwargs,
+        ): cluster_ctx
+        for cluster_ctx in contexts
+    }
+    done, not_done = wait(futures, timeout=timeout)
+    # do not block on the tasks which didn't finish in time
+    executor.shutdown(wait=False)
+    for future, cluster_ctx in futures.items():
+        if future in done:
+            results[cluster_ctx.index] = future.result()
+        else:
+            results[cluster_ctx.index] = ClusterTaskResult(
+                index=cluster_ctx.index,
+                cluster_name=cluster_ctx.name,
+                error=TimeoutExpiredError(
+                    timeout,
+                    f"Task {task.__name__} didn't finish in {timeout} seconds "
+                    f"on cluster {cluster_ctx.name}",
+                ),
+            )
+    return {index: results[index] for index in indexes}
@@ -57,21 +57,58 @@ from ocs_ci.ocs import exceptions
 
 log = logging.getLogger(__name__)
 
+# Tables which index names, table names can not be query parameters, so only
+# those tables are accepted by the generic name / id lookups
+DIMENSION_TABLES = ("versions", "platform", "az_topology", "tests")
+
+RESULTS_COLUMNS = (
+    "sample",
+    "version",
+    "build",
+    "platform",
+    "az_topology",
+    "test_name",
+    "es_link",
+    "log_file",
+)
+
 
 class PerfDash(object):
     """
     The API class to connect and managing the performance dashboard database
+
+    The connection is kept for the whole life of the object, all the queries
+    are parameterized, and the IDs of the indexing tables (and the builds) are
+    cached, so every name is looked up in the DB only once.
     """
 
-    def __init__(self):
+    def __init__(self, connection=None, paramstyle="pyformat"):
         """
         Initializing the dashboard object and make a connection
 
+        Args:
+            connection (obj): DB-API connection to use instead of connecting
+                to the dashboard DB with the configured credentials (e.g.
+                sqlite3 connection for testing)
+            paramstyle (str): DB-API paramstyle of the connection, "qmark"
+                for sqlite3, "pyformat" for mysql
+
         Raise:
             if credential file can not be open / read
             if the connection failed
 
         """
+        self.placeholder = "?" if paramstyle == "qmark" else "%s"
+        # {(table, name): id} and {(table, id): name} of the indexing tables,
+        # builds are cached under ("builds", version id) key
+        self._ids = {}
+        self._names = {}
+
+        if connection is not None:
+            self.creds = {}
+            self.cnx = connection
+            self.cursor = self.cnx.cursor()
+            return
 
         # Reading connection information and credentials from local file
         # which is not stored in the GitHub repository
@@ -99,29 +136,72 @@ class PerfDash(object):
         log.info("Creating DB connector and connect to it")
         try:
             self.cnx = mysql.connector.connect(**self.creds)
-            self.cursor = self.cnx.cursor()
+            # buffered cursor, so partially read results do not block the
+            # next query on the same connection
+            self.cursor = self.cnx.cursor(buffered=True)
         except Exception as err:
             log.error(f"Can not connect to DB - [{err}]")
             raise err
 
-    def _run_query(self, query=None):
+    def _sql(self, query):
+        """
+        Replace the %s placeholders of the query by the connection paramstyle
+        placeholder.
+
+        Args:
+            query (str): sql query string with %s placeholders
+
+        Returns:
+            str: the query for the connection
+
+        """
+        return query.replace("%s", self.placeholder)
+
+    def _run_query(self, query=None, params=None):
         """
         Run an SQL Query
 
         Args:
-            query (str): sql query string
+            query (str): sql query string, with %s placeholders for params
+            params (tuple): values of the query parameters
 
         Returns:
             bool: True if succeed, otherwise False
         """
-        log.debug(f"Try to Execute query : {query}")
+        log.debug(f"Try to Execute query : {query} {params or ''}")
         try:
-            self.cursor.execute(query)
+            if params is None:
+                self.cursor.execute(self._sql(query))
+            else:
+                self.cursor.execute(self._sql(query), params)
             return True
         except Exception as err:
-            log.error(f"Can not execute [{query}]\n{err}")
+            log.error(f"Can not execute [{query}] {params or ''}\n{err}")
             return False
 
+    def _fetch(self, query, params=None):
+        """
+        Run an SQL Query and read all the rows it returns
+
+        Args:
+            query (str): sql query string, with %s placeholders for params
+            params (tuple): values of the query parameters
+
+        Returns:
+            list: the rows (tuples), None if the query failed
+
+        """
+        if not self._run_query(query=query, params=params):
+            return None
+        return self.cursor.fetchall()
+
+    @staticmethod
+    def _check_table(table):
+        if table not in DIMENSION_TABLES:
+            raise ValueError(
+                f"Unknown table {table}, expected one of {DIMENSION_TABLES}"
+            )
+
     def get_id_by_name(self, table=None, name=None):
         """
         Query the ID of specific 'name' value from selected table
@@ -134,13 +214,18 @@ class PerfDash(object):
              int : the value of the ID field in the table, otherwise None
 
         """
-        query = f"SELECT id FROM {table} WHERE name = '{name}' ;"
-        if self._run_query(query=query):
-            for result_id in self.cursor:
-                # The query return a tuple and we need only the firs element
-                return result_id[0]
-
-        return None
+        self._check_table(table)
+        rec_id = self._ids.get((table, name))
+        if rec_id is not None:
+            return rec_id
+        rows = self._fetch(f"SELECT id FROM {table} WHERE name = %s ;", (name,))
+        if not rows:
+            return None
+        # The query return a tuple and we need only the first element
+        rec_id = rows[0][0]
+        self._ids[(table, name)] = rec_id
+        self._names[(table, rec_id)] = name
+        return rec_id
 
     def get_name_by_id(self, table=None, recid=None):
         """
@@ -154,21 +239,28 @@ class PerfDash(object):
              str : the value of the Name field in the table, otherwise None
 
         """
-        query = f"SELECT name FROM {table} WHERE id = {recid} ;"
-        if self._run_query(query=query):
-            for result_name in self.cursor:
-                # The query return a tuple and we need only the first element
-                return result_name[0]
-
-        return None
+        self._check_table(table)
+        name = self._names.get((table, recid))
+        if name is not None:
+            return name
+        rows = self._fetch(f"SELECT name FROM {table} WHERE id = %s ;", (recid,))
+        if not rows:
+            return None
+        # The query return a tuple and we need only the first element
+        name = rows[0][0]
+        self._ids[(table, name)] = recid
+        self._names[(table, recid)] = name
+        return name
 
-    def insert_single_value(self, table=None, value=None):
+    def insert_single_value(self, table=None, value=None, commit=True):
         """
         Insert a value to 'table' and return it's ID
 
         Args:
             table (str): The table to insert data into
             value (str): The value to insert
+            commit (bool): Commit the insert, False when it is part of bigger
+                transaction
 
         Returns:
              int : the ID of the value in the table, otherwise None
@@ -179,12 +271,15 @@ class PerfDash(object):
         if record_id is not None:
             return record_id
 
-        query = f"INSERT INTO {table} (name) VALUES ('{value}') ;"
-        if self._run_query(query=query):
+        query = f"INSERT INTO {table} (name) VALUES (%s) ;"
+        if self._run_query(query=query, params=(value,)):
             try:
                 rec_id = self.cursor.lastrowid
-                # Make sure data is committed to the database
-                self.cnx.commit()
+                if commit:
+                    # Make sure data is committed to the database
+                    self.cnx.commit()
+                self._ids[(table, value)] = rec_id
+                self._names[(table, rec_id)] = value
                 return rec_id
             except Exception as err:
                 log.error(f"Can not insert {value} into {table} - [{err}]")
@@ -309,13 +404,16 @@ class PerfDash(object):
         if ver_id is None:
             return None
 
-        results = {}
-        query = f"SELECT id, name FROM builds WHERE version = {ver_id} ;"
-        if self._run_query(query=query):
-            for build_id, name in self.cursor:
-                results[name] = build_id
+        results = self._ids.get(("builds", ver_id))
+        if results is None:
+            rows = self._fetch(
+                "SELECT id, name FROM builds WHERE version = %s ;", (ver_id,)
+            )
+            results = {name: build_id for build_id, name in rows or []}
+            if rows is not None:
+                self._ids[("builds", ver_id)] = results
 
-        return None if results == {} else results
+        return None if results == {} else dict(results)
 
     def get_build_id(self, version, build):
         """
@@ -335,39 +433,107 @@ class PerfDash(object):
             return all_builds.get(build)
         return None
 
-    def insert_build(self, version, build):
+    def insert_build(self, version, build, commit=True):
         """
         Insert a new build to the DB and return it's ID
 
         Args:
             version (str): The version number as string (e.g. 4.9.0)
             build (str): The build number (e.g. 180 / RC1-200 / GA)
+            commit (bool): Commit the insert, False when it is part of bigger
+                transaction
 
         Returns:
              int : the ID of the build in the DB, otherwise None
 
         """
-        # prevent of duplicate records for the same build
+        # prevent of duplicate records for the same build, the cached builds
+        # are refreshed as the build could be added by another run
         build_id = self.get_build_id(version=version, build=build)
+        if build_id is None:
+            self._ids.pop(("builds", self.get_version_id(version)), None)
+            build_id = self.get_build_id(version=version, build=build)
         if build_id is not None:
             return build_id
 
         # Try to insert the version into the DB, it will not be inserted twice,
         # If the version is exists in the DB it will just return the id of it.
-        ver_id = self.insert_single_value(table="versions", value=version)
+        ver_id = self.insert_single_value(
+            table="versions", value=version, commit=commit
+        )
+        if ver_id is None:
+            return None
 
-        query = f"INSERT INTO builds (version, name) VALUES ({ver_id}, '{build}') ;"
-        if self._run_query(query=query):
+        query = "INSERT INTO builds (version, name) VALUES (%s, %s) ;"
+        if self._run_query(query=query, params=(ver_id, build)):
             # Insert the data
             try:
                 rec_id = self.cursor.lastrowid
-                # Make sure data is committed to the database
-                self.cnx.commit()
+                if commit:
+                    # Make sure data is committed to the database
+                    self.cnx.commit()
+                self._ids.setdefault(("builds", ver_id), {})[build] = rec_id
                 return rec_id
             except Exception as err:
                 log.error(f"Can not insert {version}-{build} into builds - [{err}]")
                 return None
 
+    def _get_config_ids(self, version, build, platform, topology, test):
+        """
+        Getting the IDs of a test configuration
+
+        Returns:
+            tuple: (version, build, platform, topology, test) IDs, None if
+                one of them does not exist in the DB
+
+        """
+        ids = (
+            self.get_version_id(version=version),
+            self.get_build_id(version=version, build=build),
+            self.get_platform_id(platform=platform),
+            self.get_topology_id(topology=topology),
+            self.get_test_id(test=test),
+        )
+        return None if None in ids else ids
+
+    def _insert_config_ids(self, version, build, platform, topology, test):
+        """
+        Getting the IDs of a test configuration, missing values are inserted
+        into the DB without commit.
+
+        Returns:
+            tuple: (version, build, platform, topology, test) IDs, None if
+                insert of some value failed
+
+        """
+        ids = (
+            self.insert_single_value(table="versions", value=version, commit=False),
+            self.insert_build(version=version, build=build, commit=False),
+            self.insert_single_value(table="platform", value=platform, commit=False),
+            self.insert_single_value(table="az_topology", value=topology, commit=False),
+            self.insert_single_value(table="tests", value=test, commit=False),
+        )
+        return None if None in ids else ids
+
+    def _next_sample_by_ids(self, config_ids):
+        """
+        Getting the number of the next sample of test configuration given by
+        IDs (version, build, platform, topology, test)
+
+        Returns:
+            int: the number of the next sample, None if the query failed
+
+        """
+        query = (
+            "SELECT MAX(sample) FROM results WHERE version = %s AND "
+            "build = %s AND platform = %s AND az_topology = %s AND test_name = %s ;"
+        )
+        rows = self._fetch(query, config_ids)
+        if rows is None:
+            return None
+        last = rows[0][0] if rows else None
+        return 0 if last is None else last + 1
+
     def get_results(self, version, build, platform, topology, test):
         """
         Getting the results information (es_link, log_file) for all test samples
@@ -408,17 +574,17 @@ class PerfDash(object):
             return None
         results = {}
         query = (
-            f"SELECT sample,es_link,log_file FROM results WHERE version = {ver_id} "
-            f"AND build = {build_id} AND platform = {platform_id} AND "
-            f"az_topology = {topology_id} AND test_name = {test_id} ;"
+            "SELECT sample,es_link,log_file FROM results WHERE version = %s "
+            "AND build = %s AND platform = %s AND "
+            "az_topology = %s AND test_name = %s ;"
         )
-        if self._run_query(query=query):
-            for sample, eslink, logfile in self.cursor:
-                log.debug(f"{sample}, {eslink}, {logfile}")
-                results[sample] = {
-                    "eslink": eslink.rstrip("\r\n"),
-                    "log": logfile.rstrip("\r\n"),
-                }
+        rows = self._fetch(query, (ver_id, build_id, platform_id, topology_id, test_id))
+        for sample, eslink, logfile in rows or []:
+            log.debug(f"{sample}, {eslink}, {logfile}")
+            results[sample] = {
+                "eslink": eslink.rstrip("\r\n"),
+                "log": logfile.rstrip("\r\n"),
+            }
 
         return results
 
@@ -438,40 +604,11 @@ class PerfDash(object):
              int : the number of the next sample to insert to the DB
 
         """
-        ver_id = self.get_version_id(version=version)
-        if ver_id is None:
-            return 0
-
-        build_id = self.get_build_id(version=version, build=build)
-        if build_id is None:
-            return 0
-
-        platform_id = self.get_platform_id(platform)
-        if platform_id is None:
-            return 0
-
-        topology_id = self.get_topology_id(topology)
-        if topology_id is None:
+        config_ids = self._get_config_ids(version, build, platform, topology, test)
+        if config_ids is None:
             return 0
 
-        test_id = self.get_test_id(test)
-        if test_id is None:
-            return 0
-
-        results = []
-        query = (
-            f"SELECT sample FROM results WHERE version = {ver_id} AND "
-            f"build = {build_id} AND platform = {platform_id} AND "
-            f"az_topology = {topology_id} AND test_name = {test_id} ;"
-        )
-        if self._run_query(query=query):
-            for sample in self.cursor:
-                results.append(sample[0])
-
-        if len(results) == 0:
-            return 0
-        else:
-            return max(results) + 1
+        return self._next_sample_by_ids(config_ids) or 0
 
     def add_results(self, version, build, platform, topology, test, eslink, logfile):
         """
@@ -490,59 +627,87 @@ class PerfDash(object):
              bool : True if the operation succeed otherwise False
 
         """
-        ver_id = self.get_version_id(version=version)
-        if ver_id is None:
-            ver_id = self.insert_single_value(table="versions", value=version)
-            if ver_id is None:
-                return False
+        return self.add_results_batch(
+            [
+                {
+                    "version": version,
+                    "build": build,
+                    "platform": platform,
+                    "topology": topology,
+                    "test": test,
+                    "eslink": eslink,
+                    "logfile": logfile,
+                }
+            ]
+        )
 
-        build_id = self.get_build_id(version=version, build=build)
-        if build_id is None:
-            build_id = self.insert_build(version=version, build=build)
-            if build_id is None:
-                return False
+    def add_results_batch(self, results):
+        """
+        Adding results information of many tests into the DB, with single
+        multi-row insert and single commit. Samples of the same test
+        configuration get consecutive sample numbers.
 
-        platform_id = self.get_platform_id(platform)
-        if platform_id is None:
-            platform_id = self.insert_single_value(table="platform", value=platform)
-            if platform_id is None:
-                return False
+        Args:
+            results (list): dicts with the add_results() arguments as keys
+                (version, build, platform, topology, test, eslink, logfile)
 
-        topology_id = self.get_topology_id(topology)
-        if topology_id is None:
-            topology_id = self.insert_single_value(table="az_topology", value=topology)
-            if topology_id is None:
-                return False
+        Returns:
+             bool : True if the operation succeed otherwise False
 
-        test_id = self.get_test_id(test)
-        if test_id is None:
-            test_id = self.insert_single_value(table="tests", value=test)
-            if test_id is None:
+        """
+        rows = []
+        next_samples = {}
+        for res in results:
+            config_ids = self._insert_config_ids(
+                res["version"],
+                res["build"],
+                res["platform"],
+                res["topology"],
+                res["test"],
+            )
+            if config_ids is None:
+                self._rollback()
                 return False
-
-        sample = self.get_next_sample(
-            version=version,
-            build=build,
-            platform=platform,
-            topology=topology,
-            test=test,
+            sample = next_samples.get(config_ids)
+            if sample is None:
+                sample = self._next_sample_by_ids(config_ids)
+                if sample is None:
+                    self._rollback()
+                    return False
+            next_samples[config_ids] = sample + 1
+            rows.append((sample, *config_ids, res["eslink"], res["logfile"]))
+
+        if not rows:
+            return True
+        query = self._sql(
+            f"INSERT INTO results ({', '.join(RESULTS_COLUMNS)}) "
+            f"VALUES ({', '.join(['%s'] * len(RESULTS_COLUMNS))})"
         )
+        log.debug(f"Try to insert {len(rows)} results : {rows}")
+        try:
+            # mysql connector sends the rows as one multi-row insert
+            self.cursor.executemany(query, rows)
+            # Make sure data is committed to the database
+            self.cnx.commit()
+            log.info(f"Test results pushed to the DB! ({len(rows)} results)")
+            return True
+        except Exception as err:
+            log.error(f"Can not insert result into the DB - [{err}]")
+            self._rollback()
+            return False
 
-        query = (
-            f"INSERT INTO results "
-            "(sample, version, build, platform, az_topology, test_name, es_link, log_file) "
-            f"VALUES ({sample}, {ver_id}, {build_id}, {platform_id}, {topology_id}, "
-            f"{test_id}, '{eslink}', '{logfile}') ;"
-        )
-        if self._run_query(query=query):
-            try:
-                # Make sure data is committed to the database
-                self.cnx.commit()
-                log.info("Test results pushed to the DB!")
-                return True
-            except Exception as err:
-                log.error(f"Can not insert result into the DB - [{err}]")
-                return False
+    def _rollback(self):
+        """
+        Rollback the current transaction, the cached IDs are dropped as some
+        of them can belong to the rolled back inserts
+
+        """
+        try:
+            self.cnx.rollback()
+        except Exception as err:
+            log.error(f"Can not rollback the transaction - [{err}]")
+        self._ids.clear()
+        self._names.clear()
 
     def cleanup(self):
         """
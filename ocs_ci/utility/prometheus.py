@@ -537,7 +537,9 @@ class PrometheusAPI(object):
         # return actual result of the query
         return content["data"]["result"]
 
-    def query_range(self, query, start, end, step, timeout=None, validate=True):
+    def query_range(
+        self, query, start, end, step, timeout=None, validate=True, mute_logs=False
+    ):
         """
         Perform Prometheus `range query`_. This is a simple wrapper over
         ``get()`` method with plumbing code for range queries, additional
@@ -553,6 +555,7 @@ class PrometheusAPI(object):
             validate (bool): Perform basic validation on the response.
                 Optional, ``True`` is the default. Use ``False`` when you
                 expect query to fail eg. during negative testing.
+            mute_logs (bool): True for muting the logs, False otherwise
 
         Returns:
             list: result of the query
@@ -564,12 +567,13 @@ class PrometheusAPI(object):
             query_payload["timeout"] = timeout
         # Human readable summary of the query (details are logged by get
         # method itself with debug level).
-        logger.info(
-            (
-                f"Performing prometheus range query '{query}' "
-                f"over a time range ({start}, {end})"
+        if not mute_logs:
+            logger.info(
+                (
+                    f"Performing prometheus range query '{query}' "
+                    f"over a time range ({start}, {end})"
+                )
             )
-        )
         resp = self.get("query_range", payload=query_payload)
         try:
             content = yaml.safe_load(resp.content)
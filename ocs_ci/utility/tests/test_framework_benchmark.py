@@ -0,0 +1,63 @@
+# -*- coding: utf8 -*-
+
+
+from ocs_ci.utility.fake_kube import FakeKubeState, match_selector
+from ocs_ci.utility.framework_benchmark import (
+    BenchmarkResult,
+    FrameworkBenchmark,
+    compare_results,
+)
+
+
+def test_fake_kube_state():
+    state = FakeKubeState()
+    state.seed(pods=3, nodes=2)
+    stdout, _, rc = state.run(
+        ["--kubeconfig", "kc", "-n", "openshift-storage", "get", "Pod", "-o", "yaml"]
+    )
+    assert rc == 0
+    assert "benchmark-pod-2" in stdout
+    stdout, _, _ = state.run(
+        ["get", "pod", "benchmark-pod-1", "-n", "openshift-storage"]
+    )
+    assert stdout.splitlines()[1].split()[:3] == ["benchmark-pod-1", "1/1", "Running"]
+    _, stderr, rc = state.run(["get", "node", "worker-5"])
+    assert rc == 1
+    assert "NotFound" in stderr
+    assert state.calls["get"] == 3
+    assert match_selector({"app": "osd", "osd": "1"}, "app=osd,osd!=0")
+    assert not match_selector({"app": "osd"}, "app=osd,topology")
+
+
+def test_benchmark_counts_framework_overhead():
+    benchmark = FrameworkBenchmark(
+        cases=["ocp_wait_for_resource", "create_multiple_pvcs_burst"],
+        scales=[3],
+        trace_memory=False,
+    )
+    wait, burst = benchmark.run()
+    # the list of the pods, `oc get` for the status of every pod and one more
+    # list of all the pods loaded by OCP.data in get_resource
+    assert wait.oc_calls == {"get": 5}
+    assert wait.forks == 5
+    assert wait.yaml_loads == 5
+    # bulk creation sleeps one second per PVC
+    assert burst.oc_calls == {"create": 1}
+    assert burst.sleep_seconds == 3
+
+
+def test_compare_results():
+    baseline = [
+        {"case": "get_all_pods", "scale": 10, "wall_time": 1.0, "forks": 2},
+        {"case": "ocp_get", "scale": 10, "wall_time": 1.0, "forks": 1},
+    ]
+    results = [
+        BenchmarkResult("get_all_pods", 10, wall_time=1.2, forks=2),
+        BenchmarkResult("ocp_get", 10, wall_time=1.5, forks=2),
+        BenchmarkResult("get_node_objs", 10, wall_time=9.0, forks=9),
+    ]
+    regressions = compare_results(results, baseline, tolerance=0.25)
+    assert regressions == [
+        "ocp_get at scale 10: forks 2 > 1",
+        "ocp_get at scale 10: wall_time 1.5 > 1.0",
+    ]
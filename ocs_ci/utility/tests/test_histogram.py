@@ -0,0 +1,125 @@
+# -*- coding: utf8 -*-
+
+import json
+import random
+import textwrap
+
+import pytest
+
+from ocs_ci.utility.histogram import LatencyHistogram
+from ocs_ci.utility.workload_log_parser import FioTextLogParser, fio_latency_histogram
+
+
+@pytest.mark.parametrize("value", [0, 1, 255, 256, 511, 512, 1000, 10**6, 10**9])
+def test_bucket_range_contains_value(value):
+    histogram = LatencyHistogram()
+    low, high = histogram.bucket_range(histogram.bucket_index(value))
+    assert low <= value <= high
+    # relative error of the bucket is bounded by the precision
+    assert high - low <= max(1, value / 2 ** (histogram.sub_bucket_bits - 1))
+
+
+def test_percentiles_within_precision():
+    rng = random.Random(42)
+    values = sorted(int(rng.lognormvariate(7, 1)) for _ in range(10000))
+    histogram = LatencyHistogram()
+    for value in values:
+        histogram.record(value)
+    for percentile in (50, 99, 99.9):
+        exact = values[int(len(values) * percentile / 100) - 1]
+        assert histogram.value_at_percentile(percentile) == pytest.approx(
+            exact, rel=0.01
+        )
+    assert histogram.value_at_percentile(100) == values[-1]
+    assert histogram.min == values[0]
+
+
+def test_merge_equals_recording_all():
+    first, second, both = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+    for value in range(0, 5000, 7):
+        first.record(value)
+        both.record(value)
+    for value in range(3000, 90000, 13):
+        second.record(value, 2)
+        both.record(value, 2)
+    merged = LatencyHistogram.merged([first, second])
+    assert merged.to_dict() == both.to_dict()
+    assert merged.percentiles() == both.percentiles()
+
+
+def test_merge_incompatible():
+    with pytest.raises(ValueError):
+        LatencyHistogram(unit="us").merge(LatencyHistogram(unit="ms"))
+
+
+def test_serialization_roundtrip():
+    histogram = LatencyHistogram()
+    for value in (5, 500, 5000, 50000):
+        histogram.record(value, 3)
+    data = json.loads(json.dumps(histogram.to_dict()))
+    restored = LatencyHistogram.from_dict(data)
+    assert restored.summary() == histogram.summary()
+    assert set(histogram.percentiles()) == {"p50", "p90", "p95", "p99", "p99_9"}
+
+
+def test_empty_histogram():
+    histogram = LatencyHistogram()
+    assert histogram.value_at_percentile(99) is None
+    assert histogram.summary()["mean"] is None
+
+
+def test_record_percentiles():
+    histogram = LatencyHistogram()
+    histogram.record_percentiles({"50.000000": 100, "99.000000": 200}, total=1000)
+    assert histogram.total == 1000
+    assert histogram.value_at_percentile(50) == 100
+    assert histogram.value_at_percentile(99) == 200
+    assert histogram.value_at_percentile(100) == 200
+
+
+def test_fio_latency_histogram():
+    report = {
+        "jobs": [
+            {
+                "read": {"clat_ns": {"N": 0}},
+                "write": {
+                    "clat_ns": {
+                        "N": 100,
+                        "percentile": {"50.000000": 1000000, "99.000000": 4000000},
+                    }
+                },
+            },
+            {"write": {"clat_ns": {"N": 10, "bins": {"2000": 5, "3000": 5}}}},
+        ]
+    }
+    histogram = fio_latency_histogram(report)
+    assert histogram.total == 110
+    assert histogram.min == 2
+    assert histogram.value_at_percentile(50) == pytest.approx(1000, rel=0.01)
+    assert fio_latency_histogram(None).total == 0
+
+
+def test_fio_text_parser():
+    output = textwrap.dedent(
+        """\
+        job: (groupid=0, jobs=4): err= 0: pid=1: Tue Jan  1 00:00:00 2025
+          write: IOPS=100, BW=25.0MiB/s (26.2MB/s)(3000MiB/120001msec)
+            clat (usec): min=190, max=9110, avg=500.12, stdev=20.00
+             lat (usec): min=191, max=9111, avg=501.00, stdev=20.00
+            clat percentiles (usec):
+             |  1.00th=[  190],  5.00th=[  210], 10.00th=[  223], 50.00th=[  400],
+             | 99.00th=[ 1205], 99.90th=[ 3261],
+             | 99.99th=[ 9110]
+          lat (usec)   : 250=10.00%, 500=50.00%
+          IO depths    : 1=100.0%, 2=0.0%
+             issued rwts: total=0,12000,0,0 short=0,0,0,0 dropped=0,0,0,0
+        """
+    )
+    parser = FioTextLogParser()
+    parser.feed_text(output)
+    result = parser.result()
+    assert result["write"]["total"] == 12000
+    assert result["write"]["percentiles"]["99.90"] == 3261
+    histogram = parser.histogram()
+    assert histogram.total == 12000
+    assert histogram.value_at_percentile(99) == pytest.approx(1205, rel=0.01)
@@ -0,0 +1,60 @@
+# -*- coding: utf8 -*-
+
+import time
+
+import pytest
+
+from ocs_ci.framework import Config, config
+from ocs_ci.ocs.exceptions import TimeoutExpiredError
+from ocs_ci.utility.multicluster import run_on_clusters
+
+
+@pytest.fixture
+def clusters(monkeypatch):
+    cluster_configs = []
+    for i in range(3):
+        cluster = Config()
+        cluster.ENV_DATA["cluster_name"] = f"cluster-{i}"
+        cluster.MULTICLUSTER["multicluster_index"] = i
+        cluster_configs.append(cluster)
+    monkeypatch.setattr(config, "clusters", cluster_configs)
+    monkeypatch.setattr(config, "cur_index", 0)
+    return cluster_configs
+
+
+def test_run_on_clusters_uses_cluster_config(clusters):
+    def task(cluster_ctx):
+        # config object resolves to the cluster of the task
+        return cluster_ctx.name, config.ENV_DATA["cluster_name"]
+
+    results = run_on_clusters(task, skip_index=1)
+    assert list(results) == [0, 2]
+    assert results[2].value == ("cluster-2", "cluster-2")
+    assert config.cur_index == 0
+
+
+def test_run_on_clusters_runs_in_parallel(clusters):
+    start = time.time()
+    results = run_on_clusters(lambda cluster_ctx: time.sleep(0.5))
+    assert time.time() - start < 1
+    assert all(result.ok for result in results.values())
+
+
+def test_run_on_clusters_partial_failure(clusters):
+    def task(cluster_ctx, fail_index):
+        if cluster_ctx.index == fail_index:
+            raise ValueError("failed")
+        return cluster_ctx.index
+
+    results = run_on_clusters(task, 1)
+    assert isinstance(results[1].error, ValueError)
+    assert results[0].value == 0
+    assert results[2].value == 2
+
+
+def test_run_on_clusters_timeout(clusters):
+    results = run_on_clusters(
+        lambda cluster_ctx: time.sleep(1 if cluster_ctx.index else 0), timeout=0.3
+    )
+    assert results[0].ok
+    assert isinstance(results[1].error, TimeoutExpiredError)
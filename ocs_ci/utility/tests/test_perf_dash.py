@@ -0,0 +1,84 @@
+# -*- coding: utf8 -*-
+
+import sqlite3
+
+import pytest
+
+from ocs_ci.utility.perf_dash.dashboard_api import PerfDash
+
+SCHEMA = """
+CREATE TABLE versions (id INTEGER PRIMARY KEY, name TEXT);
+CREATE TABLE platform (id INTEGER PRIMARY KEY, name TEXT);
+CREATE TABLE az_topology (id INTEGER PRIMARY KEY, name TEXT);
+CREATE TABLE tests (id INTEGER PRIMARY KEY, name TEXT);
+CREATE TABLE builds (id INTEGER PRIMARY KEY, version INTEGER, name TEXT);
+CREATE TABLE results (
+    id INTEGER PRIMARY KEY, sample INTEGER, version INTEGER, build INTEGER,
+    platform INTEGER, az_topology INTEGER, test_name INTEGER, es_link TEXT,
+    log_file TEXT
+);
+"""
+
+
+@pytest.fixture
+def connection():
+    cnx = sqlite3.connect(":memory:")
+    cnx.executescript(SCHEMA)
+    yield cnx
+    cnx.close()
+
+
+def result(test, eslink, build="RC1"):
+    return {
+        "version": "4.18",
+        "build": build,
+        "platform": "AWS",
+        "topology": "3-AZ",
+        "test": test,
+        "eslink": eslink,
+        "logfile": "",
+    }
+
+
+def test_add_results_batch(connection):
+    db = PerfDash(connection=connection, paramstyle="qmark")
+    assert db.add_results_batch(
+        [result("FIO", "es/1"), result("FIO", "es/2"), result("SmallFiles", "es/3")]
+    )
+    assert db.get_results("4.18", "RC1", "AWS", "3-AZ", "FIO") == {
+        0: {"eslink": "es/1", "log": ""},
+        1: {"eslink": "es/2", "log": ""},
+    }
+    assert db.get_next_sample("4.18", "RC1", "AWS", "3-AZ", "FIO") == 2
+    assert db.get_next_sample("4.18", "RC1", "AWS", "3-AZ", "SmallFiles") == 1
+    assert db.get_next_sample("4.18", "RC2", "AWS", "3-AZ", "FIO") == 0
+    assert db.get_version_builds("4.18") == {"RC1": 1}
+
+
+def test_ids_are_cached(connection):
+    db = PerfDash(connection=connection, paramstyle="qmark")
+    assert db.add_results(**result("FIO", "es/1"))
+    statements = []
+    connection.set_trace_callback(statements.append)
+    assert db.add_results(**result("FIO", "es/2"))
+    selects = [s for s in statements if s.startswith("SELECT")]
+    # only the next sample number is queried
+    assert len(selects) == 1
+    assert db.get_test_name(db.get_test_id("FIO")) == "FIO"
+    assert db.get_platform_id("AWS") == 1
+
+
+def test_names_are_query_parameters(connection):
+    db = PerfDash(connection=connection, paramstyle="qmark")
+    assert db.add_results(**result("FIO'; DROP TABLE tests; --", "es/'1'"))
+    assert db.get_test_id("FIO'; DROP TABLE tests; --") == 1
+    with pytest.raises(ValueError):
+        db.get_id_by_name("results", "x")
+
+
+def test_failed_batch_is_rolled_back(connection):
+    db = PerfDash(connection=connection, paramstyle="qmark")
+    connection.execute("DROP TABLE results")
+    assert not db.add_results_batch([result("FIO", "es/1")])
+    assert connection.execute("SELECT COUNT(*) FROM tests").fetchone()[0] == 0
+    assert db.get_test_id("FIO") is None
@@ -0,0 +1,51 @@
+# -*- coding: utf8 -*-
+
+from ocs_ci.utility.timeseries import TimeSeries, TimeSeriesStore
+
+
+def test_timeseries_raw_window():
+    series = TimeSeries(raw_size=100, resolutions=((10, 10),))
+    for ts in range(50):
+        series.add(ts, float(ts))
+    stats = series.stats(10, 19)
+    assert stats["count"] == 10
+    assert stats["min"] == 10
+    assert stats["max"] == 19
+    assert stats["avg"] == 14.5
+    assert stats["last"] == 19
+
+
+def test_timeseries_downsampled_window():
+    series = TimeSeries(raw_size=10, resolutions=((10, 100),))
+    for ts in range(100):
+        series.add(ts, float(ts))
+    # raw samples cover only the last 10 seconds, so older windows are
+    # answered from 10 seconds buckets
+    stats = series.stats(20, 39)
+    assert stats["count"] == 20
+    assert stats["min"] == 20
+    assert stats["max"] == 39
+    assert stats["avg"] == 29.5
+
+
+def test_timeseries_constant_memory():
+    series = TimeSeries(raw_size=10, resolutions=((10, 5), (100, 2)))
+    for ts in range(10000):
+        series.add(ts, 1.0)
+    assert len(series.raw) == 10
+    assert [len(buckets) for _, buckets in series.resolutions] == [5, 2]
+    stats = series.stats()
+    assert stats["count"] == 200
+    assert stats["avg"] == 1.0
+
+
+def test_timeseries_store():
+    store = TimeSeriesStore(raw_size=10)
+    store.add("node-a", "cpu_percent", 1, 10.0)
+    store.add("node-a", "cpu_percent", 2, 30.0)
+    store.add("node-b", "memory_percent", 1, 50.0)
+    assert store.stats("node-a", "cpu_percent")["avg"] == 20.0
+    assert store.stats("node-c", "cpu_percent")["count"] == 0
+    window = store.window_stats(2, 2)
+    assert window["node-a"]["cpu_percent"]["max"] == 30.0
+    assert window["node-b"]["memory_percent"]["count"] == 0
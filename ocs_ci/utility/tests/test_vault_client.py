@@ -0,0 +1,120 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from ocs_ci.ocs.exceptions import VaultOperationError
+from ocs_ci.utility.vault_client import VaultClient, kv_secret_data
+
+TOKEN = "s.test-token"
+# mount: KV version
+MOUNTS = {"ocs-kv2/": 2, "ocs-kv1/": 1}
+
+
+class FakeVault(ThreadingHTTPServer):
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), FakeVaultHandler)
+        self.secrets = {}
+        self.requests = []
+        self.connections = set()
+
+    @property
+    def addr(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class FakeVaultHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def reply(self, code, body=None):
+        content = json.dumps(body).encode() if body is not None else b""
+        self.send_response(code)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def handle_request(self):
+        server = self.server
+        server.requests.append((self.command, self.path))
+        server.connections.add(self.client_address)
+        if self.headers.get("X-Vault-Token") != TOKEN:
+            return self.reply(403, {"errors": ["permission denied"]})
+        path = self.path[len("/v1/") :]
+        if path.startswith("sys/internal/ui/mounts/"):
+            path = path[len("sys/internal/ui/mounts/") :] + "/"
+            for mount, kv_version in MOUNTS.items():
+                if path.startswith(mount):
+                    return self.reply(
+                        200,
+                        {"data": {"path": mount, "options": {"version": kv_version}}},
+                    )
+            return self.reply(404, {"errors": []})
+        mount = path.split("/")[0] + "/"
+        rest = path[len(mount) :]
+        if MOUNTS.get(mount) == 2:
+            prefix, _, rest = rest.partition("/")
+            assert prefix == ("metadata" if self.command == "LIST" else "data")
+        secrets = server.secrets.get(mount, {})
+        if self.command == "LIST":
+            if not secrets:
+                return self.reply(404, {"errors": []})
+            return self.reply(200, {"data": {"keys": sorted(secrets)}})
+        if rest not in secrets:
+            return self.reply(404, {"errors": []})
+        data = secrets[rest]
+        if MOUNTS[mount] == 2:
+            data = {"data": data, "metadata": {"version": 1}}
+        return self.reply(200, {"data": data})
+
+    do_GET = handle_request
+    do_LIST = handle_request
+
+
+@pytest.fixture
+def vault():
+    server = FakeVault()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_bulk_key_check_and_reads(vault):
+    handles = [f"0001-0011-openshift-storage-{i:04d}" for i in range(200)]
+    vault.secrets["ocs-kv2/"] = {
+        handle: {"passphrase": f"secret-{handle}"} for handle in handles
+    }
+    vault.secrets["ocs-kv2/"]["rook-ceph-osd-encryption-key-ocs-deviceset-0"] = {
+        "rook-ceph-osd-encryption-key-ocs-deviceset-0": "osd-key"
+    }
+    client = VaultClient(addr=vault.addr, token=TOKEN)
+    missing = client.missing_keys(
+        "ocs-kv2", handles + ["ocs-deviceset-0", "not-created-handle"]
+    )
+    assert missing == ["not-created-handle"]
+    # one mount detection and one listing for all the keys
+    assert len(vault.requests) == 2
+
+    for handle in handles[:50]:
+        data = kv_secret_data(client.kv_get(f"ocs-kv2/{handle}"))
+        assert data["passphrase"] == f"secret-{handle}"
+    assert client.kv_get("ocs-kv2/not-created-handle") is None
+    # the mount is detected once and the connection is reused
+    assert len(vault.requests) == 53
+    assert len(vault.connections) == 1
+
+
+def test_kv_v1_and_errors(vault):
+    vault.secrets["ocs-kv1/"] = {"key": {"passphrase": "v1-secret"}}
+    client = VaultClient(addr=vault.addr, token=TOKEN)
+    assert kv_secret_data(client.kv_get("ocs-kv1/key")) == {"passphrase": "v1-secret"}
+    assert client.kv_list("ocs-kv2") == []
+    with pytest.raises(VaultOperationError, match="No secrets engine"):
+        client.kv_list("unknown-path")
+    with pytest.raises(VaultOperationError, match="403"):
+        VaultClient(addr=vault.addr, token="wrong").kv_list("ocs-kv1")
@@ -0,0 +1,106 @@
+# -*- coding: utf8 -*-
+
+import textwrap
+
+
+from ocs_ci.utility.utils import parse_pgsql_logs
+from ocs_ci.utility.workload_log_parser import (
+    IntervalStats,
+    PgbenchLogParser,
+    PillowfightLogParser,
+)
+
+PILLOWFIGHT_LOG = textwrap.dedent(
+    """\
+    Running. Press Ctrl-C to terminate...
+    OPS/SEC: 2500
+    OPS/SEC: 3500
+    OPS/SEC: bad
+    [100 - 199]us |######## - 120
+    [200 - 299]us |## - 30
+    [1 - 2]ms |# - 5
+    """
+)
+
+PGBENCH_LOG = textwrap.dedent(
+    """\
+    progress: 5.0 s, 100.0 tps, lat 10.0 ms stddev 1.0
+    progress: 10.0 s, 300.0 tps, lat 20.0 ms stddev 2.0
+    PGBench Results {'scaling_factor': 1, 'number_of_clients': 2,
+     'number_of_threads': 3, 'number_of_transactions_per_client': 100,
+     'number_of_transactions_actually_processed':
+     200, 'latency_average_ms': 7, 'latency_stddev_ms': 0,
+     'tps_incl_con_est': 234, 'tps_excl_con_est': 243}
+    progress: 5.0 s, 200.0 tps, lat 15.0 ms stddev 1.5
+    PGBench Results {'scaling_factor': 1, 'number_of_clients': 4,
+     'number_of_threads': 3}
+    """
+)
+
+
+def test_interval_stats():
+    stats = IntervalStats()
+    assert stats.summary()["avg"] is None
+    for value in range(1, 101):
+        stats.add(value)
+    summary = stats.summary()
+    assert summary["count"] == 100
+    assert summary["min"] == 1
+    assert summary["max"] == 100
+    assert summary["avg"] == 50.5
+    assert summary["p50"] == 50.5
+
+
+def test_pillowfight_parser():
+    result = PillowfightLogParser().feed_text(PILLOWFIGHT_LOG)
+    assert result["opspersec"] == [2500, 3500]
+    assert result["resptimes"] == {
+        199: {"minindx": 100, "number": 120},
+        299: {"minindx": 200, "number": 30},
+        2000: {"minindx": 1000, "number": 5},
+    }
+    assert result["opspersec_stats"]["avg"] == 3000
+
+
+def test_pgbench_parser_matches_runs():
+    parser = PgbenchLogParser()
+    result = parser.feed_lines(PGBENCH_LOG.splitlines(keepends=True))
+    assert result == [
+        {
+            1: {
+                "scaling_factor": "1",
+                "num_clients": "2",
+                "num_threads": "3",
+                "number_of_transactions_per_client": "100",
+                "number_of_transactions_actually_processed": "200",
+                "latency_avg": "7",
+                "lat_stddev": "0",
+                "tps_incl": "234",
+                "tps_excl": "243",
+            }
+        },
+        {2: {"scaling_factor": "1", "num_clients": "4", "num_threads": "3"}},
+    ]
+    assert parse_pgsql_logs(PGBENCH_LOG) == result
+    progress = parser.progress_summary()
+    assert progress["tps"]["count"] == 3
+    assert progress["tps"]["max"] == 300.0
+    assert progress["latency_ms"]["avg"] == 15.0
+
+
+def test_pgbench_parser_histogram():
+    parser = PgbenchLogParser()
+    parser.feed_text(PGBENCH_LOG)
+    histogram = parser.histogram()
+    # 5 s intervals, elapsed time restarts with the second run
+    assert histogram.total == 500 + 1500 + 1000
+    assert histogram.min == 10000
+    assert histogram.max == 20000
+
+
+def test_pillowfight_parser_histogram():
+    parser = PillowfightLogParser()
+    parser.feed_text(PILLOWFIGHT_LOG)
+    histogram = parser.histogram()
+    assert histogram.total == 155
+    assert histogram.max == 2000
@@ -0,0 +1,216 @@
+"""
+Compact in-memory time-series store with downsampling.
+"""
+
+import threading
+from collections import deque
+
+# (bucket size in seconds, number of buckets) of downsampled resolutions,
+# default keeps 1 minute buckets for 6 hours and 10 minutes buckets for 2 days
+DEFAULT_RESOLUTIONS = ((60, 360), (600, 288))
+
+
+def empty_stats():
+    """
+    Statistics of a window without any samples.
+
+    Returns:
+        dict: with ``count``, ``min``, ``max``, ``avg`` and ``last`` keys
+
+    """
+    return {"count": 0, "min": None, "max": None, "avg": None, "last": None}
+
+
+def _covers(buffer, oldest, t0):
+    """
+    Whether the ring buffer holds all data since t0, which is true when the
+    oldest item is not newer than t0 or nothing was evicted yet.
+    """
+    return bool(buffer) and (oldest <= t0 or len(buffer) < buffer.maxlen)
+
+
+class Bucket:
+    """
+    Aggregate of samples which fall into one time bucket.
+    """
+
+    __slots__ = ("start", "count", "total", "min", "max")
+
+    def __init__(self, start):
+        """
+        Args:
+            start (float): Start timestamp of the bucket
+
+        """
+        self.start = start
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def add(self, value):
+        """
+        Add sample value to the bucket.
+
+        Args:
+            value (float): Sample value
+
+        """
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+
+class TimeSeries:
+    """
+    Single metric series with raw samples and downsampled resolutions.
+    """
+
+    def __init__(self, raw_size=720, resolutions=DEFAULT_RESOLUTIONS):
+        """
+        Args:
+            raw_size (int): Number of the newest raw samples to keep
+            resolutions (tuple): Tuples of (bucket size in seconds, number of
+                buckets) of downsampled resolutions, from the finest
+
+        """
+        self.raw = deque(maxlen=raw_size)
+        self.resolutions = [
+            (size, deque(maxlen=count)) for size, count in sorted(resolutions)
+        ]
+        self._current = [None] * len(self.resolutions)
+        self._lock = threading.Lock()
+
+    def add(self, timestamp, value):
+        """
+        Add sample to the series, samples are expected in time order.
+
+        Args:
+            timestamp (float): Timestamp of the sample in seconds
+            value (float): Sample value
+
+        """
+        with self._lock:
+            self.raw.append((timestamp, value))
+            for i, (size, buckets) in enumerate(self.resolutions):
+                start = timestamp - timestamp % size
+                current = self._current[i]
+                if current is None or current.start != start:
+                    current = Bucket(start)
+                    self._current[i] = current
+                    buckets.append(current)
+                current.add(value)
+
+    def _aggregates(self, t0, t1):
+        """
+        Get aggregates (start, count, sum, min, max) covering given window from
+        the finest resolution which still holds data for the window start.
+        """
+        if _covers(self.raw, self.raw and self.raw[0][0], t0):
+            return [(ts, 1, v, v, v) for ts, v in self.raw if t0 <= ts <= t1]
+        if not self.resolutions:
+            return []
+        for size, buckets in self.resolutions:
+            if _covers(buckets, buckets and buckets[0].start, t0):
+                break
+        return [
+            (b.start, b.count, b.total, b.min, b.max)
+            for b in buckets
+            if b.start + size > t0 and b.start <= t1
+        ]
+
+    def stats(self, t0=None, t1=None):
+        """
+        Statistics of the series over window [t0, t1]. For windows older than
+        raw samples retention, the window is rounded to the downsampled buckets.
+
+        Args:
+            t0 (float): Window start timestamp, the oldest data by default
+            t1 (float): Window end timestamp, the newest data by default
+
+        Returns:
+            dict: with ``count``, ``min``, ``max``, ``avg`` and ``last`` keys,
+                values are None if there are no samples in the window
+
+        """
+        t0 = float("-inf") if t0 is None else t0
+        t1 = float("inf") if t1 is None else t1
+        with self._lock:
+            aggregates = self._aggregates(t0, t1)
+        stats = empty_stats()
+        if not aggregates:
+            return stats
+        count = sum(a[1] for a in aggregates)
+        stats["count"] = count
+        stats["min"] = min(a[3] for a in aggregates)
+        stats["max"] = max(a[4] for a in aggregates)
+        stats["avg"] = sum(a[2] for a in aggregates) / count
+        last = aggregates[-1]
+        stats["last"] = last[2] / last[1]
+        return stats
+
+
+class TimeSeriesStore:
+    """
+    Collection of time series identified by (entity, metric) key, e.g.
+    (node name, "cpu_percent").
+    """
+
+    def __init__(self, raw_size=720, resolutions=DEFAULT_RESOLUTIONS):
+        """
+        Args:
+            raw_size (int): Number of the newest raw samples kept per series
+            resolutions (tuple): Downsampled resolutions, see :class:`TimeSeries`
+
+        """
+        self.raw_size = raw_size
+        self.resolutions = resolutions
+        self.series = {}
+        self._lock = threading.Lock()
+
+    def add(self, entity, metric, timestamp, value):
+        """
+        Add sample to the series of given entity and metric.
+
+        Args:
+            entity (str): Entity the sample belongs to (e.g. node name)
+            metric (str): Metric name
+            timestamp (float): Timestamp of the sample in seconds
+            value (float): Sample value
+
+        """
+        key = (entity, metric)
+        with self._lock:
+            series = self.series.get(key)
+            if series is None:
+                series = TimeSeries(self.raw_size, self.resolutions)
+                self.series[key] = series
+        series.add(timestamp, value)
+
+    def stats(self, entity, metric, t0=None, t1=None):
+        """
+        Statistics of one series over window [t0, t1].
+
+        Returns:
+            dict: Statistics as returned by :meth:`TimeSeries.stats`, empty
+                statistics if the series does not exist
+
+        """
+        series = self.series.get((entity, metric))
+        if series is None:
+            return empty_stats()
+        return series.stats(t0, t1)
+
+    def window_stats(self, t0=None, t1=None):
+        """
+        Statistics of all the series over window [t0, t1].
+
+        Returns:
+            dict: {entity: {metric: stats}}
+
+        """
+        result = {}
+        for (entity, metric), series in list(self.series.items()):
+            result.setdefault(entity, {})[metric] = series.stats(t0, t1)
+        return result
@@ -538,7 +538,8 @@ def run_cmd_multicluster(
 ):
     """
     Run command on multiple clusters. Useful in multicluster scenarios
-    This is wrapper around exec_cmd
+    This is wrapper around exec_cmd, the command is executed on all the clusters
+    in parallel without switching the global config context.
 
     Args:
         cmd (str): command to be run
@@ -551,7 +552,8 @@ def run_cmd_multicluster(
         skip_index (list of int): List of indexes that needs to be skipped from executing the command
 
     Raises:
-        CommandFailed: In case the command execution fails
+        CommandFailed: In case the command execution fails on any of the clusters,
+            raised once the command finished on all the clusters
 
     Returns:
         list : of CompletedProcess objects as per cluster's index in config.clusters
@@ -559,40 +561,34 @@ def run_cmd_multicluster(
             if command execution skipped on a particular cluster then corresponding entry will have None
 
     """
+    from ocs_ci.utility.multicluster import run_on_clusters
+
+    def _exec_cmd(cluster_ctx):
+        return exec_cmd(
+            cmd,
+            secrets=secrets,
+            timeout=timeout,
+            ignore_error=ignore_error,
+            cluster_config=config.clusters[cluster_ctx.index],
+            **kwargs,
+        )
+
     # Skip indexed cluster while running commands
     # Useful to skip operations on ACM cluster
-    restore_ctx_index = config.cur_index
+    if skip_index is not None:
+        log.warning(f"skipping index = {skip_index}")
+    results = run_on_clusters(_exec_cmd, skip_index=skip_index)
     completed_process = [None] * len(config.clusters)
-    # this need's to be done to skip none value as skip_index accepts type none
-    if not isinstance(skip_index, list):
-        skip_index = [skip_index]
-    for cluster in config.clusters:
-        if cluster.MULTICLUSTER["multicluster_index"] in skip_index:
-            log.warning(f"skipping index = {skip_index}")
-            continue
-        else:
-            config.switch_ctx(cluster.MULTICLUSTER["multicluster_index"])
-            log.info(
-                f"Switched the context to cluster:{cluster.ENV_DATA['cluster_name']}"
-            )
-            try:
-                completed_process[cluster.MULTICLUSTER["multicluster_index"]] = (
-                    exec_cmd(
-                        cmd,
-                        secrets=secrets,
-                        timeout=timeout,
-                        ignore_error=ignore_error,
-                        **kwargs,
-                    )
-                )
-            except CommandFailed:
-                # In case of failure, restore the cluster context to where we started
-                config.switch_ctx(restore_ctx_index)
-                log.error(
-                    f"Command {cmd} execution failed on cluster {cluster.ENV_DATA['cluster_name']} "
-                )
-                raise
-    config.switch_ctx(restore_ctx_index)
+    for index, result in results.items():
+        completed_process[index] = result.value
+    failed = [result for result in results.values() if not result.ok]
+    for result in failed:
+        log.error(
+            f"Command {cmd} execution failed on cluster {result.cluster_name}: "
+            f"{result.error}"
+        )
+    if failed:
+        raise failed[0].error
     return completed_process
 
 
@@ -2358,46 +2354,9 @@ def parse_pgsql_logs(data):
                 where keys{1,2,3} are run-IDs
 
     """
-    match = data.split("PGBench Results")
-    list_data = []
-    for i in range(1, len(match)):
-        log = "".join(match[i].split("\n"))
-        pgsql_data = dict()
-        pgsql_data[i] = {}
-        clients = re.search(r"scaling_factor\':\s+(\d+),", log)
-        if clients and clients.group(1):
-            pgsql_data[i]["scaling_factor"] = clients.group(1)
-        clients = re.search(r"number_of_clients\':\s+(\d+),", log)
-        if clients and clients.group(1):
-            pgsql_data[i]["num_clients"] = clients.group(1)
-        threads = re.search(r"number_of_threads\':\s+(\d+)", log)
-        if threads and threads.group(1):
-            pgsql_data[i]["num_threads"] = threads.group(1)
-        clients = re.search(r"number_of_transactions_per_client\':\s+(\d+),", log)
-        if clients and clients.group(1):
-            pgsql_data[i]["number_of_transactions_per_client"] = clients.group(1)
-        clients = re.search(
-            r"number_of_transactions_actually_processed\':\s+(\d+),", log
-        )
-        if clients and clients.group(1):
-            pgsql_data[i]["number_of_transactions_actually_processed"] = clients.group(
-                1
-            )
-        lat_avg = re.search(r"latency_average_ms\':\s+(\d+)", log)
-        if lat_avg and lat_avg.group(1):
-            pgsql_data[i]["latency_avg"] = lat_avg.group(1)
-        lat_stddev = re.search(r"latency_stddev_ms\':\s+(\d+)", log)
-        if lat_stddev and lat_stddev.group(1):
-            pgsql_data[i]["lat_stddev"] = lat_stddev.group(1)
-        tps_incl = re.search(r"tps_incl_con_est\':\s+(\w+)", log)
-        if tps_incl and tps_incl.group(1):
-            pgsql_data[i]["tps_incl"] = tps_incl.group(1)
-        tps_excl = re.search(r"tps_excl_con_est\':\s+(\w+)", log)
-        if tps_excl and tps_excl.group(1):
-            pgsql_data[i]["tps_excl"] = tps_excl.group(1)
-        list_data.append(pgsql_data)
-
-    return list_data
+    from ocs_ci.utility.workload_log_parser import PgbenchLogParser
+
+    return PgbenchLogParser().feed_text(data)
 
 
 def create_directory_path(path):
@@ -2657,7 +2616,9 @@ def ceph_health_recover(health_status, namespace=None):
             )
 
 
-def ceph_health_check(namespace=None, tries=20, delay=30, fix_ceph_health=False):
+def ceph_health_check(
+    namespace=None, tries=20, delay=30, fix_ceph_health=False, max_age=0
+):
     """
     Args:
         namespace (str): Namespace of OCS
@@ -2666,6 +2627,8 @@ def ceph_health_check(namespace=None, tries=20, delay=30, fix_ceph_health=False)
         delay (int): Delay in seconds between retries
         fix_ceph_health (bool): If True, it will try to fix the health to be OK
             even if it will recover, we will get an exception CephHealthRecoveredException
+        max_age (float): Max age in seconds of the cached Ceph state the first
+            try can use, 0 to always query the cluster
 
     Returns:
         bool: ceph_health_check_base return value with default retries of 20,
@@ -2684,18 +2647,22 @@ def ceph_health_check(namespace=None, tries=20, delay=30, fix_ceph_health=False)
         tries=tries,
         delay=delay,
         backoff=1,
-    )(ceph_health_check_base)(namespace, fix_ceph_health)
+    )(ceph_health_check_base)(namespace, fix_ceph_health, max_age)
 
 
-def ceph_health_check_base(namespace=None, fix_ceph_health=False):
+def ceph_health_check_base(namespace=None, fix_ceph_health=False, max_age=0):
     """
-    Exec `ceph health` cmd on tools pod to determine health of cluster.
+    Exec `ceph health` cmd on tools pod to determine health of cluster, or
+    use the cached Ceph state snapshot when max_age is provided.
 
     Args:
         namespace (str): Namespace of OCS
             (default: config.ENV_DATA['cluster_namespace'])
         fix_ceph_health (bool): If True, it will try to fix the health to be OK
             even if it will recover, we will get an exception CephHealthRecoveredException
+        max_age (float): Max age of the cached Ceph state snapshot in seconds,
+            the snapshot is fetched when the cached one is older. With 0 (the
+            default) only `ceph health` is run on the cluster
 
     Raises:
         CephHealthException: If the ceph health returned is not HEALTH_OK
@@ -2706,13 +2673,24 @@ def ceph_health_check_base(namespace=None, fix_ceph_health=False):
         boolean: True if HEALTH_OK
 
     """
+    # Import here to avoid circular loop
+    from ocs_ci.ocs.ceph_snapshot import (
+        get_ceph_snapshot_cache,
+        invalidate_ceph_snapshot,
+    )
+
     namespace = namespace or config.ENV_DATA["cluster_namespace"]
-    health = run_ceph_health_cmd(namespace)
+    if max_age:
+        health = get_ceph_snapshot_cache(namespace).get(max_age=max_age).health
+    else:
+        health = run_ceph_health_cmd(namespace)
 
     if health.strip() == "HEALTH_OK":
         log.info("Ceph cluster health is HEALTH_OK.")
         return True
     else:
+        # the cached checks (e.g. retry) have to see the current state
+        invalidate_ceph_snapshot(namespace)
         if fix_ceph_health:
             ceph_health_recover(health, namespace)
         raise CephHealthException(f"Ceph cluster health is not OK. Health: {health}")
@@ -3515,7 +3493,7 @@ def get_cluster_name(cluster_path):
     return metadata["clusterName"]
 
 
-def skipif_ocp_version(expressions):
+def skipif_ocp_version(expressions, ocp_version=None):
     """
     This function evaluates the condition for test skip
     based on expression
@@ -3524,12 +3502,14 @@ def skipif_ocp_version(expressions):
         expressions (str OR list): condition for which we need to check,
         eg: A single expression string '>=4.2' OR
             A list of expressions like ['<4.3', '>4.2'], ['<=4.3', '>=4.2']
+        ocp_version (str): Already known running OCP version, it is fetched
+            from the cluster if not provided
 
     Return:
         'True' if test needs to be skipped else 'False'
 
     """
-    ocp_version = get_running_ocp_version()
+    ocp_version = ocp_version or get_running_ocp_version()
     expr_list = [expressions] if isinstance(expressions, str) else expressions
     return any(
         version_module.compare_versions(ocp_version + expr) for expr in expr_list
@@ -3556,19 +3536,20 @@ def skipif_ocs_version(expressions):
     )
 
 
-def skipif_ui_not_support(ui_test):
+def skipif_ui_not_support(ui_test, locators=None):
     """
     This function evaluates the condition for ui test skip
     based on ui_test expression
 
     Args:
         ui_test (str): condition for which we need to check,
+        locators (dict): Already loaded locators of the current OCP version,
+            they are loaded if not provided
 
     Return:
         'True' if test needs to be skipped else 'False'
 
     """
-    from ocs_ci.ocs.ui.views import locators_for_current_ocp_version
 
     if (
         (
@@ -3580,11 +3561,11 @@ def skipif_ui_not_support(ui_test):
         or config.ENV_DATA["platform"].lower() == constants.ROSA_PLATFORM
     ):
         return True
-    try:
-        locators_for_current_ocp_version()[ui_test]
-    except KeyError:
-        return True
-    return False
+    if locators is None:
+        from ocs_ci.ocs.ui.views import locators_for_current_ocp_version
+
+        locators = locators_for_current_ocp_version()
+    return ui_test not in locators
 
 
 def get_ocs_version_from_image(image):
@@ -4527,13 +4508,15 @@ def download_file_from_git_repo(git_repo_url, path_to_file_in_git, filename):
     rmtree(temp_dir)
 
 
-def skipif_upgraded_from(version_list):
+def skipif_upgraded_from(version_list, prev_version=None):
     """
     This function evaluates the condition to skip a test if the cluster
     is upgraded from a particular OCS version
 
     Args:
         version_list (list): List of versions to check
+        prev_version (str): Already known 'replaces' field of the OCS CSV,
+            it is fetched from the cluster if not provided
 
     Return:
         (bool): True if test needs to be skipped else False
@@ -4544,9 +4527,10 @@ def skipif_upgraded_from(version_list):
 
         skip_this = False
         version_list = [version_list] if isinstance(version_list, str) else version_list
-        ocs_csv = get_ocs_csv()
-        csv_info = ocs_csv.get()
-        prev_version = csv_info.get("spec").get("replaces", "")
+        if prev_version is None:
+            ocs_csv = get_ocs_csv()
+            csv_info = ocs_csv.get()
+            prev_version = csv_info.get("spec").get("replaces", "")
         for version in version_list:
             if f".v{version}" in prev_version:
                 skip_this = True
@@ -0,0 +1,294 @@
+"""
+Vault HTTP API client.
+"""
+
+import logging
+import os
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from ocs_ci.ocs.exceptions import VaultOperationError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = 30
+DEFAULT_POOL_SIZE = 10
+
+
+def kv_secret_data(response):
+    """
+    Get the secret key/values from the response of the KV read.
+
+    Args:
+        response (dict): Response of the KV v1 or v2 read (the same as the
+            `vault kv get -format=json` output)
+
+    Returns:
+        dict: Key/values of the secret
+
+    """
+    data = (response or {}).get("data") or {}
+    if isinstance(data.get("data"), dict) and "metadata" in data:
+        return data["data"]
+    return data
+
+
+class VaultClient(object):
+    """
+    Client of the Vault HTTP API with a persistent session.
+    """
+
+    def __init__(
+        self,
+        addr=None,
+        token=None,
+        namespace=None,
+        ca_cert=None,
+        skip_verify=None,
+        timeout=DEFAULT_TIMEOUT,
+        pool_size=DEFAULT_POOL_SIZE,
+    ):
+        """
+        Args:
+            addr (str): Address of the Vault server, VAULT_ADDR by default
+            token (str): Vault token, VAULT_TOKEN or the ~/.vault-token file
+                by default
+            namespace (str): Vault namespace, VAULT_NAMESPACE by default
+            ca_cert (str): Path to the CA certificate, VAULT_CACERT by default
+            skip_verify (bool): True to skip the TLS verification,
+                VAULT_SKIP_VERIFY by default
+            timeout (int): Timeout of the requests in seconds
+            pool_size (int): Max number of the pooled connections
+
+        Raises:
+            VaultOperationError: If the address is not known
+
+        """
+        self.addr = (addr or os.environ.get("VAULT_ADDR", "")).rstrip("/")
+        if not self.addr:
+            raise VaultOperationError("Vault address (VAULT_ADDR) is not set")
+        self._token = token
+        self.namespace = (
+            namespace if namespace is not None else os.environ.get("VAULT_NAMESPACE")
+        )
+        if skip_verify is None:
+            skip_verify = os.environ.get("VAULT_SKIP_VERIFY", "").lower() in (
+                "1",
+                "true",
+            )
+        ca_cert = ca_cert or os.environ.get("VAULT_CACERT")
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.verify = False if skip_verify else ca_cert or True
+        self._mounts = {}
+        self._lock = threading.Lock()
+
+    @property
+    def token(self):
+        """
+        str: Vault token, read once
+        """
+        if self._token is None:
+            token = os.environ.get("VAULT_TOKEN")
+            token_file = os.path.expanduser("~/.vault-token")
+            if not token and os.path.isfile(token_file):
+                with open(token_file) as f:
+                    token = f.read().strip()
+            self._token = token or ""
+        return self._token
+
+    def request(self, method, path, namespace=None, **kwargs):
+        """
+        Send the request to the Vault API.
+
+        Args:
+            method (str): HTTP method, e.g. "GET" or "LIST"
+            path (str): API path without the "/v1/" prefix
+            namespace (str): Vault namespace of the request, the client
+                namespace by default
+            kwargs: Other arguments of requests.Session.request
+
+        Returns:
+            dict: JSON response, None if the path was not found
+
+        Raises:
+            VaultOperationError: If the request failed
+
+        """
+        headers = {"X-Vault-Token": self.token}
+        namespace = namespace if namespace is not None else self.namespace
+        if namespace:
+            headers["X-Vault-Namespace"] = namespace
+        url = f"{self.addr}/v1/{path.lstrip('/')}"
+        try:
+            response = self.session.request(
+                method, url, headers=headers, timeout=self.timeout, **kwargs
+            )
+        except requests.RequestException as ex:
+            raise VaultOperationError(f"Vault request {method} {path} failed: {ex}")
+        if response.status_code == 404:
+            return None
+        if response.status_code >= 400:
+            raise VaultOperationError(
+                f"Vault request {method} {path} failed with "
+                f"{response.status_code}: {response.text.strip()}"
+            )
+        if not response.content:
+            return {}
+        return response.json()
+
+    def _mount(self, path):
+        """
+        Args:
+            path (str): Path of the secret, e.g. "ocs-path/key"
+
+        Returns:
+            tuple: Mount path (e.g. "ocs-path/"), KV version (int)
+
+        """
+        with self._lock:
+            for mount, kv_version in self._mounts.items():
+                if f"{path.strip('/')}/".startswith(mount):
+                    return mount, kv_version
+        response = self.request("GET", f"sys/internal/ui/mounts/{path.strip('/')}")
+        if not response:
+            raise VaultOperationError(f"No secrets engine is mounted at {path}")
+        data = response.get("data", {})
+        mount = data.get("path", f"{path.strip('/').split('/')[0]}/")
+        kv_version = int((data.get("options") or {}).get("version") or 1)
+        with self._lock:
+            self._mounts[mount] = kv_version
+        return mount, kv_version
+
+    def _kv_path(self, path, v2_prefix):
+        mount, kv_version = self._mount(path)
+        rest = path.strip("/")[len(mount) :]
+        if kv_version == 2:
+            return f"{mount}{v2_prefix}/{rest}".rstrip("/")
+        return f"{mount}{rest}".rstrip("/")
+
+    def kv_list(self, path):
+        """
+        List the keys of the KV path, the same as `vault kv list`.
+
+        Args:
+            path (str): KV path, e.g. the backend path
+
+        Returns:
+            list: Keys in the path, empty if there are none
+
+        """
+        response = self.request("LIST", self._kv_path(path, "metadata"))
+        if not response:
+            return []
+        return response.get("data", {}).get("keys", [])
+
+    def kv_keys(self, path):
+        """
+        Args:
+            path (str): KV path
+
+        Returns:
+            set: Keys in the path
+
+        """
+        return set(self.kv_list(path))
+
+    def kv_get(self, path):
+        """
+        Read the secret, the same as `vault kv get -format=json`.
+
+        Args:
+            path (str): Path of the secret
+
+        Returns:
+            dict: The response, None if the secret doesn't exist
+
+        """
+        return self.request("GET", self._kv_path(path, "data"))
+
+    def missing_keys(self, path, keys, substring=True):
+        """
+        Check the presence of many keys with a single listing of the path.
+
+        Args:
+            path (str): KV path
+            keys (iterable): Keys to check
+            substring (bool): True to accept also a listed key containing the
+                checked key, e.g. "rook-ceph-osd-encryption-key-<pvc>" for
+                "<pvc>"
+
+        Returns:
+            list: The keys which are not present
+
+        """
+        listed = self.kv_keys(path)
+        missing = [key for key in keys if key not in listed]
+        if substring and missing:
+            missing = [
+                key
+                for key in missing
+                if not any(key in listed_key for listed_key in listed)
+            ]
+        return missing
+
+    def secrets_engines(self, namespace=None):
+        """
+        Args:
+            namespace (str): Vault namespace, the client namespace by default
+
+        Returns:
+            dict: Mount path: mount info, the same as `vault secrets list`
+
+        """
+        response = self.request("GET", "sys/mounts", namespace=namespace) or {}
+        return response.get("data", response)
+
+    def namespace_exists(self, name, parent=None):
+        """
+        Args:
+            name (str): Name of the Vault namespace
+            parent (str): Parent namespace, the client namespace by default
+
+        Returns:
+            bool: True if the namespace exists
+
+        """
+        return (
+            self.request("GET", f"sys/namespaces/{name.strip('/')}", namespace=parent)
+            is not None
+        )
+
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def get_vault_client():
+    """
+    Get the client for the current Vault environment variables, the client
+    (and its connections) is reused while the variables don't change.
+
+    Returns:
+        VaultClient: The client
+
+    """
+    key = tuple(
+        os.environ.get(name)
+        for name in (
+            "VAULT_ADDR",
+            "VAULT_TOKEN",
+            "VAULT_NAMESPACE",
+            "VAULT_CACERT",
+            "VAULT_SKIP_VERIFY",
+        )
+    )
+    with _clients_lock:
+        if key not in _clients:
+            _clients[key] = VaultClient()
+        return _clients[key]
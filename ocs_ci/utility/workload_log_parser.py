@@ -0,0 +1,603 @@
+"""
+Streaming parsers of workload (benchmark) pod logs.
+"""
+
+import logging
+import os
+import re
+import subprocess
+from concurrent.futures import wait as wait_futures
+
+import yaml
+from scipy.stats import scoreatpercentile
+
+from ocs_ci.framework import config, ConfigContextThreadPoolExecutor
+from ocs_ci.ocs.exceptions import CommandFailed, TimeoutExpiredError
+from ocs_ci.utility.histogram import LatencyHistogram
+
+log = logging.getLogger(__name__)
+
+
+class IntervalStats:
+    """
+    Running aggregates of values reported per interval, e.g. transactions per
+    second reported by every progress line of the benchmark.
+    """
+
+    def __init__(self):
+        self.values = []
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    @property
+    def count(self):
+        return len(self.values)
+
+    def add(self, value):
+        """
+        Add value of one interval.
+
+        Args:
+            value (float): The value
+
+        """
+        self.values.append(value)
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def summary(self, percentiles=(50, 95, 99)):
+        """
+        Summary of all the intervals.
+
+        Args:
+            percentiles (tuple): Percentiles to compute
+
+        Returns:
+            dict: with ``count``, ``min``, ``max``, ``avg`` and percentile
+                (e.g. ``p95``) keys, values are None without any interval
+
+        """
+        summary = {"count": self.count, "min": self.min, "max": self.max}
+        summary["avg"] = self.total / self.count if self.count else None
+        for p in percentiles:
+            summary[f"p{p}"] = (
+                float(scoreatpercentile(self.values, p)) if self.values else None
+            )
+        return summary
+
+
+class WorkloadLogParser:
+    """
+    Base class of the streaming log parsers, subclasses implement feed() and
+    result().
+    """
+
+    def feed(self, line):
+        """
+        Process one line of the log.
+
+        Args:
+            line (str): Log line without trailing newline
+
+        """
+        raise NotImplementedError
+
+    def result(self):
+        """
+        Result of the parsed log.
+        """
+        raise NotImplementedError
+
+    def feed_lines(self, lines):
+        """
+        Process all the lines (e.g. of an open log file) and get the result.
+
+        Args:
+            lines (iterable): Log lines
+
+        Returns:
+            Result of the parser, see result()
+
+        """
+        for line in lines:
+            self.feed(line.rstrip("\n"))
+        return self.result()
+
+    def feed_text(self, text):
+        """
+        Process the whole log text and get the result.
+
+        Args:
+            text (str): Log text
+
+        Returns:
+            Result of the parser, see result()
+
+        """
+        return self.feed_lines(text.splitlines())
+
+
+class PillowfightLogParser(WorkloadLogParser):
+    """
+    Parser of couchbase pillowfight logs, which consist of OPS/SEC values and
+    histogram of response times.
+    """
+
+    HISTOGRAM_LINE = re.compile(r"^\[\d+ +- \d+ *\][um]s \|#* - \d+")
+
+    def __init__(self):
+        self.ops_per_sec = IntervalStats()
+        self.resp_hist = {}
+
+    def feed(self, line):
+        try:
+            if line.startswith("OPS/SEC"):
+                self.ops_per_sec.add(int(line.split(" ")[-1].strip()))
+            if self.HISTOGRAM_LINE.match(line):
+                for element in ["[", "]", "|", "-", "#"]:
+                    line = line.replace(element, " ")
+                parts = line.split()
+                i1 = int(parts[0])
+                i2 = int(parts[1])
+                if parts[2] == "ms":
+                    i1 *= 1000
+                    i2 *= 1000
+                self.resp_hist[i2] = {"minindx": i1, "number": int(parts[3])}
+        except ValueError:
+            log.info(f"{line} -- contains invalid data")
+
+    def result(self):
+        """
+        Returns:
+            dict: ``opspersec`` list of reported ops per second values,
+                ``resptimes`` dict indexed by the max response time (us) of the
+                histogram range with min response time and count of the range
+                and ``opspersec_stats`` summary of the ops per second values
+
+        """
+        return {
+            "opspersec": list(self.ops_per_sec.values),
+            "resptimes": dict(self.resp_hist),
+            "opspersec_stats": self.ops_per_sec.summary(),
+        }
+
+    def histogram(self):
+        """
+        Returns:
+            LatencyHistogram: Response times histogram (us)
+
+        """
+        return pillowfight_latency_histogram(self.result())
+
+
+class PgbenchLogParser(WorkloadLogParser):
+    """
+    Parser of pgbench logs of benchmark operator. Each run ends with
+    "PGBench Results" followed by the run summary, progress lines of pgbench
+    (``progress: 5.0 s, 1234.5 tps, lat 1.623 ms stddev 0.803``) are
+    aggregated per interval.
+    """
+
+    RESULTS_MARKER = "PGBench Results"
+    PROGRESS_LINE = re.compile(
+        r"progress: ([\d.]+) s, ([\d.]+) tps, lat ([\d.]+) ms stddev ([\d.]+|NaN)"
+    )
+    FIELDS = (
+        ("scaling_factor", re.compile(r"scaling_factor\':\s+(\d+),")),
+        ("num_clients", re.compile(r"number_of_clients\':\s+(\d+),")),
+        ("num_threads", re.compile(r"number_of_threads\':\s+(\d+)")),
+        (
+            "number_of_transactions_per_client",
+            re.compile(r"number_of_transactions_per_client\':\s+(\d+),"),
+        ),
+        (
+            "number_of_transactions_actually_processed",
+            re.compile(r"number_of_transactions_actually_processed\':\s+(\d+),"),
+        ),
+        ("latency_avg", re.compile(r"latency_average_ms\':\s+(\d+)")),
+        ("lat_stddev", re.compile(r"latency_stddev_ms\':\s+(\d+)")),
+        ("tps_incl", re.compile(r"tps_incl_con_est\':\s+(\w+)")),
+        ("tps_excl", re.compile(r"tps_excl_con_est\':\s+(\w+)")),
+    )
+
+    def __init__(self):
+        self.runs = []
+        self.tps = IntervalStats()
+        self.latency = IntervalStats()
+        self.latency_histogram = LatencyHistogram(unit="us")
+        self._progress_time = 0.0
+        self._block = None
+        self._block_done = True
+
+    def _parse_block(self):
+        """
+        Parse the buffered summary of the current run, the block stops being
+        buffered once all the fields were found.
+        """
+        data = self.runs[-1][len(self.runs)]
+        for key, pattern in self.FIELDS:
+            if key in data:
+                continue
+            match = pattern.search(self._block)
+            if match and match.group(1):
+                data[key] = match.group(1)
+        if len(data) == len(self.FIELDS):
+            self._block_done = True
+            self._block = None
+
+    def feed(self, line):
+        progress = self.PROGRESS_LINE.search(line)
+        if progress:
+            elapsed, tps, latency = (float(progress.group(i)) for i in (1, 2, 3))
+            self.tps.add(tps)
+            self.latency.add(latency)
+            # elapsed time starts from 0 with every run
+            interval = elapsed - self._progress_time
+            if interval <= 0:
+                interval = elapsed
+            self._progress_time = elapsed
+            self.latency_histogram.record(latency * 1000, int(round(tps * interval)))
+            return
+        if self.RESULTS_MARKER in line:
+            self.runs.append({len(self.runs) + 1: {}})
+            self._block = line.split(self.RESULTS_MARKER, 1)[1]
+            self._block_done = False
+        elif not self._block_done:
+            # summary values might be wrapped to the next line
+            self._block += line
+        else:
+            return
+        self._parse_block()
+
+    def result(self):
+        """
+        Returns:
+            list: data of every run in the same format as
+                :py:func:`ocs_ci.utility.utils.parse_pgsql_logs`, e.g.
+                [{1: {'num_clients': '2', 'latency_avg': '7', ...}}, ...]
+
+        """
+        return self.runs
+
+    def progress_summary(self):
+        """
+        Returns:
+            dict: ``tps`` and ``latency_ms`` summaries of the progress lines
+
+        """
+        return {"tps": self.tps.summary(), "latency_ms": self.latency.summary()}
+
+    def histogram(self):
+        """
+        Latency histogram built from the progress lines, the average latency
+        of every interval is recorded for all the transactions of the interval.
+        Percentiles of it are percentiles of the interval averages weighted by
+        the transactions, as pgbench doesn't report per transaction latency.
+
+        Returns:
+            LatencyHistogram: Latency histogram (us)
+
+        """
+        return self.latency_histogram
+
+
+class FioLogParser(WorkloadLogParser):
+    """
+    Parser of fio output with ``--output-format=json``. Lines preceding the
+    json report (e.g. warnings) are logged, only the report is kept.
+    """
+
+    def __init__(self):
+        self._report_lines = []
+
+    def feed(self, line):
+        if self._report_lines or line == "{":
+            self._report_lines.append(line)
+        else:
+            log.info(line)
+
+    def result(self):
+        """
+        Returns:
+            dict: fio report, None if there is no report in the output
+
+        Raises:
+            yaml.parser.ParserError: if the report can't be parsed
+
+        """
+        if not self._report_lines:
+            return None
+        try:
+            return yaml.safe_load("\n".join(self._report_lines))
+        except yaml.parser.ParserError as ex:
+            log.error("json output from fio can't be parsed: %s", ex)
+            raise ex
+
+
+class FioTextLogParser(WorkloadLogParser):
+    """
+    Parser of fio output in the default (normal) format, keeps the completion
+    latency percentiles and the number of issued IOs of each operation. With
+    ``--status-interval`` the report is repeated, the last one is kept.
+    """
+
+    OPERATION_LINE = re.compile(r"^\s*(read|write|trim)\s*:\s*IOPS=")
+    PERCENTILES_HEADER = re.compile(r"^\s*clat percentiles \((\w+)\):")
+    PERCENTILE = re.compile(r"(\d+\.\d+)th=\[\s*(\d+)\]")
+    ISSUED_LINE = re.compile(r"issued rwts: total=(\d+),(\d+),(\d+)")
+    UNITS = {"nsec": 0.001, "usec": 1, "msec": 1000}
+
+    def __init__(self):
+        self.operations = {}
+        self._operation = None
+        self._unit = None
+
+    def feed(self, line):
+        operation = self.OPERATION_LINE.match(line)
+        if operation:
+            self._operation = operation.group(1)
+            self.operations[self._operation] = {"percentiles": {}, "total": 0}
+            self._unit = None
+            return
+        if self._operation is None:
+            return
+        header = self.PERCENTILES_HEADER.match(line)
+        if header:
+            self._unit = self.UNITS.get(header.group(1), 1)
+            return
+        if self._unit is not None and line.lstrip().startswith("|"):
+            percentiles = self.operations[self._operation]["percentiles"]
+            for percentile, value in self.PERCENTILE.findall(line):
+                percentiles[percentile] = int(value) * self._unit
+            return
+        self._unit = None
+        issued = self.ISSUED_LINE.search(line)
+        if issued:
+            for i, name in enumerate(("read", "write", "trim")):
+                if name in self.operations:
+                    self.operations[name]["total"] = int(issued.group(i + 1))
+
+    def result(self):
+        """
+        Returns:
+            dict: {operation: {"percentiles": {percentile: latency (us)},
+                "total": number of issued IOs}}
+
+        """
+        return self.operations
+
+    def histogram(self, operations=("read", "write")):
+        """
+        Args:
+            operations (tuple): Operations to include
+
+        Returns:
+            LatencyHistogram: Completion latency histogram (us)
+
+        """
+        histogram = LatencyHistogram(unit="us")
+        for name in operations:
+            data = self.operations.get(name)
+            if data and data["percentiles"] and data["total"]:
+                histogram.record_percentiles(data["percentiles"], data["total"])
+        return histogram
+
+
+def fio_latency_histogram(fio_report, operations=("read", "write")):
+    """
+    Build completion latency histogram from fio json report. Exact latency
+    bins are used when present (``--output-format=json+``), otherwise the
+    distribution is approximated from the clat percentiles.
+
+    Args:
+        fio_report (dict): fio json report
+        operations (tuple): Operations to include
+
+    Returns:
+        LatencyHistogram: Completion latency histogram (us) of all the jobs
+
+    """
+    histogram = LatencyHistogram(unit="us")
+    for job in (fio_report or {}).get("jobs", []):
+        for name in operations:
+            clat = (job.get(name) or {}).get("clat_ns") or {}
+            if not clat.get("N"):
+                continue
+            if clat.get("bins"):
+                for value, count in clat["bins"].items():
+                    histogram.record(int(value) / 1000, count)
+            elif clat.get("percentile"):
+                histogram.record_percentiles(
+                    {p: v / 1000 for p, v in clat["percentile"].items()}, clat["N"]
+                )
+    return histogram
+
+
+def pillowfight_latency_histogram(result):
+    """
+    Build response time histogram from parsed pillowfight log, every range of
+    the pillowfight histogram is recorded at its upper bound.
+
+    Args:
+        result (dict): Result of PillowfightLogParser
+
+    Returns:
+        LatencyHistogram: Response time histogram (us)
+
+    """
+    histogram = LatencyHistogram(unit="us")
+    for max_resp_time, item in result["resptimes"].items():
+        histogram.record(max_resp_time, item["number"])
+    return histogram
+
+
+def follow_pod_logs(
+    pod_name, namespace, parser, output_file=None, follow=True, container=None
+):
+    """
+    Stream logs of the pod line by line through the parser.
+
+    Args:
+        pod_name (str): Name of the pod
+        namespace (str): Namespace of the pod
+        parser (WorkloadLogParser): Parser of the log lines
+        output_file (str): Path of a file to write the raw log into
+        follow (bool): True to follow the log until the container ends,
+            False to read the current log only
+        container (str): Name of the container, the default one if not set
+
+    Returns:
+        Result of the parser, see WorkloadLogParser.result()
+
+    Raises:
+        CommandFailed: If oc logs fails
+
+    """
+    cmd = [
+        "oc",
+        "--kubeconfig",
+        config.RUN["kubeconfig"],
+        "logs",
+        pod_name,
+        "-n",
+        namespace,
+    ]
+    if follow:
+        cmd.append("-f")
+    if container:
+        cmd += ["-c", container]
+    log.info(f"Streaming logs of pod {pod_name}: {' '.join(cmd)}")
+    out = open(output_file, "w") if output_file else None
+    proc = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        errors="replace",
+    )
+    try:
+        for line in proc.stdout:
+            line = line.replace("\x00", "")
+            if out:
+                out.write(line)
+            parser.feed(line.rstrip("\n"))
+        proc.wait()
+    finally:
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+        if out:
+            out.close()
+    if proc.returncode:
+        raise CommandFailed(
+            f"Error during execution of command: {' '.join(cmd)}.\n"
+            f"Error is {proc.stderr.read().strip()}"
+        )
+    return parser.result()
+
+
+class WorkloadLogCollector:
+    """
+    Follows logs of many workload pods concurrently, each through its own
+    parser instance.
+    """
+
+    def __init__(
+        self, namespace, parser_class, logs_dir=None, follow=True, max_workers=32
+    ):
+        """
+        Args:
+            namespace (str): Namespace of the workload pods
+            parser_class (type): WorkloadLogParser subclass, new instance is
+                created for each pod
+            logs_dir (str): Directory to write raw logs into (as
+                <pod name>.log), logs are not stored if not provided
+            follow (bool): True to follow the logs until the containers end
+            max_workers (int): Maximal number of logs followed at once
+
+        """
+        self.namespace = namespace
+        self.parser_class = parser_class
+        self.logs_dir = logs_dir
+        self.follow_logs = follow
+        self.parsers = {}
+        self._futures = {}
+        self._executor = ConfigContextThreadPoolExecutor(max_workers=max_workers)
+
+    @property
+    def pods(self):
+        """
+        list: Names of the followed pods
+        """
+        return list(self._futures)
+
+    def log_path(self, pod_name):
+        """
+        Args:
+            pod_name (str): Name of the pod
+
+        Returns:
+            str: Path of the raw log file of the pod, None if logs are not stored
+
+        """
+        if not self.logs_dir:
+            return None
+        return os.path.join(self.logs_dir, f"{pod_name}.log")
+
+    def follow(self, pod_name):
+        """
+        Start following logs of the pod, pods already followed are skipped.
+
+        Args:
+            pod_name (str): Name of the pod
+
+        """
+        if pod_name in self._futures:
+            return
+        parser = self.parser_class()
+        self.parsers[pod_name] = parser
+        self._futures[pod_name] = self._executor.submit(
+            follow_pod_logs,
+            pod_name,
+            self.namespace,
+            parser,
+            output_file=self.log_path(pod_name),
+            follow=self.follow_logs,
+        )
+
+    def wait(self, timeout=None, raise_errors=True):
+        """
+        Wait for logs of all the followed pods to end.
+
+        Args:
+            timeout (int): Time in seconds to wait, no limit if not provided
+            raise_errors (bool): True to raise the error of failed log stream,
+                False to leave the pods with failed log stream out of the
+                results
+
+        Returns:
+            dict: {pod name: result of its parser}
+
+        Raises:
+            TimeoutExpiredError: If the logs did not end in time
+            CommandFailed: If streaming of any log failed
+
+        """
+        _, not_done = wait_futures(list(self._futures.values()), timeout=timeout)
+        if not_done:
+            pending = [pod for pod, f in self._futures.items() if f in not_done]
+            raise TimeoutExpiredError(
+                timeout, f"Logs of pods {pending} did not end in {timeout} seconds"
+            )
+        self._executor.shutdown(wait=False)
+        results = {}
+        for pod_name, future in self._futures.items():
+            try:
+                results[pod_name] = future.result()
+            except CommandFailed as ex:
+                if raise_errors:
+                    raise
+                log.warning(f"Failed to stream logs of pod {pod_name}: {ex}")
+        return results
@@ -122,6 +122,7 @@ setup(
             "rosa-ocp-version=ocs_ci.utility.rosa:rosa_ocp_version_endpoint",
             "deploy-fusion=ocs_ci.framework.fusion.main:main",
             "deploy-fdf=ocs_ci.framework.fusion_data_foundation.main:main",
+            "framework-benchmark=ocs_ci.utility.framework_benchmark:main",
         ],
     },
     zip_safe=True,
@@ -31,6 +31,9 @@ from ocs_ci.deployment.hosted_cluster import (
 )
 from ocs_ci.framework import config as ocsci_config, config
 import ocs_ci.framework.pytest_customization.marks
+from ocs_ci.framework.pytest_customization.collection_facts import (
+    SkipMarkerEvaluator,
+)
 from ocs_ci.framework.pytest_customization.marks import (
     deployment,
     ignore_leftovers,
@@ -46,6 +49,8 @@ from ocs_ci.helpers.virtctl import get_virtctl_tool
 from ocs_ci.ocs import constants, defaults, fio_artefacts, node, ocp, platform_nodes
 from ocs_ci.ocs.acm.acm import login_to_acm
 from ocs_ci.ocs.awscli_pod import create_awscli_pod, awscli_pod_cleanup
+from ocs_ci.ocs.health_gate import get_health_gate
+from ocs_ci.ocs.ceph_snapshot import DEFAULT_SNAPSHOT_TTL
 from ocs_ci.ocs.benchmark_operator_fio import get_file_size, BenchmarkOperatorFIO
 from ocs_ci.ocs.bucket_utils import (
     craft_s3_command,
@@ -89,6 +94,7 @@ from ocs_ci.ocs.scale_lib import FioPodScale
 from ocs_ci.ocs import utils
 from ocs_ci.ocs.resources.deployment import Deployment
 from ocs_ci.ocs.resources.job import get_job_obj
+from ocs_ci.ocs.resources.bulk_teardown import BulkTeardown
 from ocs_ci.ocs.resources.backingstore import (
     backingstore_factory as backingstore_factory_implementation,
     clone_bs_dict_from_backingstore,
@@ -161,7 +167,7 @@ from ocs_ci.utility.resource_check import (
     get_environment_status_after_execution,
 )
 from ocs_ci.utility.flexy import load_cluster_info
-from ocs_ci.utility.kms import is_kms_enabled, get_ksctl_cli
+from ocs_ci.utility.kms import get_ksctl_cli
 from ocs_ci.utility.prometheus import PrometheusAPI
 from ocs_ci.utility.reporting import update_live_must_gather_image
 from ocs_ci.utility.retry import retry
@@ -179,12 +185,8 @@ from ocs_ci.utility.utils import (
     get_testrun_name,
     load_auth_config,
     ocsci_log_path,
-    skipif_ocp_version,
-    skipif_ocs_version,
     TimeoutSampler,
-    skipif_upgraded_from,
     update_container_with_mirrored_image,
-    skipif_ui_not_support,
     run_cmd,
     ceph_health_check_multi_storagecluster_external,
     clone_repo,
@@ -393,7 +395,9 @@ def pytest_generate_tests(metafunc):
 def pytest_collection_modifyitems(session, config, items):
     """
     A pytest hook to filter out skipped tests satisfying
-    skipif_ocs_version, skipif_upgraded_from or skipif_no_kms
+    skipif_ocs_version, skipif_upgraded_from or skipif_no_kms, the cluster
+    facts and marker expressions are evaluated only once, see
+    ocs_ci.framework.pytest_customization.collection_facts
 
     Args:
         session: pytest session
@@ -417,84 +421,16 @@ def pytest_collection_modifyitems(session, config, items):
                 item.user_properties.append(("squad", squad.capitalize()))
 
     if not (teardown or deploy or (deploy and skip_ocs_deployment)):
-        for item in items[:]:
-            skipif_ocp_version_marker = item.get_closest_marker("skipif_ocp_version")
-            skipif_ocs_version_marker = item.get_closest_marker("skipif_ocs_version")
-            skipif_upgraded_from_marker = item.get_closest_marker(
-                "skipif_upgraded_from"
-            )
-            skipif_no_kms_marker = item.get_closest_marker("skipif_no_kms")
-            skipif_ui_not_support_marker = item.get_closest_marker(
-                "skipif_ui_not_support"
-            )
-            skipif_lvm_not_installed_marker = item.get_closest_marker(
-                "skipif_lvm_not_installed"
-            )
-            if skipif_lvm_not_installed_marker:
-                if not ocsci_config.RUN.get("lvm", False):
-                    log.info(f"Test {item} will be removed due to lvm not installed")
-                    items.remove(item)
-                    continue
-            if skipif_ocp_version_marker:
-                skip_condition = skipif_ocp_version_marker.args
-                # skip_condition will be a tuple
-                # and condition will be first element in the tuple
-                if skipif_ocp_version(skip_condition[0]):
-                    log.debug(
-                        f"Test: {item} will be skipped due to OCP {skip_condition}"
-                    )
-                    items.remove(item)
-                    continue
-            if skipif_ocs_version_marker:
-                skip_condition = skipif_ocs_version_marker.args
-                # skip_condition will be a tuple
-                # and condition will be first element in the tuple
-                if skipif_ocs_version(skip_condition[0]):
-                    log.debug(f"Test: {item} will be skipped due to {skip_condition}")
-                    items.remove(item)
-                    continue
-            if (
-                skipif_upgraded_from_marker
-                and ocsci_config.ENV_DATA.get("platform", "").lower()
-                not in constants.HCI_PROVIDER_CLIENT_PLATFORMS
-            ):
-                skip_args = skipif_upgraded_from_marker.args
-                if skipif_upgraded_from(skip_args[0]):
-                    log.debug(
-                        f"Test: {item} will be skipped because the OCS cluster is"
-                        f" upgraded from one of these versions: {skip_args[0]}"
-                    )
-                    items.remove(item)
-            if skipif_no_kms_marker:
-                try:
-                    if not is_kms_enabled(dont_raise=True):
-                        log.debug(
-                            f"Test: {item} it will be skipped because the OCS cluster"
-                            " has not configured cluster-wide encryption with KMS"
-                        )
-                        items.remove(item)
-                except KeyError:
-                    log.warning(
-                        "Cluster is not yet installed. Skipping skipif_no_kms check."
-                    )
-            if skipif_ui_not_support_marker:
-                skip_condition = skipif_ui_not_support_marker
-                if skipif_ui_not_support(skip_condition.args[0]):
-                    log.debug(
-                        f"Test: {item} will be skipped due to UI test"
-                        f" {skip_condition.args} is not available"
-                    )
-                    items.remove(item)
-                    continue
+        SkipMarkerEvaluator().filter_items(items)
     # Skip UI test on openshift dedicated, ODF-MS, FaaS platform
     if ocsci_config.ENV_DATA["platform"].lower() in constants.MANAGED_SERVICE_PLATFORMS:
-        for item in items.copy():
-            if "/ui/" in str(item.fspath):
-                log.debug(
-                    f"Test {item} is removed from the collected items"
-                    f" UI is not supported on {ocsci_config.ENV_DATA['platform'].lower()}"
-                )
-                items.remove(item)
+        ui_tests = [item for item in items if "/ui/" in str(item.fspath)]
+        if ui_tests:
+            log.debug(
+                f"Tests {ui_tests} are removed from the collected items"
+                f" UI is not supported on {ocsci_config.ENV_DATA['platform'].lower()}"
+            )
+            items[:] = [item for item in items if "/ui/" not in str(item.fspath)]
     # If multicluster upgrade scenario
     if ocsci_config.multicluster and ocsci_config.UPGRADE.get("upgrade", False):
         for item in items:
@@ -548,10 +484,18 @@ def pytest_collection_modifyitems(session, config, items):
     # Update PREUPGRADE_CONFIG for each of the Config class
     # so that in case of Y stream upgrade we will have preupgrade configurations for reference
     # across the tests as Y stream upgrade will reload the config of target version
+    # All the sections are copied by one deepcopy so the objects shared between
+    # the sections are copied only once
     for cluster in ocsci_config.clusters:
-        for k in cluster.__dataclass_fields__.keys():
-            if k != "PREUPGRADE_CONFIG":
-                cluster.PREUPGRADE_CONFIG[k] = deepcopy(getattr(cluster, k))
+        cluster.PREUPGRADE_CONFIG.update(
+            deepcopy(
+                {
+                    k: getattr(cluster, k)
+                    for k in cluster.__dataclass_fields__.keys()
+                    if k != "PREUPGRADE_CONFIG"
+                }
+            )
+        )
 
 
 def pytest_collection_finish(session):
@@ -1295,9 +1239,10 @@ def delete_projects(instances):
         except Exception:
             # we don't want any problem to disrupt the teardown itself
             log.exception("Failed to get events for project %s", instance.namespace)
-        ocp.switch_to_default_rook_cluster_project()
-        instance.delete(resource_name=instance.namespace)
-        instance.wait_for_delete(instance.namespace, timeout=300)
+    ocp.switch_to_default_rook_cluster_project()
+    teardown = BulkTeardown(timeout=300)
+    teardown.register(instances)
+    teardown.run()
 
 
 @pytest.fixture(scope="class")
@@ -1413,30 +1358,12 @@ def pvc_factory_fixture(request, project_factory):
 
     def finalizer():
         """
-        Delete the PVC
+        Delete the PVCs and wait for their PVs to be deleted, the ReclaimPolicy
+        of the PVs set to Retain is changed to Delete
         """
-        pv_objs = []
-
-        # Get PV form PVC instances and delete PVCs
-        for instance in instances:
-            if not instance.is_deleted:
-                pv_objs.append(instance.backed_pv_obj)
-                instance.delete()
-                instance.ocp.wait_for_delete(instance.name)
-
-        # Wait for PVs to delete
-        # If they have ReclaimPolicy set to Retain then change to Delete
-        for pv_obj in pv_objs:
-            if (
-                pv_obj.data.get("spec", {}).get("persistentVolumeReclaimPolicy")
-                == constants.RECLAIM_POLICY_RETAIN
-                and pv_obj is not None
-            ):
-                helpers.wait_for_resource_state(pv_obj, constants.STATUS_RELEASED)
-                patch_param = '{"spec":{"persistentVolumeReclaimPolicy":"Delete"}}'
-                pv_obj.ocp.patch(resource_name=pv_obj.name, params=patch_param)
-
-            pv_obj.ocp.wait_for_delete(resource_name=pv_obj.name, timeout=180)
+        teardown = BulkTeardown(timeout=180, delete_retained_pvs=True)
+        teardown.register(instances)
+        teardown.run()
 
     request.addfinalizer(finalizer)
     return factory
@@ -1566,9 +1493,9 @@ def pod_factory_fixture(request, pvc_factory):
         """
         Delete the Pod or the DeploymentConfig
         """
-        for instance in instances:
-            instance.delete()
-            instance.ocp.wait_for_delete(instance.name)
+        teardown = BulkTeardown()
+        teardown.register(instances)
+        teardown.run()
 
     request.addfinalizer(finalizer)
     return factory
@@ -1615,27 +1542,12 @@ def teardown_factory_fixture(request):
 
     def finalizer():
         """
-        Delete the resources created in the test
+        Delete the resources created in the test, the PVs of the PVCs with the
+        Delete ReclaimPolicy are validated to be deleted too
         """
-        for instance in instances[::-1]:
-            if not instance.is_deleted:
-                try:
-                    if (instance.kind == constants.PVC) and (instance.reclaim_policy):
-                        pass
-                    reclaim_policy = (
-                        instance.reclaim_policy
-                        if instance.kind == constants.PVC
-                        else None
-                    )
-                    instance.delete()
-                    instance.ocp.wait_for_delete(instance.name)
-                    if reclaim_policy == constants.RECLAIM_POLICY_DELETE:
-                        helpers.validate_pv_delete(instance.backed_pv)
-                except CommandFailed as ex:
-                    log.warning(
-                        "Resource is already in deleted state, skipping this step"
-                        f"Error: {ex}"
-                    )
+        teardown = BulkTeardown(ignore_delete_errors=True)
+        teardown.register(instances[::-1])
+        teardown.run()
 
     request.addfinalizer(finalizer)
     return factory
@@ -1946,14 +1858,28 @@ def health_checker(request, tier_marks_name, upgrade_marks_name):
                     or mcg_only_deployment
                     or not ceph_cluster_installed
                 ):
-                    # We are allowing 20 re-tries for health check, to avoid teardown failures for cases like:
-                    # "flip-flopping ceph health OK and warn because of:
-                    # HEALTH_WARN Reduced data availability: 2 pgs peering
-                    ceph_health_check(
-                        namespace=ocsci_config.ENV_DATA["cluster_namespace"],
-                        fix_ceph_health=True,
+
+                    def teardown_health_check():
+                        # We are allowing 20 re-tries for health check, to avoid teardown failures for cases like:
+                        # "flip-flopping ceph health OK and warn because of:
+                        # HEALTH_WARN Reduced data availability: 2 pgs peering
+                        # the gate has just fetched the Ceph state to check
+                        # the change signal, so the first try reuses it
+                        ceph_health_check(
+                            namespace=ocsci_config.ENV_DATA["cluster_namespace"],
+                            fix_ceph_health=True,
+                            max_age=DEFAULT_SNAPSHOT_TTL,
+                        )
+                        log.info("Ceph health check passed at teardown!")
+                        return True
+
+                    # the test could have changed the cluster, so the change
+                    # signal is always fetched from the cluster
+                    get_health_gate().check(
+                        teardown_health_check, "teardown", fresh=True
                     )
-                    log.info("Ceph health check passed at teardown!")
+                    # the gate tracks the internal cluster only, the external
+                    # cluster is always checked
                     if ocsci_config.DEPLOYMENT.get("multi_storagecluster"):
                         ceph_health_check_multi_storagecluster_external()
                         log.info(
@@ -2004,27 +1930,34 @@ def health_checker(request, tier_marks_name, upgrade_marks_name):
             "cephcluster"
         ):
             log.info("Checking for Ceph Health OK ")
-            external_multi_storagecluster_status = False
-            try:
-                status = ceph_health_check(
+
+            def setup_health_check():
+                return ceph_health_check(
                     namespace=ocsci_config.ENV_DATA["cluster_namespace"],
                     tries=10,
                     delay=15,
                     fix_ceph_health=True,
                 )
-                if not ocsci_config.DEPLOYMENT.get("multi_storagecluster"):
-                    if status:
-                        log.info("Ceph health check passed at setup")
-                        return
-                else:
+
+            try:
+                # the verdict of the previous check is reused if the cluster
+                # health state did not change since then
+                status = get_health_gate().check(setup_health_check, "setup")
+                # the gate tracks the internal cluster only, the external
+                # cluster is always checked
+                if ocsci_config.DEPLOYMENT.get("multi_storagecluster"):
                     external_multi_storagecluster_status = (
                         ceph_health_check_multi_storagecluster_external()
                     )
-                    if status and external_multi_storagecluster_status:
+                    status = status and external_multi_storagecluster_status
+                if status:
+                    if not ocsci_config.DEPLOYMENT.get("multi_storagecluster"):
+                        log.info("Ceph health check passed at setup")
+                    else:
                         log.info(
                             "Ceph health check passed for internal and multi-storagecluster external at setup"
                         )
-                        return
+                    return
             except (CephHealthException, CephHealthNotRecoveredException):
                 ocsci_config.RUN["skipped_tests_ceph_health"] += 1
                 skipped = True
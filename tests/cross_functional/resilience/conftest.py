@@ -5,6 +5,7 @@ from ocs_ci.ocs import constants
 from ocs_ci.resiliency.resiliency_helper import ResiliencyConfig
 from ocs_ci.resiliency.resiliency_workload import workload_object
 from ocs_ci.resiliency.platform_stress import PlatformStress
+from ocs_ci.resiliency.node_metrics import NodeMetricsCollector
 from ocs_ci.ocs.node import get_nodes
 from ocs_ci.workloads.vdbench import VdbenchWorkload
 from ocs_ci.helpers.vdbench_helpers import create_temp_config_file
@@ -77,8 +78,9 @@ def resiliency_workload(request):
 def run_platform_stress(request):
     """Factory fixture to create and run a PlatformStress object.
 
-    Automatically starts stress tests on given node types (default: worker nodes).
-    All stress will stop when the test completes.
+    Automatically starts stress tests on given node types (default: worker nodes)
+    together with node metrics collection on the same nodes. All stress will stop
+    when the test completes and the load measured during every stress run is logged.
 
     Usage:
         stress = run_platform_stress()
@@ -109,19 +111,29 @@ def run_platform_stress(request):
             "Creating PlatformStress instance for nodes: %s", [n.name for n in nodes]
         )
 
+        collector = NodeMetricsCollector(nodes=[n.name for n in nodes])
+        collector.start()
         stress_obj = PlatformStress(nodes)
         stress_obj.start_random_stress()
-        created_instances.append(stress_obj)
+        created_instances.append((stress_obj, collector))
         log.info("Started stress testing in background.")
         return stress_obj
 
     def finalizer():
         """Cleanup function to stop all PlatformStress instances."""
-        for stress_obj in created_instances:
+        for stress_obj, collector in created_instances:
             if stress_obj.run_status:
                 log.info("Stopping stress for PlatformStress instance...")
                 stress_obj.stop()
                 log.info("Stress stopped.")
+            collector.stop()
+            for load in stress_obj.get_stress_load_stats(collector):
+                log.info(
+                    "Load during %s on %s: %s",
+                    load["stress"],
+                    load["node"],
+                    load["stats"],
+                )
 
     request.addfinalizer(finalizer)
     return factory
@@ -8,6 +8,7 @@ from ocs_ci.framework.pytest_customization.marks import (
     polarion_id,
 )
 from ocs_ci.resiliency.resiliency_helper import Resiliency
+from ocs_ci.utility.histogram import LatencyHistogram
 
 log = logging.getLogger(__name__)
 
@@ -55,13 +56,17 @@ class TestStorageClusterComponentFailurescenarios:
         """
         Validate workload results and stop/cleanup all workloads.
         """
+        histograms = []
         for workload in workloads:
             result = workload.get_fio_results()
             assert (
                 "error" not in result.lower()
             ), f"Workload {workload.deployment_name} failed after failure injection"
+            histograms.append(workload.get_latency_histogram(result))
 
         log.info("All workloads passed after failure injection.")
+        latency = LatencyHistogram.merged(histograms)
+        log.info(f"FIO completion latency of all the workloads: {latency.summary()}")
 
     @pytest.mark.parametrize(
         argnames=["scenario_name", "failure_case"],
@@ -90,19 +90,12 @@ class TestSequentialRelocate:
         for relocate in relocate_results:
             relocate.result()
 
-        # Verify resources deletion from primary cluster
-        config.switch_to_cluster_by_name(primary_cluster_name)
-        for wl in workloads:
-            dr_helpers.wait_for_all_resources_deletion(wl.workload_namespace)
-
-        # Verify resources creation on secondary cluster (preferredCluster)
+        # Verify resources deletion from primary cluster and creation on
+        # secondary cluster (preferredCluster) at once
+        dr_helpers.wait_for_all_resources_on_clusters(
+            workloads, secondary_cluster_name, primary_cluster_name
+        )
         config.switch_to_cluster_by_name(secondary_cluster_name)
-        for wl in workloads:
-            dr_helpers.wait_for_all_resources_creation(
-                wl.workload_pvc_count,
-                wl.workload_pod_count,
-                wl.workload_namespace,
-            )
 
         if pvc_interface == constants.CEPHFILESYSTEM:
             for wl in workloads: